@@ -86,6 +86,7 @@ INSERT INTO T_VAGA_EMPRESA (vaga_tema, des_vaga, st_vaga) VALUES ('Designer UX/U
 
 -- 5. T_LVUP_LOGIN (10 registros - Chaves Primárias para Pessoa, Empresa e Instituição)
 -- IDs 1 a 4: Pessoas | IDs 5 a 7: Empresas | IDs 8 a 10: Instituições
+-- IDs 11 a 16: Pessoas 5 a 10 | IDs 17 a 23: Empresas 4 a 10 | IDs 24 a 30: Instituições 4 a 10
 INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('joao.silva', 'senha123', 'S', 1);
 INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('maria.souza', 'senha123', 'S', 2);
 INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('pedro.santos', 'senha123', 'S', 3);
@@ -96,42 +97,62 @@ INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('globalcor
 INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('univabc.adm', 'inst123', 'S', 1);
 INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('faculdef.adm', 'inst123', 'S', 2);
 INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('escolaghi.adm', 'inst123', 'S', 3);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('lucas.costa', 'senha123', 'S', 5);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('juliana.lima', 'senha123', 'S', 6);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('rafaela.mendes', 'senha123', 'S', 7);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('gustavo.rocha', 'senha123', 'S', 8);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('carla.oliveira', 'senha123', 'S', 9);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_pessoa) VALUES ('felipe.alves', 'senha123', 'S', 10);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('varejotop.adm', 'empresa123', 'S', 4);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('logistica.adm', 'empresa123', 'S', 5);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('saudetotal.adm', 'empresa123', 'S', 6);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('autoft.adm', 'empresa123', 'S', 7);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('streamplus.adm', 'empresa123', 'S', 8);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('designc.adm', 'empresa123', 'S', 9);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_empresa) VALUES ('rhsol.adm', 'empresa123', 'S', 10);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('institutojkl.adm', 'inst123', 'S', 4);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('centromno.adm', 'inst123', 'S', 5);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('pospqr.adm', 'inst123', 'S', 6);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('direitostu.adm', 'inst123', 'S', 7);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('engenhariavwx.adm', 'inst123', 'S', 8);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('saudeyza.adm', 'inst123', 'S', 9);
+INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo, id_instAcademica) VALUES ('negociosbcd.adm', 'inst123', 'S', 10);
 
--- 6. T_PESSOA (10 registros - usando ENDERECO 1 a 10 e LOGIN 1 a 4)
+-- 6. T_PESSOA (10 registros - usando ENDERECO 1 a 10 e LOGIN 1 a 4 e 11 a 16)
 INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('João Silva', '111.111.111-11', DATE '2000-01-15', 1, 1);
 INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Maria Souza', '222.222.222-22', DATE '1999-05-20', 2, 2);
 INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Pedro Santos', '333.333.333-33', DATE '1985-11-10', 3, 3);
 INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Ana Ferreira', '444.444.444-44', DATE '2001-08-01', 4, 4);
-INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco) VALUES ('Lucas Costa', '555.555.555-55', DATE '2002-03-25', 5);
-INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco) VALUES ('Juliana Lima', '666.666.666-66', DATE '1998-12-12', 6);
-INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco) VALUES ('Rafaela Mendes', '777.777.777-77', DATE '2003-07-30', 7);
-INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco) VALUES ('Gustavo Rocha', '888.888.888-88', DATE '1995-04-18', 8);
-INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco) VALUES ('Carla Oliveira', '999.999.999-99', DATE '2000-09-05', 9);
-INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco) VALUES ('Felipe Alves', '000.000.000-00', DATE '2001-02-28', 10);
+INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Lucas Costa', '555.555.555-55', DATE '2002-03-25', 5, 11);
+INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Juliana Lima', '666.666.666-66', DATE '1998-12-12', 6, 12);
+INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Rafaela Mendes', '777.777.777-77', DATE '2003-07-30', 7, 13);
+INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Gustavo Rocha', '888.888.888-88', DATE '1995-04-18', 8, 14);
+INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Carla Oliveira', '999.999.999-99', DATE '2000-09-05', 9, 15);
+INSERT INTO T_PESSOA (nm_pessoa, cpf_pessoa, dt_nascimento, id_endereco, id_login) VALUES ('Felipe Alves', '000.000.000-00', DATE '2001-02-28', 10, 16);
 
--- 7. T_EMPRESA (10 registros - usando ENDERECO 11 a 20 e LOGIN 5 a 7)
+-- 7. T_EMPRESA (10 registros - usando ENDERECO 11 a 20 e LOGIN 5 a 7 e 17 a 23)
 INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('TechCo Software', '01.000.000/0001-01', 'contato@techco.com', DATE '2018-01-01', 'A', 11, 5);
 INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Bank X S.A.', '02.000.000/0001-02', 'rh@bankx.com', DATE '2015-05-10', 'A', 12, 6);
 INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Global Corp Consultoria', '03.000.000/0001-03', 'info@globalcorp.com', DATE '2019-07-20', 'A', 13, 7);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('Varejo Top LTDA', '04.000.000/0001-04', 'contato@varejotop.com', DATE '2020-03-01', 'A', 14);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('Logística Rápida', '05.000.000/0001-05', 'frotas@logistica.com', DATE '2017-11-11', 'A', 15);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('Saúde Total Hospitais', '06.000.000/0001-06', 'adm@saudetotal.com', DATE '2016-06-06', 'A', 16);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('Automotiva Futurista', '07.000.000/0001-07', 'vendas@autoft.com', DATE '2021-02-14', 'A', 17);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('Mídia Streaming Plus', '08.000.000/0001-08', 'imprensa@streamplus.com', DATE '2022-09-01', 'A', 18);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('Design Criativo Estúdio', '09.000.000/0001-09', 'jobs@designc.com', DATE '2019-04-20', 'A', 19);
-INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco) VALUES ('RH Solutions Treinamento', '10.000.000/0001-10', 'treinamento@rhsol.com', DATE '2014-10-05', 'A', 20);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Varejo Top LTDA', '04.000.000/0001-04', 'contato@varejotop.com', DATE '2020-03-01', 'A', 14, 17);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Logística Rápida', '05.000.000/0001-05', 'frotas@logistica.com', DATE '2017-11-11', 'A', 15, 18);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Saúde Total Hospitais', '06.000.000/0001-06', 'adm@saudetotal.com', DATE '2016-06-06', 'A', 16, 19);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Automotiva Futurista', '07.000.000/0001-07', 'vendas@autoft.com', DATE '2021-02-14', 'A', 17, 20);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Mídia Streaming Plus', '08.000.000/0001-08', 'imprensa@streamplus.com', DATE '2022-09-01', 'A', 18, 21);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('Design Criativo Estúdio', '09.000.000/0001-09', 'jobs@designc.com', DATE '2019-04-20', 'A', 19, 22);
+INSERT INTO T_EMPRESA (nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login) VALUES ('RH Solutions Treinamento', '10.000.000/0001-10', 'treinamento@rhsol.com', DATE '2014-10-05', 'A', 20, 23);
 
--- 8. T_INST_ACADEMICA (10 registros - usando ENDERECO 21 a 30 e LOGIN 8 a 10)
+-- 8. T_INST_ACADEMICA (10 registros - usando ENDERECO 21 a 30 e LOGIN 8 a 10 e 24 a 30)
 INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Universidade ABC', 'S', '11.000.000/0001-11', 21, 8);
 INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Faculdade DEF', 'S', '12.000.000/0001-12', 22, 9);
 INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Escola Técnica GHI', 'S', '13.000.000/0001-13', 23, 10);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Instituto JKL', 'S', '14.000.000/0001-14', 24);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Centro de Ensino MNO', 'S', '15.000.000/0001-15', 25);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Pós-Graduação PQR', 'S', '16.000.000/0001-16', 26);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Faculdade de Direito STU', 'S', '17.000.000/0001-17', 27);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Universidade de Engenharia VWX', 'S', '18.000.000/0001-18', 28);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Faculdade de Saúde YZA', 'S', '19.000.000/0001-19', 29);
-INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco) VALUES ('Escola de Negócios BCD', 'S', '20.000.000/0001-20', 30);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Instituto JKL', 'S', '14.000.000/0001-14', 24, 24);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Centro de Ensino MNO', 'S', '15.000.000/0001-15', 25, 25);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Pós-Graduação PQR', 'S', '16.000.000/0001-16', 26, 26);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Faculdade de Direito STU', 'S', '17.000.000/0001-17', 27, 27);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Universidade de Engenharia VWX', 'S', '18.000.000/0001-18', 28, 28);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Faculdade de Saúde YZA', 'S', '19.000.000/0001-19', 29, 29);
+INSERT INTO T_INST_ACADEMICA (nm_instAcademica, st_ativo, cnpj_inst_academica, id_endereco, id_login) VALUES ('Escola de Negócios BCD', 'S', '20.000.000/0001-20', 30, 30);
 
 -- 9. T_LVUP_EVENTO (10 registros - usando ENDERECO 31 a 40)
 INSERT INTO T_LVUP_EVENTO (nm_evento, descricao_evento, qt_dias, dt_inicio_evento, id_instAcademica, id_endereco, id_vagaEmpresa) VALUES ('Feira de Carreiras 2025', 'Evento para conectar alunos e empresas.', 1, DATE '2025-10-20', 1, 31, 1);
@@ -0,0 +1,516 @@
+"""
+Benchmark das funções de CRUD e exportação do pacote levelup.
+
+Cada função pública (3 inserts, 4 selects, update, delete e exportação JSON) é medida
+com bases de 10^3 a 10^6 empresas, usando o driver local em SQLite (oracledb_local.py)
+no lugar do Oracle. Para cada caso são informados:
+    vazão (operações/s), latência p50/p95/p99/máx e pico de memória (tracemalloc)
+
+Os resultados podem ser gravados como baseline e comparados nas execuções seguintes;
+uma piora acima da tolerância é marcada como regressão e o programa sai com código 1.
+
+Também mede o custo de importação (python -X importtime) e o tempo de inicialização
+do processo para os pontos de entrada do pacote, em processos novos, e (com --carga-http)
+a vazão e a latência do serviço HTTP (python -m levelup servir) sob clientes concorrentes.
+
+Uso:
+    python benchmark.py                                   # 1000,10000,100000,1000000
+    python benchmark.py --tamanhos 1000,10000 --tempo 1
+    python benchmark.py --salvar-baseline                 # grava benchmark_baseline.json
+    python benchmark.py --tolerancia 0.25                 # compara com o baseline salvo
+    python benchmark.py --tamanhos "" --importacao 10     # só o custo de importação
+    python benchmark.py --tamanhos "" --importacao 0 --carga-http 20 --clientes 64
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import re
+import tempfile
+import subprocess
+import tracemalloc
+from datetime import datetime
+
+from levelup import oracledb_local
+import levelup
+from gerador_dados import GeradorDados, carregar_no_banco
+
+PASTA_PROJETO = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_ESQUEMA = os.path.join(PASTA_PROJETO, "GERAL_1executado.sql")
+ARQUIVO_BASELINE = "benchmark_baseline.json"
+TAMANHOS_PADRAO = (1_000, 10_000, 100_000, 1_000_000)
+TAMANHO_LOTE_CARGA = 10_000
+
+# ==========================================================
+#   BASE DE TESTE
+# ==========================================================
+
+def criar_base(_caminho: str, _quantidade: int, _semente: int = 42) -> oracledb_local.Pool:
+    """
+    Cria o esquema do GERAL_1executado.sql e carrega _quantidade empresas do gerador_dados.py
+    (com telefones, vagas e categorias, para o delete ter dependências reais).
+    """
+    pool = oracledb_local.create_pool(dsn=_caminho, min=1, max=2, stmtcachesize=50)
+    conexao = pool.acquire()
+    oracledb_local.executar_script(conexao, ARQUIVO_ESQUEMA)
+
+    gerador = GeradorDados(_quantidade, _semente, _pessoas=0, _instituicoes=0, _tamanho_lote=TAMANHO_LOTE_CARGA)
+    ok, resultado = carregar_no_banco(conexao, gerador.lotes(), _ids_explicitos=True)
+    pool.release(conexao)
+    if not ok:
+        raise RuntimeError(f"Falha ao carregar a base de teste: {resultado}")
+    return pool
+
+# ==========================================================
+#   CASOS MEDIDOS
+# ==========================================================
+
+def montar_casos(_pool, _quantidade: int, _pasta: str) -> list[tuple[str, callable, callable]]:
+    """
+    Cada caso é (nome, preparar, executar): preparar() roda fora da medição e devolve
+    os argumentos de executar(*args), que deve retornar o (ok, resultado) do levelup.
+    """
+    aleatorio = random.Random(_quantidade)
+    contador = iter(range(_quantidade + 1, 10**9))
+    ids_exclusao = list(range(1, _quantidade + 1))  # pop() exclui do fim para o começo
+    arquivo_json = os.path.join(_pasta, "empresa.json")
+
+    dados_endereco = {"cep": "01001000", "pais": "BRA", "estado": "SP", "cidade": "São Paulo", "bairro": "Sé", "rua": "Praça da Sé", "numero": 1}
+    dados_empresa = {"nm_empresa": "Empresa Benchmark", "cnpj_empresa": "11222333000181", "email_empresa": "bench@levelup.com", "dt_cadastro": "01/01/2025", "st_empresa": "A"}
+
+    ok, empresas_exportacao = levelup.select_todas_empresas_completas(_pool)
+    if not ok:
+        raise RuntimeError(f"Falha ao ler as empresas para a exportação: {empresas_exportacao}")
+
+    def id_existente():
+        return (_pool, aleatorio.randint(1, ids_exclusao[-1] if ids_exclusao else 1))
+
+    return [
+        ("insert_endereco", lambda: (_pool, dados_endereco), levelup.insert_endereco),
+        ("insert_lvup_login", lambda: (_pool, {"login": f"bench{next(contador)}@levelup.com", "senha": "x", "st_ativo": "A"}), levelup.insert_lvup_login),
+        ("insert_empresa", lambda: (_pool, dados_empresa, 1, 1), levelup.insert_empresa),
+        ("select_empresa_por_id", id_existente, lambda pool, id_empresa: levelup.select_empresa_por_id(pool, id_empresa, _usar_cache=False)),
+        ("select_todas_empresas_completas", lambda: (_pool,), levelup.select_todas_empresas_completas),
+        ("select_para_preview", lambda: (_pool,), levelup.select_para_preview),
+        ("select_para_generico", lambda: (_pool, f"Empresa {aleatorio.randint(1, _quantidade):07d}"[:-1]), lambda pool, parametro: levelup.select_para_generico(pool, parametro, levelup.TABELAS_COLUNAS_BUSCA)),
+        ("atualizar_empresa_parcial", lambda: (*id_existente(), {"nm_empresa": f"Empresa {next(contador)}", "cidade": "Campinas"}), levelup.atualizar_empresa_parcial),
+        ("excluir_empresa_por_id", lambda: (_pool, ids_exclusao.pop()), levelup.excluir_empresa_por_id),
+        ("exportar_para_json", lambda: ([dict(item) for item in empresas_exportacao], arquivo_json), levelup.exportar_para_json)
+    ]
+
+# ==========================================================
+#   MEDIÇÃO
+# ==========================================================
+
+def percentil(_ordenados: list[float], _p: float) -> float:
+    if not _ordenados:
+        return 0.0
+    posicao = (len(_ordenados) - 1) * _p
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(_ordenados) - 1)
+    return _ordenados[inferior] + (_ordenados[superior] - _ordenados[inferior]) * (posicao - inferior)
+
+def executar_verificando(_nome: str, _executar, _args) -> None:
+    ok, resultado = _executar(*_args)
+    if not ok:
+        raise RuntimeError(f"{_nome} falhou: {resultado}")
+
+def medir_caso(_nome: str, _preparar, _executar, _tempo: float, _min_repeticoes: int, _max_repeticoes: int) -> dict:
+    """
+    Uma chamada com tracemalloc (pico de memória, também serve de aquecimento)
+    e depois repetições até esgotar _tempo segundos, sem tracemalloc ligado.
+    """
+    args = _preparar()
+    tracemalloc.start()
+    executar_verificando(_nome, _executar, args)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencias = []
+    limite = time.perf_counter() + _tempo
+    while len(latencias) < _max_repeticoes and (len(latencias) < _min_repeticoes or time.perf_counter() < limite):
+        args = _preparar()
+        inicio = time.perf_counter()
+        executar_verificando(_nome, _executar, args)
+        latencias.append(time.perf_counter() - inicio)
+
+    latencias.sort()
+    total = sum(latencias)
+    return {
+        "repeticoes": len(latencias),
+        "ops_por_segundo": len(latencias) / total if total else 0.0,
+        "p50_ms": percentil(latencias, 0.50) * 1000,
+        "p95_ms": percentil(latencias, 0.95) * 1000,
+        "p99_ms": percentil(latencias, 0.99) * 1000,
+        "max_ms": latencias[-1] * 1000,
+        "pico_memoria_kb": pico / 1024
+    }
+
+def executar_benchmark(_tamanhos, _tempo: float, _min_repeticoes: int, _max_repeticoes: int, _filtro: set | None = None) -> dict:
+    resultados = {}
+    for quantidade in _tamanhos:
+        with tempfile.TemporaryDirectory(prefix="levelup_bench_") as pasta:
+            inicio_carga = time.perf_counter()
+            pool = criar_base(os.path.join(pasta, "levelup.db"), quantidade)
+            print(f"\n=== {quantidade:,} empresas (carga em {time.perf_counter() - inicio_carga:.1f}s) ===".replace(",", "."))
+            print(f"{'função':<34}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'máx ms':>10}{'mem KB':>11}")
+
+            levelup.cache_empresas.limpar()
+            levelup.lista_preview_empresas.invalidar()
+            resultados[str(quantidade)] = {}
+            for nome, preparar, executar in montar_casos(pool, quantidade, pasta):
+                if _filtro and nome not in _filtro:
+                    continue
+                medida = medir_caso(nome, preparar, executar, _tempo, _min_repeticoes, _max_repeticoes)
+                resultados[str(quantidade)][nome] = medida
+                print(
+                    f"{nome:<34}{medida['ops_por_segundo']:>10.1f}{medida['p50_ms']:>10.3f}{medida['p95_ms']:>10.3f}"
+                    f"{medida['p99_ms']:>10.3f}{medida['max_ms']:>10.3f}{medida['pico_memoria_kb']:>11.1f}"
+                )
+            pool.close()
+    return resultados
+
+# ==========================================================
+#   CUSTO DE IMPORTAÇÃO (python -X importtime)
+# ==========================================================
+
+# nome do caso -> código executado em um processo novo
+CASOS_IMPORTACAO = {
+    "import levelup": "import levelup",
+    "levelup.insert_empresa": "import levelup; levelup.insert_empresa",
+    "levelup.select_empresa_por_id": "import levelup; levelup.select_empresa_por_id",
+    "levelup.exportar_para_json": "import levelup; levelup.exportar_para_json",
+    "levelup.menu (python -m levelup)": "import levelup.menu",
+    "import main (compatibilidade)": "import main"
+}
+
+def ler_importtime(_saida_erro: str) -> dict[str, float]:
+    """Converte as linhas 'import time: próprio | acumulado | módulo' em {módulo de nível 0: ms acumulados}."""
+    modulos = {}
+    for linha in _saida_erro.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, acumulado, nome = linha[len("import time:"):].split("|")
+        if acumulado.strip().isdigit() and not nome.startswith("  "):
+            modulos[nome.strip()] = int(acumulado) / 1000
+    return modulos
+
+def executar_importtime(_codigo: str) -> tuple[float, dict[str, float]]:
+    """Roda o código em um processo novo; retorna (tempo total do processo em ms, importações de nível 0)."""
+    ambiente = {**os.environ, "PYTHONDONTWRITEBYTECODE": "0"}
+    inicio = time.perf_counter()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _codigo],
+        cwd=PASTA_PROJETO, env=ambiente, capture_output=True, text=True, check=True
+    )
+    return (time.perf_counter() - inicio) * 1000, ler_importtime(processo.stderr)
+
+def medir_importacao(_repeticoes: int) -> dict:
+    """
+    Custo de importação de cada caso descontando o que o interpretador já carrega sozinho
+    (site e afins, medidos com "pass"), e tempo total do processo.
+    Uma execução de aquecimento antes garante os .pyc em disco.
+    """
+    resultados = {}
+    _, modulos_iniciais = executar_importtime("pass")
+    processo_vazio = sorted(executar_importtime("pass")[0] for _ in range(_repeticoes))
+
+    print(f"\n=== Importação ({_repeticoes} processos por caso; processo vazio: {percentil(processo_vazio, 0.5):.1f} ms) ===")
+    print(f"{'caso':<36}{'import ms':>11}{'p95 ms':>10}{'processo ms':>13}  mais pesados")
+
+    for nome, codigo in CASOS_IMPORTACAO.items():
+        executar_importtime(codigo)
+        custos = []
+        processos = []
+        pesados = {}
+        for _ in range(_repeticoes):
+            tempo_processo, modulos = executar_importtime(codigo)
+            proprios = {modulo: ms for modulo, ms in modulos.items() if modulo not in modulos_iniciais}
+            custos.append(sum(proprios.values()))
+            processos.append(tempo_processo)
+            for modulo, ms in proprios.items():
+                pesados[modulo] = pesados.get(modulo, 0.0) + ms / _repeticoes
+
+        custos.sort()
+        processos.sort()
+        mais_pesados = sorted(pesados.items(), key=lambda item: item[1], reverse=True)[:3]
+        resultados[nome] = {
+            "repeticoes": _repeticoes,
+            "ops_por_segundo": 1000 / percentil(processos, 0.5) if processos else 0.0,
+            "p50_ms": percentil(custos, 0.50),
+            "p95_ms": percentil(custos, 0.95),
+            "p99_ms": percentil(custos, 0.99),
+            "max_ms": custos[-1],
+            "processo_p50_ms": percentil(processos, 0.50),
+            "mais_pesados": [[modulo, round(ms, 2)] for modulo, ms in mais_pesados]
+        }
+        descricao = ", ".join(f"{modulo} {ms:.1f}" for modulo, ms in mais_pesados)
+        print(f"{nome:<36}{resultados[nome]['p50_ms']:>11.1f}{resultados[nome]['p95_ms']:>10.1f}{resultados[nome]['processo_p50_ms']:>13.1f}  {descricao}")
+
+    return resultados
+
+# ==========================================================
+#   CARGA NO SERVIÇO HTTP
+# ==========================================================
+
+# (peso, rota) — leitura predominante, como num painel consultando o cadastro
+MISTURA_CARGA_HTTP = (
+    (60, "GET /empresas/{id}"),
+    (15, "GET /empresas?limite=20"),
+    (10, "PATCH /empresas/{id}"),
+    (10, "POST /empresas"),
+    (5, "GET /busca")
+)
+
+def montar_requisicao_http(_rota: str, _aleatorio: random.Random, _quantidade: int) -> bytes:
+    id_empresa = _aleatorio.randint(1, _quantidade)
+    corpo = b""
+    match _rota:
+        case "GET /empresas/{id}":
+            linha = f"GET /empresas/{id_empresa}"
+        case "GET /empresas?limite=20":
+            linha = f"GET /empresas?depois={id_empresa}&limite=20"
+        case "PATCH /empresas/{id}":
+            linha = f"PATCH /empresas/{id_empresa}"
+            corpo = json.dumps({"cidade": _aleatorio.choice(("Recife", "Curitiba", "Manaus")), "numero": id_empresa % 999 + 1}).encode()
+        case "POST /empresas":
+            linha = "POST /empresas"
+            corpo = json.dumps({
+                "login": f"carga{id_empresa}", "senha": "123", "nm_empresa": f"Empresa Carga {id_empresa}",
+                "cnpj_empresa": "11222333000181", "email_empresa": f"carga{id_empresa}@levelup.com",
+                "cep": "01310100", "estado": "SP", "cidade": "São Paulo", "bairro": "Bela Vista",
+                "rua": "Av. Paulista", "numero": str(id_empresa % 999 + 1)
+            }).encode()
+        case _:
+            linha = f"GET /busca?q={_aleatorio.choice(('Tech', 'Silva', 'Norte', 'Digital'))}"
+    return (
+        f"{linha} HTTP/1.1\r\nHost: benchmark\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(corpo)}\r\n\r\n"
+    ).encode() + corpo
+
+async def ler_resposta_http(_leitor: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Lê uma resposta HTTP/1.1 com Content-Length ou chunked; retorna (status, corpo)."""
+    status = int((await _leitor.readline()).split()[1])
+    cabecalhos = {}
+    while (linha := await _leitor.readline()) not in (b"\r\n", b""):
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+
+    if cabecalhos.get("transfer-encoding") == "chunked":
+        partes = []
+        while (tamanho := int((await _leitor.readline()).strip(), 16)):
+            partes.append(await _leitor.readexactly(tamanho + 2))
+        await _leitor.readline()
+        return status, b"".join(parte[:-2] for parte in partes)
+
+    return status, await _leitor.readexactly(int(cabecalhos.get("content-length", "0")))
+
+async def cliente_carga_http(_porta: int, _limite: float, _aleatorio: random.Random, _quantidade: int, _latencias: dict, _erros: dict) -> None:
+    """Um cliente com conexão keep-alive repetindo requisições da mistura até o tempo acabar."""
+    pesos = [peso for peso, _ in MISTURA_CARGA_HTTP]
+    rotas = [rota for _, rota in MISTURA_CARGA_HTTP]
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", _porta)
+    try:
+        while time.perf_counter() < _limite:
+            rota = _aleatorio.choices(rotas, pesos)[0]
+            inicio = time.perf_counter()
+            escritor.write(montar_requisicao_http(rota, _aleatorio, _quantidade))
+            status, _ = await ler_resposta_http(leitor)
+            _latencias[rota].append(time.perf_counter() - inicio)
+            if status >= 500:  # 404 é esperado no PATCH de empresa já excluída; 5xx não
+                _erros[rota] += 1
+    finally:
+        escritor.close()
+
+async def gerar_carga_http(_porta: int, _segundos: float, _clientes: int, _quantidade: int) -> tuple[dict, dict, float]:
+    latencias = {rota: [] for _, rota in MISTURA_CARGA_HTTP}
+    erros = {rota: 0 for _, rota in MISTURA_CARGA_HTTP}
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        cliente_carga_http(_porta, inicio + _segundos, random.Random(42 + i), _quantidade, latencias, erros)
+        for i in range(_clientes)
+    ))
+    return latencias, erros, time.perf_counter() - inicio
+
+async def medir_exportacao_http(_porta: int) -> tuple[float, int]:
+    """Um GET /exportar completo (stream chunked): retorna (segundos, bytes)."""
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", _porta)
+    inicio = time.perf_counter()
+    escritor.write(b"GET /exportar HTTP/1.1\r\nHost: benchmark\r\nConnection: close\r\n\r\n")
+    status, corpo = await ler_resposta_http(leitor)
+    escritor.close()
+    if status != 200:
+        raise RuntimeError(f"GET /exportar respondeu {status}")
+    return time.perf_counter() - inicio, len(corpo)
+
+def medir_servico_http(_quantidade: int, _segundos: float, _clientes: int, _conexoes: int) -> dict:
+    """
+    Sobe "python -m levelup servir" num processo separado, sobre uma base local com
+    _quantidade empresas, e mede vazão e latência por rota com _clientes conexões keep-alive.
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory(prefix="levelup_http_") as pasta:
+        caminho = os.path.join(pasta, "levelup.db")
+        criar_base(caminho, _quantidade).close()
+
+        ambiente = {**os.environ, "LEVELUP_DRIVER": "local", "LEVELUP_DSN": caminho}
+        servidor = subprocess.Popen(
+            [sys.executable, "-m", "levelup", "servir", "--porta", "0", "--conexoes", str(_conexoes),
+             "--max-concorrencia", str(max(_clientes, 1)), "--max-fila", str(_clientes * 4)],
+            cwd=PASTA_PROJETO, env=ambiente, stdout=subprocess.PIPE, text=True
+        )
+        try:
+            linha = servidor.stdout.readline()
+            encontrado = re.search(r":(\d+) ", linha)
+            if not encontrado:
+                raise RuntimeError(f"O serviço não subiu: {linha!r}")
+            porta = int(encontrado.group(1))
+
+            latencias, erros, duracao = asyncio.run(gerar_carga_http(porta, _segundos, _clientes, _quantidade))
+            segundos_exportacao, bytes_exportacao = asyncio.run(medir_exportacao_http(porta))
+        finally:
+            servidor.terminate()
+            servidor.wait(timeout=30)
+
+    total = sum(len(valores) for valores in latencias.values())
+    empresas = f"{_quantidade:,}".replace(",", ".")
+    print(f"\n=== Serviço HTTP ({empresas} empresas, {_clientes} clientes, {_conexoes} conexões, {duracao:.1f}s) ===")
+    print(f"{'rota':<26}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'máx ms':>10}{'erros':>8}")
+
+    todas = sorted(latencia for valores in latencias.values() for latencia in valores)
+    for rota, valores in (*latencias.items(), ("total", todas)):
+        valores.sort()
+        if not valores:
+            continue
+        resultados[rota] = {
+            "repeticoes": len(valores),
+            "ops_por_segundo": len(valores) / duracao,
+            "p50_ms": percentil(valores, 0.50) * 1000,
+            "p95_ms": percentil(valores, 0.95) * 1000,
+            "p99_ms": percentil(valores, 0.99) * 1000,
+            "max_ms": valores[-1] * 1000,
+            "erros": erros.get(rota, sum(erros.values()))
+        }
+        medida = resultados[rota]
+        print(
+            f"{rota:<26}{medida['ops_por_segundo']:>10.1f}{medida['p50_ms']:>10.2f}{medida['p95_ms']:>10.2f}"
+            f"{medida['p99_ms']:>10.2f}{medida['max_ms']:>10.2f}{medida['erros']:>8}"
+        )
+
+    resultados["GET /exportar"] = {
+        "repeticoes": 1,
+        "ops_por_segundo": 1 / segundos_exportacao,
+        "p50_ms": segundos_exportacao * 1000,
+        "p95_ms": segundos_exportacao * 1000,
+        "p99_ms": segundos_exportacao * 1000,
+        "max_ms": segundos_exportacao * 1000,
+        "bytes": bytes_exportacao
+    }
+    print(f"{'GET /exportar (stream)':<26}{bytes_exportacao / 1024 / 1024 / segundos_exportacao:>9.1f} MB/s em {segundos_exportacao:.2f}s ({bytes_exportacao / 1024 / 1024:.1f} MB)")
+    if total and sum(erros.values()):
+        print(f"⚠️  {sum(erros.values())} resposta(s) 5xx durante a carga.")
+    return resultados
+
+# ==========================================================
+#   BASELINE E REGRESSÕES
+# ==========================================================
+
+def carregar_baseline(_caminho: str) -> dict | None:
+    if not os.path.exists(_caminho):
+        return None
+    with open(_caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+def salvar_baseline(_caminho: str, _resultados: dict) -> None:
+    conteudo = {
+        "gerado_em": datetime.now().strftime("%d/%m/%Y %H:%M"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": _resultados
+    }
+    temporario = f"{_caminho}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(conteudo, arquivo, ensure_ascii=False, indent=4)
+    os.replace(temporario, _caminho)
+
+def comparar_com_baseline(_resultados: dict, _baseline: dict, _tolerancia: float) -> list[str]:
+    """
+    Regressão = vazão caiu ou p95 subiu mais que _tolerancia (0.20 = 20%) em relação ao baseline.
+    Casos que não existem no baseline são ignorados.
+    """
+    regressoes = []
+    anteriores = _baseline.get("resultados", {})
+    for tamanho, casos in _resultados.items():
+        for nome, atual in casos.items():
+            anterior = anteriores.get(tamanho, {}).get(nome)
+            if not anterior:
+                continue
+            if anterior["ops_por_segundo"] and atual["ops_por_segundo"] < anterior["ops_por_segundo"] * (1 - _tolerancia):
+                regressoes.append(f"{nome} ({tamanho}): vazão {anterior['ops_por_segundo']:.1f} -> {atual['ops_por_segundo']:.1f} ops/s")
+            if anterior["p95_ms"] and atual["p95_ms"] > anterior["p95_ms"] * (1 + _tolerancia):
+                regressoes.append(f"{nome} ({tamanho}): p95 {anterior['p95_ms']:.3f} -> {atual['p95_ms']:.3f} ms")
+    return regressoes
+
+# ==========================================================
+#   LINHA DE COMANDO
+# ==========================================================
+
+def ler_argumentos(_argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark das funções de CRUD do LevelUp sobre o driver local (SQLite).")
+    parser.add_argument("--tamanhos", default=",".join(str(t) for t in TAMANHOS_PADRAO), help="quantidades de empresas, separadas por vírgula")
+    parser.add_argument("--tempo", type=float, default=2.0, help="segundos de medição por função (padrão 2)")
+    parser.add_argument("--min-repeticoes", type=int, default=3)
+    parser.add_argument("--max-repeticoes", type=int, default=100_000)
+    parser.add_argument("--funcoes", default="", help="mede só estas funções (separadas por vírgula)")
+    parser.add_argument("--importacao", type=int, default=5, help="processos por caso no custo de importação (0 desliga)")
+    parser.add_argument("--carga-http", type=float, default=0, help="segundos de carga no serviço HTTP (0 desliga)")
+    parser.add_argument("--carga-empresas", type=int, default=10_000, help="empresas na base do serviço HTTP")
+    parser.add_argument("--clientes", type=int, default=32, help="conexões keep-alive simultâneas na carga HTTP")
+    parser.add_argument("--conexoes", type=int, default=8, help="tamanho do pool do serviço HTTP")
+    parser.add_argument("--baseline", default=ARQUIVO_BASELINE, help="arquivo de baseline (padrão benchmark_baseline.json)")
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava os resultados como novo baseline")
+    parser.add_argument("--tolerancia", type=float, default=0.20, help="piora aceita antes de acusar regressão (padrão 0.20)")
+    parser.add_argument("--saida", default="", help="também grava os resultados desta execução neste JSON")
+    return parser.parse_args(_argv)
+
+def executar(_argv=None) -> int:
+    argumentos = ler_argumentos(_argv)
+    tamanhos = [int(t.replace("_", "")) for t in argumentos.tamanhos.split(",") if t.strip()]
+    filtro = {f.strip() for f in argumentos.funcoes.split(",") if f.strip()} or None
+
+    resultados = executar_benchmark(tamanhos, argumentos.tempo, argumentos.min_repeticoes, argumentos.max_repeticoes, filtro)
+    if argumentos.importacao > 0:
+        resultados["importacao"] = medir_importacao(argumentos.importacao)
+    if argumentos.carga_http > 0:
+        resultados["servico"] = medir_servico_http(argumentos.carga_empresas, argumentos.carga_http, argumentos.clientes, argumentos.conexoes)
+
+    if argumentos.saida:
+        salvar_baseline(argumentos.saida, resultados)
+
+    if argumentos.salvar_baseline:
+        salvar_baseline(argumentos.baseline, resultados)
+        print(f"\nBaseline gravado em {argumentos.baseline}.")
+        return 0
+
+    baseline = carregar_baseline(argumentos.baseline)
+    if baseline is None:
+        print(f"\nSem baseline em {argumentos.baseline} (use --salvar-baseline para criar).")
+        return 0
+
+    regressoes = comparar_com_baseline(resultados, baseline, argumentos.tolerancia)
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} regressão(ões) acima de {argumentos.tolerancia:.0%} em relação ao baseline de {baseline.get('gerado_em', '?')}:")
+        for regressao in regressoes:
+            print(f"  - {regressao}")
+        return 1
+
+    print(f"\n✅ Sem regressões acima de {argumentos.tolerancia:.0%} em relação ao baseline de {baseline.get('gerado_em', '?')}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(executar())
@@ -0,0 +1,587 @@
+"""
+Gerador de dados sintéticos para o esquema completo do GERAL_1executado.sql.
+
+Produz milhões de registros coerentes (FKs válidas, CNPJ/CPF com dígitos verificadores
+corretos, estados e cidades distribuídos pela população) em lotes, sem montar a base
+inteira na memória. Os lotes podem ir direto para o banco (executemany) ou para arquivos.
+A mesma semente gera sempre os mesmos dados.
+
+Uso:
+    python gerador_dados.py --empresas 100000 --formato csv --saida dados/
+    python gerador_dados.py --empresas 10000 --formato sql --saida carga.sql
+    python gerador_dados.py --empresas 1000000 --formato banco --dsn levelup.db   # driver local (SQLite)
+"""
+
+import os
+import csv
+import sys
+import random
+import argparse
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+# ==========================================================
+#   DÍGITOS VERIFICADORES (CPF E CNPJ)
+# ==========================================================
+
+PESOS_CNPJ_1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+PESOS_CNPJ_2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+def _digito_modulo_11(_digitos: str, _pesos) -> str:
+    resto = sum(int(d) * p for d, p in zip(_digitos, _pesos)) % 11
+    return "0" if resto < 2 else str(11 - resto)
+
+def completar_cnpj(_base_12: str) -> str:
+    """Recebe os 12 primeiros dígitos e devolve os 14 com os dois dígitos verificadores."""
+    primeiro = _digito_modulo_11(_base_12, PESOS_CNPJ_1)
+    return _base_12 + primeiro + _digito_modulo_11(_base_12 + primeiro, PESOS_CNPJ_2)
+
+def completar_cpf(_base_9: str) -> str:
+    """Recebe os 9 primeiros dígitos e devolve os 11 com os dois dígitos verificadores."""
+    primeiro = _digito_modulo_11(_base_9, range(10, 1, -1))
+    return _base_9 + primeiro + _digito_modulo_11(_base_9 + primeiro, range(11, 1, -1))
+
+def cnpj_valido(_texto: str) -> bool:
+    digitos = "".join(c for c in _texto if c.isdigit())
+    return len(digitos) == 14 and len(set(digitos)) > 1 and completar_cnpj(digitos[:12]) == digitos
+
+def cpf_valido(_texto: str) -> bool:
+    digitos = "".join(c for c in _texto if c.isdigit())
+    return len(digitos) == 11 and len(set(digitos)) > 1 and completar_cpf(digitos[:9]) == digitos
+
+def formatar_cnpj(_digitos: str) -> str:
+    return f"{_digitos[0:2]}.{_digitos[2:5]}.{_digitos[5:8]}/{_digitos[8:12]}-{_digitos[12:14]}"
+
+def formatar_cpf(_digitos: str) -> str:
+    return f"{_digitos[0:3]}.{_digitos[3:6]}.{_digitos[6:9]}-{_digitos[9:11]}"
+
+# Multiplicação por um primo (módulo 10^n) embaralha os números sem repetir:
+# cada ID vira uma raiz de CNPJ/CPF diferente, sem precisar guardar um set dos já usados.
+PRIMO_EMBARALHAMENTO = 7_368_787
+
+def raiz_unica(_id: int, _digitos: int, _semente: int) -> str:
+    modulo = 10 ** _digitos
+    return f"{(_id * PRIMO_EMBARALHAMENTO + _semente) % modulo:0{_digitos}d}"
+
+# ==========================================================
+#   DISTRIBUIÇÕES (POPULAÇÃO POR ESTADO E CIDADE)
+# ==========================================================
+
+# estado: (população em milhões - Censo 2022, faixa de CEP, [(cidade, DDD, peso), ...])
+ESTADOS = {
+    "SP": (44.4, (1000, 19999), [("São Paulo", "11", 11.5), ("Guarulhos", "11", 1.3), ("Campinas", "19", 1.1), ("São Bernardo do Campo", "11", 0.8), ("Santo André", "11", 0.7), ("Ribeirão Preto", "16", 0.7), ("Sorocaba", "15", 0.7), ("São José dos Campos", "12", 0.7), ("Santos", "13", 0.4)]),
+    "MG": (20.5, (30000, 39999), [("Belo Horizonte", "31", 2.3), ("Uberlândia", "34", 0.7), ("Contagem", "31", 0.6), ("Juiz de Fora", "32", 0.5), ("Montes Claros", "38", 0.4)]),
+    "RJ": (16.1, (20000, 28999), [("Rio de Janeiro", "21", 6.2), ("São Gonçalo", "21", 0.9), ("Duque de Caxias", "21", 0.8), ("Nova Iguaçu", "21", 0.8), ("Niterói", "21", 0.5)]),
+    "BA": (14.1, (40000, 48999), [("Salvador", "71", 2.4), ("Feira de Santana", "75", 0.6), ("Vitória da Conquista", "77", 0.4), ("Lauro de Freitas", "71", 0.2)]),
+    "PR": (11.4, (80000, 87999), [("Curitiba", "41", 1.8), ("Londrina", "43", 0.6), ("Maringá", "44", 0.4), ("Ponta Grossa", "42", 0.4)]),
+    "RS": (10.9, (90000, 99999), [("Porto Alegre", "51", 1.3), ("Caxias do Sul", "54", 0.5), ("Canoas", "51", 0.3), ("Pelotas", "53", 0.3), ("Santa Maria", "55", 0.3)]),
+    "PE": (9.1, (50000, 56999), [("Recife", "81", 1.5), ("Jaboatão dos Guararapes", "81", 0.6), ("Olinda", "81", 0.4), ("Caruaru", "81", 0.4), ("Petrolina", "87", 0.4)]),
+    "CE": (8.8, (60000, 63999), [("Fortaleza", "85", 2.4), ("Caucaia", "85", 0.4), ("Juazeiro do Norte", "88", 0.3), ("Sobral", "88", 0.2)]),
+    "PA": (8.1, (66000, 68899), [("Belém", "91", 1.3), ("Ananindeua", "91", 0.5), ("Santarém", "93", 0.3), ("Marabá", "94", 0.3)]),
+    "SC": (7.6, (88000, 89999), [("Joinville", "47", 0.6), ("Florianópolis", "48", 0.5), ("Blumenau", "47", 0.4), ("São José", "48", 0.3)]),
+    "GO": (7.1, (72800, 76799), [("Goiânia", "62", 1.4), ("Aparecida de Goiânia", "62", 0.5), ("Anápolis", "62", 0.4)]),
+    "MA": (6.8, (65000, 65999), [("São Luís", "98", 1.0), ("Imperatriz", "99", 0.3), ("Caxias", "99", 0.2)]),
+    "PB": (4.0, (58000, 58999), [("João Pessoa", "83", 0.8), ("Campina Grande", "83", 0.4)]),
+    "AM": (3.9, (69000, 69299), [("Manaus", "92", 2.1), ("Parintins", "92", 0.1), ("Itacoatiara", "92", 0.1), ("Tefé", "97", 0.1)]),
+    "ES": (3.8, (29000, 29999), [("Serra", "27", 0.5), ("Vila Velha", "27", 0.5), ("Vitória", "27", 0.3), ("Cariacica", "27", 0.4)]),
+    "MT": (3.7, (78000, 78899), [("Cuiabá", "65", 0.7), ("Várzea Grande", "65", 0.3), ("Rondonópolis", "66", 0.2)]),
+    "RN": (3.3, (59000, 59999), [("Natal", "84", 0.8), ("Mossoró", "84", 0.3)]),
+    "PI": (3.3, (64000, 64999), [("Teresina", "86", 0.9), ("Parnaíba", "86", 0.2)]),
+    "AL": (3.1, (57000, 57999), [("Maceió", "82", 1.0), ("Arapiraca", "82", 0.2)]),
+    "DF": (2.8, (70000, 72799), [("Brasília", "61", 2.8)]),
+    "MS": (2.8, (79000, 79999), [("Campo Grande", "67", 0.9), ("Dourados", "67", 0.2)]),
+    "SE": (2.2, (49000, 49999), [("Aracaju", "79", 0.6), ("Nossa Senhora do Socorro", "79", 0.2)]),
+    "RO": (1.6, (76800, 76999), [("Porto Velho", "69", 0.5), ("Ji-Paraná", "69", 0.1)]),
+    "TO": (1.5, (77000, 77999), [("Palmas", "63", 0.3), ("Araguaína", "63", 0.2)]),
+    "AC": (0.8, (69900, 69999), [("Rio Branco", "68", 0.4)]),
+    "AP": (0.7, (68900, 68999), [("Macapá", "96", 0.4)]),
+    "RR": (0.6, (69300, 69399), [("Boa Vista", "95", 0.4)])
+}
+
+BAIRROS = ("Centro", "Jardim América", "Vila Nova", "Bela Vista", "Boa Vista", "Santa Cruz", "São José", "Industrial",
+           "Jardim Europa", "Vila Mariana", "Liberdade", "Alto da Glória", "Cidade Nova", "Santo Antônio", "Planalto")
+TIPOS_RUA = ("Rua", "Rua", "Rua", "Avenida", "Travessa", "Alameda")
+NOMES_RUA = ("das Flores", "XV de Novembro", "Sete de Setembro", "Tiradentes", "Getúlio Vargas", "Brasil", "dos Andradas",
+             "Santos Dumont", "Rui Barbosa", "Dom Pedro II", "da Paz", "São João", "Marechal Deodoro", "Paulista", "do Comércio")
+COMPLEMENTOS = (None, None, None, None, "Sala 1", "Apto 12", "Bloco B", "Casa 2", "Loja 3", "Andar 5")
+
+PRENOMES = ("Ana", "Maria", "João", "José", "Pedro", "Lucas", "Gabriel", "Juliana", "Mariana", "Rafael", "Beatriz",
+            "Felipe", "Camila", "Bruno", "Larissa", "Gustavo", "Fernanda", "Carlos", "Amanda", "Thiago", "Letícia", "Paulo")
+SOBRENOMES = ("Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima", "Gomes",
+              "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa")
+
+PREFIXOS_EMPRESA = ("Tech", "Nova", "Global", "Prime", "Alpha", "Brasil", "Inova", "Mega", "Vale", "Horizonte", "Sol", "Atlântico")
+RAMOS_EMPRESA = ("Software", "Logística", "Engenharia", "Alimentos", "Consultoria", "Saúde", "Varejo", "Energia",
+                 "Educação", "Transportes", "Construções", "Serviços")
+SUFIXOS_EMPRESA = ("LTDA", "LTDA", "LTDA", "S.A.", "ME", "EIRELI")
+
+TIPOS_INSTITUICAO = ("Universidade", "Faculdade", "Instituto", "Centro Universitário", "Escola Técnica")
+
+# Mesmas categorias do DML.sql
+CATEGORIAS_EMPRESA = (
+    ("Tecnologia", "Software", "SaaS"), ("Tecnologia", "Hardware", "Fabricação"), ("Varejo", "E-commerce", "Moda"),
+    ("Saúde", "Hospitais", "Geral"), ("Indústria", "Automotiva", "Montadora"), ("Finanças", "Bancos", "Varejo"),
+    ("Consultoria", "RH", "Treinamento"), ("Educação", "Ensino Superior", "Graduação"), ("Logística", "Transporte", "Rodoviário"),
+    ("Energia", "Renováveis", "Solar")
+)
+CATEGORIAS_VAGA = (
+    ("TI", "Desenvolvimento", "Frontend"), ("TI", "Desenvolvimento", "Backend"), ("TI", "Dados", "Ciência de Dados"),
+    ("RH", "Recrutamento", "Técnico"), ("Engenharia", "Civil", "Obras"), ("Engenharia", "Produção", "Processos"),
+    ("Saúde", "Enfermagem", "Hospitalar"), ("Vendas", "Comercial", "B2B"), ("Finanças", "Contabilidade", "Fiscal"),
+    ("Marketing", "Digital", "Mídias Sociais")
+)
+TEMAS_VAGA = ("Desenvolvedor Python", "Analista de Dados", "Engenheiro de Produção", "Técnico de Enfermagem",
+              "Analista de RH", "Executivo de Vendas", "Analista Contábil", "Designer UX", "Analista de Marketing", "Engenheiro Civil")
+NIVEIS_VAGA = ("Estagiário", "Júnior", "Pleno", "Sênior")
+TEMAS_EVENTO = ("Feira de Carreiras", "Hackathon", "Semana de Tecnologia", "Workshop de Currículos", "Recrutamento Rápido",
+                "Palestra de Inovação", "Jornada de Saúde Mental", "Treinamento em Vendas B2B")
+
+def _pesos_acumulados(_pares):
+    itens = [item for item, _ in _pares]
+    return itens, list(accumulate(peso for _, peso in _pares))
+
+ESTADOS_ITENS, ESTADOS_PESOS = _pesos_acumulados([(uf, dados[0]) for uf, dados in ESTADOS.items()])
+CIDADES_POR_ESTADO = {uf: _pesos_acumulados([((cidade, ddd), peso) for cidade, ddd, peso in dados[2]]) for uf, dados in ESTADOS.items()}
+
+# ==========================================================
+#   ESQUEMA (ORDEM DE CARGA, IDENTITY E FKs)
+# ==========================================================
+
+# tabela: (coluna identity ou None, colunas na ordem do INSERT, {coluna FK: tabela referenciada})
+ESQUEMA = {
+    "T_CATEGORIA_EMPRESA": ("id_categoriaEmpresa", ("setor", "subsetor", "segmento"), {}),
+    "T_CATEGORIA_VAGA": ("id_categoria_vaga", ("setor", "subsetor", "segmento"), {}),
+    "T_ENDERECO": ("id_endereco", ("cep", "pais", "estado", "cidade", "bairro", "rua", "numero", "complemento"), {}),
+    "T_LVUP_LOGIN": ("id_login", ("login", "senha", "st_ativo", "id_empresa", "id_instAcademica", "id_pessoa"), {}),
+    "T_INST_ACADEMICA": ("id_instAcademica", ("nm_instAcademica", "st_ativo", "cnpj_inst_academica", "id_endereco", "id_login"),
+                         {"id_endereco": "T_ENDERECO", "id_login": "T_LVUP_LOGIN"}),
+    "T_EMPRESA": ("id_empresa", ("nm_empresa", "cnpj_empresa", "email_empresa", "dt_cadastro", "st_empresa", "id_endereco", "id_login"),
+                  {"id_endereco": "T_ENDERECO", "id_login": "T_LVUP_LOGIN"}),
+    "T_TELEFONE_EMPRESA": ("id_telefoneEmpresa", ("ddi", "ddd", "numero", "st_telefone", "id_empresa"), {"id_empresa": "T_EMPRESA"}),
+    "T_VAGA_EMPRESA": ("id_vagaEmpresa", ("vaga_tema", "des_vaga", "st_vaga"), {}),
+    "EMPRESA_CATEGORIA": (None, ("id_empresa", "id_categoriaEmpresa"),
+                          {"id_empresa": "T_EMPRESA", "id_categoriaEmpresa": "T_CATEGORIA_EMPRESA"}),
+    "EMPRESA_VAGA": (None, ("id_empresa", "id_vagaEmpresa"), {"id_empresa": "T_EMPRESA", "id_vagaEmpresa": "T_VAGA_EMPRESA"}),
+    "VAGA_CATEGORIA": (None, ("id_vagaEmpresa", "id_categoria_vaga"),
+                       {"id_vagaEmpresa": "T_VAGA_EMPRESA", "id_categoria_vaga": "T_CATEGORIA_VAGA"}),
+    "T_LVUP_EVENTO": ("id_evento", ("nm_evento", "descricao_evento", "qt_dias", "dt_inicio_evento", "id_instAcademica", "id_endereco", "id_vagaEmpresa"),
+                      {"id_instAcademica": "T_INST_ACADEMICA", "id_endereco": "T_ENDERECO", "id_vagaEmpresa": "T_VAGA_EMPRESA"}),
+    "T_PESSOA": ("id_pessoa", ("nm_pessoa", "cpf_pessoa", "dt_nascimento", "id_endereco", "id_login"),
+                 {"id_endereco": "T_ENDERECO", "id_login": "T_LVUP_LOGIN"}),
+    "PESSOA_EVENTO": (None, ("id_pessoa", "id_evento"), {"id_pessoa": "T_PESSOA", "id_evento": "T_LVUP_EVENTO"})
+}
+
+# Os IDs de login guardados em T_LVUP_LOGIN apontam para as entidades, mas sem FK no esquema
+REFERENCIAS_LOGIN = {"id_empresa": "T_EMPRESA", "id_instAcademica": "T_INST_ACADEMICA", "id_pessoa": "T_PESSOA"}
+
+# ==========================================================
+#   GERADOR
+# ==========================================================
+
+class GeradorDados:
+    """
+    Gera os registros em lotes (tabela, [linhas]) na ordem em que podem ser carregados:
+    categorias -> instituições -> empresas (com telefones, vagas e M:N) -> eventos -> pessoas.
+
+    Os IDs são atribuídos em sequência a partir de 1 em cada tabela, igual ao IDENTITY de
+    uma tabela recém-criada; as FKs usam esses IDs. Quem carrega em uma base que já tem
+    dados só precisa somar o deslocamento de cada tabela (ver carregar_no_banco()).
+    """
+
+    def __init__(
+        self,
+        _empresas: int,
+        _semente: int = 42,
+        _pessoas: int | None = None,
+        _instituicoes: int | None = None,
+        _eventos: int | None = None,
+        _tamanho_lote: int = 5000,
+        _data_base: datetime = datetime(2025, 1, 1)
+    ):
+        self.empresas = _empresas
+        self.pessoas = 2 * _empresas if _pessoas is None else _pessoas
+        self.instituicoes = max(1, _empresas // 50) if _instituicoes is None else _instituicoes
+        self.eventos = max(1, _empresas // 20) if _eventos is None else _eventos
+        if self.instituicoes == 0:
+            self.eventos = 0
+        self.semente = _semente
+        self.tamanho_lote = max(1, _tamanho_lote)
+        self.data_base = _data_base
+        self.aleatorio = random.Random(_semente)
+        self.proximo_id = {tabela: 1 for tabela in ESQUEMA}
+        self.contagens = {tabela: 0 for tabela in ESQUEMA}
+
+    def _novo_id(self, _tabela: str) -> int:
+        novo = self.proximo_id[_tabela]
+        self.proximo_id[_tabela] = novo + 1
+        return novo
+
+    # ---------- campos ----------
+
+    def _endereco(self) -> dict:
+        aleatorio = self.aleatorio
+        uf = aleatorio.choices(ESTADOS_ITENS, cum_weights=ESTADOS_PESOS)[0]
+        cidades, pesos = CIDADES_POR_ESTADO[uf]
+        cidade, ddd = aleatorio.choices(cidades, cum_weights=pesos)[0]
+        inicio_cep, fim_cep = ESTADOS[uf][1]
+        return {
+            "id_endereco": self._novo_id("T_ENDERECO"),
+            "cep": f"{aleatorio.randint(inicio_cep, fim_cep):05d}-{aleatorio.randint(0, 999):03d}",
+            "pais": "BRA",
+            "estado": uf,
+            "cidade": cidade,
+            "bairro": aleatorio.choice(BAIRROS),
+            "rua": f"{aleatorio.choice(TIPOS_RUA)} {aleatorio.choice(NOMES_RUA)}",
+            "numero": aleatorio.randint(1, 3000),
+            "complemento": aleatorio.choice(COMPLEMENTOS),
+            "_ddd": ddd
+        }
+
+    def _login(self, _login: str, _coluna_dono: str, _id_dono: int) -> dict:
+        linha = {
+            "id_login": self._novo_id("T_LVUP_LOGIN"),
+            "login": _login,
+            "senha": f"{self.aleatorio.getrandbits(48):012x}",
+            "st_ativo": "S" if self.aleatorio.random() < 0.95 else "N",
+            "id_empresa": None,
+            "id_instAcademica": None,
+            "id_pessoa": None
+        }
+        linha[_coluna_dono] = _id_dono
+        return linha
+
+    def _data_anterior(self, _dias_max: int) -> datetime:
+        return self.data_base - timedelta(days=self.aleatorio.randint(0, _dias_max))
+
+    # ---------- blocos por entidade ----------
+
+    def _gerar_categorias(self):
+        for tabela, categorias in (("T_CATEGORIA_EMPRESA", CATEGORIAS_EMPRESA), ("T_CATEGORIA_VAGA", CATEGORIAS_VAGA)):
+            chave = ESQUEMA[tabela][0]
+            yield tabela, [{chave: self._novo_id(tabela), "setor": s, "subsetor": ss, "segmento": sg} for s, ss, sg in categorias]
+
+    def _gerar_instituicoes(self, _quantidade: int) -> dict:
+        lote = {"T_ENDERECO": [], "T_LVUP_LOGIN": [], "T_INST_ACADEMICA": []}
+        for _ in range(_quantidade):
+            id_inst = self._novo_id("T_INST_ACADEMICA")
+            endereco = self._endereco()
+            nome = f"{self.aleatorio.choice(TIPOS_INSTITUICAO)} {endereco['cidade']} {id_inst}"
+            login = self._login(f"inst{id_inst}.adm", "id_instAcademica", id_inst)
+            lote["T_ENDERECO"].append(endereco)
+            lote["T_LVUP_LOGIN"].append(login)
+            lote["T_INST_ACADEMICA"].append({
+                "id_instAcademica": id_inst,
+                "nm_instAcademica": nome,
+                "st_ativo": "S",
+                # a coluna tem 15 posições: só os dígitos
+                "cnpj_inst_academica": completar_cnpj(raiz_unica(id_inst + 50_000_000, 8, self.semente) + "0001"),
+                "id_endereco": endereco["id_endereco"],
+                "id_login": login["id_login"]
+            })
+        return lote
+
+    def _gerar_empresas(self, _quantidade: int) -> dict:
+        aleatorio = self.aleatorio
+        lote = {tabela: [] for tabela in ("T_ENDERECO", "T_LVUP_LOGIN", "T_EMPRESA", "T_TELEFONE_EMPRESA", "T_VAGA_EMPRESA",
+                                          "EMPRESA_CATEGORIA", "EMPRESA_VAGA", "VAGA_CATEGORIA")}
+        total_categorias_empresa = len(CATEGORIAS_EMPRESA)
+        total_categorias_vaga = len(CATEGORIAS_VAGA)
+
+        for _ in range(_quantidade):
+            id_empresa = self._novo_id("T_EMPRESA")
+            endereco = self._endereco()
+            nome = f"{aleatorio.choice(PREFIXOS_EMPRESA)} {aleatorio.choice(RAMOS_EMPRESA)} {id_empresa} {aleatorio.choice(SUFIXOS_EMPRESA)}"
+            dominio = f"empresa{id_empresa}.com.br"
+            login = self._login(f"adm@{dominio}", "id_empresa", id_empresa)
+            filial = "0001" if aleatorio.random() < 0.9 else f"{aleatorio.randint(2, 30):04d}"
+
+            lote["T_ENDERECO"].append(endereco)
+            lote["T_LVUP_LOGIN"].append(login)
+            lote["T_EMPRESA"].append({
+                "id_empresa": id_empresa,
+                "nm_empresa": nome,
+                "cnpj_empresa": formatar_cnpj(completar_cnpj(raiz_unica(id_empresa, 8, self.semente) + filial)),
+                "email_empresa": f"contato@{dominio}",
+                "dt_cadastro": self._data_anterior(3650),
+                "st_empresa": "A" if aleatorio.random() < 0.9 else "I",
+                "id_endereco": endereco["id_endereco"],
+                "id_login": login["id_login"]
+            })
+
+            for _ in range(aleatorio.choices((1, 2, 3), cum_weights=(60, 90, 100))[0]):
+                celular = aleatorio.random() < 0.6
+                numero = f"9{aleatorio.randint(1000, 9999)}-{aleatorio.randint(0, 9999):04d}" if celular else f"{aleatorio.randint(2000, 5999)}-{aleatorio.randint(0, 9999):04d}"
+                lote["T_TELEFONE_EMPRESA"].append({
+                    "id_telefoneEmpresa": self._novo_id("T_TELEFONE_EMPRESA"),
+                    "ddi": "55", "ddd": endereco["_ddd"], "numero": numero,
+                    "st_telefone": "C" if celular else "F", "id_empresa": id_empresa
+                })
+
+            for id_categoria in aleatorio.sample(range(1, total_categorias_empresa + 1), aleatorio.randint(1, 2)):
+                lote["EMPRESA_CATEGORIA"].append({"id_empresa": id_empresa, "id_categoriaEmpresa": id_categoria})
+
+            for _ in range(aleatorio.choices((0, 1, 2, 3), cum_weights=(30, 70, 90, 100))[0]):
+                id_vaga = self._novo_id("T_VAGA_EMPRESA")
+                tema = aleatorio.choice(TEMAS_VAGA)
+                lote["T_VAGA_EMPRESA"].append({
+                    "id_vagaEmpresa": id_vaga,
+                    "vaga_tema": f"{tema} {aleatorio.choice(NIVEIS_VAGA)}",
+                    "des_vaga": f"Vaga de {tema.lower()} em {endereco['cidade']}/{endereco['estado']}.",
+                    "st_vaga": "A" if aleatorio.random() < 0.8 else "F"
+                })
+                lote["EMPRESA_VAGA"].append({"id_empresa": id_empresa, "id_vagaEmpresa": id_vaga})
+                lote["VAGA_CATEGORIA"].append({"id_vagaEmpresa": id_vaga, "id_categoria_vaga": aleatorio.randint(1, total_categorias_vaga)})
+        return lote
+
+    def _gerar_eventos(self, _quantidade: int) -> dict:
+        aleatorio = self.aleatorio
+        total_vagas = self.proximo_id["T_VAGA_EMPRESA"] - 1
+        total_instituicoes = self.proximo_id["T_INST_ACADEMICA"] - 1
+        lote = {"T_ENDERECO": [], "T_LVUP_EVENTO": []}
+        for _ in range(_quantidade):
+            endereco = self._endereco()
+            tema = aleatorio.choice(TEMAS_EVENTO)
+            lote["T_ENDERECO"].append(endereco)
+            lote["T_LVUP_EVENTO"].append({
+                "id_evento": self._novo_id("T_LVUP_EVENTO"),
+                "nm_evento": f"{tema} {endereco['cidade']}",
+                "descricao_evento": f"{tema} aberto a alunos e empresas da região de {endereco['cidade']}.",
+                "qt_dias": aleatorio.choices((1, 2, 3, 5), cum_weights=(50, 75, 95, 100))[0],
+                "dt_inicio_evento": self.data_base + timedelta(days=aleatorio.randint(-365, 365)),
+                "id_instAcademica": aleatorio.randint(1, total_instituicoes),
+                "id_endereco": endereco["id_endereco"],
+                "id_vagaEmpresa": aleatorio.randint(1, total_vagas) if total_vagas and aleatorio.random() < 0.6 else None
+            })
+        return lote
+
+    def _gerar_pessoas(self, _quantidade: int) -> dict:
+        aleatorio = self.aleatorio
+        total_eventos = self.proximo_id["T_LVUP_EVENTO"] - 1
+        lote = {"T_ENDERECO": [], "T_LVUP_LOGIN": [], "T_PESSOA": [], "PESSOA_EVENTO": []}
+        for _ in range(_quantidade):
+            id_pessoa = self._novo_id("T_PESSOA")
+            endereco = self._endereco()
+            prenome = aleatorio.choice(PRENOMES)
+            sobrenome = aleatorio.choice(SOBRENOMES)
+            login = self._login(f"{prenome.lower()}.{sobrenome.lower()}{id_pessoa}", "id_pessoa", id_pessoa)
+            lote["T_ENDERECO"].append(endereco)
+            lote["T_LVUP_LOGIN"].append(login)
+            lote["T_PESSOA"].append({
+                "id_pessoa": id_pessoa,
+                "nm_pessoa": f"{prenome} {aleatorio.choice(SOBRENOMES)} {sobrenome}",
+                "cpf_pessoa": formatar_cpf(completar_cpf(raiz_unica(id_pessoa, 9, self.semente))),
+                "dt_nascimento": self.data_base - timedelta(days=aleatorio.randint(16 * 365, 60 * 365)),
+                "id_endereco": endereco["id_endereco"],
+                "id_login": login["id_login"]
+            })
+            if total_eventos:
+                quantidade_eventos = aleatorio.choices((0, 1, 2, 3), cum_weights=(40, 75, 92, 100))[0]
+                for id_evento in set(aleatorio.randint(1, total_eventos) for _ in range(quantidade_eventos)):
+                    lote["PESSOA_EVENTO"].append({"id_pessoa": id_pessoa, "id_evento": id_evento})
+        return lote
+
+    # ---------- pipeline ----------
+
+    def _em_lotes(self, _total: int, _gerar):
+        for inicio in range(0, _total, self.tamanho_lote):
+            for tabela, linhas in _gerar(min(self.tamanho_lote, _total - inicio)).items():
+                if linhas:
+                    yield tabela, linhas
+
+    def lotes(self):
+        """Gera (tabela, linhas) respeitando as FKs: cada lote só referencia IDs de lotes anteriores."""
+        for tabela, linhas in self._gerar_categorias():
+            self.contagens[tabela] += len(linhas)
+            yield tabela, linhas
+
+        etapas = (
+            (self.instituicoes, self._gerar_instituicoes),
+            (self.empresas, self._gerar_empresas),
+            (self.eventos, self._gerar_eventos),
+            (self.pessoas, self._gerar_pessoas)
+        )
+        for total, gerar in etapas:
+            for tabela, linhas in self._em_lotes(total, gerar):
+                self.contagens[tabela] += len(linhas)
+                yield tabela, linhas
+
+# ==========================================================
+#   DESTINOS (BANCO, CSV, SQL)
+# ==========================================================
+
+def _valores_linha(_tabela: str, _linha: dict, _com_id: bool) -> dict:
+    identidade, colunas, _ = ESQUEMA[_tabela]
+    valores = {coluna: _linha[coluna] for coluna in colunas}
+    if _com_id and identidade:
+        valores[identidade] = _linha[identidade]
+    return valores
+
+def montar_insert_carga(_tabela: str, _com_id: bool) -> str:
+    identidade, colunas, _ = ESQUEMA[_tabela]
+    if _com_id and identidade:
+        colunas = (identidade, *colunas)
+    retorno = f" RETURNING {identidade} INTO :{identidade}" if identidade and not _com_id else ""
+    return f"INSERT INTO {_tabela} ({', '.join(colunas)}) VALUES ({', '.join(':' + c for c in colunas)}){retorno}"
+
+def carregar_no_banco(_conexao, _lotes, _ids_explicitos: bool = False, _commit_a_cada: int = 50_000) -> tuple[bool, any]:
+    """
+    Carrega os lotes com executemany (uma ida ao banco por lote e tabela).
+
+    _ids_explicitos=True grava os IDs gerados (driver local / tabelas sem GENERATED ALWAYS).
+    Sem isso, os IDs ficam com o IDENTITY: cada INSERT devolve os IDs por RETURNING INTO,
+    e a diferença para os IDs do gerador (base com dados anteriores) é somada nas FKs
+    dos lotes seguintes. IDs fora de sequência interrompem a carga. Os IDs de dono em
+    T_LVUP_LOGIN (sem FK) só ficam exatos quando a base começa vazia.
+    Retorna (True, {tabela: linhas}) ou (False, erro)
+    """
+    try:
+        deslocamento = {tabela: 0 for tabela in ESQUEMA}
+        contagens = {tabela: 0 for tabela in ESQUEMA}
+        pendentes = 0
+        cur = _conexao.cursor()
+
+        for tabela, linhas in _lotes:
+            identidade, _, fks = ESQUEMA[tabela]
+            referencias = {**fks, **(REFERENCIAS_LOGIN if tabela == "T_LVUP_LOGIN" else {})}
+            valores = []
+            for linha in linhas:
+                registro = _valores_linha(tabela, linha, _ids_explicitos)
+                for coluna, referenciada in referencias.items():
+                    if registro[coluna] is not None and deslocamento[referenciada]:
+                        registro[coluna] += deslocamento[referenciada]
+                valores.append(registro)
+
+            comando_sql = montar_insert_carga(tabela, _ids_explicitos)
+            if identidade and not _ids_explicitos:
+                ids = cur.var(int, arraysize=len(valores))
+                cur.setinputsizes(**{identidade: ids})
+                cur.executemany(comando_sql, valores)
+                gerados = [ids.getvalue(i)[0] for i in range(len(valores))]
+                esperado = gerados[0] - linhas[0][identidade]
+                if (contagens[tabela] and esperado != deslocamento[tabela]) or gerados[-1] - gerados[0] != len(gerados) - 1:
+                    raise RuntimeError(f"IDs de {tabela} gerados fora de sequência; use uma base recém-criada ou _ids_explicitos=True.")
+                deslocamento[tabela] = esperado
+            else:
+                cur.executemany(comando_sql, valores)
+
+            contagens[tabela] += len(valores)
+            pendentes += len(valores)
+            if pendentes >= _commit_a_cada:
+                _conexao.commit()
+                pendentes = 0
+
+        _conexao.commit()
+        cur.close()
+        return (True, contagens)
+
+    except Exception as e:
+        _conexao.rollback()
+        return (False, e)
+
+def _formatar_csv(_valor):
+    if isinstance(_valor, datetime):
+        return _valor.strftime("%d/%m/%Y")
+    return "" if _valor is None else _valor
+
+def gravar_csv(_pasta: str, _lotes) -> tuple[bool, any]:
+    """Grava um CSV por tabela (com cabeçalho, datas DD/MM/AAAA), escrevendo lote a lote."""
+    arquivos = {}
+    try:
+        os.makedirs(_pasta, exist_ok=True)
+        escritores = {}
+        contagens = {}
+        for tabela, linhas in _lotes:
+            if tabela not in escritores:
+                identidade, colunas, _ = ESQUEMA[tabela]
+                cabecalho = (identidade, *colunas) if identidade else colunas
+                arquivos[tabela] = open(os.path.join(_pasta, f"{tabela}.csv"), "w", encoding="utf-8", newline="")
+                escritores[tabela] = (csv.writer(arquivos[tabela]), cabecalho)
+                escritores[tabela][0].writerow(cabecalho)
+                contagens[tabela] = 0
+            escritor, cabecalho = escritores[tabela]
+            escritor.writerows([_formatar_csv(linha[coluna]) for coluna in cabecalho] for linha in linhas)
+            contagens[tabela] += len(linhas)
+        return (True, contagens)
+    except Exception as e:
+        return (False, e)
+    finally:
+        for arquivo in arquivos.values():
+            arquivo.close()
+
+def _literal_sql(_valor) -> str:
+    if _valor is None:
+        return "NULL"
+    if isinstance(_valor, datetime):
+        return f"DATE '{_valor:%Y-%m-%d}'"
+    if isinstance(_valor, int):
+        return str(_valor)
+    return "'" + str(_valor).replace("'", "''") + "'"
+
+def gravar_sql(_caminho: str, _lotes) -> tuple[bool, any]:
+    """
+    Grava um script de INSERTs no formato do DML.sql (sem as colunas IDENTITY, que o Oracle gera).
+    Os IDs das FKs batem com o IDENTITY quando o script roda logo após o GERAL_1executado.sql.
+    """
+    try:
+        contagens = {}
+        with open(_caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write("-- Gerado por gerador_dados.py: executar logo após o GERAL_1executado.sql\n")
+            for tabela, linhas in _lotes:
+                _, colunas, _ = ESQUEMA[tabela]
+                prefixo = f"INSERT INTO {tabela} ({', '.join(colunas)}) VALUES ("
+                arquivo.writelines(f"{prefixo}{', '.join(_literal_sql(linha[c]) for c in colunas)});\n" for linha in linhas)
+                arquivo.write("COMMIT;\n")
+                contagens[tabela] = contagens.get(tabela, 0) + len(linhas)
+        return (True, contagens)
+    except Exception as e:
+        return (False, e)
+
+# ==========================================================
+#   LINHA DE COMANDO
+# ==========================================================
+
+def ler_argumentos(_argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos para o esquema LEVEL UP.")
+    parser.add_argument("--empresas", type=int, default=10_000)
+    parser.add_argument("--pessoas", type=int, default=None, help="padrão: 2 por empresa")
+    parser.add_argument("--instituicoes", type=int, default=None, help="padrão: 1 a cada 50 empresas")
+    parser.add_argument("--eventos", type=int, default=None, help="padrão: 1 a cada 20 empresas")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--lote", type=int, default=5000, help="entidades por lote")
+    parser.add_argument("--formato", choices=("csv", "sql", "banco"), default="csv")
+    parser.add_argument("--saida", default="dados_sinteticos", help="pasta (csv) ou arquivo (sql)")
+    parser.add_argument("--dsn", default="levelup_local.db", help="arquivo SQLite do driver local (formato banco)")
+    return parser.parse_args(_argv)
+
+def executar(_argv=None) -> int:
+    argumentos = ler_argumentos(_argv)
+    gerador = GeradorDados(
+        argumentos.empresas, argumentos.semente, argumentos.pessoas, argumentos.instituicoes, argumentos.eventos, argumentos.lote
+    )
+    inicio = datetime.now()
+
+    if argumentos.formato == "csv":
+        ok, resultado = gravar_csv(argumentos.saida, gerador.lotes())
+    elif argumentos.formato == "sql":
+        ok, resultado = gravar_sql(argumentos.saida, gerador.lotes())
+    else:
+        from levelup import oracledb_local
+        conexao = oracledb_local.connect(dsn=argumentos.dsn)
+        oracledb_local.executar_script(conexao, os.path.join(os.path.dirname(os.path.abspath(__file__)), "GERAL_1executado.sql"))
+        ok, resultado = carregar_no_banco(conexao, gerador.lotes(), _ids_explicitos=True)
+        conexao.close()
+
+    if not ok:
+        print(f"❌ Erro ao gerar os dados: {resultado}")
+        return 1
+
+    segundos = (datetime.now() - inicio).total_seconds()
+    total = sum(resultado.values())
+    for tabela, quantidade in resultado.items():
+        if quantidade:
+            print(f"{tabela:<22}{quantidade:>12}")
+    print(f"\n✅ {total} linhas em {segundos:.1f}s ({total / segundos if segundos else 0:.0f} linhas/s).")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(executar())
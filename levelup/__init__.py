@@ -0,0 +1,118 @@
+"""
+LEVEL UP - Portal de Empresas e Demandas.
+
+O pacote pode ser importado sem efeitos colaterais: nada conecta ao banco e o menu só
+abre com "python -m levelup" (com um subcomando, ex. "python -m levelup consultar --id 1",
+roda a linha de comando não interativa). Os nomes públicos ficam disponíveis direto no pacote
+(levelup.insert_empresa, levelup.select_empresa_por_id, ...), mas cada módulo só é
+importado no primeiro acesso a um nome dele; oracledb, requests e pyarrow só carregam
+quando a função que precisa deles é chamada.
+"""
+
+import importlib
+
+# módulo -> nomes públicos exportados pelo pacote
+# (indice_busca e _indice_cep são reatribuídos em tempo de execução: use levelup.busca.indice_busca)
+_EXPORTACOES = {
+    "terminal": (
+        "limpar_terminal", "exibir_titulo_centralizado", "imprimir_linha_separadora", "obter_int",
+        "obter_float", "obter_texto", "obter_data", "obter_data_hora", "obter_sim_nao",
+        "obter_int_intervalado", "obter_opcao_dict", "obter_multiplas_opcoes_dict", "obter_lista_ids",
+        "imprimir_lista_como_tabela", "imprimir_lista_simples"
+    ),
+    "validacao": (
+        "obter_email", "obter_m_f", "obter_cpf", "obter_cnpj", "normalizar_cnpj", "normalizar_cep",
+        "validar_email", "obter_rg"
+    ),
+    "metricas": (
+        "ATIVAR_METRICAS", "ARQUIVO_METRICAS", "LIMITES_LATENCIA", "MetricaFuncao", "Metricas", "metricas",
+        "instrumentar", "tamanho_arquivo_do_argumento"
+    ),
+    "cep": (
+        "ARQUIVO_CACHE_CEP", "TTL_CEP_ENCONTRADO", "TTL_CEP_NAO_ENCONTRADO", "CacheCep", "cache_cep",
+        "ARQUIVO_INDICE_CEP", "MODO_INDICE_CEP", "IndiceCep", "construir_indice_cep", "obter_indice_cep",
+        "URL_VIACEP", "consultar_viacep", "buscar_endereco_por_cep", "LimitadorTaxa", "resolver_ceps_em_lote"
+    ),
+    "formularios": (
+        "obter_endereco", "obter_cep", "obter_rua", "obter_bairro", "obter_cidade", "obter_estado",
+        "obter_pais", "solicitar_dados_endereco", "solicitar_dados_t_lvup_login", "solicitar_dados_t_empresa",
+        "solicitar_alteracao_empresa"
+    ),
+    "driver": (
+        "DRIVER_LOCAL", "obter_driver"
+    ),
+    "conexao": (
+        "conectar_oracledb", "criar_pool_oracledb", "adquirir_conexao", "liberar_conexao", "usar_conexao",
+        "dsn_sistema", "abrir_pool_sistema", "inicializar_base_local", "PoolLocal", "criar_pool_local", "medir_aquisicao_pool"
+    ),
+    "sentencas": (
+        "IDENTIFICADOR_SQL", "CAPACIDADE_REGISTRO_SQL", "RegistroSql", "registro_sql", "validar_identificadores_sql",
+        "montar_update_campo", "COLUNAS_SECRETAS", "COLUNAS_RESULTADO_BUSCA", "montar_busca_generica", "pre_montar_sentencas"
+    ),
+    "cadastro": (
+        "SQL_INSERT_ENDERECO", "SQL_INSERT_LVUP_LOGIN", "SQL_INSERT_EMPRESA", "insert_endereco",
+        "insert_lvup_login", "insert_empresa", "cadastrar_empresa_completa"
+    ),
+    "consultas": (
+        "COLUNAS_EMPRESA_COMPLETA", "FORMATOS_LINHA", "criar_classe_registro", "RegistroEmpresa",
+        "definir_fabrica_linhas", "CAPACIDADE_CACHE_EMPRESAS", "TTL_CACHE_EMPRESAS", "CacheEmpresas",
+        "cache_empresas", "SQL_SELECT_EMPRESA_COMPLETA", "SQL_EMPRESA_POR_ID", "SQL_TODAS_EMPRESAS",
+        "SQL_PAGINA_EMPRESAS", "SQL_PREVIEW_EMPRESAS", "select_empresa_por_id", "select_todas_empresas_completas",
+        "select_pagina_empresas", "select_para_preview", "INTERVALO_RECARGA_PREVIEW", "LIMITE_ALTERACOES_PREVIEW", "ListaPreviewEmpresas",
+        "lista_preview_empresas"
+    ),
+    "busca": (
+        "select_para_generico", "padrao_like_para_regex", "sem_colunas_secretas", "marcar_colunas_encontradas",
+        "select_para_generico_por_tabela",
+        "TABELAS_COLUNAS_BUSCA", "CHAVES_PRIMARIAS", "normalizar_texto_busca", "gerar_trigramas",
+        "IndiceTrigramas", "construir_indice_busca", "notificar_indice_busca",
+        "buscar_no_indice"
+    ),
+    "alteracao": (
+        "SQL_UPDATE_CEP_COMPLETO", "atualizar_dados_empresa_por_id", "CAMPOS_ATUALIZACAO_PARCIAL",
+        "TIPOS_RETORNO_PARCIAL", "TIPOS_SQL_PARCIAL", "colunas_retorno_parcial", "montar_update_parcial",
+        "binds_update_parcial", "validar_alteracoes_empresa", "atualizar_empresa_parcial"
+    ),
+    "exclusao": (
+        "SQL_RELACIONADOS_EMPRESA", "SQL_EXCLUIR_EMPRESA", "SQL_EXCLUIR_LOGIN", "SQL_EXCLUIR_ENDERECO",
+        "excluir_empresa_por_id", "TABELAS_DEPENDENTES_EMPRESA", "contar_exclusao_empresas",
+        "excluir_empresas_em_lote"
+    ),
+    "exportacao": (
+        "exportar_para_json", "SQL_EMPRESAS_COMPLETAS", "formatar_valor_json", "exportar_consulta_streaming",
+        "ESQUEMA_SNAPSHOT_EMPRESAS", "ASSINATURA_LVCOL", "EPOCA_SNAPSHOT", "ColunaSnapshot",
+        "SnapshotColunar", "FORMATOS_SNAPSHOT", "carregar_pyarrow", "exportar_snapshot_colunar", "carregar_snapshot_colunar"
+    ),
+    "importacao": (
+        "COLUNAS_OBRIGATORIAS_IMPORTACAO", "ler_arquivo_em_lotes", "validar_linha_importacao",
+        "executar_lote_com_retorno", "inserir_lote_empresas", "importar_empresas_arquivo"
+    ),
+    "assincrono": (
+        "conectar_oracledb_async", "criar_pool_oracledb_async", "abrir_pool_sistema_async",
+        "usar_conexao_async", "executar_concorrentes", "insert_endereco_async", "insert_lvup_login_async",
+        "insert_empresa_async", "select_empresa_por_id_async", "select_todas_empresas_completas_async",
+        "select_pagina_empresas_async", "select_para_preview_async", "select_para_generico_async",
+        "atualizar_empresa_parcial_async", "excluir_empresa_por_id_async"
+    ),
+    "menu": (
+        "executar_sistema",
+    ),
+    "cli": (
+        "executar_cli",
+    ),
+}
+
+_MODULO_DO_NOME = {nome: modulo for modulo, nomes in _EXPORTACOES.items() for nome in nomes}
+
+__all__ = sorted(_MODULO_DO_NOME)
+
+def __getattr__(_nome: str):
+    modulo = _MODULO_DO_NOME.get(_nome)
+    if modulo is None:
+        raise AttributeError(f"module 'levelup' has no attribute '{_nome}'")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), _nome)
+    globals()[_nome] = valor  # próximos acessos não passam mais por aqui
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
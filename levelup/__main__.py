@@ -0,0 +1,11 @@
+"""Ponto de entrada do sistema: python -m levelup (menu) ou python -m levelup <subcomando> (linha de comando)."""
+
+import sys
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from .cli import executar_cli
+        sys.exit(executar_cli(sys.argv[1:]))
+
+    from .menu import executar_sistema
+    executar_sistema()
@@ -0,0 +1,501 @@
+"""UPDATEs de empresa: um campo por vez (menu) ou vários campos de uma vez (parcial)."""
+
+from __future__ import annotations
+
+from datetime import datetime, date
+from typing import TYPE_CHECKING
+
+from .terminal import obter_int, obter_sim_nao, obter_texto
+from .validacao import normalizar_cep, normalizar_cnpj, obter_cnpj, obter_email, validar_email
+from .metricas import instrumentar
+from .formularios import obter_endereco
+from .conexao import usar_conexao
+from .sentencas import montar_update_campo, registro_sql
+from .consultas import cache_empresas, lista_preview_empresas, select_empresa_por_id
+from .busca import CHAVES_PRIMARIAS, notificar_indice_busca
+
+if TYPE_CHECKING:
+    import oracledb
+
+# ========= UPDATE POR ID =========
+SQL_UPDATE_CEP_COMPLETO = """
+    UPDATE T_ENDERECO
+    SET cep = :cep, pais = :pais, estado = :estado, cidade = :cidade, bairro = :bairro, rua = :rua
+    WHERE id_endereco = :id_endereco
+"""
+
+def atualizar_dados_empresa_por_id(_conexao: oracledb.Connection, _index: int, id_empresa: int) -> tuple[bool, any]:
+    """
+    Atualiza os dados de uma empresa pelo ID e pelo índice de campo escolhido.
+    index = 1..16 conforme os campos:
+    1 - ID (não editável)
+    2 - Nome da empresa
+    3 - CNPJ
+    4 - E-mail
+    5 - Data de cadastro
+    6 - Status da empresa
+    7 - Login
+    8 - Status do login
+    9 - CEP
+    10 - País
+    11 - Estado
+    12 - Cidade
+    13 - Bairro
+    14 - Rua
+    15 - Número
+    16 - Complemento
+
+    Retorno:
+        (True, dados_atualizados) ou (False, erro)
+    """
+    try:
+        with usar_conexao(_conexao) as conexao:
+            # Recupera os dados atuais da empresa
+            ok, dados_empresa = select_empresa_por_id(conexao, id_empresa)
+            if not ok or not dados_empresa:
+                return False, "Empresa não encontrada ou erro ao consultar."
+            dados_empresa = dados_empresa[0]  # pega o primeiro registro (único ID)
+
+            # Buscar IDs relacionados
+            cur = conexao.cursor()
+
+            # Busca id_login e id_endereco da empresa
+            cur.execute("""
+                SELECT id_login, id_endereco 
+                FROM T_EMPRESA 
+                WHERE id_empresa = :id_empresa
+            """, {"id_empresa": id_empresa})
+
+            resultado = cur.fetchone()
+            if not resultado:
+                cur.close()
+                return False, "IDs relacionados não encontrados."
+
+            id_login, id_endereco = resultado
+            dados_empresa["id_login"] = id_login
+            dados_empresa["id_endereco"] = id_endereco
+
+            cur.close()
+
+        # Atualiza o campo escolhido
+        novo_valor = None
+        campo_nome = ""
+
+        match _index:
+            case 1:
+                return False, "Não é possível atualizar o ID."
+            case 2:
+                campo_nome = "Nome da Empresa"
+                novo_valor = obter_texto("Novo nome da empresa: ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["nm_empresa"] = novo_valor
+            case 3:
+                campo_nome = "CNPJ"
+                novo_valor = obter_cnpj("Novo CNPJ da empresa (ex: 00.000.000/0000-00): ", "Entrada inválida. Digite um CNPJ com 14 números.")
+                dados_empresa["cnpj_empresa"] = novo_valor
+            case 4:
+                campo_nome = "E-mail"
+                novo_valor = obter_email("Novo e-mail da empresa: ", "Formato de e-mail incorreto. Digite um e-mail válido.")
+                dados_empresa["email_empresa"] = novo_valor
+            case 5:
+                campo_nome = "Data de Cadastro"
+                novo_valor = datetime.now()
+                dados_empresa["dt_cadastro"] = novo_valor
+            case 6:
+                campo_nome = "Status da Empresa"
+                novo_valor = "A" if obter_sim_nao("Empresa está ativa? (S/N): ", "Entrada inválida! Digite 'S' para Sim ou 'N' para Não.") else "I"
+                dados_empresa["st_empresa"] = novo_valor
+            case 7:
+                campo_nome = "Login"
+                novo_valor = obter_texto("Novo login: ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["login"] = novo_valor
+            case 8:
+                campo_nome = "Status do Login"
+                novo_valor = "S" if obter_sim_nao("Login está ativo? (S/N): ", "Entrada inválida! Digite 'S' para Sim ou 'N' para Não.") else "N"
+                dados_empresa["st_login"] = novo_valor
+            case 9:
+                campo_nome = "CEP"
+                endereco = obter_endereco("Novo CEP (ex: 01310200): ", "CEP inválido! Digite um CEP com 8 números.")
+                novo_valor = endereco["cep"]
+                dados_empresa["cep"] = novo_valor
+                # Atualiza também outros campos do endereço se CEP mudar
+                dados_empresa["pais"] = endereco.get("pais", "BRA")
+                dados_empresa["estado"] = endereco.get("estado", "")
+                dados_empresa["cidade"] = endereco.get("cidade", "")
+                dados_empresa["bairro"] = endereco.get("bairro", "")
+                dados_empresa["rua"] = endereco.get("logradouro", "")
+            case 10:
+                campo_nome = "País"
+                novo_valor = obter_texto("Novo país (ex: BRA): ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["pais"] = novo_valor
+            case 11:
+                campo_nome = "Estado"
+                novo_valor = obter_texto("Novo estado (ex: SP): ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["estado"] = novo_valor
+            case 12:
+                campo_nome = "Cidade"
+                novo_valor = obter_texto("Nova cidade: ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["cidade"] = novo_valor
+            case 13:
+                campo_nome = "Bairro"
+                novo_valor = obter_texto("Novo bairro: ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["bairro"] = novo_valor
+            case 14:
+                campo_nome = "Rua"
+                novo_valor = obter_texto("Nova rua: ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["rua"] = novo_valor
+            case 15:
+                campo_nome = "Número"
+                novo_valor = obter_int("Novo número: ", "Entrada inválida. Digite apenas números.")
+                dados_empresa["numero"] = novo_valor
+            case 16:
+                campo_nome = "Complemento"
+                novo_valor = obter_texto("Novo complemento: ", "Entrada inválida. O campo não pode ficar vazio")
+                dados_empresa["complemento"] = novo_valor
+            case _:
+                return False, "Campo inválido!"
+
+        # Atualização no banco de dados (a conexão só é retirada do pool após a digitação)
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            conexao.autocommit = False
+
+            try:
+                # Atualiza apenas o campo escolhido na T_EMPRESA
+                campos_empresa_map = {
+                    2: "nm_empresa", 
+                    3: "cnpj_empresa", 
+                    4: "email_empresa", 
+                    5: "dt_cadastro", 
+                    6: "st_empresa"
+                }
+                # Os textos vêm do registro_sql: um texto fixo por campo, reaproveitado entre chamadas
+                if _index in campos_empresa_map:
+                    campo_sql = campos_empresa_map[_index]
+                    if _index == 5:  # Data de cadastro
+                        registro_sql.executar(
+                            cur, ("update", "T_EMPRESA", campo_sql, "SYSDATE"),
+                            lambda: montar_update_campo("T_EMPRESA", campo_sql, "id_empresa", _sysdate=True),
+                            {"id_empresa": id_empresa}
+                        )
+                    else:
+                        registro_sql.executar(
+                            cur, ("update", "T_EMPRESA", campo_sql),
+                            lambda: montar_update_campo("T_EMPRESA", campo_sql, "id_empresa"),
+                            {"valor": novo_valor, "id_empresa": id_empresa}
+                        )
+
+                # Atualiza login
+                campos_login_map = {7: "login", 8: "st_ativo"}
+                if _index in [7, 8]:
+                    campo_sql = campos_login_map[_index]
+                    registro_sql.executar(
+                        cur, ("update", "T_LVUP_LOGIN", campo_sql),
+                        lambda: montar_update_campo("T_LVUP_LOGIN", campo_sql, "id_login"),
+                        {"valor": novo_valor, "id_login": id_login}
+                    )
+
+                # Atualiza endereço
+                campos_end_map = {
+                    9: "cep", 10: "pais", 11: "estado", 12: "cidade", 
+                    13: "bairro", 14: "rua", 15: "numero", 16: "complemento"
+                }
+                if _index == 9:
+                    # CEP novo: todos os campos do endereço num único UPDATE
+                    registro_sql.executar(
+                        cur, ("update", "T_ENDERECO", "cep_completo"),
+                        lambda: SQL_UPDATE_CEP_COMPLETO,
+                        {
+                            **{campo: dados_empresa.get(campo) for campo in ["cep", "pais", "estado", "cidade", "bairro", "rua"]},
+                            "id_endereco": id_endereco
+                        }
+                    )
+                elif _index in campos_end_map:
+                    campo_sql = campos_end_map[_index]
+                    registro_sql.executar(
+                        cur, ("update", "T_ENDERECO", campo_sql),
+                        lambda: montar_update_campo("T_ENDERECO", campo_sql, "id_endereco"),
+                        {"valor": novo_valor, "id_endereco": id_endereco}
+                    )
+
+                conexao.commit()
+                cache_empresas.invalidar(id_empresa)
+                cur.close()
+
+                # Mantém o índice de busca em memória em dia
+                if _index in campos_empresa_map:
+                    notificar_indice_busca("alterar", "T_EMPRESA", id_empresa, {campos_empresa_map[_index]: novo_valor})
+                    if _index == 2:
+                        lista_preview_empresas.registrar("alterar", id_empresa, novo_valor)
+                elif _index in campos_login_map:
+                    notificar_indice_busca("alterar", "T_LVUP_LOGIN", id_login, {campos_login_map[_index]: novo_valor})
+                elif _index == 9:
+                    notificar_indice_busca("alterar", "T_ENDERECO", id_endereco, {
+                        campo: dados_empresa.get(campo) for campo in ["cep", "pais", "estado", "cidade", "bairro", "rua"]
+                    })
+                elif _index in campos_end_map:
+                    notificar_indice_busca("alterar", "T_ENDERECO", id_endereco, {campos_end_map[_index]: novo_valor})
+
+                # Recupera os dados atualizados para retornar
+                ok, dados_atualizados = select_empresa_por_id(conexao, id_empresa)
+                if ok and dados_atualizados:
+                    return True, dados_atualizados[0]
+                else:
+                    return True, dados_empresa  # Retorna pelo menos os dados que temos
+
+            except Exception as e:
+                conexao.rollback()
+                cur.close()
+                return False, f"Erro ao atualizar no banco: {str(e)}"
+            finally:
+                conexao.autocommit = True
+
+    except Exception as e:
+        return False, f"Erro geral: {str(e)}"
+
+# ========= UPDATE PARCIAL (VÁRIOS CAMPOS DE UMA VEZ) =========
+# campo do registro (nomes de select_empresa_por_id) -> coluna no banco, agrupado por tabela
+CAMPOS_ATUALIZACAO_PARCIAL = {
+    "T_EMPRESA": {
+        "nm_empresa": "nm_empresa",
+        "cnpj_empresa": "cnpj_empresa",
+        "email_empresa": "email_empresa",
+        "dt_cadastro": "dt_cadastro",
+        "st_empresa": "st_empresa"
+    },
+    "T_LVUP_LOGIN": {
+        "login": "login",
+        "st_login": "st_ativo"
+    },
+    "T_ENDERECO": {
+        "cep": "cep",
+        "pais": "pais",
+        "estado": "estado",
+        "cidade": "cidade",
+        "bairro": "bairro",
+        "rua": "rua",
+        "numero": "numero",
+        "complemento": "complemento"
+    }
+}
+
+# Tipo das variáveis de RETURNING que não são texto
+TIPOS_RETORNO_PARCIAL = {
+    "dt_cadastro": datetime,  # o driver mapeia datetime para DB_TYPE_DATE
+    "numero": int,
+    "id_login": int,
+    "id_endereco": int
+}
+
+# Colunas tipadas precisam de CAST: o bind vazio (None) chega como texto e o CASE exige o mesmo tipo
+TIPOS_SQL_PARCIAL = {
+    "dt_cadastro": "DATE",
+    "numero": "INTEGER"
+}
+
+def colunas_retorno_parcial(_tabela: str) -> dict:
+    """Colunas devolvidas pelo RETURNING: as da tabela e as chaves usadas nas tabelas seguintes."""
+    retorno = dict(CAMPOS_ATUALIZACAO_PARCIAL[_tabela])
+    if _tabela == "T_EMPRESA":
+        retorno.update({"id_login": "id_login", "id_endereco": "id_endereco"})
+    else:
+        retorno[CHAVES_PRIMARIAS[_tabela]] = CHAVES_PRIMARIAS[_tabela]
+    return retorno
+
+def montar_update_parcial(_tabela: str, _por_subconsulta: bool) -> str:
+    """
+    UPDATE de texto fixo por tabela: cada coluna só recebe :v_<campo> quando :m_<campo> = 1
+    (dt_cadastro aceita 2 = SYSDATE). Qualquer combinação de campos usa a mesma sentença,
+    então o cache de sentenças não vê um texto novo a cada conjunto de alterações.
+    """
+    campos = CAMPOS_ATUALIZACAO_PARCIAL[_tabela]
+    chave_primaria = CHAVES_PRIMARIAS[_tabela]
+
+    atribuicoes = []
+    for campo, coluna in campos.items():
+        valor = f":v_{campo}"
+        if campo in TIPOS_SQL_PARCIAL:
+            valor = f"CAST(:v_{campo} AS {TIPOS_SQL_PARCIAL[campo]})"
+        sysdate = " WHEN 2 THEN SYSDATE" if campo == "dt_cadastro" else ""
+        atribuicoes.append(f"{coluna} = CASE :m_{campo} WHEN 1 THEN {valor}{sysdate} ELSE {coluna} END")
+
+    if _por_subconsulta:
+        filtro = f"{chave_primaria} = (SELECT {chave_primaria} FROM T_EMPRESA WHERE id_empresa = :chave)"
+    else:
+        filtro = f"{chave_primaria} = :chave"
+
+    retorno = colunas_retorno_parcial(_tabela)
+    return (
+        f"UPDATE {_tabela} SET {', '.join(atribuicoes)} WHERE {filtro} "
+        f"RETURNING {', '.join(retorno.values())} "
+        f"INTO {', '.join(':r_' + campo for campo in retorno)}"
+    )
+
+def binds_update_parcial(_campos: dict, _alteracoes_tabela: dict) -> dict:
+    """Marca de cada campo da tabela: 0 mantém, 1 grava o valor, 2 usa SYSDATE (só dt_cadastro)."""
+    binds = {}
+    for campo in _campos:
+        valor = _alteracoes_tabela.get(campo)
+        if campo not in _alteracoes_tabela:
+            binds[f"m_{campo}"] = 0
+        elif campo == "dt_cadastro" and valor is None:
+            binds[f"m_{campo}"] = 2
+        else:
+            binds[f"m_{campo}"] = 1
+        binds[f"v_{campo}"] = valor
+    return binds
+
+def validar_alteracoes_empresa(_alteracoes: dict) -> tuple[bool, any]:
+    """
+    Confere e normaliza as alterações antes do UPDATE (mesmas regras da importação).
+    Retorna (True, alteracoes_normalizadas) ou (False, erro).
+    """
+    campos_validos = {campo for campos in CAMPOS_ATUALIZACAO_PARCIAL.values() for campo in campos}
+    alteracoes = {}
+
+    for campo, valor in _alteracoes.items():
+        if campo not in campos_validos:
+            return False, f"O campo '{campo}' não pode ser atualizado."
+
+        match campo:
+            case "cnpj_empresa":
+                valor = normalizar_cnpj(valor)
+                if valor is None:
+                    return False, "CNPJ inválido (precisa ter 14 números)."
+            case "email_empresa":
+                if not validar_email(valor):
+                    return False, "E-mail inválido."
+                valor = str(valor).strip()
+            case "cep":
+                cep = normalizar_cep(valor)
+                if cep is None:
+                    return False, "CEP inválido (precisa ter 8 números)."
+                valor = f"{cep[:5]}-{cep[5:]}"
+            case "st_empresa" | "st_login":
+                valor = str(valor).strip().upper()
+                permitidos = ("A", "I") if campo == "st_empresa" else ("S", "N")
+                if valor not in permitidos:
+                    return False, f"O campo '{campo}' aceita apenas {' ou '.join(permitidos)}."
+            case "numero":
+                try:
+                    valor = int(valor)
+                except (TypeError, ValueError):
+                    return False, "O número do endereço deve ser inteiro."
+            case "dt_cadastro":
+                # None -> SYSDATE
+                if valor is not None and not isinstance(valor, date):
+                    try:
+                        valor = datetime.strptime(str(valor).strip(), "%d/%m/%Y")
+                    except ValueError:
+                        return False, "Data de cadastro inválida (use dd/mm/aaaa)."
+            case "complemento":
+                valor = None if valor is None else str(valor).strip()
+            case _:
+                valor = "" if valor is None else str(valor).strip()
+                if not valor:
+                    return False, f"O campo '{campo}' não pode ficar vazio."
+
+        alteracoes[campo] = valor
+
+    return True, alteracoes
+
+@instrumentar(_linhas=lambda args, kwargs, valor: 1)
+def atualizar_empresa_parcial(
+    _conexao: oracledb.Connection,
+    _id_empresa: int,
+    _alteracoes: dict,
+    _dados_atuais: dict | None = None
+) -> tuple[bool, any]:
+    """
+    Aplica várias alterações de uma empresa numa única transação, com no máximo
+    um UPDATE por tabela (T_EMPRESA, T_LVUP_LOGIN, T_ENDERECO) e um único COMMIT.
+
+    _alteracoes usa os nomes de campo de select_empresa_por_id, por exemplo:
+        {"nm_empresa": "Nova Razão", "st_login": "N", "cidade": "Recife"}
+    dt_cadastro aceita datetime, "dd/mm/aaaa" ou None (SYSDATE).
+
+    Os valores gravados voltam pelo RETURNING. Se _dados_atuais (registro já exibido ao
+    usuário) for informado, o retorno é esse registro com os campos atualizados, sem SELECT
+    depois do UPDATE; senão, o registro completo é relido com select_empresa_por_id após o
+    COMMIT (mesmo formato da consulta por ID).
+
+    Retorno:
+        (True, dados_atualizados) ou (False, erro)
+    """
+    ok, alteracoes = validar_alteracoes_empresa(_alteracoes)
+    if not ok:
+        return False, alteracoes
+    if not alteracoes:
+        return False, "Nenhuma alteração informada."
+
+    try:
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            conexao.autocommit = False
+
+            try:
+                dados_atualizados = dict(_dados_atuais) if _dados_atuais else {}
+                dados_atualizados["id_empresa"] = _id_empresa
+                chaves = {"T_EMPRESA": _id_empresa, "T_LVUP_LOGIN": None, "T_ENDERECO": None}
+                colunas_alteradas = {}
+
+                # T_EMPRESA primeiro: o RETURNING dela já entrega id_login e id_endereco
+                for tabela, campos in CAMPOS_ATUALIZACAO_PARCIAL.items():
+                    alteracoes_tabela = {campo: valor for campo, valor in alteracoes.items() if campo in campos}
+                    if not alteracoes_tabela:
+                        continue
+
+                    binds = binds_update_parcial(campos, alteracoes_tabela)
+                    por_subconsulta = chaves[tabela] is None
+                    binds["chave"] = _id_empresa if por_subconsulta else chaves[tabela]
+
+                    retorno = colunas_retorno_parcial(tabela)
+                    for campo in retorno:
+                        binds[f"r_{campo}"] = cur.var(TIPOS_RETORNO_PARCIAL.get(campo, str))
+
+                    registro_sql.executar(
+                        cur, ("update_parcial", tabela, por_subconsulta),
+                        lambda: montar_update_parcial(tabela, por_subconsulta),
+                        binds
+                    )
+
+                    if cur.rowcount == 0:
+                        conexao.rollback()
+                        cur.close()
+                        return False, "Empresa não encontrada." if tabela == "T_EMPRESA" else f"Registro relacionado em {tabela} não encontrado."
+
+                    valores = {campo: binds[f"r_{campo}"].getvalue()[0] for campo in retorno}
+                    if tabela == "T_EMPRESA":
+                        chaves["T_LVUP_LOGIN"] = valores.pop("id_login")
+                        chaves["T_ENDERECO"] = valores.pop("id_endereco")
+                    else:
+                        chaves[tabela] = valores.pop(CHAVES_PRIMARIAS[tabela])
+
+                    dados_atualizados.update(valores)
+                    colunas_alteradas[tabela] = {campos[campo]: valores[campo] for campo in alteracoes_tabela}
+
+                conexao.commit()
+                cache_empresas.invalidar(_id_empresa)
+                cur.close()
+
+            except Exception as e:
+                conexao.rollback()
+                cur.close()
+                return False, f"Erro ao atualizar no banco: {str(e)}"
+            finally:
+                conexao.autocommit = True
+
+        # Mantém o índice de busca em memória em dia
+        for tabela, colunas in colunas_alteradas.items():
+            notificar_indice_busca("alterar", tabela, chaves[tabela], colunas)
+        lista_preview_empresas.registrar("alterar", _id_empresa, colunas_alteradas.get("T_EMPRESA", {}).get("nm_empresa"))
+
+        if _dados_atuais:
+            return True, dados_atualizados
+
+        ok, registros = select_empresa_por_id(_conexao, _id_empresa)
+        if not ok or not registros:
+            return False, f"Empresa atualizada, mas não foi possível reler o registro: {registros}"
+        return True, registros[0]
+
+    except Exception as e:
+        return False, f"Erro geral: {str(e)}"
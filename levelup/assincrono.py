@@ -0,0 +1,503 @@
+"""
+Variantes async (asyncio) das funções de acesso a dados, sobre o connect_async/create_pool_async do oracledb.
+Mesmo contrato (ok, resultado) das versões síncronas, então chamadas independentes podem rodar juntas
+(dentro de uma corrotina):
+    ok, pool = criar_pool_oracledb_async(usuario, senha, dsn, _max=4)
+    (ok_a, empresa), (ok_b, preview) = await executar_concorrentes(
+        select_empresa_por_id_async(pool, 1), select_para_preview_async(pool)
+    )
+Cada função aceita um pool async (retira e devolve uma conexão por chamada) ou uma conexão async.
+Duas corrotinas não devem usar a mesma conexão ao mesmo tempo: para rodar em paralelo, passe o pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from .metricas import instrumentar
+from .driver import DRIVER_LOCAL, obter_driver
+from .conexao import USUARIO_BD, SENHA_BD, dsn_sistema, inicializar_base_local
+from .sentencas import montar_busca_generica, registro_sql
+from .cadastro import SQL_INSERT_ENDERECO, SQL_INSERT_LVUP_LOGIN, SQL_INSERT_EMPRESA
+from .consultas import (
+    SQL_EMPRESA_POR_ID, SQL_TODAS_EMPRESAS, SQL_PAGINA_EMPRESAS, SQL_PREVIEW_EMPRESAS,
+    cache_empresas, definir_fabrica_linhas, lista_preview_empresas
+)
+from .busca import CHAVES_PRIMARIAS, marcar_colunas_encontradas, notificar_indice_busca, padrao_like_para_regex, sem_colunas_secretas
+from .alteracao import (
+    CAMPOS_ATUALIZACAO_PARCIAL, TIPOS_RETORNO_PARCIAL, binds_update_parcial, colunas_retorno_parcial,
+    montar_update_parcial, validar_alteracoes_empresa
+)
+from .exclusao import (
+    SQL_RELACIONADOS_EMPRESA, SQL_EXCLUIR_EMPRESA, SQL_EXCLUIR_LOGIN, SQL_EXCLUIR_ENDERECO,
+    TABELAS_DEPENDENTES_EMPRESA
+)
+
+if TYPE_CHECKING:
+    import oracledb
+
+# ==========================================================
+#   CONEXÃO ASYNC
+# ==========================================================
+
+# ========= CONEXÃO BANCO DE DADOS (ASYNC) =========
+@instrumentar()
+async def conectar_oracledb_async(_user: str, _password: str, _dsn: str) -> tuple[bool, any]:
+    """Tenta conectar ao Oracle e retorna (True, conexão async) ou (False, erro)."""
+    try:
+        conexao_bd = await obter_driver().connect_async(
+            user = _user,
+            password = _password,
+            dsn = _dsn
+        )
+        return (True, conexao_bd)
+
+    except Exception as e:
+        return (False, e)
+
+# ========= POOL DE CONEXÕES (ASYNC) =========
+@instrumentar()
+def criar_pool_oracledb_async(
+    _user: str,
+    _password: str,
+    _dsn: str,
+    _min: int = 1,
+    _max: int = 4,
+    _incremento: int = 1,
+    _ping_intervalo: int = 0,
+    _cache_sentencas: int = 50
+) -> tuple[bool, any]:
+    """
+    Cria um pool async (mesmos parâmetros de criar_pool_oracledb) e retorna (True, pool) ou (False, erro).
+    _max limita quantas consultas rodam ao mesmo tempo: as demais esperam uma conexão livre.
+    Não é aguardável (create_pool_async devolve o pool direto), mas precisa do event loop rodando:
+    chame dentro de uma corrotina. As conexões abrem no primeiro acquire.
+    """
+    try:
+        driver = obter_driver()
+        pool = driver.create_pool_async(
+            user = _user,
+            password = _password,
+            dsn = _dsn,
+            min = _min,
+            max = _max,
+            increment = _incremento,
+            ping_interval = _ping_intervalo,
+            stmtcachesize = _cache_sentencas,
+            getmode = driver.POOL_GETMODE_WAIT
+        )
+        return (True, pool)
+
+    except Exception as e:
+        return (False, e)
+
+async def abrir_pool_sistema_async(_min: int = 1, _max: int = 4, _incremento: int = 1) -> tuple[bool, any]:
+    """
+    abrir_pool_sistema para o pool async: credenciais do sistema, base local criada se for nova
+    e uma conexão retirada e devolvida para validar usuário, senha e DSN.
+    Retorna (True, pool) ou (False, erro)
+    """
+    ok, pool = criar_pool_oracledb_async(USUARIO_BD, SENHA_BD, dsn_sistema(), _min=_min, _max=_max, _incremento=_incremento)
+
+    if ok and DRIVER_LOCAL:
+        def preparar_base():
+            conexao = obter_driver().connect(dsn=dsn_sistema())
+            try:
+                return inicializar_base_local(conexao)
+            finally:
+                conexao.close()
+
+        ok_base, erro_base = await asyncio.to_thread(preparar_base)
+        if not ok_base:
+            return (False, erro_base)
+
+    if ok:
+        try:
+            conexao_teste = await pool.acquire()
+            await pool.release(conexao_teste)
+        except Exception as e:
+            return (False, e)
+
+    return (ok, pool)
+
+@asynccontextmanager
+async def usar_conexao_async(_origem):
+    """
+    usar_conexao para o driver async: com um pool, a conexão é retirada dele e devolvida
+    ao final do bloco "async with"; se já for uma conexão, ela é usada diretamente.
+    """
+    if hasattr(_origem, "acquire"):
+        conexao = await _origem.acquire()
+        try:
+            yield conexao
+        finally:
+            await _origem.release(conexao)
+    else:
+        yield _origem
+
+async def executar_concorrentes(*_corrotinas) -> list[tuple[bool, any]]:
+    """
+    Aguarda várias chamadas async independentes ao mesmo tempo (ex.: as consultas de um painel)
+    e devolve os (ok, resultado) na ordem em que foram passadas. Exceção não tratada vira (False, mensagem).
+    """
+    resultados = await asyncio.gather(*_corrotinas, return_exceptions=True)
+    return [(False, str(r)) if isinstance(r, BaseException) else r for r in resultados]
+
+# ==========================================================
+#   INSERT
+# ==========================================================
+
+# ========= INSERT T_ENDERECO (ASYNC) =========
+@instrumentar()
+async def insert_endereco_async(_conexao: oracledb.AsyncConnection, _dados_endereco: dict) -> tuple[bool, any]:
+    """
+    Insere um novo endereço na tabela T_ENDERECO.
+    Retorna (True, id_endereco) ou (False, erro)
+    """
+    try:
+        async with usar_conexao_async(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_endereco = cur.var(int)
+            await cur.execute(SQL_INSERT_ENDERECO, {**_dados_endereco, "id_endereco": id_endereco})
+            await conexao.commit()
+            cur.close()
+        notificar_indice_busca("inserir", "T_ENDERECO", id_endereco.getvalue()[0], _dados_endereco)
+        return (True, id_endereco.getvalue()[0])
+    except Exception as e:
+        return (False, e)
+
+# ========= INSERT T_LVUP_LOGIN (ASYNC) =========
+@instrumentar()
+async def insert_lvup_login_async(_conexao: oracledb.AsyncConnection, _dados_login: dict) -> tuple[bool, any]:
+    """
+    Insere um novo login na tabela T_LVUP_LOGIN.
+    Retorna (True, id_login) ou (False, erro)
+    """
+    try:
+        async with usar_conexao_async(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_login = cur.var(int)
+            await cur.execute(SQL_INSERT_LVUP_LOGIN, {**_dados_login, "id_login": id_login})
+            await conexao.commit()
+            cur.close()
+        notificar_indice_busca("inserir", "T_LVUP_LOGIN", id_login.getvalue()[0], sem_colunas_secretas(_dados_login))
+        return (True, id_login.getvalue()[0])
+    except Exception as e:
+        return (False, e)
+
+# ========= INSERT T_EMPRESA (ASYNC) =========
+@instrumentar()
+async def insert_empresa_async(_conexao: oracledb.AsyncConnection, _dados_empresa: dict, id_endereco: int, id_login: int) -> tuple[bool, any]:
+    """
+    Insere uma nova empresa na tabela T_EMPRESA.
+    Retorna (True, id_empresa) ou (False, erro)
+    """
+    try:
+        async with usar_conexao_async(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_empresa = cur.var(int)
+            await cur.execute(SQL_INSERT_EMPRESA, {**_dados_empresa, "id_endereco": id_endereco, "id_login": id_login, "id_empresa": id_empresa})
+            await conexao.commit()
+            cur.close()
+        notificar_indice_busca("inserir", "T_EMPRESA", id_empresa.getvalue()[0], {**_dados_empresa, "id_endereco": id_endereco, "id_login": id_login})
+        lista_preview_empresas.registrar("inserir", id_empresa.getvalue()[0], _dados_empresa.get("nm_empresa"))
+        return (True, id_empresa.getvalue()[0])
+    except Exception as e:
+        return (False, e)
+
+# ==========================================================
+#   SELECT
+# ==========================================================
+
+async def _consultar(_conexao, _sql: str, _parametros: dict | None, _formato: str, _tamanho_lote: int = 100) -> list:
+    """Executa a consulta numa conexão do pool (ou na conexão informada) e devolve todas as linhas no _formato."""
+    async with usar_conexao_async(_conexao) as conexao:
+        cur = conexao.cursor()
+        try:
+            cur.arraysize = _tamanho_lote
+            await cur.execute(_sql, _parametros or {})
+            definir_fabrica_linhas(cur, _sql, _formato)
+            return await cur.fetchall()
+        finally:
+            cur.close()
+
+# ========= SELECT EMPRESA POR ID (ASYNC) =========
+@instrumentar()
+async def select_empresa_por_id_async(
+    _conexao: oracledb.AsyncConnection,
+    _id_empresa: int,
+    _formato: str = "dict",
+    _usar_cache: bool = True
+) -> tuple[bool, any]:
+    """
+    Recupera os dados de uma empresa específica pelo ID, incluindo informações de login e endereço.
+    Usa o mesmo cache_empresas de select_empresa_por_id no formato "dict".
+    """
+    if not _id_empresa:
+        return False, "Erro: é necessário informar o ID da empresa."
+
+    usar_cache = _usar_cache and _formato == "dict" and cache_empresas.ativo
+    if usar_cache:
+        encontrado, registro = cache_empresas.obter(_id_empresa)
+        if encontrado:
+            return True, [registro]
+        versao_cache = cache_empresas.versao()
+
+    try:
+        resultados = await _consultar(_conexao, SQL_EMPRESA_POR_ID, {"id_empresa": _id_empresa}, _formato)
+
+        if usar_cache and resultados:
+            cache_empresas.guardar(_id_empresa, resultados[0], versao_cache)
+
+        return True, resultados  # lista vazia = nenhum registro encontrado
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT TODAS AS EMPRESAS COMPLETAS (ASYNC) =========
+@instrumentar()
+async def select_todas_empresas_completas_async(_conexao: oracledb.AsyncConnection, _formato: str = "dict") -> tuple[bool, any]:
+    """
+    Recupera todos os registros de empresas, incluindo informações de login e endereço.
+    Retorna lista de dicionários (ou no _formato de definir_fabrica_linhas).
+    """
+    try:
+        return True, await _consultar(_conexao, SQL_TODAS_EMPRESAS, None, _formato, 1000)
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT PAGINADO (KEYSET, ASYNC) =========
+@instrumentar()
+async def select_pagina_empresas_async(
+    _conexao: oracledb.AsyncConnection,
+    _id_referencia: int = 0,
+    _tamanho_pagina: int = 20,
+    _anterior: bool = False,
+    _formato: str = "dict"
+) -> tuple[bool, any]:
+    """
+    Recupera uma página de empresas completas por chave (keyset) em id_empresa, como select_pagina_empresas.
+    Retorna lista de dicionários em ordem crescente de id_empresa.
+    """
+    try:
+        resultados = await _consultar(
+            _conexao, SQL_PAGINA_EMPRESAS[_anterior],
+            {"id_referencia": _id_referencia, "tamanho_pagina": _tamanho_pagina},
+            _formato, _tamanho_pagina
+        )
+
+        if _anterior:
+            resultados.reverse()
+
+        return True, resultados
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT PARA PREVIEW (ASYNC) =========
+@instrumentar()
+async def select_para_preview_async(_conexao: oracledb.AsyncConnection, _formato: str = "dict") -> tuple[bool, any]:
+    """
+    Recupera apenas o ID e o nome de todas as empresas.
+    Retorna uma lista de dicionários com as colunas: id_empresa e nm_empresa.
+    """
+    try:
+        return True, await _consultar(_conexao, SQL_PREVIEW_EMPRESAS, None, _formato, 1000)
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT GENÉRICO (ASYNC, TABELAS EM PARALELO) =========
+@instrumentar()
+async def select_para_generico_async(_conexao, _parametro, _tabelas_colunas) -> tuple[bool, any]:
+    """
+    Busca um valor genérico com uma consulta por tabela, como select_para_generico_por_tabela.
+    Com um pool async, as tabelas são consultadas ao mesmo tempo (uma conexão por tabela);
+    com uma conexão, uma depois da outra. A lista final segue a ordem de _tabelas_colunas.
+    Retorna: (True, lista de dicionários) ou (False, mensagem de erro)
+    """
+    padrao = f'%{_parametro}%'
+    regex = padrao_like_para_regex(padrao)
+    tabelas = [(tabela, tuple(cols)) for tabela, cols in _tabelas_colunas.items() if cols]
+
+    async def buscar_tabela(_tabela: str, _colunas: tuple) -> list[dict]:
+        async with usar_conexao_async(_conexao) as conexao:
+            cursor = conexao.cursor()
+            try:
+                sql = await registro_sql.executar_async(
+                    cursor, ("busca", _tabela, _colunas),
+                    lambda: montar_busca_generica(_tabela, _colunas),
+                    {'param': padrao}
+                )
+                definir_fabrica_linhas(cursor, sql, "dict")
+                return marcar_colunas_encontradas(_tabela, _colunas, await cursor.fetchall(), regex)
+            finally:
+                cursor.close()
+
+    try:
+        if hasattr(_conexao, "acquire"):
+            partes = await asyncio.gather(*(buscar_tabela(tabela, colunas) for tabela, colunas in tabelas))
+        else:
+            partes = [await buscar_tabela(tabela, colunas) for tabela, colunas in tabelas]
+
+        return True, [registro for parte in partes for registro in parte]
+
+    except Exception as e:
+        return False, str(e)
+
+# ==========================================================
+#   UPDATE E DELETE
+# ==========================================================
+
+# ========= UPDATE PARCIAL (ASYNC) =========
+@instrumentar(_linhas=lambda args, kwargs, valor: 1)
+async def atualizar_empresa_parcial_async(
+    _conexao: oracledb.AsyncConnection,
+    _id_empresa: int,
+    _alteracoes: dict,
+    _dados_atuais: dict | None = None
+) -> tuple[bool, any]:
+    """
+    atualizar_empresa_parcial com o driver async: no máximo um UPDATE por tabela, valores
+    gravados de volta pelo RETURNING e um único COMMIT. Sem _dados_atuais, o registro
+    completo é relido com select_empresa_por_id_async após o COMMIT.
+    Retorno:
+        (True, dados_atualizados) ou (False, erro)
+    """
+    ok, alteracoes = validar_alteracoes_empresa(_alteracoes)
+    if not ok:
+        return False, alteracoes
+    if not alteracoes:
+        return False, "Nenhuma alteração informada."
+
+    try:
+        async with usar_conexao_async(_conexao) as conexao:
+            cur = conexao.cursor()
+            conexao.autocommit = False
+
+            try:
+                dados_atualizados = dict(_dados_atuais) if _dados_atuais else {}
+                dados_atualizados["id_empresa"] = _id_empresa
+                chaves = {"T_EMPRESA": _id_empresa, "T_LVUP_LOGIN": None, "T_ENDERECO": None}
+                colunas_alteradas = {}
+
+                # T_EMPRESA primeiro: o RETURNING dela já entrega id_login e id_endereco
+                for tabela, campos in CAMPOS_ATUALIZACAO_PARCIAL.items():
+                    alteracoes_tabela = {campo: valor for campo, valor in alteracoes.items() if campo in campos}
+                    if not alteracoes_tabela:
+                        continue
+
+                    binds = binds_update_parcial(campos, alteracoes_tabela)
+                    por_subconsulta = chaves[tabela] is None
+                    binds["chave"] = _id_empresa if por_subconsulta else chaves[tabela]
+
+                    retorno = colunas_retorno_parcial(tabela)
+                    for campo in retorno:
+                        binds[f"r_{campo}"] = cur.var(TIPOS_RETORNO_PARCIAL.get(campo, str))
+
+                    await registro_sql.executar_async(
+                        cur, ("update_parcial", tabela, por_subconsulta),
+                        lambda: montar_update_parcial(tabela, por_subconsulta),
+                        binds
+                    )
+
+                    if cur.rowcount == 0:
+                        await conexao.rollback()
+                        cur.close()
+                        return False, "Empresa não encontrada." if tabela == "T_EMPRESA" else f"Registro relacionado em {tabela} não encontrado."
+
+                    valores = {campo: binds[f"r_{campo}"].getvalue()[0] for campo in retorno}
+                    if tabela == "T_EMPRESA":
+                        chaves["T_LVUP_LOGIN"] = valores.pop("id_login")
+                        chaves["T_ENDERECO"] = valores.pop("id_endereco")
+                    else:
+                        chaves[tabela] = valores.pop(CHAVES_PRIMARIAS[tabela])
+
+                    dados_atualizados.update(valores)
+                    colunas_alteradas[tabela] = {campos[campo]: valores[campo] for campo in alteracoes_tabela}
+
+                await conexao.commit()
+                cache_empresas.invalidar(_id_empresa)
+                cur.close()
+
+            except Exception as e:
+                await conexao.rollback()
+                cur.close()
+                return False, f"Erro ao atualizar no banco: {str(e)}"
+            finally:
+                conexao.autocommit = True
+
+        # Mantém o índice de busca em memória em dia
+        for tabela, colunas in colunas_alteradas.items():
+            notificar_indice_busca("alterar", tabela, chaves[tabela], colunas)
+        lista_preview_empresas.registrar("alterar", _id_empresa, colunas_alteradas.get("T_EMPRESA", {}).get("nm_empresa"))
+
+        if _dados_atuais:
+            return True, dados_atualizados
+
+        ok, registros = await select_empresa_por_id_async(_conexao, _id_empresa)
+        if not ok or not registros:
+            return False, f"Empresa atualizada, mas não foi possível reler o registro: {registros}"
+        return True, registros[0]
+
+    except Exception as e:
+        return False, f"Erro geral: {str(e)}"
+
+# ========= EXCLUIR EMPRESA POR ID (ASYNC) =========
+@instrumentar()
+async def excluir_empresa_por_id_async(_conexao: oracledb.AsyncConnection, _id_empresa: int) -> tuple[bool, any]:
+    """
+    Exclui uma empresa pelo ID com telefones, categorias, vagas, login e endereço, numa única transação.
+    Retorna (True, mensagem_sucesso) ou (False, erro)
+    """
+    try:
+        async with usar_conexao_async(_conexao) as conexao:
+            cur = conexao.cursor()
+
+            # Busca id_login e id_endereco da empresa
+            await cur.execute(SQL_RELACIONADOS_EMPRESA, {"id_empresa": _id_empresa})
+            resultado = await cur.fetchone()
+
+            if not resultado:
+                cur.close()
+                return False, "Empresa não encontrada."
+
+            id_login, id_endereco = resultado
+            conexao.autocommit = False
+
+            try:
+                # Telefones, categorias e vagas ligados à empresa (FKs para T_EMPRESA)
+                for tabela in TABELAS_DEPENDENTES_EMPRESA:
+                    await registro_sql.executar_async(
+                        cur, ("excluir_dependentes", tabela),
+                        lambda: f"DELETE FROM {tabela} WHERE id_empresa = :id_empresa",
+                        {"id_empresa": _id_empresa}
+                    )
+
+                await cur.execute(SQL_EXCLUIR_EMPRESA, {"id_empresa": _id_empresa})
+                if id_login:
+                    await cur.execute(SQL_EXCLUIR_LOGIN, {"id_login": id_login})
+                if id_endereco:
+                    await cur.execute(SQL_EXCLUIR_ENDERECO, {"id_endereco": id_endereco})
+
+                await conexao.commit()
+                cache_empresas.invalidar(_id_empresa)
+                cur.close()
+
+                notificar_indice_busca("remover", "T_EMPRESA", _id_empresa)
+                lista_preview_empresas.registrar("remover", _id_empresa)
+                notificar_indice_busca("remover", "T_LVUP_LOGIN", id_login)
+                notificar_indice_busca("remover", "T_ENDERECO", id_endereco)
+
+                return True, f"Empresa ID {_id_empresa} excluída com sucesso!"
+
+            except Exception as e:
+                await conexao.rollback()
+                cur.close()
+                return False, f"Erro durante a exclusão: {str(e)}"
+            finally:
+                conexao.autocommit = True
+
+    except Exception as e:
+        return False, f"Erro ao processar exclusão: {str(e)}"
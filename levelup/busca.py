@@ -0,0 +1,358 @@
+"""Busca genérica (LIKE no banco) e índice de busca em memória por trigramas."""
+
+import re
+import heapq
+import threading
+import unicodedata
+
+from .metricas import instrumentar
+from .conexao import usar_conexao
+from .sentencas import COLUNAS_RESULTADO_BUSCA, COLUNAS_SECRETAS, montar_busca_generica, registro_sql
+from .consultas import definir_fabrica_linhas
+
+# ========= SELECT GENÉRICO =========
+@instrumentar()
+def select_para_generico(_conexao, _parametro, _tabelas_colunas, _uma_consulta_por_tabela: bool = True):
+    """
+    Busca um valor genérico em várias tabelas e colunas específicas.
+    Por padrão faz uma única consulta por tabela (colunas combinadas com OR), sem linhas
+    repetidas, e informa em "colunas_encontradas" quais colunas contêm o valor.
+    Com _uma_consulta_por_tabela = False usa o modo antigo (uma consulta por coluna).
+    Retorna: (True, lista de dicionários) ou (False, mensagem de erro)
+    """
+    if _uma_consulta_por_tabela:
+        return select_para_generico_por_tabela(_conexao, _parametro, _tabelas_colunas)
+
+    lista_resultados = []
+
+    try:
+        with usar_conexao(_conexao) as conexao:
+            cursor = conexao.cursor()  # um cursor para todas as consultas
+
+            for tabela, cols in _tabelas_colunas.items():
+                for col in cols:
+                    sql = registro_sql.executar(
+                        cursor, ("busca", tabela, (col,)),
+                        lambda: montar_busca_generica(tabela, (col,)),
+                        {'param': f'%{_parametro}%'}
+                    )
+                    definir_fabrica_linhas(cursor, sql, "dict")
+                    dados = cursor.fetchall()
+
+                    for registro in dados:
+                        lista_resultados.append({'tabela': tabela, **sem_colunas_secretas(registro)})  # adiciona o nome da tabela
+
+            cursor.close()
+
+        return True, lista_resultados
+
+    except Exception as e:
+        return False, str(e)
+
+def padrao_like_para_regex(_padrao_like: str) -> re.Pattern:
+    """Converte um padrão do LIKE (% e _) em regex, para saber em Python qual coluna bateu."""
+    partes = []
+    for caractere in _padrao_like:
+        if caractere == "%":
+            partes.append(".*")
+        elif caractere == "_":
+            partes.append(".")
+        else:
+            partes.append(re.escape(caractere))
+    return re.compile("".join(partes), re.DOTALL)
+
+def sem_colunas_secretas(_registro: dict) -> dict:
+    """Cópia do registro sem as COLUNAS_SECRETAS (senha), para resultados de busca e para o índice."""
+    if not any(coluna.lower() in COLUNAS_SECRETAS for coluna in _registro):
+        return _registro
+    return {coluna: valor for coluna, valor in _registro.items() if coluna.lower() not in COLUNAS_SECRETAS}
+
+def marcar_colunas_encontradas(_tabela: str, _colunas, _linhas: list, _regex: re.Pattern) -> list[dict]:
+    """
+    Acrescenta "tabela" e "colunas_encontradas" (colunas em que _regex bate) a cada linha da busca.
+    Colunas secretas são retiradas (tabelas fora de COLUNAS_RESULTADO_BUSCA vêm com SELECT *).
+    """
+    colunas_busca = [col.lower() for col in _colunas]
+    registros = []
+    for linha in _linhas:
+        registro = {'tabela': _tabela, **sem_colunas_secretas(linha)}
+        registro['colunas_encontradas'] = ", ".join(
+            col for col in colunas_busca
+            if registro.get(col) is not None and _regex.fullmatch(str(registro[col]))
+        )
+        registros.append(registro)
+    return registros
+
+# ========= SELECT GENÉRICO (UMA CONSULTA POR TABELA) =========
+def select_para_generico_por_tabela(_conexao, _parametro, _tabelas_colunas) -> tuple[bool, any]:
+    """
+    Busca um valor genérico com uma consulta por tabela:
+    SELECT * FROM tabela WHERE col1 LIKE :param OR col2 LIKE :param ...
+    Cada registro vem com "tabela" e "colunas_encontradas" (colunas que contêm o valor).
+    Retorna: (True, lista de dicionários) ou (False, mensagem de erro)
+    """
+    lista_resultados = []
+    padrao = f'%{_parametro}%'
+    regex = padrao_like_para_regex(padrao)
+
+    try:
+        with usar_conexao(_conexao) as conexao:
+            cursor = conexao.cursor()  # um cursor para todas as tabelas
+
+            for tabela, cols in _tabelas_colunas.items():
+                if not cols:
+                    continue
+
+                # O texto é montado (e os nomes validados) só na primeira busca com estas colunas
+                colunas = tuple(cols)
+                sql = registro_sql.executar(
+                    cursor, ("busca", tabela, colunas),
+                    lambda: montar_busca_generica(tabela, colunas),
+                    {'param': padrao}
+                )
+                definir_fabrica_linhas(cursor, sql, "dict")
+                lista_resultados.extend(marcar_colunas_encontradas(tabela, cols, cursor.fetchall(), regex))
+
+            cursor.close()
+
+        return True, lista_resultados
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= ÍNDICE DE BUSCA EM MEMÓRIA (TRIGRAMAS) =========
+TABELAS_COLUNAS_BUSCA = {
+    "T_EMPRESA": ["nm_empresa", "cnpj_empresa", "email_empresa"],
+    "T_LVUP_LOGIN": ["login"],
+    "T_ENDERECO": ["cep", "pais", "estado", "cidade", "bairro", "rua", "complemento"]
+}
+
+CHAVES_PRIMARIAS = {
+    "T_EMPRESA": "id_empresa",
+    "T_LVUP_LOGIN": "id_login",
+    "T_ENDERECO": "id_endereco"
+}
+
+def normalizar_texto_busca(_texto) -> str:
+    """Remove acentos e deixa em minúsculas ('São Paulo' -> 'sao paulo')."""
+    decomposto = unicodedata.normalize("NFKD", str(_texto))
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+def gerar_trigramas(_texto_normalizado: str) -> set[str]:
+    return {_texto_normalizado[i:i + 3] for i in range(len(_texto_normalizado) - 2)}
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas sobre as colunas de TABELAS_COLUNAS_BUSCA.
+    Cada trigrama aponta para o conjunto de registros que o contém; a busca intersecta
+    essas listas, confere o trecho completo e ordena por relevância.
+    Busca sem diferenciar maiúsculas/minúsculas nem acentos.
+    Internamente cada registro (tabela, id) recebe um número inteiro, o que deixa
+    as interseções de conjuntos bem mais rápidas do que com tuplas.
+    Colunas secretas (senha) nunca são indexadas nem guardadas.
+    """
+
+    def __init__(self, _tabelas_colunas: dict = TABELAS_COLUNAS_BUSCA):
+        self.tabelas_colunas = {
+            tabela: [c.lower() for c in cols if c.lower() not in COLUNAS_SECRETAS]
+            for tabela, cols in _tabelas_colunas.items()
+        }
+        self._numeros = {}      # (tabela, id) -> número interno
+        self._registros = {}    # número -> registro sem colunas secretas
+        self._normalizados = {} # número -> {coluna: texto normalizado}
+        self._postagens = {}    # trigrama -> set(números)
+        self._proximo_numero = 0
+        self._trava = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def adicionar(self, _tabela: str, _chave: int, _registro: dict) -> None:
+        """Indexa (ou reindexa) um registro."""
+        colunas = self.tabelas_colunas.get(_tabela)
+        if colunas is None:
+            return
+
+        registro = sem_colunas_secretas(_registro)
+
+        with self._trava:
+            self.remover(_tabela, _chave)
+
+            numero = self._proximo_numero
+            self._proximo_numero += 1
+
+            normalizados = {}
+            trigramas = set()
+            for coluna in colunas:
+                valor = registro.get(coluna)
+                if valor is None or valor == "":
+                    continue
+                texto = normalizar_texto_busca(valor)
+                normalizados[coluna] = texto
+                trigramas |= gerar_trigramas(texto)
+
+            for trigrama in trigramas:
+                postagem = self._postagens.get(trigrama)
+                if postagem is None:
+                    self._postagens[trigrama] = {numero}
+                else:
+                    postagem.add(numero)
+
+            self._numeros[(_tabela, _chave)] = numero
+            self._registros[numero] = {"tabela": _tabela, **registro}
+            self._normalizados[numero] = normalizados
+
+    def alterar(self, _tabela: str, _chave: int, _campos: dict) -> None:
+        """Aplica campos alterados em um registro já indexado."""
+        with self._trava:
+            numero = self._numeros.get((_tabela, _chave))
+            if numero is None:
+                return
+            registro = {k: v for k, v in self._registros[numero].items() if k != "tabela"}
+            registro.update(_campos)
+            self.adicionar(_tabela, _chave, registro)
+
+    def remover(self, _tabela: str, _chave: int) -> None:
+        with self._trava:
+            numero = self._numeros.pop((_tabela, _chave), None)
+            if numero is None:
+                return
+            self._registros.pop(numero, None)
+            normalizados = self._normalizados.pop(numero, {})
+
+            trigramas = set()
+            for texto in normalizados.values():
+                trigramas |= gerar_trigramas(texto)
+            for trigrama in trigramas:
+                postagem = self._postagens.get(trigrama)
+                if postagem is not None:
+                    postagem.discard(numero)
+                    if not postagem:
+                        del self._postagens[trigrama]
+
+    def buscar(self, _parametro: str, _limite: int = 50) -> list[dict]:
+        """
+        Retorna até _limite registros que contêm o parâmetro, do mais relevante para o menos:
+        valor igual ao parâmetro > começa com o parâmetro > contém o parâmetro,
+        valorizando mais colunas encontradas e textos mais curtos.
+        """
+        consulta = normalizar_texto_busca(_parametro).strip()
+        if not consulta:
+            return []
+
+        with self._trava:
+            trigramas = gerar_trigramas(consulta)
+            if trigramas:
+                postagens = []
+                for trigrama in trigramas:
+                    postagem = self._postagens.get(trigrama)
+                    if not postagem:
+                        return []
+                    postagens.append(postagem)
+                postagens.sort(key=len)
+                candidatos = postagens[0].intersection(*postagens[1:])
+            else:
+                candidatos = self._normalizados.keys()  # parâmetro com menos de 3 letras
+
+            # Heap limitado a _limite itens: não guarda todos os candidatos na memória
+            tamanho_consulta = len(consulta)
+            melhores = []
+            for numero in candidatos:
+                pontos = 0.0
+                for texto in self._normalizados[numero].values():
+                    if consulta not in texto:
+                        continue
+                    if texto == consulta:
+                        pontos += 3.0
+                    elif texto.startswith(consulta):
+                        pontos += 2.0
+                    else:
+                        pontos += 1.0
+                    pontos += tamanho_consulta / len(texto)
+                if not pontos:
+                    continue
+                if len(melhores) < _limite:
+                    heapq.heappush(melhores, (pontos, -numero))
+                elif pontos > melhores[0][0]:
+                    heapq.heapreplace(melhores, (pontos, -numero))
+
+            resultados = []
+            for pontos, numero in sorted(melhores, reverse=True):
+                numero = -numero
+                encontradas = [c for c, texto in self._normalizados[numero].items() if consulta in texto]
+                registro = dict(self._registros[numero])
+                registro["colunas_encontradas"] = ", ".join(encontradas)
+                registro["relevancia"] = round(pontos, 3)
+                resultados.append(registro)
+            return resultados
+
+# Índice global: None até ser construído (LEVELUP_INDICE_BUSCA=1 constrói ao iniciar)
+indice_busca = None
+
+def construir_indice_busca(_conexao, _tabelas_colunas: dict = TABELAS_COLUNAS_BUSCA) -> tuple[bool, any]:
+    """
+    Lê as tabelas de _tabelas_colunas e monta o índice de trigramas global.
+    Retorna (True, quantidade de registros indexados) ou (False, erro)
+    """
+    global indice_busca
+
+    try:
+        indice = IndiceTrigramas(_tabelas_colunas)
+
+        with usar_conexao(_conexao) as conexao:
+            for tabela in _tabelas_colunas:
+                chave_primaria = CHAVES_PRIMARIAS[tabela]
+                cursor = conexao.cursor()
+                cursor.arraysize = 1000
+                colunas = COLUNAS_RESULTADO_BUSCA.get(tabela, ("*",))  # nunca lê a senha
+                sql = f"SELECT {', '.join(colunas)} FROM {tabela}"
+                cursor.execute(sql)
+                definir_fabrica_linhas(cursor, sql, "dict")
+
+                while True:
+                    linhas = cursor.fetchmany()
+                    if not linhas:
+                        break
+                    for registro in linhas:
+                        indice.adicionar(tabela, registro[chave_primaria], registro)
+
+                cursor.close()
+
+        indice_busca = indice
+        return (True, len(indice))
+
+    except Exception as e:
+        return (False, e)
+
+def notificar_indice_busca(_acao: str, _tabela: str, _chave: int, _dados: dict | None = None) -> None:
+    """
+    Mantém o índice de busca em dia após insert/update/delete.
+    _acao: "inserir" (registro completo), "alterar" (só os campos alterados) ou "remover".
+    Não faz nada enquanto o índice não tiver sido construído.
+    """
+    if indice_busca is None or _chave is None:
+        return
+
+    if _acao == "inserir":
+        indice_busca.adicionar(_tabela, _chave, {CHAVES_PRIMARIAS[_tabela]: _chave, **(_dados or {})})
+    elif _acao == "alterar":
+        indice_busca.alterar(_tabela, _chave, _dados or {})
+    elif _acao == "remover":
+        indice_busca.remover(_tabela, _chave)
+
+@instrumentar()
+def buscar_no_indice(_conexao, _parametro: str, _limite: int = 50) -> tuple[bool, any]:
+    """
+    Pesquisa genérica usando o índice em memória (constrói o índice na primeira chamada).
+    Retorna: (True, lista de dicionários ordenada por relevância) ou (False, mensagem de erro)
+    """
+    try:
+        if indice_busca is None:
+            ok, resultado = construir_indice_busca(_conexao)
+            if not ok:
+                return False, str(resultado)
+
+        return True, indice_busca.buscar(_parametro, _limite)
+
+    except Exception as e:
+        return False, str(e)
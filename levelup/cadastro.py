@@ -0,0 +1,233 @@
+"""INSERTs de T_ENDERECO, T_LVUP_LOGIN e T_EMPRESA e o cadastro completo em um bloco PL/SQL."""
+
+from __future__ import annotations
+
+from datetime import datetime, date
+from typing import TYPE_CHECKING
+
+from .metricas import instrumentar
+from .conexao import usar_conexao
+from .consultas import lista_preview_empresas
+from .busca import notificar_indice_busca, sem_colunas_secretas
+
+if TYPE_CHECKING:
+    import oracledb
+
+# Textos fixos dos INSERTs, compartilhados com as variantes async (assincrono.py)
+SQL_INSERT_ENDERECO = """
+        INSERT INTO T_ENDERECO (
+            cep, pais, estado, cidade, bairro, rua, numero
+        ) VALUES (
+            :cep, :pais, :estado, :cidade, :bairro, :rua, :numero
+        )
+        RETURNING id_endereco INTO :id_endereco
+        """
+
+SQL_INSERT_LVUP_LOGIN = """
+        INSERT INTO T_LVUP_LOGIN (
+            login, senha, st_ativo
+        ) VALUES (
+            :login, :senha, :st_ativo
+        )
+        RETURNING id_login INTO :id_login
+        """
+
+SQL_INSERT_EMPRESA = """
+        INSERT INTO T_EMPRESA (
+            nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login
+        ) VALUES (
+            :nm_empresa, :cnpj_empresa, :email_empresa, TO_DATE(:dt_cadastro, 'DD/MM/YY'), :st_empresa, :id_endereco, :id_login
+        )
+        RETURNING id_empresa INTO :id_empresa
+        """
+
+# ========= INSERT  =========
+@instrumentar()
+def insert_endereco(_conexao: oracledb.Connection, _dados_endereco: dict) -> tuple[bool, any]:
+    """
+    Insere um novo endereço na tabela T_ENDERECO.
+    Retorna (True, id_endereco) ou (False, erro)
+    """
+    try:
+        comando_sql = SQL_INSERT_ENDERECO
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_endereco = cur.var(int)
+            cur.execute(comando_sql, {**_dados_endereco, "id_endereco": id_endereco})
+            conexao.commit()
+            cur.close()
+        notificar_indice_busca("inserir", "T_ENDERECO", id_endereco.getvalue()[0], _dados_endereco)
+        return (True, id_endereco.getvalue()[0])
+    except Exception as e:
+        return (False, e)
+"""CREATE TABLE T_ENDERECO(
+id_endereco INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+cep VARCHAR2(10) NOT NULL,
+pais VARCHAR2(3) NOT NULL,
+estado VARCHAR2(2) NOT NULL,
+cidade VARCHAR2(100) NOT NULL,
+bairro VARCHAR2(100) NOT NULL,
+rua VARCHAR2(150) NOT NULL,
+numero INTEGER NOT NULL,
+complemento VARCHAR2(150)
+);
+"""
+
+#  ========= INSERT T_LVUP_LOGIN =========
+@instrumentar()
+def insert_lvup_login(_conexao: oracledb.Connection, _dados_login: dict) -> tuple[bool, any]:
+    """
+    Insere um novo login na tabela T_LVUP_LOGIN.
+    Retorna (True, id_login) ou (False, erro)
+    """
+    try:
+        comando_sql = SQL_INSERT_LVUP_LOGIN
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_login = cur.var(int)
+            cur.execute(comando_sql, {**_dados_login, "id_login": id_login})
+            conexao.commit()
+            cur.close()
+        notificar_indice_busca("inserir", "T_LVUP_LOGIN", id_login.getvalue()[0], sem_colunas_secretas(_dados_login))
+        return (True, id_login.getvalue()[0])
+    except Exception as e:
+        return (False, e)
+"""CREATE TABLE T_LVUP_LOGIN (
+id_login INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+login VARCHAR2(100) NOT NULL,
+senha VARCHAR2(100) NOT NULL,
+st_ativo CHAR(1) NOT NULL,
+id_empresa INTEGER,
+id_instAcademica INTEGER,
+id_pessoa INTEGER
+);
+"""
+
+# ========= INSERT T_EMPRESA =========
+@instrumentar()
+def insert_empresa(_conexao: oracledb.Connection, _dados_empresa: dict, id_endereco: int, id_login: int) -> tuple[bool, any]:
+    """
+    Insere uma nova empresa na tabela T_EMPRESA.
+    Retorna (True, id_empresa) ou (False, erro)
+    """
+    try:
+        comando_sql = SQL_INSERT_EMPRESA
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_empresa = cur.var(int)
+            cur.execute(comando_sql, {**_dados_empresa, "id_endereco": id_endereco, "id_login": id_login, "id_empresa": id_empresa})
+            conexao.commit()
+            cur.close()
+        notificar_indice_busca("inserir", "T_EMPRESA", id_empresa.getvalue()[0], {**_dados_empresa, "id_endereco": id_endereco, "id_login": id_login})
+        lista_preview_empresas.registrar("inserir", id_empresa.getvalue()[0], _dados_empresa.get("nm_empresa"))
+        return (True, id_empresa.getvalue()[0])
+    except Exception as e:
+        return (False, e)
+"""CREATE TABLE T_EMPRESA (
+id_empresa INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+nm_empresa VARCHAR2(150) NOT NULL,
+cnpj_empresa VARCHAR2(20) NOT NULL,
+email_empresa VARCHAR2(100) NOT NULL,
+dt_cadastro DATE NOT NULL, -- mudar isso para fazer automatico
+st_empresa CHAR(1) NOT NULL,
+id_endereco INTEGER REFERENCES T_ENDERECO (id_endereco),
+id_login INTEGER NOT NULL REFERENCES T_LVUP_LOGIN (id_login)
+);
+"""
+
+# ========= CADASTRO COMPLETO (LOGIN + ENDEREÇO + EMPRESA) =========
+@instrumentar()
+def cadastrar_empresa_completa(
+    _conexao: oracledb.Connection,
+    _dados_login: dict,
+    _dados_endereco: dict,
+    _dados_empresa: dict
+) -> tuple[bool, any]:
+    """
+    Insere login, endereço e empresa em um único bloco PL/SQL anônimo:
+    uma ida ao servidor e um único commit. Se qualquer INSERT falhar,
+    nada é gravado (sem login ou endereço órfão).
+    Retorna (True, {"id_login", "id_endereco", "id_empresa"}) ou (False, erro)
+    """
+    try:
+        comando_plsql = """
+        BEGIN
+            INSERT INTO T_LVUP_LOGIN (
+                login, senha, st_ativo
+            ) VALUES (
+                :login, :senha, :st_ativo
+            )
+            RETURNING id_login INTO :id_login;
+
+            INSERT INTO T_ENDERECO (
+                cep, pais, estado, cidade, bairro, rua, numero, complemento
+            ) VALUES (
+                :cep, :pais, :estado, :cidade, :bairro, :rua, :numero, :complemento
+            )
+            RETURNING id_endereco INTO :id_endereco;
+
+            INSERT INTO T_EMPRESA (
+                nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login
+            ) VALUES (
+                :nm_empresa, :cnpj_empresa, :email_empresa, TO_DATE(:dt_cadastro, 'DD/MM/YY'), :st_empresa, :id_endereco, :id_login
+            )
+            RETURNING id_empresa INTO :id_empresa;
+
+            COMMIT;
+        END;
+        """
+
+        dt_cadastro = _dados_empresa.get("dt_cadastro") or datetime.now()
+        if isinstance(dt_cadastro, (datetime, date)):
+            dt_cadastro = dt_cadastro.strftime("%d/%m/%Y")
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            id_login = cur.var(int)
+            id_endereco = cur.var(int)
+            id_empresa = cur.var(int)
+
+            try:
+                cur.execute(comando_plsql, {
+                    "login": _dados_login["login"],
+                    "senha": _dados_login["senha"],
+                    "st_ativo": _dados_login.get("st_ativo", "S"),
+                    "cep": _dados_endereco["cep"],
+                    "pais": _dados_endereco.get("pais", "BRA"),
+                    "estado": _dados_endereco["estado"],
+                    "cidade": _dados_endereco["cidade"],
+                    "bairro": _dados_endereco["bairro"],
+                    "rua": _dados_endereco["rua"],
+                    "numero": _dados_endereco["numero"],
+                    "complemento": _dados_endereco.get("complemento"),
+                    "nm_empresa": _dados_empresa["nm_empresa"],
+                    "cnpj_empresa": _dados_empresa["cnpj_empresa"],
+                    "email_empresa": _dados_empresa["email_empresa"],
+                    "dt_cadastro": dt_cadastro,
+                    "st_empresa": _dados_empresa.get("st_empresa", "A"),
+                    "id_login": id_login,
+                    "id_endereco": id_endereco,
+                    "id_empresa": id_empresa
+                })
+            except Exception:
+                conexao.rollback()
+                raise
+            finally:
+                cur.close()
+
+        ids = {
+            "id_login": id_login.getvalue(),
+            "id_endereco": id_endereco.getvalue(),
+            "id_empresa": id_empresa.getvalue()
+        }
+        notificar_indice_busca("inserir", "T_LVUP_LOGIN", ids["id_login"], sem_colunas_secretas(_dados_login))
+        notificar_indice_busca("inserir", "T_ENDERECO", ids["id_endereco"], _dados_endereco)
+        notificar_indice_busca("inserir", "T_EMPRESA", ids["id_empresa"], {
+            **_dados_empresa, "id_endereco": ids["id_endereco"], "id_login": ids["id_login"]
+        })
+        lista_preview_empresas.registrar("inserir", ids["id_empresa"], _dados_empresa.get("nm_empresa"))
+
+        return (True, ids)
+
+    except Exception as e:
+        return (False, e)
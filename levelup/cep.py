@@ -0,0 +1,492 @@
+"""Consulta de CEP: API ViaCEP, cache em memória/disco, índice local offline e resolução em lote."""
+
+import os
+import csv
+import json
+import mmap
+import time
+import struct
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .validacao import normalizar_cep
+from .metricas import instrumentar, metricas
+
+# ==========================================================
+#   CONSULTA DE CEP (VIACEP + CACHE)
+# ==========================================================
+
+ARQUIVO_CACHE_CEP = os.environ.get("LEVELUP_CACHE_CEP", "cache_cep.sqlite3")
+TTL_CEP_ENCONTRADO = 30 * 24 * 3600      # 30 dias
+TTL_CEP_NAO_ENCONTRADO = 24 * 3600       # 1 dia (cache negativo)
+
+class CacheCep:
+    """
+    Cache de CEPs em dois níveis: LRU em memória e arquivo SQLite em disco, ambos com TTL.
+    Guarda também os CEPs não encontrados (cache negativo) e conta acertos e faltas.
+
+    obter(cep) retorna:
+        (True, dict)  -> CEP em cache
+        (True, None)  -> CEP em cache como não encontrado
+        (False, None) -> CEP fora do cache ou expirado
+    """
+
+    def __init__(
+        self,
+        _caminho_arquivo: str | None = ARQUIVO_CACHE_CEP,
+        _capacidade_memoria: int = 1024,
+        _ttl_encontrado: int = TTL_CEP_ENCONTRADO,
+        _ttl_nao_encontrado: int = TTL_CEP_NAO_ENCONTRADO
+    ):
+        self.caminho_arquivo = _caminho_arquivo
+        self.capacidade_memoria = _capacidade_memoria
+        self.ttl_encontrado = _ttl_encontrado
+        self.ttl_nao_encontrado = _ttl_nao_encontrado
+
+        self._memoria = OrderedDict()  # cep -> (expira_em, endereco ou None)
+        self._trava = threading.Lock()
+        self._banco = None  # aberto só no primeiro uso
+
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.acertos_negativos = 0
+        self.faltas = 0
+        self.expirados = 0
+
+    def _abrir_disco(self):
+        if self._banco is None and self.caminho_arquivo:
+            try:
+                self._banco = sqlite3.connect(self.caminho_arquivo, check_same_thread=False)
+                self._banco.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_cep ("
+                    "cep TEXT PRIMARY KEY, expira_em REAL NOT NULL, endereco TEXT)"
+                )
+                self._banco.commit()
+            except sqlite3.Error:
+                self.caminho_arquivo = None  # segue só com a memória
+                self._banco = None
+        return self._banco
+
+    def _guardar_memoria(self, _cep: str, _expira_em: float, _endereco: dict | None) -> None:
+        self._memoria[_cep] = (_expira_em, _endereco)
+        self._memoria.move_to_end(_cep)
+        while len(self._memoria) > self.capacidade_memoria:
+            self._memoria.popitem(last=False)
+
+    def obter(self, _cep: str) -> tuple[bool, any]:
+        agora = time.time()
+
+        with self._trava:
+            item = self._memoria.get(_cep)
+            if item is not None:
+                expira_em, endereco = item
+                if expira_em > agora:
+                    self._memoria.move_to_end(_cep)
+                    self.acertos_memoria += 1
+                    if endereco is None:
+                        self.acertos_negativos += 1
+                    return (True, None if endereco is None else dict(endereco))
+                del self._memoria[_cep]
+                self.expirados += 1
+
+            banco = self._abrir_disco()
+            if banco is not None:
+                linha = banco.execute(
+                    "SELECT expira_em, endereco FROM cache_cep WHERE cep = ?", (_cep,)
+                ).fetchone()
+                if linha is not None:
+                    expira_em, endereco_json = linha
+                    if expira_em > agora:
+                        endereco = json.loads(endereco_json) if endereco_json else None
+                        self._guardar_memoria(_cep, expira_em, endereco)
+                        self.acertos_disco += 1
+                        if endereco is None:
+                            self.acertos_negativos += 1
+                        return (True, None if endereco is None else dict(endereco))
+                    banco.execute("DELETE FROM cache_cep WHERE cep = ?", (_cep,))
+                    banco.commit()
+                    self.expirados += 1
+
+            self.faltas += 1
+            return (False, None)
+
+    def guardar(self, _cep: str, _endereco: dict | None) -> None:
+        """Guarda o endereço do CEP; _endereco = None registra 'CEP não encontrado'."""
+        ttl = self.ttl_encontrado if _endereco is not None else self.ttl_nao_encontrado
+        expira_em = time.time() + ttl
+        endereco = None if _endereco is None else dict(_endereco)
+
+        with self._trava:
+            self._guardar_memoria(_cep, expira_em, endereco)
+
+            banco = self._abrir_disco()
+            if banco is not None:
+                banco.execute(
+                    "INSERT OR REPLACE INTO cache_cep (cep, expira_em, endereco) VALUES (?, ?, ?)",
+                    (_cep, expira_em, json.dumps(endereco, ensure_ascii=False) if endereco else None)
+                )
+                banco.commit()
+
+    def limpar(self) -> None:
+        """Remove todos os CEPs da memória e do disco."""
+        with self._trava:
+            self._memoria.clear()
+            banco = self._abrir_disco()
+            if banco is not None:
+                banco.execute("DELETE FROM cache_cep")
+                banco.commit()
+
+    def estatisticas(self) -> dict:
+        acertos = self.acertos_memoria + self.acertos_disco
+        consultas = acertos + self.faltas
+        return {
+            "acertos_memoria": self.acertos_memoria,
+            "acertos_disco": self.acertos_disco,
+            "acertos_negativos": self.acertos_negativos,
+            "faltas": self.faltas,
+            "expirados": self.expirados,
+            "taxa_acerto": acertos / consultas if consultas else 0.0,
+            "itens_memoria": len(self._memoria)
+        }
+
+# Cache compartilhado pelo cadastro, pela atualização de CEP e pela importação em lote
+cache_cep = CacheCep()
+
+# ========= ÍNDICE LOCAL DE CEPS (OFFLINE) =========
+ARQUIVO_INDICE_CEP = os.environ.get("LEVELUP_INDICE_CEP", "indice_cep.bin")
+MODO_INDICE_CEP = os.environ.get("LEVELUP_MODO_INDICE_CEP", "fallback")  # "primario", "fallback" ou "desligado"
+
+class IndiceCep:
+    """
+    Base local de CEPs somente leitura, aberta com mmap (custo de abertura praticamente zero).
+
+    Formato do arquivo:
+        cabeçalho  : "LVCEP001" + quantidade de registros (uint32) + reservado (uint32)
+        registros  : tamanho fixo, ordenados por CEP -> cep (uint32), estado (2 bytes),
+                     e deslocamentos de logradouro, bairro e cidade na tabela de textos
+        textos     : cada texto aparece uma única vez, como tamanho (uint16) + UTF-8
+    A busca é binária direto nos bytes mapeados, sem carregar o arquivo na memória.
+    """
+
+    ASSINATURA = b"LVCEP001"
+    CABECALHO = struct.Struct("<8sII")
+    REGISTRO = struct.Struct("<I2s2xIII")
+    TAMANHO_TEXTO = struct.Struct("<H")
+
+    def __init__(self, _caminho: str):
+        self.caminho = _caminho
+        self._arquivo = open(_caminho, "rb")
+        try:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._arquivo.close()
+            raise
+
+        assinatura, self.quantidade, _ = self.CABECALHO.unpack_from(self._mapa, 0)
+        if assinatura != self.ASSINATURA:
+            self.fechar()
+            raise ValueError(f"Arquivo '{_caminho}' não é um índice de CEP válido.")
+
+        self._inicio_registros = self.CABECALHO.size
+        self._inicio_textos = self._inicio_registros + self.quantidade * self.REGISTRO.size
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def _texto(self, _deslocamento: int) -> str:
+        posicao = self._inicio_textos + _deslocamento
+        (tamanho,) = self.TAMANHO_TEXTO.unpack_from(self._mapa, posicao)
+        inicio = posicao + self.TAMANHO_TEXTO.size
+        return self._mapa[inicio:inicio + tamanho].decode("utf-8")
+
+    def buscar(self, _cep: str) -> dict | None:
+        """Retorna o endereço no mesmo formato de obter_endereco() ou None se o CEP não estiver no índice."""
+        cep = normalizar_cep(_cep)
+        if cep is None:
+            return None
+        alvo = int(cep)
+
+        baixo, alto = 0, self.quantidade - 1
+        tamanho = self.REGISTRO.size
+        inicio = self._inicio_registros
+        while baixo <= alto:
+            meio = (baixo + alto) // 2
+            cep_meio, estado, off_logradouro, off_bairro, off_cidade = self.REGISTRO.unpack_from(
+                self._mapa, inicio + meio * tamanho
+            )
+            if cep_meio < alvo:
+                baixo = meio + 1
+            elif cep_meio > alvo:
+                alto = meio - 1
+            else:
+                return {
+                    "cep": f"{cep[:5]}-{cep[5:]}",
+                    "logradouro": self._texto(off_logradouro),
+                    "bairro": self._texto(off_bairro),
+                    "cidade": self._texto(off_cidade),
+                    "estado": estado.decode("ascii").strip(),
+                    "pais": "BRA"
+                }
+        return None
+
+    def fechar(self) -> None:
+        self._mapa.close()
+        self._arquivo.close()
+
+def construir_indice_cep(_caminho_dump: str, _caminho_indice: str = ARQUIVO_INDICE_CEP) -> tuple[bool, any]:
+    """
+    Gera o arquivo do IndiceCep a partir de um dump CSV com as colunas
+    cep, logradouro, bairro, cidade e estado (separado por vírgula ou ponto e vírgula).
+    CEPs repetidos ficam com a última ocorrência.
+    Retorna (True, quantidade de CEPs gravados) ou (False, erro)
+    """
+    try:
+        textos = {}
+        tabela_textos = bytearray()
+
+        def deslocamento_texto(_valor: str) -> int:
+            valor = (_valor or "").strip()
+            if valor not in textos:
+                dados = valor.encode("utf-8")[:65535]
+                textos[valor] = len(tabela_textos)
+                tabela_textos.extend(IndiceCep.TAMANHO_TEXTO.pack(len(dados)))
+                tabela_textos.extend(dados)
+            return textos[valor]
+
+        registros = {}
+        with open(_caminho_dump, "r", encoding="utf-8-sig", newline="") as arquivo:
+            amostra = arquivo.read(4096)
+            arquivo.seek(0)
+            delimitador = ";" if amostra.count(";") > amostra.count(",") else ","
+
+            for linha in csv.DictReader(arquivo, delimiter=delimitador):
+                linha = {str(k).strip().lower(): v for k, v in linha.items() if k is not None}
+                cep = normalizar_cep(linha.get("cep", ""))
+                if cep is None:
+                    continue
+                registros[int(cep)] = (
+                    (linha.get("estado") or linha.get("uf") or "").strip().upper()[:2].encode("ascii", "ignore").ljust(2),
+                    deslocamento_texto(linha.get("logradouro")),
+                    deslocamento_texto(linha.get("bairro")),
+                    deslocamento_texto(linha.get("cidade") or linha.get("localidade"))
+                )
+
+        caminho_temporario = _caminho_indice + ".tmp"
+        with open(caminho_temporario, "wb") as saida:
+            saida.write(IndiceCep.CABECALHO.pack(IndiceCep.ASSINATURA, len(registros), 0))
+            for cep in sorted(registros):
+                saida.write(IndiceCep.REGISTRO.pack(cep, *registros[cep]))
+            saida.write(tabela_textos)
+        os.replace(caminho_temporario, _caminho_indice)
+
+        return (True, len(registros))
+
+    except Exception as e:
+        return (False, e)
+
+_indice_cep = None
+
+def obter_indice_cep() -> IndiceCep | None:
+    """Abre o índice local de CEPs na primeira chamada; retorna None se estiver desligado ou não existir."""
+    global _indice_cep
+
+    if _indice_cep is None and MODO_INDICE_CEP != "desligado" and os.path.isfile(ARQUIVO_INDICE_CEP):
+        try:
+            _indice_cep = IndiceCep(ARQUIVO_INDICE_CEP)
+        except Exception:
+            _indice_cep = None
+
+    return _indice_cep
+
+# ========= CONSULTA VIACEP =========
+URL_VIACEP = os.environ.get("LEVELUP_URL_VIACEP", "https://viacep.com.br/ws")
+
+@instrumentar()
+def consultar_viacep(_cep: str, _timeout: float = 5.0, _sessao = None, _url_base: str | None = None) -> tuple[bool, any]:
+    """
+    Consulta o CEP (8 dígitos) direto na API ViaCEP, sem cache.
+    _sessao permite reaproveitar conexões HTTP (requests.Session).
+    Retorna (True, endereco), (True, None) se o CEP não existir ou (False, erro).
+    """
+    try:
+        if _sessao is not None:
+            cliente = _sessao
+        else:
+            import requests  # carregado só na primeira consulta à API
+            cliente = requests
+        response = cliente.get(f"{_url_base or URL_VIACEP}/{_cep}/json/", timeout=_timeout)
+        if metricas.ativo:
+            metricas.somar_bytes("consultar_viacep", len(response.content))
+        response.raise_for_status()  # 429/5xx viram erro, não um endereço vazio
+        data = response.json()
+
+        if "erro" in data:
+            return (True, None)
+
+        endereco = {
+            "cep": data.get("cep", ""),
+            "logradouro": data.get("logradouro", ""),
+            "bairro": data.get("bairro", ""),
+            "cidade": data.get("localidade", ""),
+            "estado": data.get("uf", ""),
+            "pais": "BRA"
+        }
+        return (True, endereco)
+
+    except Exception as e:
+        return (False, e)
+
+# ========= BUSCAR ENDEREÇO POR CEP (COM CACHE) =========
+def buscar_endereco_por_cep(_cep: str, _cache: CacheCep | None = None) -> tuple[bool, any]:
+    """
+    Busca o endereço do CEP passando pelo cache antes da API ViaCEP.
+    Erros de rede não são guardados no cache; CEPs inexistentes são.
+    Com o índice local (IndiceCep), MODO_INDICE_CEP define se ele é consultado
+    antes de tudo ("primario") ou só quando a API falha ("fallback").
+    Retorna (True, endereco), (True, None) se o CEP não existir ou (False, erro).
+    """
+    cache = _cache if _cache is not None else cache_cep
+
+    cep = normalizar_cep(_cep)
+    if cep is None:
+        return (True, None)
+
+    indice = obter_indice_cep()
+    if indice is not None and MODO_INDICE_CEP == "primario":
+        endereco = indice.buscar(cep)
+        if endereco is not None:
+            return (True, endereco)
+
+    em_cache, endereco = cache.obter(cep)
+    if em_cache:
+        return (True, endereco)
+
+    ok, endereco = consultar_viacep(cep)
+    if ok:
+        cache.guardar(cep, endereco)
+    elif indice is not None and MODO_INDICE_CEP == "fallback":
+        endereco_local = indice.buscar(cep)
+        if endereco_local is not None:
+            return (True, endereco_local)
+
+    return (ok, endereco)
+
+# ========= RESOLUÇÃO DE CEPS EM LOTE =========
+class LimitadorTaxa:
+    """Limita quantas requisições por segundo são liberadas, dividindo o intervalo entre as threads."""
+
+    def __init__(self, _por_segundo: float):
+        self.intervalo = 1.0 / _por_segundo if _por_segundo and _por_segundo > 0 else 0.0
+        self._proxima = time.monotonic()
+        self._trava = threading.Lock()
+
+    def aguardar(self) -> None:
+        if not self.intervalo:
+            return
+        with self._trava:
+            agora = time.monotonic()
+            espera = self._proxima - agora
+            self._proxima = max(agora, self._proxima) + self.intervalo
+        if espera > 0:
+            time.sleep(espera)
+
+def _erro_temporario(_erro: Exception) -> bool:
+    """Indica se vale repetir a consulta: falha de conexão/timeout ou resposta HTTP 429/5xx."""
+    import requests
+
+    if isinstance(_erro, requests.HTTPError):
+        status = _erro.response.status_code if _erro.response is not None else 0
+        return status == 429 or status >= 500
+    return isinstance(_erro, (requests.ConnectionError, requests.Timeout))
+
+def resolver_ceps_em_lote(
+    _ceps: list[str],
+    _max_threads: int = 8,
+    _requisicoes_por_segundo: float = 10.0,
+    _timeout: float = 5.0,
+    _cache: CacheCep | None = None,
+    _url_base: str | None = None,
+    _tentativas: int = 3,
+    _espera_tentativa: float = 0.5
+) -> tuple[bool, any]:
+    """
+    Resolve vários CEPs de uma vez: remove repetidos, responde o que já estiver no índice
+    local ou no cache e consulta o restante no ViaCEP em paralelo, com uma requests.Session
+    compartilhada (conexões keep-alive), limite de requisições por segundo e timeout por requisição.
+    Falhas de rede, timeout e respostas 429/5xx são repetidas até _tentativas vezes, esperando
+    _espera_tentativa, 2x, 4x... entre elas; cada nova tentativa também passa pelo limitador.
+
+    Retorno:
+        (True, {"enderecos": {cep: endereco ou None}, "falhas": {cep: erro}}) ou (False, erro)
+        Os CEPs são devolvidos só com os 8 dígitos; endereco = None indica CEP inexistente.
+    """
+    try:
+        cache = _cache if _cache is not None else cache_cep
+        enderecos = {}
+        falhas = {}
+        pendentes = {}  # dict como conjunto ordenado: busca O(1) e mantém a ordem de entrada
+
+        for cep_original in dict.fromkeys(_ceps):
+            cep = normalizar_cep(cep_original)
+            if cep is None:
+                falhas[str(cep_original)] = "CEP inválido (precisa ter 8 números)."
+            else:
+                pendentes[cep] = None
+
+        # Índice local (modo primário) e cache respondem sem rede
+        indice = obter_indice_cep()
+        restantes = []
+        for cep in pendentes:
+            if indice is not None and MODO_INDICE_CEP == "primario":
+                endereco = indice.buscar(cep)
+                if endereco is not None:
+                    enderecos[cep] = endereco
+                    continue
+            em_cache, endereco = cache.obter(cep)
+            if em_cache:
+                enderecos[cep] = endereco
+            else:
+                restantes.append(cep)
+
+        if restantes:
+            limitador = LimitadorTaxa(_requisicoes_por_segundo)
+            threads = max(1, min(_max_threads, len(restantes)))
+
+            import requests
+            with requests.Session() as sessao:
+                adaptador = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=threads)
+                sessao.mount("http://", adaptador)
+                sessao.mount("https://", adaptador)
+
+                def resolver(_cep: str) -> tuple[bool, any]:
+                    for tentativa in range(max(1, _tentativas)):
+                        if tentativa:
+                            time.sleep(_espera_tentativa * 2 ** (tentativa - 1))
+                        limitador.aguardar()
+                        ok, resultado = consultar_viacep(_cep, _timeout, sessao, _url_base)
+                        if ok or not _erro_temporario(resultado):
+                            break
+                    return (ok, resultado)
+
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    for cep, (ok, resultado) in zip(restantes, executor.map(resolver, restantes)):
+                        if ok:
+                            cache.guardar(cep, resultado)
+                            enderecos[cep] = resultado
+                            continue
+
+                        endereco_local = None
+                        if indice is not None and MODO_INDICE_CEP == "fallback":
+                            endereco_local = indice.buscar(cep)
+
+                        if endereco_local is not None:
+                            enderecos[cep] = endereco_local
+                        else:
+                            falhas[cep] = str(resultado)
+
+        return (True, {"enderecos": enderecos, "falhas": falhas})
+
+    except Exception as e:
+        return (False, e)
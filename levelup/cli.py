@@ -0,0 +1,380 @@
+"""
+Linha de comando não interativa: python -m levelup <subcomando> [opções].
+
+Cada subcomando usa as mesmas validações e funções de banco do menu, sem input():
+os dados vêm dos argumentos ou de um arquivo/entrada padrão em JSON (--entrada -).
+O processo abre um único pool e o reaproveita em todas as operações, então um
+arquivo com milhares de registros paga uma conexão só.
+
+Saída em JSON Lines no stdout (um resultado por registro); o código de saída é 0 se
+tudo deu certo, 1 se alguma operação falhou e 2 para argumentos inválidos.
+
+Exemplos:
+    python -m levelup cadastrar --login acme --senha 123 --nm-empresa "ACME" ...
+    python -m levelup cadastrar --entrada empresas.jsonl
+    python -m levelup consultar --id 1 2 3
+    python -m levelup consultar --todas --formato json > empresas.json
+    python -m levelup consultar --busca "recife" --rapida
+    python -m levelup atualizar --id 7 --campo cidade=Recife --campo st_empresa=I
+    echo '{"id_empresa": 7, "nm_empresa": "Nova Razão"}' | python -m levelup atualizar --entrada -
+    python -m levelup excluir --id 7 8 9 --simular
+    python -m levelup exportar --arquivo empresas.jsonl
+    python -m levelup importar empresas.csv
+    python -m levelup servir --porta 8080 --conexoes 8
+"""
+
+import sys
+import json
+import argparse
+
+from .terminal import imprimir_lista_como_tabela
+from .metricas import metricas
+from .conexao import abrir_pool_sistema
+from .sentencas import pre_montar_sentencas
+from .cadastro import cadastrar_empresa_completa
+from .consultas import select_empresa_por_id, select_pagina_empresas
+from .busca import TABELAS_COLUNAS_BUSCA, buscar_no_indice, select_para_generico
+from .alteracao import atualizar_empresa_parcial
+from .exclusao import excluir_empresas_em_lote
+from .exportacao import exportar_consulta_streaming, exportar_snapshot_colunar, formatar_valor_json
+from .importacao import COLUNAS_OBRIGATORIAS_IMPORTACAO, importar_empresas_arquivo, ler_arquivo_em_lotes, validar_linha_importacao
+
+# ==========================================================
+#   SESSÃO, ENTRADA E SAÍDA
+# ==========================================================
+
+CAMPOS_OPCIONAIS_CADASTRO = ["pais", "complemento", "dt_cadastro", "st_ativo", "st_empresa"]
+
+_pool = None
+
+def obter_pool(_conexoes: int = 4) -> tuple[bool, any]:
+    """Abre o pool do sistema na primeira chamada e devolve o mesmo nas seguintes (uma sessão por processo)."""
+    global _pool
+
+    if _pool is None:
+        ok, pool = abrir_pool_sistema(_max=_conexoes)
+        if not ok:
+            return (False, pool)
+        pre_montar_sentencas()
+        _pool = pool
+
+    return (True, _pool)
+
+_codificador = json.JSONEncoder(ensure_ascii=False, default=formatar_valor_json)
+
+def emitir(_objeto) -> None:
+    """Escreve um objeto como uma linha JSON no stdout (datas no formato da exportação)."""
+    sys.stdout.write(_codificador.encode(_objeto))
+    sys.stdout.write("\n")
+
+def avisar(_mensagem: str) -> None:
+    """Mensagens de erro vão para o stderr, sem misturar com os dados do stdout."""
+    print(_mensagem, file=sys.stderr)
+
+def ler_entrada(_caminho: str, _tamanho_lote: int = 500):
+    """
+    Gera (numero_linha, item) de um arquivo CSV, JSON ou JSON Lines (mesmas regras da
+    importação) ou, com _caminho = "-", da entrada padrão: uma lista JSON, um objeto JSON
+    ou JSON Lines. JSON Lines é lido linha a linha, sem carregar tudo na memória.
+    Linhas JSON inválidas chegam como ValueError e são recusadas por quem valida o item.
+    """
+    if _caminho != "-":
+        for lote in ler_arquivo_em_lotes(_caminho, _tamanho_lote):
+            yield from lote
+        return
+
+    linhas = iter(sys.stdin)
+    primeira = True
+    for numero, texto in enumerate(linhas, start=1):
+        if not texto.strip():
+            continue
+
+        if primeira and texto.lstrip().startswith("["):
+            yield from enumerate(json.loads(texto + "".join(linhas)), start=1)
+            return
+
+        try:
+            item = json.loads(texto)
+        except json.JSONDecodeError as e:
+            if not primeira:
+                yield (numero, ValueError(f"JSON inválido: {e}"))
+                continue
+            # Um único objeto JSON escrito em várias linhas
+            yield (numero, json.loads(texto + "".join(linhas)))
+            return
+
+        primeira = False
+        yield (numero, item)
+
+def ler_campo_valor(_texto: str) -> tuple[str, str | None]:
+    """Converte "campo=valor" em (campo, valor); "campo=" vira None (NULL, ou a data atual em dt_cadastro)."""
+    if "=" not in _texto:
+        raise argparse.ArgumentTypeError(f"Use campo=valor (recebido: '{_texto}').")
+    campo, valor = _texto.split("=", 1)
+    return campo.strip(), valor if valor != "" else None
+
+# ==========================================================
+#   SUBCOMANDOS
+# ==========================================================
+
+# ========= CADASTRAR =========
+def comando_cadastrar(_pool, _args) -> bool:
+    """Cadastra login, endereço e empresa de cada registro (validação da importação, um commit por empresa)."""
+    if _args.entrada:
+        registros = ler_entrada(_args.entrada)
+    else:
+        campos = COLUNAS_OBRIGATORIAS_IMPORTACAO + CAMPOS_OPCIONAIS_CADASTRO
+        registros = [(1, {campo: getattr(_args, campo) for campo in campos if getattr(_args, campo) is not None})]
+
+    tudo_ok = True
+    for numero, linha in registros:
+        ok, resultado = validar_linha_importacao(linha)
+        if ok:
+            ok, resultado = cadastrar_empresa_completa(_pool, *resultado)
+
+        if ok:
+            emitir({"ok": True, "linha": numero, **resultado})
+        else:
+            emitir({"ok": False, "linha": numero, "erro": str(resultado)})
+            tudo_ok = False
+
+    return tudo_ok
+
+# ========= CONSULTAR =========
+def paginas_consulta(_pool, _args):
+    """Gera (ok, lista de empresas) ou (False, erro) para o modo de consulta escolhido."""
+    if _args.id:
+        for id_empresa in _args.id:
+            ok, resultados = select_empresa_por_id(_pool, id_empresa)
+            if ok and not resultados:
+                ok, resultados = False, f"Empresa ID {id_empresa} não encontrada."
+            yield ok, resultados
+
+    elif _args.todas:
+        # Paginação por chave: memória limitada ao tamanho da página, mesmo com a tabela inteira
+        id_referencia = 0
+        while True:
+            ok, pagina = select_pagina_empresas(_pool, id_referencia, _args.tamanho_pagina)
+            yield ok, pagina
+            if not ok or len(pagina) < _args.tamanho_pagina:
+                break
+            id_referencia = pagina[-1]["id_empresa"]
+
+    elif _args.rapida:
+        yield buscar_no_indice(_pool, _args.busca, _args.limite)
+
+    else:
+        yield select_para_generico(_pool, _args.busca, TABELAS_COLUNAS_BUSCA)
+
+def comando_consultar(_pool, _args) -> bool:
+    """Escreve as empresas encontradas no stdout em JSON Lines, lista JSON ou tabela."""
+    tudo_ok = True
+    total = 0
+
+    if _args.formato == "json":
+        sys.stdout.write("[")
+
+    for ok, resultados in paginas_consulta(_pool, _args):
+        if not ok:
+            avisar(f"Erro na consulta: {resultados}")
+            tudo_ok = False
+            continue
+
+        if _args.formato == "tabela":
+            imprimir_lista_como_tabela(resultados)
+            total += len(resultados)
+            continue
+
+        for registro in resultados:
+            if _args.formato == "json":
+                sys.stdout.write(",\n" if total else "\n")
+                sys.stdout.write(_codificador.encode(registro))
+            else:
+                emitir(registro)
+            total += 1
+
+    if _args.formato == "json":
+        sys.stdout.write("\n]\n")
+
+    return tudo_ok
+
+# ========= ATUALIZAR =========
+def comando_atualizar(_pool, _args) -> bool:
+    """Aplica as alterações de cada registro com atualizar_empresa_parcial (um UPDATE por tabela e um commit)."""
+    if _args.entrada:
+        registros = ler_entrada(_args.entrada)
+    else:
+        if _args.id is None or not _args.campo:
+            avisar("Informe --id e ao menos um --campo nome=valor, ou use --entrada.")
+            return False
+        registros = [(1, {"id_empresa": _args.id, **dict(_args.campo)})]
+
+    tudo_ok = True
+    for numero, linha in registros:
+        if not isinstance(linha, dict) or "id_empresa" not in linha:
+            ok, resultado = False, "Registro precisa ser um objeto com id_empresa e os campos a alterar."
+        else:
+            alteracoes = dict(linha)
+            try:
+                id_empresa = int(alteracoes.pop("id_empresa"))
+            except (TypeError, ValueError):
+                id_empresa = None
+            if id_empresa is None:
+                ok, resultado = False, "id_empresa precisa ser um número inteiro."
+            else:
+                ok, resultado = atualizar_empresa_parcial(_pool, id_empresa, alteracoes)
+
+        if ok:
+            emitir({"ok": True, "linha": numero, "empresa": resultado})
+        else:
+            emitir({"ok": False, "linha": numero, "erro": str(resultado)})
+            tudo_ok = False
+
+    return tudo_ok
+
+# ========= EXCLUIR =========
+def comando_excluir(_pool, _args) -> bool:
+    """Exclui todas as empresas informadas numa única transação (ou só conta as linhas com --simular)."""
+    ids = list(_args.id or [])
+
+    if _args.entrada:
+        for numero, item in ler_entrada(_args.entrada):
+            valor = item.get("id_empresa") if isinstance(item, dict) else item
+            try:
+                ids.append(int(valor))
+            except (TypeError, ValueError):
+                emitir({"ok": False, "linha": numero, "erro": "ID de empresa inválido; nada foi excluído."})
+                return False
+
+    if not ids:
+        avisar("Informe --id ou --entrada com os IDs das empresas.")
+        return False
+
+    ok, relatorio = excluir_empresas_em_lote(_pool, ids, _args.tamanho_lote, _args.simular)
+    if not ok:
+        emitir({"ok": False, "erro": str(relatorio)})
+        return False
+
+    emitir({"ok": True, "simulacao": _args.simular, **relatorio})
+    return not relatorio.get("nao_encontradas")
+
+# ========= EXPORTAR =========
+def comando_exportar(_pool, _args) -> bool:
+    """Exporta todas as empresas em streaming (JSON Lines ou JSON) ou como snapshot colunar."""
+    if _args.formato == "colunar":
+        ok, resultado = exportar_snapshot_colunar(_pool, _args.arquivo, _tamanho_lote=_args.tamanho_lote)
+    else:
+        ok, resultado = exportar_consulta_streaming(
+            _pool, _args.arquivo, _formato=_args.formato, _tamanho_lote=_args.tamanho_lote
+        )
+        if ok:
+            resultado = {"linhas": resultado, "formato": _args.formato, "arquivo": _args.arquivo}
+
+    if ok:
+        emitir({"ok": True, **resultado})
+    else:
+        emitir({"ok": False, "erro": str(resultado)})
+    return ok
+
+# ========= IMPORTAR =========
+def comando_importar(_pool, _args) -> bool:
+    """Importa um arquivo CSV/JSON/JSON Lines em lotes com array DML (mesmo caminho do menu)."""
+    ok, relatorio = importar_empresas_arquivo(_pool, _args.arquivo, _args.tamanho_lote, _args.commit_a_cada)
+    emitir({"ok": ok, **relatorio})
+    return ok and not relatorio["rejeitadas"]
+
+# ========= SERVIR (HTTP) =========
+def comando_servir(_pool, _args) -> bool:
+    """Sobe o serviço HTTP sobre o pool da sessão (o servico.py só é importado aqui)."""
+    from .servico import executar_servico
+
+    ok, erro = executar_servico(_pool, _args.host, _args.porta, _args.conexoes, _args.max_concorrencia, _args.max_fila)
+    if not ok:
+        avisar(f"Erro no serviço HTTP: {erro}")
+    return ok
+
+# ==========================================================
+#   ARGUMENTOS E EXECUÇÃO
+# ==========================================================
+
+def montar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m levelup",
+        description="Operações do LEVEL UP sem o menu interativo (saída em JSON Lines)."
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True, metavar="subcomando")
+
+    cadastrar = subcomandos.add_parser("cadastrar", help="cadastra empresas (argumentos ou --entrada)")
+    cadastrar.add_argument("--entrada", help="arquivo CSV/JSON/JSON Lines com as empresas ('-' lê o stdin)")
+    for campo in COLUNAS_OBRIGATORIAS_IMPORTACAO + CAMPOS_OPCIONAIS_CADASTRO:
+        cadastrar.add_argument(f"--{campo.replace('_', '-')}", dest=campo)
+    cadastrar.set_defaults(executar=comando_cadastrar)
+
+    consultar = subcomandos.add_parser("consultar", help="consulta por ID, todas ou busca genérica")
+    modo = consultar.add_mutually_exclusive_group(required=True)
+    modo.add_argument("--id", type=int, nargs="+", help="um ou mais IDs de empresa")
+    modo.add_argument("--todas", action="store_true", help="todas as empresas, página a página")
+    modo.add_argument("--busca", help="texto procurado nas tabelas de empresa, login e endereço")
+    consultar.add_argument("--rapida", action="store_true", help="usa o índice de busca em memória (com --busca)")
+    consultar.add_argument("--limite", type=int, default=50, help="máximo de resultados da busca rápida")
+    consultar.add_argument("--tamanho-pagina", type=int, default=500, help="empresas por ida ao banco (com --todas)")
+    consultar.add_argument("--formato", choices=("jsonl", "json", "tabela"), default="jsonl")
+    consultar.set_defaults(executar=comando_consultar)
+
+    atualizar = subcomandos.add_parser("atualizar", help="altera campos de empresas")
+    atualizar.add_argument("--id", type=int, help="ID da empresa")
+    atualizar.add_argument("--campo", type=ler_campo_valor, action="append", metavar="NOME=VALOR",
+                           help="campo a alterar, com os nomes da consulta (pode repetir)")
+    atualizar.add_argument("--entrada", help="objetos com id_empresa e os campos a alterar ('-' lê o stdin)")
+    atualizar.set_defaults(executar=comando_atualizar)
+
+    excluir = subcomandos.add_parser("excluir", help="exclui empresas numa única transação")
+    excluir.add_argument("--id", type=int, nargs="+", help="um ou mais IDs de empresa")
+    excluir.add_argument("--entrada", help="IDs (um por linha, ou objetos com id_empresa); '-' lê o stdin")
+    excluir.add_argument("--simular", action="store_true", help="só conta as linhas que seriam excluídas")
+    excluir.add_argument("--tamanho-lote", type=int, default=500)
+    excluir.set_defaults(executar=comando_excluir)
+
+    exportar = subcomandos.add_parser("exportar", help="exporta todas as empresas para arquivo")
+    exportar.add_argument("--arquivo", required=True, help="arquivo de destino")
+    exportar.add_argument("--formato", choices=("jsonl", "json", "colunar"), default="jsonl",
+                          help="colunar gera Arrow IPC (com pyarrow) ou .lvcol")
+    exportar.add_argument("--tamanho-lote", type=int, default=1000)
+    exportar.set_defaults(executar=comando_exportar)
+
+    importar = subcomandos.add_parser("importar", help="importa empresas de arquivo CSV/JSON/JSON Lines")
+    importar.add_argument("arquivo")
+    importar.add_argument("--tamanho-lote", type=int, default=500)
+    importar.add_argument("--commit-a-cada", type=int, default=1, help="lotes por commit")
+    importar.set_defaults(executar=comando_importar)
+
+    servir = subcomandos.add_parser("servir", help="sobe o serviço HTTP com o CRUD de empresas em JSON")
+    servir.add_argument("--host", default="127.0.0.1")
+    servir.add_argument("--porta", type=int, default=8080, help="0 escolhe uma porta livre")
+    servir.add_argument("--conexoes", type=int, default=8, help="tamanho do pool e das threads de banco")
+    servir.add_argument("--max-concorrencia", type=int, default=64, help="requisições atendidas ao mesmo tempo")
+    servir.add_argument("--max-fila", type=int, default=256, help="requisições em espera antes de responder 503")
+    servir.set_defaults(executar=comando_servir)
+
+    return parser
+
+def executar_cli(_argv: list[str] | None = None) -> int:
+    """Executa um subcomando e retorna o código de saída (0 = sucesso, 1 = alguma operação falhou)."""
+    args = montar_parser().parse_args(_argv)
+
+    ok, pool = obter_pool(getattr(args, "conexoes", 4))
+    if not ok:
+        avisar(f"Erro ao conectar ao banco de dados: {pool}")
+        return 1
+
+    try:
+        tudo_ok = args.executar(pool, args)
+    except (OSError, ValueError) as e:
+        avisar(f"Erro ao ler a entrada: {e}")
+        tudo_ok = False
+    finally:
+        sys.stdout.flush()
+        if metricas.ativo:
+            metricas.exportar()
+
+    return 0 if tudo_ok else 1
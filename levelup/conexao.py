@@ -0,0 +1,388 @@
+"""Conexão com o banco: conexão simples, pool do driver, pool local e medição do pool."""
+
+import os
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .metricas import instrumentar
+from .driver import DRIVER_LOCAL, obter_driver
+
+# ==========================================================
+#   BANCO DE DADOS
+# ==========================================================
+
+# ========= CONEXÃO BANCO DE DADOS =========
+@instrumentar()
+def conectar_oracledb(_user: str, _password: str, _dsn: str) -> tuple[bool, any]:
+    """Tenta conectar ao Oracle e retorna (True, conexão) ou (False, erro)."""
+    retorno = None
+
+    try:
+        conexao_bd = obter_driver().connect(
+            user = _user,
+            password = _password,
+            dsn = _dsn
+        )
+    
+        retorno = (True, conexao_bd) 
+
+    except Exception as e:
+        
+        retorno = (False, e)
+
+    return retorno
+
+# ========= POOL DE CONEXÕES =========
+@instrumentar()
+def criar_pool_oracledb(
+    _user: str,
+    _password: str,
+    _dsn: str,
+    _min: int = 1,
+    _max: int = 4,
+    _incremento: int = 1,
+    _ping_intervalo: int = 0,
+    _cache_sentencas: int = 50
+) -> tuple[bool, any]:
+    """
+    Cria um pool de conexões Oracle e retorna (True, pool) ou (False, erro).
+    _ping_intervalo = 0 faz o driver testar a sessão a cada retirada do pool,
+    descartando conexões derrubadas antes de entregá-las ao sistema.
+    _cache_sentencas comporta os textos do registro_sql (pre_montar_sentencas) e os fixos.
+    """
+    try:
+        driver = obter_driver()
+        pool = driver.create_pool(
+            user = _user,
+            password = _password,
+            dsn = _dsn,
+            min = _min,
+            max = _max,
+            increment = _incremento,
+            ping_interval = _ping_intervalo,
+            stmtcachesize = _cache_sentencas,
+            getmode = driver.POOL_GETMODE_WAIT
+        )
+        return (True, pool)
+
+    except Exception as e:
+        return (False, e)
+
+# ========= POOL DO SISTEMA (MENU E LINHA DE COMANDO) =========
+USUARIO_BD = "rm561713"
+SENHA_BD = "290107"
+DSN_BD = "oracle.fiap.com.br:1521/ORCL"
+
+def dsn_sistema() -> str:
+    """DSN em uso: o servidor da FIAP ou, com LEVELUP_DRIVER=local, o arquivo da base SQLite."""
+    if DRIVER_LOCAL:
+        return os.environ.get("LEVELUP_DSN", "levelup_local.db")
+    return DSN_BD
+
+def abrir_pool_sistema(_min: int = 1, _max: int = 4, _incremento: int = 1) -> tuple[bool, any]:
+    """
+    Cria o pool com as credenciais do sistema e valida usuário, senha e DSN retirando
+    e devolvendo uma conexão. Na base local nova cria as tabelas e carrega o DML.sql.
+    Retorna (True, pool) ou (False, erro)
+    """
+    ok, pool = criar_pool_oracledb(USUARIO_BD, SENHA_BD, dsn_sistema(), _min=_min, _max=_max, _incremento=_incremento)
+
+    if ok and DRIVER_LOCAL:
+        ok_base, erro_base = inicializar_base_local(pool)
+        if not ok_base:
+            return (False, erro_base)
+
+    if ok:
+        # Retira e devolve uma conexão para validar credenciais e DSN antes do uso
+        ok, conexao_teste = adquirir_conexao(pool)
+        if not ok:
+            return (False, conexao_teste)
+        liberar_conexao(pool, conexao_teste)
+
+    return (ok, pool)
+
+def inicializar_base_local(_origem) -> tuple[bool, any]:
+    """Base local nova (LEVELUP_DRIVER=local): cria as tabelas e carrega os dados de exemplo do DML.sql."""
+    with usar_conexao(_origem) as conexao:
+        pasta = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # raiz do projeto, com os .sql
+        return obter_driver().inicializar_base(
+            conexao, os.path.join(pasta, "GERAL_1executado.sql"), os.path.join(pasta, "DML.sql")
+        )
+
+def adquirir_conexao(_pool) -> tuple[bool, any]:
+    """Retira uma conexão do pool e retorna (True, conexão) ou (False, erro)."""
+    try:
+        return (True, _pool.acquire())
+    except Exception as e:
+        return (False, e)
+
+def liberar_conexao(_pool, _conexao) -> tuple[bool, any]:
+    """Devolve uma conexão ao pool e retorna (True, None) ou (False, erro)."""
+    try:
+        _pool.release(_conexao)
+        return (True, None)
+    except Exception as e:
+        return (False, e)
+
+@contextmanager
+def usar_conexao(_origem):
+    """
+    Entrega uma conexão pronta para uso dentro de um bloco with.
+    Se _origem for um pool, a conexão é retirada dele e devolvida ao final;
+    se já for uma conexão, ela é usada diretamente.
+    """
+    if hasattr(_origem, "acquire"):
+        conexao = _origem.acquire()
+        try:
+            yield conexao
+        finally:
+            _origem.release(conexao)
+    else:
+        yield _origem
+
+# ========= POOL LOCAL (SEM SERVIDOR ORACLE) =========
+class PoolLocal:
+    """
+    Substituto local do pool do oracledb, para testar e medir o comportamento do pool
+    sem acesso ao servidor. Oferece a mesma interface usada pelo sistema:
+    acquire(), release(), close(), opened, busy, min, max e increment.
+    """
+
+    def __init__(
+        self,
+        _fabrica_conexao = None,
+        min: int = 1,
+        max: int = 4,
+        increment: int = 1,
+        ping_interval: int = 0,
+        wait_timeout: float = 30.0,
+        latencia_conexao: float = 0.0
+    ):
+        self._fabrica_conexao = _fabrica_conexao or (lambda: sqlite3.connect(":memory:", check_same_thread=False))
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.ping_interval = ping_interval
+        self.wait_timeout = wait_timeout
+        self.latencia_conexao = latencia_conexao  # simula o custo de abrir uma sessão nova
+
+        self._livres = []
+        self._em_uso = set()
+        self._ultimo_uso = {}
+        self._reservadas = 0    # vagas reservadas por acquire() enquanto as sessões são abertas
+        self._condicao = threading.Condition()
+        self._fechado = False
+
+        for _ in range(self.min):
+            self._livres.append(self._nova_conexao())
+
+    @property
+    def opened(self) -> int:
+        return len(self._livres) + len(self._em_uso)
+
+    @property
+    def busy(self) -> int:
+        return len(self._em_uso)
+
+    def _nova_conexao(self):
+        if self.latencia_conexao:
+            time.sleep(self.latencia_conexao)
+        return self._fabrica_conexao()
+
+    def _conexao_valida(self, _conexao) -> bool:
+        """Faz o ping na retirada, respeitando ping_interval (negativo desativa)."""
+        if self.ping_interval < 0:
+            return True
+        ocioso = time.monotonic() - self._ultimo_uso.get(id(_conexao), 0.0)
+        if ocioso < self.ping_interval:
+            return True
+        try:
+            if hasattr(_conexao, "ping"):
+                _conexao.ping()
+            else:
+                _conexao.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """
+        Retira uma conexão livre ou abre novas (até increment, sem passar de max).
+        A trava só protege a contagem: o ping e a abertura de sessões (latencia_conexao)
+        acontecem fora dela, então uma conexão lenta não segura as outras retiradas e devoluções.
+        """
+        limite = time.monotonic() + self.wait_timeout
+
+        while True:
+            conexao, novas = self._reservar(limite)
+            if conexao is None:
+                return self._abrir_reservadas(novas)
+            if self._conexao_valida(conexao):
+                return conexao
+            self._descartar(conexao)
+
+    def _reservar(self, _limite: float) -> tuple:
+        """(conexão livre, 0) já marcada como em uso, ou (None, quantidade de vagas reservadas para abrir)."""
+        with self._condicao:
+            while True:
+                if self._fechado:
+                    raise RuntimeError("Pool fechado.")
+
+                if self._livres:
+                    conexao = self._livres.pop()
+                    self._em_uso.add(conexao)
+                    return conexao, 0
+
+                ocupadas = self.opened + self._reservadas
+                if ocupadas < self.max:
+                    novas = min(self.increment, self.max - ocupadas)
+                    self._reservadas += novas
+                    return None, novas
+
+                restante = _limite - time.monotonic()
+                if restante <= 0:
+                    raise TimeoutError("Tempo esgotado aguardando conexão livre no pool.")
+                self._condicao.wait(restante)
+
+    def _abrir_reservadas(self, _novas: int):
+        """Abre as conexões reservadas por _reservar (fora da trava); entrega uma e deixa as demais livres."""
+        abertas = []
+        try:
+            for _ in range(_novas):
+                abertas.append(self._nova_conexao())
+        except BaseException:
+            self._fechar_todas(abertas)
+            with self._condicao:
+                self._reservadas -= _novas
+                self._condicao.notify_all()
+            raise
+
+        with self._condicao:
+            self._reservadas -= _novas
+            fechado = self._fechado
+            if not fechado:
+                conexao = abertas.pop()
+                self._em_uso.add(conexao)
+                self._livres.extend(abertas)
+                self._condicao.notify_all()
+
+        if fechado:
+            self._fechar_todas(abertas)
+            raise RuntimeError("Pool fechado.")
+        return conexao
+
+    def _descartar(self, _conexao) -> None:
+        """Tira do pool (e fecha) uma conexão que falhou no ping, liberando a vaga dela."""
+        with self._condicao:
+            self._em_uso.discard(_conexao)
+            self._ultimo_uso.pop(id(_conexao), None)
+            self._condicao.notify()
+        self._fechar_todas([_conexao])
+
+    @staticmethod
+    def _fechar_todas(_conexoes) -> None:
+        for conexao in _conexoes:
+            try:
+                conexao.close()
+            except Exception:
+                pass
+
+    def release(self, _conexao) -> None:
+        with self._condicao:
+            if _conexao not in self._em_uso:
+                raise ValueError("Conexão não pertence a este pool.")
+            self._em_uso.discard(_conexao)
+            try:
+                _conexao.rollback()  # descarta transação pendente, como o oracledb
+            except Exception:
+                pass
+            self._ultimo_uso[id(_conexao)] = time.monotonic()
+            self._livres.append(_conexao)
+            self._condicao.notify()
+
+    def close(self, force: bool = False) -> None:
+        with self._condicao:
+            if self._em_uso and not force:
+                raise RuntimeError("Existem conexões em uso no pool.")
+            for conexao in self._livres + list(self._em_uso):
+                try:
+                    conexao.close()
+                except Exception:
+                    pass
+            self._livres.clear()
+            self._em_uso.clear()
+            self._fechado = True
+            self._condicao.notify_all()
+
+def criar_pool_local(
+    _min: int = 1,
+    _max: int = 4,
+    _incremento: int = 1,
+    _ping_intervalo: int = 0,
+    _latencia_conexao: float = 0.0,
+    _fabrica_conexao = None
+) -> tuple[bool, any]:
+    """Cria um PoolLocal e retorna (True, pool) ou (False, erro)."""
+    try:
+        pool = PoolLocal(
+            _fabrica_conexao,
+            min = _min,
+            max = _max,
+            increment = _incremento,
+            ping_interval = _ping_intervalo,
+            latencia_conexao = _latencia_conexao
+        )
+        return (True, pool)
+
+    except Exception as e:
+        return (False, e)
+
+# ========= MEDIÇÃO DO POOL =========
+def medir_aquisicao_pool(_pool, _threads: int = 4, _aquisicoes_por_thread: int = 200, _tempo_uso: float = 0.0) -> tuple[bool, any]:
+    """
+    Mede a latência de acquire()/release() com várias threads disputando o pool.
+    _tempo_uso simula o tempo que cada thread fica com a conexão.
+    Retorna (True, dict com aquisições/s e percentis em ms) ou (False, erro).
+    """
+    try:
+        latencias = []
+        trava = threading.Lock()
+
+        def trabalhador():
+            locais = []
+            for _ in range(_aquisicoes_por_thread):
+                inicio = time.perf_counter()
+                conexao = _pool.acquire()
+                locais.append(time.perf_counter() - inicio)
+                if _tempo_uso:
+                    time.sleep(_tempo_uso)
+                _pool.release(conexao)
+            with trava:
+                latencias.extend(locais)
+
+        inicio_total = time.perf_counter()
+        threads = [threading.Thread(target=trabalhador) for _ in range(_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        duracao = time.perf_counter() - inicio_total
+
+        latencias.sort()
+        def percentil(p):
+            return latencias[min(len(latencias) - 1, int(len(latencias) * p))] * 1000
+
+        return (True, {
+            "aquisicoes": len(latencias),
+            "aquisicoes_por_segundo": len(latencias) / duracao if duracao else 0.0,
+            "p50_ms": percentil(0.50),
+            "p95_ms": percentil(0.95),
+            "p99_ms": percentil(0.99),
+            "max_ms": latencias[-1] * 1000,
+            "conexoes_abertas": _pool.opened
+        })
+
+    except Exception as e:
+        return (False, e)
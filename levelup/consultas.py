@@ -0,0 +1,520 @@
+"""SELECTs de empresas: mapeamento de linhas, cache de leitura, paginação e lista de preview."""
+
+from __future__ import annotations
+
+import os
+import time
+import threading
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING
+
+from .metricas import instrumentar
+from .conexao import usar_conexao
+
+if TYPE_CHECKING:
+    import oracledb
+
+# ========= MAPEAMENTO DE LINHAS (ROWFACTORY) =========
+COLUNAS_EMPRESA_COMPLETA = (
+    "id_empresa", "nm_empresa", "cnpj_empresa", "email_empresa", "dt_cadastro", "st_empresa",
+    "login", "st_login",
+    "cep", "pais", "estado", "cidade", "bairro", "rua", "numero", "complemento"
+)
+
+FORMATOS_LINHA = ("dict", "tupla", "namedtuple", "registro")
+
+def criar_classe_registro(_nome_classe: str, _colunas: tuple[str, ...]) -> type:
+    """
+    Cria uma classe com __slots__ para as colunas informadas (menos memória por linha que um dict).
+    O __init__ é gerado com os parâmetros posicionais, para servir direto como cursor.rowfactory.
+    As instâncias também aceitam registro["coluna"], keys(), items() e get(), como um dict.
+    """
+    parametros = ", ".join(_colunas)
+    atribuicoes = "\n".join(f"    self.{coluna} = {coluna}" for coluna in _colunas) or "    pass"
+    codigo = f"def __init__(self, {parametros}):\n{atribuicoes}\n" if _colunas else "def __init__(self):\n    pass\n"
+    escopo = {}
+    exec(codigo, escopo)
+
+    def keys(self):
+        return self.__slots__
+
+    def items(self):
+        return [(coluna, getattr(self, coluna)) for coluna in self.__slots__]
+
+    def get(self, _coluna, _padrao=None):
+        return getattr(self, _coluna, _padrao) if _coluna in self.__slots__ else _padrao
+
+    def __getitem__(self, _coluna):
+        if _coluna not in self.__slots__:
+            raise KeyError(_coluna)
+        return getattr(self, _coluna)
+
+    def __setitem__(self, _coluna, _valor):
+        if _coluna not in self.__slots__:
+            raise KeyError(_coluna)
+        setattr(self, _coluna, _valor)
+
+    def para_dict(self) -> dict:
+        return {coluna: getattr(self, coluna) for coluna in self.__slots__}
+
+    def __eq__(self, _outro):
+        return type(_outro) is type(self) and self.items() == _outro.items()
+
+    def __repr__(self):
+        return f"{_nome_classe}({', '.join(f'{c}={getattr(self, c)!r}' for c in self.__slots__)})"
+
+    return type(_nome_classe, (), {
+        "__slots__": tuple(_colunas),
+        "__init__": escopo["__init__"],
+        "__getitem__": __getitem__,
+        "__setitem__": __setitem__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__repr__": __repr__,
+        "keys": keys,
+        "items": items,
+        "get": get,
+        "para_dict": para_dict
+    })
+
+# Registro compacto da junção empresa + login + endereço
+RegistroEmpresa = criar_classe_registro("RegistroEmpresa", COLUNAS_EMPRESA_COMPLETA)
+
+_fabricas_linhas = {}  # (texto do SQL, formato) -> rowfactory
+
+def definir_fabrica_linhas(_cursor, _sql: str, _formato: str = "dict") -> None:
+    """
+    Define cursor.rowfactory para que o fetch já entregue cada linha no formato desejado,
+    sem laço em Python depois do fetchall(). Chamar depois do execute().
+    O mapeamento de colunas é montado uma vez por texto de SQL e reaproveitado.
+    _formato: "dict" (padrão), "tupla", "namedtuple" ou "registro" (classe com __slots__).
+    """
+    if _formato not in FORMATOS_LINHA:
+        raise ValueError(f"Formato de linha inválido: {_formato}. Use {', '.join(FORMATOS_LINHA)}.")
+
+    chave = (_sql, _formato)
+    if chave not in _fabricas_linhas:
+        colunas = tuple(c[0].lower() for c in _cursor.description)
+
+        if _formato == "dict":
+            fabrica = lambda *linha: dict(zip(colunas, linha))
+        elif _formato == "tupla":
+            fabrica = None
+        elif _formato == "namedtuple":
+            fabrica = namedtuple("Linha", colunas, rename=True)
+        elif colunas == COLUNAS_EMPRESA_COMPLETA:
+            fabrica = RegistroEmpresa
+        else:
+            fabrica = criar_classe_registro("Registro", colunas)
+
+        if len(_fabricas_linhas) >= 256:
+            _fabricas_linhas.clear()
+        _fabricas_linhas[chave] = fabrica
+
+    _cursor.rowfactory = _fabricas_linhas[chave]
+
+# ========= CACHE DE EMPRESAS (LEITURA) =========
+CAPACIDADE_CACHE_EMPRESAS = int(os.environ.get("LEVELUP_CACHE_EMPRESAS", "256"))  # 0 desliga o cache
+TTL_CACHE_EMPRESAS = float(os.environ.get("LEVELUP_TTL_CACHE_EMPRESAS", "60"))    # segundos
+
+class CacheEmpresas:
+    """
+    Cache read-through de select_empresa_por_id, em memória, com LRU e TTL.
+    As funções de update e delete chamam invalidar() depois do COMMIT.
+
+    A versão muda a cada invalidação: um SELECT que começou antes dela não grava
+    o resultado (evita guardar dados antigos lidos em paralelo com o UPDATE).
+
+    obter(id_empresa) retorna:
+        (True, dict)  -> empresa em cache
+        (False, None) -> fora do cache ou expirada
+    """
+
+    def __init__(self, _capacidade: int = CAPACIDADE_CACHE_EMPRESAS, _ttl: float = TTL_CACHE_EMPRESAS):
+        self.capacidade = _capacidade
+        self.ttl = _ttl
+
+        self._itens = OrderedDict()  # id_empresa -> (expira_em, registro)
+        self._trava = threading.Lock()
+        self._versao = 0
+
+        self.acertos = 0
+        self.faltas = 0
+        self.expirados = 0
+        self.invalidacoes = 0
+
+    @property
+    def ativo(self) -> bool:
+        return self.capacidade > 0
+
+    def versao(self) -> int:
+        return self._versao
+
+    def obter(self, _id_empresa: int) -> tuple[bool, any]:
+        agora = time.monotonic()
+
+        with self._trava:
+            item = self._itens.get(_id_empresa)
+            if item is not None:
+                expira_em, registro = item
+                if expira_em > agora:
+                    self._itens.move_to_end(_id_empresa)
+                    self.acertos += 1
+                    return (True, dict(registro))
+                del self._itens[_id_empresa]
+                self.expirados += 1
+
+            self.faltas += 1
+            return (False, None)
+
+    def guardar(self, _id_empresa: int, _registro: dict, _versao: int | None = None) -> None:
+        """Guarda o registro; se _versao for informada e o cache tiver sido invalidado depois dela, ignora."""
+        with self._trava:
+            if _versao is not None and _versao != self._versao:
+                return
+            self._itens[_id_empresa] = (time.monotonic() + self.ttl, dict(_registro))
+            self._itens.move_to_end(_id_empresa)
+            while len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+
+    def invalidar(self, *_ids_empresa: int) -> None:
+        with self._trava:
+            self._versao += 1
+            for id_empresa in _ids_empresa:
+                if self._itens.pop(id_empresa, None) is not None:
+                    self.invalidacoes += 1
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._versao += 1
+            self._itens.clear()
+
+    def estatisticas(self) -> dict:
+        consultas = self.acertos + self.faltas
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "expirados": self.expirados,
+            "invalidacoes": self.invalidacoes,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "itens": len(self._itens)
+        }
+
+# Cache compartilhado pela consulta por ID, atualização e exclusão
+cache_empresas = CacheEmpresas()
+
+# ========= TEXTOS DAS CONSULTAS DE EMPRESA =========
+# Fixos e compartilhados com as variantes async (assincrono.py): o mesmo texto reaproveita
+# o cache de sentenças do driver e a fábrica de linhas de definir_fabrica_linhas
+SQL_SELECT_EMPRESA_COMPLETA = """
+        SELECT 
+            e.id_empresa,
+            e.nm_empresa,
+            e.cnpj_empresa,
+            e.email_empresa,
+            e.dt_cadastro,
+            e.st_empresa,
+            l.login,
+            l.st_ativo AS st_login,
+            endr.cep,
+            endr.pais,
+            endr.estado,
+            endr.cidade,
+            endr.bairro,
+            endr.rua,
+            endr.numero,
+            endr.complemento
+        FROM T_EMPRESA e
+        LEFT JOIN T_LVUP_LOGIN l ON e.id_login = l.id_login
+        LEFT JOIN T_ENDERECO endr ON e.id_endereco = endr.id_endereco
+"""
+
+SQL_EMPRESA_POR_ID = SQL_SELECT_EMPRESA_COMPLETA + """        WHERE e.id_empresa = :id_empresa
+        """
+
+SQL_TODAS_EMPRESAS = SQL_SELECT_EMPRESA_COMPLETA + """        ORDER BY e.id_empresa
+        """
+
+# Paginação por chave: False = página seguinte (id > referência), True = anterior (id < referência)
+SQL_PAGINA_EMPRESAS = {
+    anterior: SQL_SELECT_EMPRESA_COMPLETA + f"""        WHERE e.id_empresa {operador} :id_referencia
+        ORDER BY e.id_empresa {ordem}
+        FETCH FIRST :tamanho_pagina ROWS ONLY
+        """
+    for anterior, operador, ordem in ((False, ">", "ASC"), (True, "<", "DESC"))
+}
+
+SQL_PREVIEW_EMPRESAS = "SELECT id_empresa, nm_empresa FROM T_EMPRESA ORDER BY id_empresa"
+
+# ========= SELECT EMPRESA POR ID =========
+@instrumentar()
+def select_empresa_por_id(
+    _conexao: oracledb.Connection,
+    _id_empresa: int,
+    _formato: str = "dict",
+    _usar_cache: bool = True
+) -> tuple[bool, any]:
+    """
+    Recupera os dados de uma empresa específica pelo ID, incluindo informações de login e endereço.
+    Retorna todas as colunas como lista de dicionários (ou no _formato de definir_fabrica_linhas).
+    No formato "dict" a leitura passa pelo cache_empresas (_usar_cache=False força o banco).
+    """
+    if not _id_empresa:
+        return False, "Erro: é necessário informar o ID da empresa."
+
+    usar_cache = _usar_cache and _formato == "dict" and cache_empresas.ativo
+    if usar_cache:
+        encontrado, registro = cache_empresas.obter(_id_empresa)
+        if encontrado:
+            return True, [registro]
+        versao_cache = cache_empresas.versao()
+
+    try:
+        query = SQL_EMPRESA_POR_ID
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            cur.execute(query, {"id_empresa": _id_empresa})
+
+            definir_fabrica_linhas(cur, query, _formato)
+            resultados = cur.fetchall()
+            cur.close()
+
+        if usar_cache and resultados:
+            cache_empresas.guardar(_id_empresa, resultados[0], versao_cache)
+
+        return True, resultados  # lista vazia = nenhum registro encontrado
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT TODAS AS EMPRESAS COMPLETAS =========
+@instrumentar()
+def select_todas_empresas_completas(_conexao: oracledb.Connection, _formato: str = "dict") -> tuple[bool, any]:
+    """
+    Recupera todos os registros de empresas, incluindo informações de login e endereço.
+    Retorna lista de dicionários, cada um representando uma empresa
+    (ou no _formato de definir_fabrica_linhas, ex: "registro" para economizar memória).
+    """
+    try:
+        query = SQL_TODAS_EMPRESAS
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            cur.arraysize = 1000
+            cur.execute(query)
+
+            definir_fabrica_linhas(cur, query, _formato)
+            resultados = cur.fetchall()
+            cur.close()
+
+        return True, resultados  # lista vazia = nenhum registro encontrado
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT PAGINADO (KEYSET) =========
+@instrumentar()
+def select_pagina_empresas(
+    _conexao: oracledb.Connection,
+    _id_referencia: int = 0,
+    _tamanho_pagina: int = 20,
+    _anterior: bool = False,
+    _formato: str = "dict"
+) -> tuple[bool, any]:
+    """
+    Recupera uma página de empresas completas usando paginação por chave (keyset) em id_empresa,
+    então o custo de cada página não cresce com o tamanho da tabela.
+    Página seguinte: id_empresa > _id_referencia (último ID da página atual).
+    Página anterior (_anterior = True): id_empresa < _id_referencia (primeiro ID da página atual).
+    Retorna lista de dicionários em ordem crescente de id_empresa.
+    """
+    try:
+        query = SQL_PAGINA_EMPRESAS[_anterior]
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            cur.arraysize = _tamanho_pagina
+            cur.prefetchrows = _tamanho_pagina + 1
+            cur.execute(query, {"id_referencia": _id_referencia, "tamanho_pagina": _tamanho_pagina})
+
+            definir_fabrica_linhas(cur, query, _formato)
+            resultados = cur.fetchall()
+            cur.close()
+
+        if _anterior:
+            resultados.reverse()
+
+        return True, resultados
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= SELECT PARA PREVIEW =========
+@instrumentar()
+def select_para_preview(_conexao: oracledb.Connection, _formato: str = "dict") -> tuple[bool, any]:
+    """
+    Recupera apenas o ID e o nome de todas as empresas.
+    Retorna uma lista de dicionários com as colunas: id_empresa e nm_empresa.
+    """
+    try:
+        query = SQL_PREVIEW_EMPRESAS
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            cur.arraysize = 1000
+            cur.execute(query)
+
+            definir_fabrica_linhas(cur, query, _formato)
+            resultados = cur.fetchall()
+            cur.close()
+
+        return True, resultados  # lista vazia = nenhum registro encontrado
+
+    except Exception as e:
+        return False, str(e)
+
+# ========= PREVIEW INCREMENTAL (MENUS DE ATUALIZAÇÃO E EXCLUSÃO) =========
+INTERVALO_RECARGA_PREVIEW = 300  # segundos; recarga completa periódica para pegar renomeações de outros processos
+LIMITE_ALTERACOES_PREVIEW = 1000  # alterações guardadas entre duas leituras; acima disso vira recarga completa
+
+class ListaPreviewEmpresas:
+    """
+    Lista (id_empresa, nm_empresa) mostrada nos menus de atualização e exclusão, atualizada aos poucos:
+      - empresas novas: só as linhas com id_empresa acima do maior ID já lido (marca d'água);
+      - alterações e exclusões feitas por este programa: aplicadas a partir do registro local
+        alimentado pelas funções de insert/update/delete (registrar);
+      - recarga completa só quando o token de mudança diverge (quantidade de empresas no banco
+        diferente da lista local), depois de invalidar() ou a cada INTERVALO_RECARGA_PREVIEW segundos.
+    O token e as linhas novas vêm na mesma consulta (uma ida ao banco por atualização).
+    O registro local só guarda alterações enquanto há uma lista carregada e no máximo
+    _limite_alteracoes delas: processos que escrevem sem nunca ler o preview (serviço HTTP,
+    linha de comando, importação) não acumulam memória.
+    """
+
+    def __init__(
+        self,
+        _intervalo_recarga: float = INTERVALO_RECARGA_PREVIEW,
+        _limite_alteracoes: int = LIMITE_ALTERACOES_PREVIEW
+    ):
+        self.intervalo_recarga = _intervalo_recarga
+        self.limite_alteracoes = _limite_alteracoes
+
+        self._nomes = {}         # id_empresa -> nm_empresa
+        self._lista = None       # [(id_empresa, nm_empresa)] ordenada, refeita só quando algo muda
+        self._maior_id = 0
+        self._alteracoes = []    # (acao, id_empresa, nm_empresa)
+        self._trava = threading.Lock()
+        self._recarregar = True
+        self._ultima_recarga = 0.0
+
+        self.recargas_completas = 0
+        self.atualizacoes_incrementais = 0
+        self.linhas_lidas = 0
+
+    def registrar(self, _acao: str, _id_empresa: int, _nm_empresa: str | None = None) -> None:
+        """_acao: "inserir", "alterar" (só interessa se o nome mudou) ou "remover"."""
+        if _id_empresa is None or (_acao == "alterar" and _nm_empresa is None):
+            return
+        with self._trava:
+            if self._recarregar:
+                return  # nada carregado ou recarga completa já marcada: a próxima leitura lê tudo
+            if len(self._alteracoes) >= self.limite_alteracoes:
+                self._alteracoes = []
+                self._recarregar = True
+                return
+            self._alteracoes.append((_acao, _id_empresa, _nm_empresa))
+
+    def invalidar(self) -> None:
+        """Força uma recarga completa na próxima leitura (e descarta as alterações guardadas)."""
+        with self._trava:
+            self._alteracoes = []
+            self._recarregar = True
+
+    def _recarregar_tudo(self, _conexao) -> tuple[bool, any]:
+        # Desmarca antes da consulta: alterações feitas durante ela voltam a ser guardadas
+        # e reaplicadas na próxima leitura (reaplicar é inofensivo)
+        with self._trava:
+            self._recarregar = False
+        ok, linhas = select_para_preview(_conexao, "tupla")
+        if not ok:
+            self.invalidar()
+            return False, linhas
+
+        self._nomes = dict(linhas)
+        self._maior_id = max(self._nomes, default=0)
+        self._lista = None
+        self._ultima_recarga = time.monotonic()
+        self.recargas_completas += 1
+        self.linhas_lidas += len(linhas)
+        return True, None
+
+    def obter(self, _conexao, _formato: str = "dict") -> tuple[bool, any]:
+        """Mesmo retorno de select_para_preview ("dict" ou "tupla")."""
+        if _formato not in ("dict", "tupla"):
+            return False, f"Formato de preview inválido: {_formato}"
+
+        with self._trava:
+            alteracoes, self._alteracoes = self._alteracoes, []
+
+        try:
+            recarregar = self._recarregar or time.monotonic() - self._ultima_recarga > self.intervalo_recarga
+
+            if not recarregar:
+                for acao, id_empresa, nm_empresa in alteracoes:
+                    if acao == "remover":
+                        self._nomes.pop(id_empresa, None)
+                    elif nm_empresa is not None:
+                        self._nomes[id_empresa] = nm_empresa
+                if alteracoes:
+                    self._lista = None
+
+                # Primeira linha: token (quantidade de empresas); demais: empresas acima da marca d'água
+                with usar_conexao(_conexao) as conexao:
+                    cur = conexao.cursor()
+                    cur.execute("""
+                        SELECT 0 AS id_empresa, NULL AS nm_empresa, COUNT(*) AS total FROM T_EMPRESA
+                        UNION ALL
+                        SELECT id_empresa, nm_empresa, NULL FROM T_EMPRESA WHERE id_empresa > :maior_id
+                        ORDER BY 1
+                    """, {"maior_id": self._maior_id})
+                    linhas = cur.fetchall()
+                    cur.close()
+
+                total = linhas[0][2]
+                for id_empresa, nm_empresa, _ in linhas[1:]:
+                    self._nomes[id_empresa] = nm_empresa
+                    self._maior_id = max(self._maior_id, id_empresa)
+                if len(linhas) > 1:
+                    self._lista = None
+
+                self.atualizacoes_incrementais += 1
+                self.linhas_lidas += len(linhas) - 1
+                recarregar = total != len(self._nomes)
+
+            if recarregar:
+                ok, erro = self._recarregar_tudo(_conexao)
+                if not ok:
+                    return False, erro
+
+            if self._lista is None:
+                self._lista = sorted(self._nomes.items())
+
+            if _formato == "tupla":
+                return True, list(self._lista)
+            return True, [{"id_empresa": id_empresa, "nm_empresa": nm_empresa} for id_empresa, nm_empresa in self._lista]
+
+        except Exception as e:
+            self.invalidar()
+            return False, str(e)
+
+    def estatisticas(self) -> dict:
+        return {
+            "recargas_completas": self.recargas_completas,
+            "atualizacoes_incrementais": self.atualizacoes_incrementais,
+            "linhas_lidas": self.linhas_lidas,
+            "empresas": len(self._nomes)
+        }
+
+# Lista compartilhada pelos menus de atualização (case 3) e exclusão (case 4)
+lista_preview_empresas = ListaPreviewEmpresas()
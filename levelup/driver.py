@@ -0,0 +1,24 @@
+"""Escolha do driver de banco: python-oracledb (servidor da FIAP) ou oracledb_local (SQLite)."""
+
+import os
+
+# LEVELUP_DRIVER=local troca o Oracle da FIAP pelo driver em SQLite (oracledb_local.py)
+DRIVER_LOCAL = os.environ.get("LEVELUP_DRIVER", "").lower() == "local"
+
+_driver = None
+
+def obter_driver():
+    """
+    Importa o driver só no primeiro uso: o oracledb é o import mais caro do sistema
+    e não é necessário para validar dados, montar SQL ou exportar arquivos.
+    """
+    global _driver
+
+    if _driver is None:
+        if DRIVER_LOCAL:
+            from . import oracledb_local as driver
+        else:
+            import oracledb as driver
+        _driver = driver
+
+    return _driver
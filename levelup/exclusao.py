@@ -0,0 +1,271 @@
+"""Exclusão de empresas: uma por ID ou em lote com array DML."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from .metricas import instrumentar
+from .conexao import usar_conexao
+from .sentencas import registro_sql
+from .consultas import cache_empresas, lista_preview_empresas
+from .busca import notificar_indice_busca
+
+if TYPE_CHECKING:
+    import oracledb
+
+# Textos fixos da exclusão por ID, compartilhados com a variante async (assincrono.py)
+SQL_RELACIONADOS_EMPRESA = "SELECT id_login, id_endereco FROM T_EMPRESA WHERE id_empresa = :id_empresa"
+SQL_EXCLUIR_EMPRESA = "DELETE FROM T_EMPRESA WHERE id_empresa = :id_empresa"
+SQL_EXCLUIR_LOGIN = "DELETE FROM T_LVUP_LOGIN WHERE id_login = :id_login"
+SQL_EXCLUIR_ENDERECO = "DELETE FROM T_ENDERECO WHERE id_endereco = :id_endereco"
+
+# ========= EXCLUIR EMPRESA POR ID =========
+@instrumentar()
+def excluir_empresa_por_id(_conexao: oracledb.Connection, _id_empresa: int) -> tuple[bool, any]:
+    """
+    Exclui uma empresa pelo ID junto com o que depende dela, numa única transação:
+    telefones, categorias e vagas (TABELAS_DEPENDENTES_EMPRESA), login e endereço.
+    Para mostrar antes quantas linhas cada tabela perde: excluir_empresas_em_lote([id], _simular=True).
+    Retorna (True, mensagem_sucesso) ou (False, erro)
+    """
+    try:
+        with usar_conexao(_conexao) as conexao:
+            # Primeiro, recupera os IDs relacionados
+            cur = conexao.cursor()
+
+            # Busca id_login e id_endereco da empresa
+            cur.execute(SQL_RELACIONADOS_EMPRESA, {"id_empresa": _id_empresa})
+
+            resultado = cur.fetchone()
+
+            if not resultado:
+                cur.close()
+                return False, "Empresa não encontrada."
+
+            id_login, id_endereco = resultado
+
+            # Inicia transação
+            conexao.autocommit = False
+
+            try:
+                # 0. Telefones, categorias e vagas ligados à empresa (FKs para T_EMPRESA)
+                for tabela in TABELAS_DEPENDENTES_EMPRESA:
+                    registro_sql.executar(
+                        cur, ("excluir_dependentes", tabela),
+                        lambda: f"DELETE FROM {tabela} WHERE id_empresa = :id_empresa",
+                        {"id_empresa": _id_empresa}
+                    )
+
+                # 1. Exclui a empresa
+                cur.execute(SQL_EXCLUIR_EMPRESA, {"id_empresa": _id_empresa})
+
+                # 2. Exclui o login (se existir e não estiver sendo usado por outras tabelas)
+                if id_login:
+                    cur.execute(SQL_EXCLUIR_LOGIN, {"id_login": id_login})
+
+                # 3. Exclui o endereço (se existir e não estiver sendo usado por outras tabelas)
+                if id_endereco:
+                    cur.execute(SQL_EXCLUIR_ENDERECO, {"id_endereco": id_endereco})
+
+                # Confirma a transação
+                conexao.commit()
+                cache_empresas.invalidar(_id_empresa)
+                cur.close()
+
+                notificar_indice_busca("remover", "T_EMPRESA", _id_empresa)
+                lista_preview_empresas.registrar("remover", _id_empresa)
+                notificar_indice_busca("remover", "T_LVUP_LOGIN", id_login)
+                notificar_indice_busca("remover", "T_ENDERECO", id_endereco)
+
+                return True, f"Empresa ID {_id_empresa} excluída com sucesso!"
+
+            except Exception as e:
+                # Rollback em caso de erro
+                conexao.rollback()
+                cur.close()
+                return False, f"Erro durante a exclusão: {str(e)}"
+            finally:
+                # Restaura autocommit
+                conexao.autocommit = True
+
+    except Exception as e:
+        return False, f"Erro ao processar exclusão: {str(e)}"
+
+# ========= EXCLUIR EMPRESAS EM LOTE =========
+# Tabelas que apontam para T_EMPRESA e precisam ser limpas antes dela
+TABELAS_DEPENDENTES_EMPRESA = ("T_TELEFONE_EMPRESA", "EMPRESA_CATEGORIA", "EMPRESA_VAGA")
+
+def contar_exclusao_empresas(_cursor, _ids_empresa: list[int], _tamanho_lote: int) -> dict:
+    """
+    Conta quantas linhas de cada tabela seriam removidas para um lote de IDs (sem alterar nada).
+    A quantidade de binds do IN é arredondada para a próxima potência de 2 (limitada a
+    _tamanho_lote) e os que sobram vão como NULL: poucos textos SQL distintos, em vez de um
+    por tamanho de lote.
+    """
+    quantidade_binds = 1
+    while quantidade_binds < len(_ids_empresa):
+        quantidade_binds *= 2
+    quantidade_binds = min(quantidade_binds, _tamanho_lote)
+
+    marcadores = ", ".join(f":id{i}" for i in range(quantidade_binds))
+    binds = {f"id{i}": None for i in range(quantidade_binds)}
+    binds.update({f"id{i}": id_empresa for i, id_empresa in enumerate(_ids_empresa)})
+    contagem = {}
+
+    for tabela in TABELAS_DEPENDENTES_EMPRESA:
+        registro_sql.executar(
+            _cursor, ("contar_exclusao", tabela, quantidade_binds),
+            lambda: f"SELECT COUNT(*) FROM {tabela} WHERE id_empresa IN ({marcadores})",
+            binds
+        )
+        contagem[tabela] = _cursor.fetchone()[0]
+
+    registro_sql.executar(
+        _cursor, ("contar_exclusao", "T_EMPRESA", quantidade_binds),
+        lambda: f"""
+            SELECT COUNT(*), COUNT(DISTINCT id_login), COUNT(DISTINCT id_endereco)
+            FROM T_EMPRESA
+            WHERE id_empresa IN ({marcadores})
+        """,
+        binds
+    )
+    contagem["T_EMPRESA"], contagem["T_LVUP_LOGIN"], contagem["T_ENDERECO"] = _cursor.fetchone()
+
+    return contagem
+
+@instrumentar(_linhas=lambda args, kwargs, valor: len(valor.get("excluidas", ())))
+def excluir_empresas_em_lote(
+    _conexao: oracledb.Connection,
+    _ids_empresa: list[int],
+    _tamanho_lote: int = 500,
+    _simular: bool = False
+) -> tuple[bool, any]:
+    """
+    Exclui várias empresas (e login/endereço de cada uma) numa única transação.
+
+    Para cada lote de até _tamanho_lote IDs:
+        1. executemany nas tabelas dependentes (telefones, categorias, vagas);
+        2. executemany de DELETE FROM T_EMPRESA ... RETURNING id_login, id_endereco
+           (equivalente ao BULK COLLECT: os IDs relacionados voltam junto com o DELETE,
+           sem SELECT separado);
+        3. executemany em T_LVUP_LOGIN e T_ENDERECO com os IDs devolvidos.
+    O COMMIT acontece uma vez só, depois do último lote. O tamanho do lote também limita
+    a quantidade de binds do IN na simulação (o Oracle aceita até 1000).
+
+    _simular=True não apaga nada: devolve apenas quantas linhas cada tabela perderia.
+
+    Retorno:
+        (True, relatorio) ou (False, erro)
+        relatorio = {"linhas": {tabela: quantidade}, "excluidas": [...], "nao_encontradas": [...],
+                     "lotes": n, "segundos": s}   (na simulação, só "linhas", "lotes" e "segundos")
+    """
+    ids = list(dict.fromkeys(int(id_empresa) for id_empresa in _ids_empresa))
+    if not ids:
+        return False, "Nenhum ID informado."
+
+    tamanho_lote = max(1, min(int(_tamanho_lote), 1000))
+    lotes = [ids[i:i + tamanho_lote] for i in range(0, len(ids), tamanho_lote)]
+    inicio = time.perf_counter()
+
+    try:
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+
+            if _simular:
+                linhas = {}
+                for lote in lotes:
+                    for tabela, quantidade in contar_exclusao_empresas(cur, lote, tamanho_lote).items():
+                        linhas[tabela] = linhas.get(tabela, 0) + quantidade
+                cur.close()
+                return True, {"linhas": linhas, "lotes": len(lotes), "segundos": time.perf_counter() - inicio}
+
+            linhas = {tabela: 0 for tabela in (*TABELAS_DEPENDENTES_EMPRESA, "T_EMPRESA", "T_LVUP_LOGIN", "T_ENDERECO")}
+            excluidas = []
+            nao_encontradas = []
+            removidos = {"T_EMPRESA": excluidas, "T_LVUP_LOGIN": [], "T_ENDERECO": []}
+
+            conexao.autocommit = False
+
+            try:
+                for lote in lotes:
+                    parametros = [{"id_empresa": id_empresa} for id_empresa in lote]
+
+                    # 1. Dependentes de T_EMPRESA
+                    for tabela in TABELAS_DEPENDENTES_EMPRESA:
+                        registro_sql.executar_varios(
+                            cur, ("excluir_dependentes", tabela),
+                            lambda: f"DELETE FROM {tabela} WHERE id_empresa = :id_empresa",
+                            parametros
+                        )
+                        linhas[tabela] += cur.rowcount
+
+                    # 2. Empresas, recolhendo login e endereço pelo RETURNING
+                    ids_login = cur.var(int, arraysize=len(lote))
+                    ids_endereco = cur.var(int, arraysize=len(lote))
+                    cur.setinputsizes(id_login=ids_login, id_endereco=ids_endereco)
+                    cur.executemany("""
+                        DELETE FROM T_EMPRESA WHERE id_empresa = :id_empresa
+                        RETURNING id_login, id_endereco INTO :id_login, :id_endereco
+                    """, parametros)
+
+                    logins = []
+                    enderecos = []
+                    for i, id_empresa in enumerate(lote):
+                        login = ids_login.getvalue(i)
+                        if not login:
+                            nao_encontradas.append(id_empresa)
+                            continue
+                        excluidas.append(id_empresa)
+                        logins.append(login[0])
+                        endereco = ids_endereco.getvalue(i)
+                        if endereco and endereco[0] is not None:
+                            enderecos.append(endereco[0])
+                    linhas["T_EMPRESA"] += len(logins)
+
+                    # 3. Login e endereço das empresas removidas
+                    logins = list(dict.fromkeys(logins))
+                    enderecos = list(dict.fromkeys(enderecos))
+                    if logins:
+                        cur.executemany(
+                            "DELETE FROM T_LVUP_LOGIN WHERE id_login = :id_login",
+                            [{"id_login": id_login} for id_login in logins]
+                        )
+                        linhas["T_LVUP_LOGIN"] += cur.rowcount
+                    if enderecos:
+                        cur.executemany(
+                            "DELETE FROM T_ENDERECO WHERE id_endereco = :id_endereco",
+                            [{"id_endereco": id_endereco} for id_endereco in enderecos]
+                        )
+                        linhas["T_ENDERECO"] += cur.rowcount
+
+                    removidos["T_LVUP_LOGIN"].extend(logins)
+                    removidos["T_ENDERECO"].extend(enderecos)
+
+                conexao.commit()
+                cache_empresas.invalidar(*excluidas)
+                cur.close()
+
+            except Exception as e:
+                conexao.rollback()
+                cur.close()
+                return False, f"Erro durante a exclusão em lote: {str(e)}"
+            finally:
+                conexao.autocommit = True
+
+        for tabela, chaves in removidos.items():
+            for chave in chaves:
+                notificar_indice_busca("remover", tabela, chave)
+        for id_empresa in excluidas:
+            lista_preview_empresas.registrar("remover", id_empresa)
+
+        return True, {
+            "linhas": linhas,
+            "excluidas": excluidas,
+            "nao_encontradas": nao_encontradas,
+            "lotes": len(lotes),
+            "segundos": time.perf_counter() - inicio
+        }
+
+    except Exception as e:
+        return False, f"Erro ao processar exclusão em lote: {str(e)}"
@@ -0,0 +1,505 @@
+"""Exportação de empresas: JSON, JSONL em streaming e snapshot colunar (Parquet ou .lvcol)."""
+
+from __future__ import annotations
+
+import os
+import json
+import mmap
+import struct
+from array import array
+from datetime import datetime, date, timedelta
+from typing import TYPE_CHECKING
+
+from .metricas import instrumentar, tamanho_arquivo_do_argumento
+from .conexao import usar_conexao
+from .consultas import definir_fabrica_linhas
+
+if TYPE_CHECKING:
+    import oracledb
+
+# ==========================================================
+#   EXPORTAR PARA JSON
+# ==========================================================
+
+# ========= EXPORTAR PACIENTES PARA JSON =========
+@instrumentar(_linhas=lambda args, kwargs, valor: len(args[0] if args else kwargs.get("_dados") or ()), _bytes=tamanho_arquivo_do_argumento(1, "_nome_arquivo", "empresa.json"))
+def exportar_para_json(_dados: list[dict], _nome_arquivo: str = "empresa.json") -> tuple[bool, any]:
+    try:
+        if not _dados:
+            return (False, "Nenhum dado recebido para exportar.")
+        
+
+        for item in _dados:
+            for chave, valor in item.items():
+                if isinstance(valor, datetime):
+                    item[chave] = valor.strftime("%d/%m/%Y %H:%M")
+                elif isinstance(valor, date):
+                    item[chave] = valor.strftime("%d/%m/%Y")
+
+        # Salva os dados em um arquivo JSON
+        with open(_nome_arquivo, "w", encoding="utf-8") as arquivo_json:
+            json.dump(_dados, arquivo_json, ensure_ascii=False, indent=4)
+
+        return (True, None)
+
+    except Exception as e:
+        return (False, e)
+
+# ========= EXPORTAR CONSULTA EM STREAMING =========
+SQL_EMPRESAS_COMPLETAS = """
+        SELECT 
+            e.id_empresa,
+            e.nm_empresa,
+            e.cnpj_empresa,
+            e.email_empresa,
+            e.dt_cadastro,
+            e.st_empresa,
+            l.login,
+            l.st_ativo AS st_login,
+            endr.cep,
+            endr.pais,
+            endr.estado,
+            endr.cidade,
+            endr.bairro,
+            endr.rua,
+            endr.numero,
+            endr.complemento
+        FROM T_EMPRESA e
+        LEFT JOIN T_LVUP_LOGIN l ON e.id_login = l.id_login
+        LEFT JOIN T_ENDERECO endr ON e.id_endereco = endr.id_endereco
+        ORDER BY e.id_empresa
+        """
+
+def formatar_valor_json(_valor):
+    """Usado como default do json: formata datas como exportar_para_json() e converte o resto para texto."""
+    if isinstance(_valor, datetime):
+        return _valor.strftime("%d/%m/%Y %H:%M")
+    if isinstance(_valor, date):
+        return _valor.strftime("%d/%m/%Y")
+    return str(_valor)
+
+@instrumentar(_linhas=lambda args, kwargs, valor: valor, _bytes=tamanho_arquivo_do_argumento(1, "_nome_arquivo"))
+def exportar_consulta_streaming(
+    _conexao: oracledb.Connection,
+    _nome_arquivo: str,
+    _sql: str = SQL_EMPRESAS_COMPLETAS,
+    _parametros: dict | None = None,
+    _formato: str = "jsonl",
+    _tamanho_lote: int = 1000
+) -> tuple[bool, any]:
+    """
+    Exporta o resultado de uma consulta direto do cursor para o arquivo, lote a lote (fetchmany),
+    sem montar a lista completa na memória: o pico de memória depende só de _tamanho_lote.
+    _formato = "jsonl" grava um objeto por linha; "json" grava uma lista JSON.
+    Retorna (True, quantidade de linhas exportadas) ou (False, erro)
+    """
+    try:
+        if _formato not in ("jsonl", "json"):
+            return (False, f"Formato inválido: {_formato}. Use 'jsonl' ou 'json'.")
+
+        codificador = json.JSONEncoder(ensure_ascii=False, default=formatar_valor_json)
+        total = 0
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            cur.arraysize = _tamanho_lote
+            cur.prefetchrows = _tamanho_lote
+            cur.execute(_sql, _parametros or {})
+            definir_fabrica_linhas(cur, _sql, "dict")
+
+            with open(_nome_arquivo, "w", encoding="utf-8", buffering=1024 * 1024) as arquivo:
+                if _formato == "json":
+                    arquivo.write("[")
+
+                while True:
+                    linhas = cur.fetchmany()
+                    if not linhas:
+                        break
+
+                    for linha in linhas:
+                        texto = codificador.encode(linha)
+                        if _formato == "jsonl":
+                            arquivo.write(texto)
+                            arquivo.write("\n")
+                        else:
+                            arquivo.write(",\n" if total else "\n")
+                            arquivo.write(texto)
+                        total += 1
+
+                if _formato == "json":
+                    arquivo.write("\n]\n")
+
+            cur.close()
+
+        return (True, total)
+
+    except Exception as e:
+        return (False, e)
+
+# ==========================================================
+#   SNAPSHOT COLUNAR (ARROW, PARQUET OU .LVCOL)
+# ==========================================================
+
+# Tipos das colunas de SQL_EMPRESAS_COMPLETAS; colunas não listadas são gravadas como texto.
+# "dicionario" = poucos valores distintos, gravados como códigos + lista de valores.
+ESQUEMA_SNAPSHOT_EMPRESAS = {
+    "id_empresa": "inteiro",
+    "dt_cadastro": "data",
+    "st_empresa": "dicionario",
+    "st_login": "dicionario",
+    "pais": "dicionario",
+    "estado": "dicionario",
+    "numero": "inteiro"
+}
+
+ASSINATURA_LVCOL = b"LVCOL001"
+EPOCA_SNAPSHOT = datetime(1970, 1, 1)
+
+def _alinhar_8(_arquivo) -> None:
+    resto = _arquivo.tell() % 8
+    if resto:
+        _arquivo.write(b"\0" * (8 - resto))
+
+def _gravar_snapshot_lvcol(_caminho: str, _colunas: dict, _esquema: dict, _quantidade: int) -> None:
+    """
+    Grava as colunas no formato .lvcol:
+        "LVCOL001" + tamanho do cabeçalho (uint32) + cabeçalho JSON + buffers alinhados em 8 bytes.
+    Inteiros e datas viram int64 (datas em segundos desde 1970), textos viram offsets int64 + UTF-8,
+    colunas "dicionario" viram códigos uint16/uint32 + lista de valores no cabeçalho.
+    Cada coluna com nulos tem um buffer de validade (1 byte por linha).
+    """
+    buffers = []   # (coluna, nome_buffer, bytes)
+    descricao = []
+
+    for nome, valores in _colunas.items():
+        tipo = _esquema.get(nome, "texto")
+        coluna = {"nome": nome, "tipo": tipo, "buffers": {}}
+
+        if any(v is None for v in valores):
+            buffers.append((coluna, "validade", array("B", (v is not None for v in valores)).tobytes()))
+
+        if tipo == "inteiro":
+            buffers.append((coluna, "valores", array("q", (0 if v is None else int(v) for v in valores)).tobytes()))
+
+        elif tipo == "data":
+            segundos = array("q")
+            for v in valores:
+                if v is None:
+                    segundos.append(0)
+                else:
+                    if not isinstance(v, datetime):
+                        v = datetime(v.year, v.month, v.day)
+                    segundos.append(int((v.replace(tzinfo=None) - EPOCA_SNAPSHOT).total_seconds()))
+            buffers.append((coluna, "valores", segundos.tobytes()))
+
+        elif tipo == "dicionario":
+            dicionario = {}
+            codigos = [dicionario.setdefault(str(v), len(dicionario)) if v is not None else 0 for v in valores]
+            formato = "H" if len(dicionario) <= 0xFFFF else "I"
+            coluna["formato"] = formato
+            coluna["dicionario"] = list(dicionario)
+            buffers.append((coluna, "valores", array(formato, codigos).tobytes()))
+
+        else:
+            offsets = array("q", [0])
+            dados = bytearray()
+            for v in valores:
+                if v is not None:
+                    dados.extend(str(v).encode("utf-8"))
+                offsets.append(len(dados))
+            buffers.append((coluna, "offsets", offsets.tobytes()))
+            buffers.append((coluna, "valores", bytes(dados)))
+
+        descricao.append(coluna)
+
+    # Calcula a posição de cada buffer (relativa ao início da área de dados)
+    posicao = 0
+    for coluna, nome_buffer, dados in buffers:
+        coluna["buffers"][nome_buffer] = [posicao, len(dados)]
+        posicao += len(dados)
+        posicao += (8 - posicao % 8) % 8
+
+    cabecalho = json.dumps({"linhas": _quantidade, "colunas": descricao}, ensure_ascii=False).encode("utf-8")
+
+    with open(_caminho, "wb") as arquivo:
+        arquivo.write(ASSINATURA_LVCOL)
+        arquivo.write(struct.pack("<I", len(cabecalho)))
+        arquivo.write(cabecalho)
+        _alinhar_8(arquivo)
+        for _, _, dados in buffers:
+            arquivo.write(dados)
+            _alinhar_8(arquivo)
+
+class ColunaSnapshot:
+    """Coluna de um SnapshotColunar; os valores são lidos direto do arquivo mapeado (sem cópia)."""
+
+    def __init__(self, _descricao: dict, _mapa: memoryview, _quantidade: int):
+        self.nome = _descricao["nome"]
+        self.tipo = _descricao["tipo"]
+        self.dicionario = _descricao.get("dicionario")
+        self._quantidade = _quantidade
+        self._visoes = []
+
+        def visao(_nome_buffer: str, _formato: str | None):
+            if _nome_buffer not in _descricao["buffers"]:
+                return None
+            inicio, tamanho = _descricao["buffers"][_nome_buffer]
+            trecho = _mapa[inicio:inicio + tamanho]
+            if _formato:
+                trecho = trecho.cast(_formato)
+            self._visoes.append(trecho)
+            return trecho
+
+        self.validade = visao("validade", "B")
+        if self.tipo in ("inteiro", "data"):
+            self.valores = visao("valores", "q")
+        elif self.tipo == "dicionario":
+            self.valores = visao("valores", _descricao.get("formato", "H"))
+        else:
+            self.offsets = visao("offsets", "q")
+            self.valores = visao("valores", None)
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def como_array(self):
+        """
+        A coluna inteira como array, sem montar linhas. Com numpy: inteiros em int64, datas em
+        datetime64[s] e dicionários nos códigos (uint16/uint32, valores em self.dicionario), todos
+        visões do arquivo mapeado, sem cópia; textos num array de objetos (decodificados aqui).
+        Sem numpy: a memoryview tipada (textos: lista de str). Nulos ficam em self.validade (0 = nulo)
+        e valem 0 no array. O array só vale enquanto o snapshot estiver aberto.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if self.tipo in ("inteiro", "data", "dicionario"):
+            if np is None:
+                return self.valores
+            valores = np.frombuffer(self.valores, dtype=self.valores.format)
+            return valores.view("datetime64[s]") if self.tipo == "data" else valores
+
+        textos = [self[indice] for indice in range(self._quantidade)]
+        return textos if np is None else np.array(textos, dtype=object)
+
+    def __getitem__(self, _indice: int):
+        if self.validade is not None and not self.validade[_indice]:
+            return None
+        if self.tipo == "inteiro":
+            return self.valores[_indice]
+        if self.tipo == "data":
+            return EPOCA_SNAPSHOT + timedelta(seconds=self.valores[_indice])
+        if self.tipo == "dicionario":
+            return self.dicionario[self.valores[_indice]]
+        return bytes(self.valores[self.offsets[_indice]:self.offsets[_indice + 1]]).decode("utf-8")
+
+    def liberar(self) -> None:
+        for trecho in self._visoes:
+            trecho.release()
+        self._visoes.clear()
+
+class SnapshotColunar:
+    """
+    Leitor de arquivos .lvcol: o arquivo é aberto com mmap e cada coluna aponta direto
+    para os bytes mapeados, então recarregar o snapshot não copia os dados.
+    """
+
+    def __init__(self, _caminho: str):
+        self.caminho = _caminho
+        self._arquivo = open(_caminho, "rb")
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mapa[:8] != ASSINATURA_LVCOL:
+            self._mapa.close()
+            self._arquivo.close()
+            raise ValueError(f"Arquivo '{_caminho}' não é um snapshot .lvcol válido.")
+
+        (tamanho_cabecalho,) = struct.unpack_from("<I", self._mapa, 8)
+        cabecalho = json.loads(self._mapa[12:12 + tamanho_cabecalho].decode("utf-8"))
+        inicio_dados = 12 + tamanho_cabecalho
+        inicio_dados += (8 - inicio_dados % 8) % 8
+
+        self.quantidade = cabecalho["linhas"]
+        self._visao_dados = memoryview(self._mapa)[inicio_dados:]
+        self._colunas = {}
+        for descricao in cabecalho["colunas"]:
+            self._colunas[descricao["nome"]] = ColunaSnapshot(descricao, self._visao_dados, self.quantidade)
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    @property
+    def colunas(self) -> list[str]:
+        return list(self._colunas)
+
+    def coluna(self, _nome: str) -> ColunaSnapshot:
+        return self._colunas[_nome]
+
+    def linha(self, _indice: int) -> dict:
+        return {nome: coluna[_indice] for nome, coluna in self._colunas.items()}
+
+    def para_pandas(self):
+        """
+        DataFrame montado coluna a coluna com como_array() (sem um dict por linha): numéricos e
+        datas sem nulos apontam para o arquivo mapeado; dicionários viram Categorical e nulos
+        viram <NA>/NaT/None. Requer pandas.
+        """
+        import numpy as np
+        import pandas as pd
+
+        dados = {}
+        for nome, coluna in self._colunas.items():
+            valores = coluna.como_array()
+            nulos = None if coluna.validade is None else np.frombuffer(coluna.validade, dtype=np.uint8) == 0
+
+            if coluna.tipo == "dicionario":
+                codigos = valores.astype(np.int32)  # -1 marca nulo no Categorical
+                if nulos is not None:
+                    codigos[nulos] = -1
+                dados[nome] = pd.Categorical.from_codes(codigos, categories=coluna.dicionario)
+            elif nulos is None or coluna.tipo == "texto":
+                dados[nome] = valores  # textos nulos já vêm como None
+            elif coluna.tipo == "inteiro":
+                dados[nome] = pd.arrays.IntegerArray(valores, nulos)
+            else:
+                dados[nome] = np.where(nulos, np.datetime64("NaT", "s"), valores)
+
+        return pd.DataFrame(dados, copy=False)
+
+    def __iter__(self):
+        for indice in range(self.quantidade):
+            yield self.linha(indice)
+
+    def fechar(self) -> None:
+        for coluna in self._colunas.values():
+            coluna.liberar()
+        self._visao_dados.release()
+        self._mapa.close()
+        self._arquivo.close()
+
+# ========= EXPORTAR SNAPSHOT COLUNAR =========
+# "arrow" (Arrow IPC sem compressão: recarga sem cópia), "parquet" (compacto, mas a recarga
+# descomprime e decodifica) ou "lvcol" (formato nativo, sem pyarrow)
+FORMATOS_SNAPSHOT = {"arrow": ".arrow", "parquet": ".parquet", "lvcol": ".lvcol"}
+
+_pyarrow = None
+
+def carregar_pyarrow() -> tuple:
+    """
+    Importa o pyarrow (opcional e pesado) só quando um snapshot é gravado ou lido.
+    Retorna (pyarrow, pyarrow.parquet) ou (None, None) se não estiver instalado.
+    """
+    global _pyarrow
+
+    if _pyarrow is None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            _pyarrow = (pa, pq)
+        except ImportError:  # sem pyarrow o snapshot colunar usa o formato .lvcol
+            _pyarrow = (None, None)
+
+    return _pyarrow
+
+@instrumentar(_linhas=lambda args, kwargs, valor: valor["linhas"], _bytes=lambda args, kwargs, valor: os.path.getsize(valor["arquivo"]))
+def exportar_snapshot_colunar(
+    _conexao: oracledb.Connection,
+    _nome_arquivo: str,
+    _sql: str = SQL_EMPRESAS_COMPLETAS,
+    _esquema: dict = ESQUEMA_SNAPSHOT_EMPRESAS,
+    _tamanho_lote: int = 1000,
+    _formato: str | None = None
+) -> tuple[bool, any]:
+    """
+    Exporta a consulta em formato colunar (_formato em FORMATOS_SNAPSHOT): por padrão Arrow IPC
+    (.arrow) quando o pyarrow está instalado, senão o formato nativo .lvcol. As colunas
+    "dicionario" do esquema (estado, país e status) são gravadas com codificação por dicionário.
+    Retorna (True, {"linhas", "formato", "arquivo"}) ou (False, erro)
+    """
+    try:
+        pa, pq = carregar_pyarrow()
+        formato = _formato or ("arrow" if pa is not None else "lvcol")
+        if formato not in FORMATOS_SNAPSHOT:
+            return (False, f"Formato de snapshot inválido: {formato}. Use {', '.join(FORMATOS_SNAPSHOT)}.")
+        if formato != "lvcol" and pa is None:
+            return (False, f"pyarrow não está instalado; não é possível gravar o formato {formato}.")
+        usar_pyarrow = formato != "lvcol"
+        base, _ = os.path.splitext(_nome_arquivo)
+        nome_arquivo = base + FORMATOS_SNAPSHOT[formato]
+
+        with usar_conexao(_conexao) as conexao:
+            cur = conexao.cursor()
+            cur.arraysize = _tamanho_lote
+            cur.prefetchrows = _tamanho_lote
+            cur.execute(_sql)
+            colunas_cursor = [c[0].lower() for c in cur.description]
+            colunas = {nome: [] for nome in colunas_cursor}
+            quantidade = 0
+
+            while True:
+                linhas = cur.fetchmany()
+                if not linhas:
+                    break
+                for linha in linhas:
+                    for nome, valor in zip(colunas_cursor, linha):
+                        colunas[nome].append(valor)
+                quantidade += len(linhas)
+
+            cur.close()
+
+        if usar_pyarrow:
+            arrays = []
+            for nome in colunas_cursor:
+                tipo = _esquema.get(nome, "texto")
+                if tipo == "dicionario":
+                    arrays.append(pa.array(colunas[nome], type=pa.string()).dictionary_encode())
+                elif tipo == "texto":
+                    arrays.append(pa.array([None if v is None else str(v) for v in colunas[nome]], type=pa.string()))
+                else:
+                    arrays.append(pa.array(colunas[nome]))
+            tabela = pa.Table.from_arrays(arrays, names=colunas_cursor)
+            if formato == "parquet":
+                pq.write_table(tabela, nome_arquivo, use_dictionary=[
+                    nome for nome in colunas_cursor if _esquema.get(nome) == "dicionario"
+                ])
+            else:
+                # Sem compressão: os buffers no arquivo já têm o layout da memória do Arrow
+                with pa.OSFile(nome_arquivo, "wb") as destino, pa.ipc.new_file(destino, tabela.schema) as escritor:
+                    escritor.write_table(tabela)
+        else:
+            _gravar_snapshot_lvcol(nome_arquivo, colunas, _esquema, quantidade)
+
+        return (True, {"linhas": quantidade, "formato": formato, "arquivo": nome_arquivo})
+
+    except Exception as e:
+        return (False, e)
+
+# ========= CARREGAR SNAPSHOT COLUNAR =========
+def carregar_snapshot_colunar(_caminho: str) -> tuple[bool, any]:
+    """
+    Abre um snapshot gerado por exportar_snapshot_colunar().
+    Retorna (True, pyarrow.Table) para .arrow/.parquet, (True, SnapshotColunar) para .lvcol ou (False, erro).
+      - .arrow: arquivo mapeado (pa.memory_map + pa.ipc.open_file); os buffers da tabela apontam
+        para o mapeamento, sem cópia nem decodificação;
+      - .parquet: lido com memory_map=True, mas as páginas são descomprimidas e decodificadas em
+        buffers novos (não é recarga sem cópia; use .arrow para isso);
+      - .lvcol: cada coluna é uma visão do arquivo mapeado.
+    Para pandas: tabela.to_pandas() (.arrow/.parquet) ou snapshot.para_pandas() (.lvcol, coluna a coluna).
+    """
+    try:
+        extensao = os.path.splitext(_caminho)[1].lower()
+        if extensao in (".arrow", ".parquet"):
+            pa, pq = carregar_pyarrow()
+            if pa is None:
+                return (False, f"pyarrow não está instalado; não é possível ler arquivos {extensao}.")
+            if extensao == ".parquet":
+                return (True, pq.read_table(_caminho, memory_map=True))
+            return (True, pa.ipc.open_file(pa.memory_map(_caminho, "r")).read_all())
+
+        return (True, SnapshotColunar(_caminho))
+
+    except Exception as e:
+        return (False, e)
+    
@@ -0,0 +1,209 @@
+"""Formulários interativos que montam os dados de T_ENDERECO, T_LVUP_LOGIN e T_EMPRESA."""
+
+from datetime import datetime
+
+from .terminal import imprimir_linha_separadora, obter_int, obter_sim_nao, obter_texto
+from .validacao import obter_cnpj, obter_email
+from .cep import buscar_endereco_por_cep
+
+def obter_endereco(_msg_input: str, _msg_erro: str) -> dict:
+    """Consulta a API ViaCEP com o CEP informado e retorna o endereço completo.
+    Aceita CEP com ou sem traço, exibe mensagem de erro personalizada.
+    As consultas passam pelo cache_cep (memória + disco).
+    API pública: https://viacep.com.br
+    """
+    
+    endereco = None
+
+    while endereco is None:
+        cep = input(_msg_input).strip().replace("-", "").replace(".", "").replace(" ", "")
+
+        if not (cep.isdigit() and len(cep) == 8):
+            print(f"{_msg_erro}\n")
+            continue
+
+        ok, endereco = buscar_endereco_por_cep(cep)
+
+        if not ok or endereco is None:
+            print(f"{_msg_erro}\n") # CEP inválido ou não encontrado. Tente novamente.
+            endereco = None
+
+    return endereco
+
+def obter_cep(_endereco: dict) -> str:
+    """Retorna o CEP do endereço obtido pela função obter_endereco()."""
+    return _endereco.get("cep", "")
+
+def obter_rua(_endereco: dict) -> str:
+    """Retorna o logradouro do endereço obtido pela função obter_endereco()."""
+    return _endereco.get("logradouro", "")
+
+def obter_bairro(_endereco: dict) -> str:
+    """Retorna o bairro do endereço obtido pela função obter_endereco()."""
+    return _endereco.get("bairro", "")
+
+def obter_cidade(_endereco: dict) -> str:
+    """Retorna a cidade do endereço obtido pela função obter_endereco()."""
+    return _endereco.get("cidade", "")
+
+def obter_estado(_endereco: dict) -> str:
+    """Retorna o estado do endereço obtido pela função obter_endereco()."""
+    return _endereco.get("estado", "")
+
+def obter_pais(_endereco: dict) -> str:
+    """Retorna o país associado ao endereço obtido pela função obter_endereco()."""
+    return _endereco.get("pais", "BRA")
+
+# ==========================================================
+#   SOLICITAÇÃO DE DADOS T_ENDERECO
+# ==========================================================
+
+def solicitar_dados_endereco() -> tuple[bool, any]:  # dict ou erro
+    """
+    Solicita e retorna todos os dados da tabela T_ENDERECO.
+    
+    Retorno:
+        (True, dict)  -> quando os dados são obtidos com sucesso
+        (False, erro) -> quando ocorre alguma exceção
+    """
+    try:
+        print("INFORMAÇÕES DE ENDEREÇO\n")
+
+        # ===== 1. CEP + consulta automática =====
+        endereco = obter_endereco(
+            "Digite o CEP (ex: 01310200): ",
+            "CEP inválido! Digite um CEP com 8 números."
+        )
+
+        # ===== 2. País, Estado, Cidade, Bairro, Rua =====
+        pais = obter_pais(endereco)
+        estado = obter_estado(endereco)
+        cidade = obter_cidade(endereco)
+        bairro = obter_bairro(endereco)
+        rua = obter_rua(endereco)
+
+        imprimir_linha_separadora("=", 40)
+
+        # ===== 3. Número =====
+        numero = obter_int(
+            "Número da residência: ",
+            "Entrada inválida. Digite apenas números."
+        )
+
+        # ===== 5. Retorno final =====
+        dados = {
+            "cep": endereco["cep"],
+            "pais": pais,
+            "estado": estado,
+            "cidade": cidade,
+            "bairro": bairro,
+            "rua": rua,
+            "numero": numero
+        }
+
+        return (True, dados)
+
+    except Exception as e:
+        return (False, e)
+
+def solicitar_dados_t_lvup_login() -> tuple[bool, any]:  # dict ou erro
+    try:
+        print("INFORMAÇÕES DE LOGIN\n")
+
+        login = obter_texto("Digite o login (ex: seu.usuario): ","Entrada inválida. O campo não pode ficar vazio.")
+        imprimir_linha_separadora("=", 40)
+
+        senha = obter_texto("Digite a senha: ","Entrada inválida. O campo não pode ficar vazio.")
+
+        dados = {
+            "login": login,
+            "senha": senha,
+            "st_ativo": "S",
+        }
+        return (True, dados)
+
+    except Exception as e:
+        return (False, e)
+
+def solicitar_dados_t_empresa() -> tuple[bool, any]:  # dict ou erro
+    try:
+        print("INFORMAÇÕES DA EMPRESA\n")
+
+        nm_empresa = obter_texto("Nome da Empresa: ", "Entrada inválida. O campo não pode ficar vazio")
+        imprimir_linha_separadora("=", 40)
+
+        cnpj_empresa = obter_cnpj("CNPJ da Empresa (ex: 00.000.000/0000-00): ", "Entrada inválida. Digite um CNPJ com 14 números.")
+        imprimir_linha_separadora("=", 40)
+
+        email_empresa = obter_email("E-mail da Empresa: ","Formato de e-mail incorreto. Digite um e-mail válido da empresa.")
+
+        dt_cadastro = datetime.now()
+
+        dados = {
+            "nm_empresa": nm_empresa,
+            "cnpj_empresa": cnpj_empresa,
+            "email_empresa": email_empresa,
+            "dt_cadastro": dt_cadastro,
+            "st_empresa": "A"
+        }
+
+        return (True, dados)
+
+    except Exception as e:
+        return (False, e)
+
+def solicitar_alteracao_empresa(_index: int) -> tuple[bool, any]:  # dict ou erro
+    """
+    Pede o novo valor de um campo da empresa (mesma numeração 1..16 de atualizar_dados_empresa_por_id)
+    e devolve as alterações no formato aceito por atualizar_empresa_parcial().
+    O CEP traz junto país, estado, cidade, bairro e rua; a data de cadastro usa SYSDATE (None).
+    """
+    try:
+        match _index:
+            case 1:
+                return (False, "Não é possível atualizar o ID.")
+            case 2:
+                return (True, {"nm_empresa": obter_texto("Novo nome da empresa: ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 3:
+                return (True, {"cnpj_empresa": obter_cnpj("Novo CNPJ da empresa (ex: 00.000.000/0000-00): ", "Entrada inválida. Digite um CNPJ com 14 números.")})
+            case 4:
+                return (True, {"email_empresa": obter_email("Novo e-mail da empresa: ", "Formato de e-mail incorreto. Digite um e-mail válido.")})
+            case 5:
+                return (True, {"dt_cadastro": None})
+            case 6:
+                ativa = obter_sim_nao("Empresa está ativa? (S/N): ", "Entrada inválida! Digite 'S' para Sim ou 'N' para Não.")
+                return (True, {"st_empresa": "A" if ativa else "I"})
+            case 7:
+                return (True, {"login": obter_texto("Novo login: ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 8:
+                ativo = obter_sim_nao("Login está ativo? (S/N): ", "Entrada inválida! Digite 'S' para Sim ou 'N' para Não.")
+                return (True, {"st_login": "S" if ativo else "N"})
+            case 9:
+                endereco = obter_endereco("Novo CEP (ex: 01310200): ", "CEP inválido! Digite um CEP com 8 números.")
+                return (True, {
+                    "cep": obter_cep(endereco),
+                    "pais": obter_pais(endereco),
+                    "estado": obter_estado(endereco),
+                    "cidade": obter_cidade(endereco),
+                    "bairro": obter_bairro(endereco),
+                    "rua": obter_rua(endereco)
+                })
+            case 10:
+                return (True, {"pais": obter_texto("Novo país (ex: BRA): ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 11:
+                return (True, {"estado": obter_texto("Novo estado (ex: SP): ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 12:
+                return (True, {"cidade": obter_texto("Nova cidade: ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 13:
+                return (True, {"bairro": obter_texto("Novo bairro: ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 14:
+                return (True, {"rua": obter_texto("Nova rua: ", "Entrada inválida. O campo não pode ficar vazio")})
+            case 15:
+                return (True, {"numero": obter_int("Novo número: ", "Entrada inválida. Digite apenas números.")})
+            case 16:
+                return (True, {"complemento": obter_texto("Novo complemento: ", "Entrada inválida. O campo não pode ficar vazio")})
+            case _:
+                return (False, "Campo inválido!")
+
+    except Exception as e:
+        return (False, e)
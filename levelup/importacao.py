@@ -0,0 +1,371 @@
+"""Importação em lote de empresas a partir de arquivos CSV, JSON ou JSON Lines."""
+
+from __future__ import annotations
+
+import os
+import csv
+import json
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .validacao import normalizar_cep, normalizar_cnpj, validar_email
+from .metricas import instrumentar
+from .conexao import usar_conexao
+from .consultas import lista_preview_empresas
+from .busca import notificar_indice_busca, sem_colunas_secretas
+
+if TYPE_CHECKING:
+    import oracledb
+
+# ==========================================================
+#   IMPORTAÇÃO EM LOTE
+# ==========================================================
+
+COLUNAS_OBRIGATORIAS_IMPORTACAO = [
+    "login", "senha",
+    "cep", "estado", "cidade", "bairro", "rua", "numero",
+    "nm_empresa", "cnpj_empresa", "email_empresa"
+]
+
+# ========= LEITURA DO ARQUIVO EM LOTES =========
+def ler_json_lines(_arquivo):
+    """
+    Gera (numero_linha, dict) de cada linha não vazia de um JSON Lines. Uma linha com JSON
+    inválido vem como ValueError (com o motivo) e é recusada na validação, sem parar a leitura.
+    """
+    for numero, texto in enumerate(_arquivo, start=1):
+        if not texto.strip():
+            continue
+        try:
+            yield (numero, json.loads(texto))
+        except ValueError as e:
+            yield (numero, ValueError(f"JSON inválido: {e}"))
+
+def ler_lista_json(_arquivo, _tamanho_bloco: int = 65536):
+    """
+    Lê uma lista JSON ([{...}, {...}]) item a item com json.JSONDecoder.raw_decode sobre blocos
+    de _tamanho_bloco caracteres: a memória acompanha o bloco e o maior item, não o arquivo.
+    Gera (numero_item, item), a partir de 1. Um item malformado interrompe a leitura com ValueError
+    (sem um separador confiável entre os itens, não há como seguir para o próximo).
+    """
+    decodificador = json.JSONDecoder()
+    texto = ""
+    posicao = 0
+    fim_arquivo = False
+    numero = 0
+    esperando = "["  # "[", depois "item" e "," alternados até o "]"
+
+    def ler_mais() -> None:
+        nonlocal texto, posicao, fim_arquivo
+        bloco = _arquivo.read(_tamanho_bloco)
+        texto = texto[posicao:] + bloco
+        posicao = 0
+        fim_arquivo = not bloco
+
+    while True:
+        while posicao < len(texto) and texto[posicao].isspace():
+            posicao += 1
+        if posicao >= len(texto):
+            if fim_arquivo:
+                raise ValueError("JSON incompleto: a lista não foi fechada com ']'.")
+            ler_mais()
+            continue
+
+        caractere = texto[posicao]
+        if esperando == "[":
+            if caractere != "[":
+                raise ValueError("O arquivo .json precisa conter uma lista de objetos.")
+            posicao += 1
+            esperando = "item"
+        elif caractere == "]":
+            return
+        elif esperando == ",":
+            if caractere != ",":
+                raise ValueError(f"JSON inválido depois do item {numero}: esperado ',' ou ']'.")
+            posicao += 1
+            esperando = "item"
+        else:
+            # Número ou literal só é decodificado com o separador seguinte no texto: cortado no
+            # fim do bloco, "15" de "150" seria lido como item completo
+            if (caractere not in '{["' and not fim_arquivo
+                    and texto.find(",", posicao) < 0 and texto.find("]", posicao) < 0):
+                ler_mais()
+                continue
+            try:
+                item, fim_item = decodificador.raw_decode(texto, posicao)
+            except ValueError as e:
+                if fim_arquivo:
+                    raise ValueError(f"JSON inválido no item {numero + 1}: {e}") from None
+                ler_mais()  # item cortado no fim do bloco
+                continue
+            numero += 1
+            posicao = fim_item
+            esperando = ","
+            yield (numero, item)
+
+def ler_arquivo_em_lotes(_caminho: str, _tamanho_lote: int = 500):
+    """
+    Lê um arquivo CSV (separado por vírgula ou ponto e vírgula), JSON Lines (.jsonl)
+    ou JSON (lista de objetos) e gera lotes de até _tamanho_lote itens no formato
+    (numero_linha, dict). Os três formatos são lidos de forma incremental; linha de
+    JSON Lines inválida chega como ValueError no lugar do dict.
+    """
+    extensao = os.path.splitext(_caminho)[1].lower()
+    lote = []
+
+    with open(_caminho, "r", encoding="utf-8-sig", newline="") as arquivo:
+        if extensao == ".csv":
+            amostra = arquivo.read(4096)
+            arquivo.seek(0)
+            delimitador = ";" if amostra.count(";") > amostra.count(",") else ","
+            # linha 1 é o cabeçalho
+            linhas = enumerate(csv.DictReader(arquivo, delimiter=delimitador), start=2)
+        elif extensao == ".jsonl":
+            linhas = ler_json_lines(arquivo)
+        elif extensao == ".json":
+            linhas = ler_lista_json(arquivo)
+        else:
+            raise ValueError(f"Formato de arquivo não suportado: '{extensao}'. Use .csv, .json ou .jsonl.")
+
+        for numero, linha in linhas:
+            lote.append((numero, linha))
+            if len(lote) >= _tamanho_lote:
+                yield lote
+                lote = []
+
+    if lote:
+        yield lote
+
+# ========= VALIDAÇÃO DE UMA LINHA =========
+def validar_linha_importacao(_linha: dict) -> tuple[bool, any]:
+    """
+    Valida e normaliza uma linha do arquivo de importação.
+    Retorna (True, (dados_login, dados_endereco, dados_empresa)) ou (False, motivo).
+    """
+    if isinstance(_linha, ValueError):
+        return (False, str(_linha))  # linha ilegível (JSON inválido), vinda de ler_arquivo_em_lotes
+    if not isinstance(_linha, dict):
+        return (False, "Linha não é um objeto com campos nomeados.")
+
+    linha = {}
+    for chave, valor in _linha.items():
+        if chave is None:
+            continue
+        linha[str(chave).strip().lower()] = "" if valor is None else str(valor).strip()
+
+    faltando = [campo for campo in COLUNAS_OBRIGATORIAS_IMPORTACAO if not linha.get(campo)]
+    if faltando:
+        return (False, f"Campos obrigatórios vazios: {', '.join(faltando)}")
+
+    cnpj = normalizar_cnpj(linha["cnpj_empresa"])
+    if cnpj is None:
+        return (False, "CNPJ inválido (precisa ter 14 números).")
+
+    cep = normalizar_cep(linha["cep"])
+    if cep is None:
+        return (False, "CEP inválido (precisa ter 8 números).")
+
+    if not validar_email(linha["email_empresa"]):
+        return (False, "E-mail da empresa inválido.")
+
+    try:
+        numero = int(linha["numero"])
+    except ValueError:
+        return (False, "Número do endereço precisa ser inteiro.")
+
+    estado = linha["estado"].upper()
+    if len(estado) != 2:
+        return (False, "Estado precisa ter 2 letras (ex: SP).")
+
+    dt_cadastro = linha.get("dt_cadastro") or datetime.now().strftime("%d/%m/%Y")
+    try:
+        dt_cadastro = datetime.strptime(dt_cadastro, "%d/%m/%Y").strftime("%d/%m/%Y")
+    except ValueError:
+        return (False, "Data de cadastro inválida. Use DD/MM/AAAA.")
+
+    st_ativo = (linha.get("st_ativo") or "S").upper()[0]
+    st_empresa = (linha.get("st_empresa") or "A").upper()[0]
+    if st_ativo not in ("S", "N") or st_empresa not in ("A", "I"):
+        return (False, "Status inválido (st_ativo: S/N, st_empresa: A/I).")
+
+    dados_login = {
+        "login": linha["login"],
+        "senha": linha["senha"],
+        "st_ativo": st_ativo
+    }
+    dados_endereco = {
+        "cep": f"{cep[:5]}-{cep[5:]}",
+        "pais": (linha.get("pais") or "BRA").upper(),
+        "estado": estado,
+        "cidade": linha["cidade"],
+        "bairro": linha["bairro"],
+        "rua": linha["rua"],
+        "numero": numero,
+        "complemento": linha.get("complemento") or None
+    }
+    dados_empresa = {
+        "nm_empresa": linha["nm_empresa"],
+        "cnpj_empresa": cnpj,
+        "email_empresa": linha["email_empresa"],
+        "dt_cadastro": dt_cadastro,
+        "st_empresa": st_empresa
+    }
+
+    return (True, (dados_login, dados_endereco, dados_empresa))
+
+# ========= INSERT EM LOTE (ARRAY DML) =========
+def executar_lote_com_retorno(_cursor, _comando_sql: str, _linhas: list[dict], _nome_retorno: str) -> list[int]:
+    """
+    Executa um INSERT ... RETURNING ... INTO com executemany (uma ida ao servidor para o lote todo)
+    e devolve a lista de IDs gerados, na mesma ordem das linhas.
+    """
+    ids = _cursor.var(int, arraysize=len(_linhas))
+    _cursor.setinputsizes(**{_nome_retorno: ids})
+    _cursor.executemany(_comando_sql, _linhas)
+    return [ids.getvalue(i)[0] for i in range(len(_linhas))]
+
+def inserir_lote_empresas(_conexao: oracledb.Connection, _registros: list[tuple[dict, dict, dict]]) -> tuple[bool, any]:
+    """
+    Insere um lote de (dados_login, dados_endereco, dados_empresa) com três executemany,
+    ligando os IDs gerados de T_LVUP_LOGIN e T_ENDERECO às linhas de T_EMPRESA.
+    Não faz commit: quem chama decide quando confirmar.
+    Retorna (True, lista de {"id_login", "id_endereco", "id_empresa"}) ou (False, erro)
+    """
+    try:
+        if not _registros:
+            return (True, [])
+
+        cur = _conexao.cursor()
+        try:
+            ids_login = executar_lote_com_retorno(cur, """
+                INSERT INTO T_LVUP_LOGIN (login, senha, st_ativo)
+                VALUES (:login, :senha, :st_ativo)
+                RETURNING id_login INTO :id_login
+            """, [login for login, _, _ in _registros], "id_login")
+
+            ids_endereco = executar_lote_com_retorno(cur, """
+                INSERT INTO T_ENDERECO (cep, pais, estado, cidade, bairro, rua, numero, complemento)
+                VALUES (:cep, :pais, :estado, :cidade, :bairro, :rua, :numero, :complemento)
+                RETURNING id_endereco INTO :id_endereco
+            """, [endereco for _, endereco, _ in _registros], "id_endereco")
+
+            linhas_empresa = []
+            for i, (_, _, empresa) in enumerate(_registros):
+                linhas_empresa.append({**empresa, "id_endereco": ids_endereco[i], "id_login": ids_login[i]})
+
+            ids_empresa = executar_lote_com_retorno(cur, """
+                INSERT INTO T_EMPRESA (
+                    nm_empresa, cnpj_empresa, email_empresa, dt_cadastro, st_empresa, id_endereco, id_login
+                ) VALUES (
+                    :nm_empresa, :cnpj_empresa, :email_empresa, TO_DATE(:dt_cadastro, 'DD/MM/YY'), :st_empresa, :id_endereco, :id_login
+                )
+                RETURNING id_empresa INTO :id_empresa
+            """, linhas_empresa, "id_empresa")
+        finally:
+            cur.close()
+
+        ids = []
+        for i in range(len(_registros)):
+            ids.append({"id_login": ids_login[i], "id_endereco": ids_endereco[i], "id_empresa": ids_empresa[i]})
+        return (True, ids)
+
+    except Exception as e:
+        return (False, e)
+
+# ========= IMPORTAR EMPRESAS DE ARQUIVO =========
+@instrumentar(_linhas=lambda args, kwargs, valor: valor["inseridas"])
+def importar_empresas_arquivo(
+    _conexao: oracledb.Connection,
+    _caminho: str,
+    _tamanho_lote: int = 500,
+    _commit_a_cada: int = 1
+) -> tuple[bool, any]:
+    """
+    Importa empresas de um arquivo CSV/JSON/JSON Lines em lotes.
+    Cada lote é validado e inserido com array DML; o commit acontece a cada
+    _commit_a_cada lotes (e sempre no final).
+
+    Retorno:
+        (True, relatorio) ou (False, relatorio com o campo "erro")
+        relatorio = {lidas, inseridas, rejeitadas: [(linha, motivo)], lotes, segundos, linhas_por_segundo}
+    """
+    relatorio = {
+        "lidas": 0,
+        "inseridas": 0,
+        "rejeitadas": [],
+        "lotes": 0,
+        "segundos": 0.0,
+        "linhas_por_segundo": 0.0
+    }
+    inicio = time.perf_counter()
+    pendentes = []  # (registro, ids) inseridos ainda sem commit
+    lotes_sem_commit = 0
+
+    def confirmar_pendentes():
+        for (login, endereco, empresa), ids in pendentes:
+            notificar_indice_busca("inserir", "T_LVUP_LOGIN", ids["id_login"], sem_colunas_secretas(login))
+            notificar_indice_busca("inserir", "T_ENDERECO", ids["id_endereco"], endereco)
+            notificar_indice_busca("inserir", "T_EMPRESA", ids["id_empresa"], {
+                **empresa, "id_endereco": ids["id_endereco"], "id_login": ids["id_login"]
+            })
+            lista_preview_empresas.registrar("inserir", ids["id_empresa"], empresa.get("nm_empresa"))
+        relatorio["inseridas"] += len(pendentes)
+        pendentes.clear()
+
+    try:
+        with usar_conexao(_conexao) as conexao:
+            conexao.autocommit = False
+
+            try:
+                for lote in ler_arquivo_em_lotes(_caminho, _tamanho_lote):
+                    registros = []
+                    for numero_linha, linha in lote:
+                        relatorio["lidas"] += 1
+                        ok, resultado = validar_linha_importacao(linha)
+                        if ok:
+                            registros.append(resultado)
+                        else:
+                            relatorio["rejeitadas"].append((numero_linha, resultado))
+
+                    ok, resultado = inserir_lote_empresas(conexao, registros)
+                    if not ok:
+                        conexao.rollback()
+                        relatorio["erro"] = (
+                            f"Erro no lote das linhas {lote[0][0]} a {lote[-1][0]}: {resultado}. "
+                            f"{len(pendentes)} linha(s) sem commit foram desfeitas."
+                        )
+                        return (False, relatorio)
+
+                    relatorio["lotes"] += 1
+                    pendentes.extend(zip(registros, resultado))
+                    lotes_sem_commit += 1
+
+                    if lotes_sem_commit >= _commit_a_cada:
+                        conexao.commit()
+                        confirmar_pendentes()
+                        lotes_sem_commit = 0
+
+                conexao.commit()
+                confirmar_pendentes()
+
+            except Exception as e:
+                # Erro fora do lote (leitura do arquivo, commit): desfaz o que não tem commit, senão
+                # o próximo commit da conexão (se ela foi passada direto) gravaria essas linhas
+                conexao.rollback()
+                relatorio["erro"] = f"{e}. {len(pendentes)} linha(s) sem commit foram desfeitas."
+                return (False, relatorio)
+
+            finally:
+                conexao.autocommit = True
+
+        return (True, relatorio)
+
+    except Exception as e:
+        relatorio["erro"] = str(e)
+        return (False, relatorio)
+
+    finally:
+        relatorio["segundos"] = time.perf_counter() - inicio
+        if relatorio["segundos"]:
+            relatorio["linhas_por_segundo"] = relatorio["lidas"] / relatorio["segundos"]
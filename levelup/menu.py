@@ -0,0 +1,709 @@
+"""Menu interativo do sistema (python -m levelup)."""
+
+import os
+
+from .terminal import (
+    exibir_titulo_centralizado,
+    imprimir_linha_separadora,
+    imprimir_lista_como_tabela,
+    imprimir_lista_simples,
+    limpar_terminal,
+    obter_int,
+    obter_int_intervalado,
+    obter_lista_ids,
+    obter_sim_nao,
+    obter_texto
+)
+from .metricas import metricas
+from . import cep
+from .cep import ARQUIVO_INDICE_CEP, MODO_INDICE_CEP, construir_indice_cep
+from .formularios import (
+    solicitar_alteracao_empresa,
+    solicitar_dados_endereco,
+    solicitar_dados_t_empresa,
+    solicitar_dados_t_lvup_login
+)
+from .driver import DRIVER_LOCAL
+from .conexao import abrir_pool_sistema, dsn_sistema
+from .sentencas import pre_montar_sentencas
+from .cadastro import cadastrar_empresa_completa
+from .consultas import lista_preview_empresas, select_empresa_por_id, select_pagina_empresas
+from . import busca
+from .busca import TABELAS_COLUNAS_BUSCA, buscar_no_indice, construir_indice_busca, select_para_generico
+from .alteracao import atualizar_empresa_parcial
+from .exclusao import excluir_empresa_por_id, excluir_empresas_em_lote
+from .exportacao import exportar_consulta_streaming, exportar_para_json, exportar_snapshot_colunar
+from .importacao import COLUNAS_OBRIGATORIAS_IMPORTACAO, importar_empresas_arquivo
+
+# ========================================
+#   CONEXÃO COM O BANCO DE DADOS ORACLE
+# ========================================
+
+def executar_sistema() -> None:
+    """Conecta ao Oracle e executa o menu interativo (ponto de entrada: python -m levelup)."""
+
+    ok, pool_bd = abrir_pool_sistema()
+
+    if ok:
+        limpar_terminal()
+        exibir_titulo_centralizado("✅ CONECTADO AO BANCO DE DADOS COM SUCESSO", 60)
+        if DRIVER_LOCAL:
+            print(f"Usando a base local (SQLite) em {dsn_sistema()}.")
+        else:
+            print("Conexão estabelecida com sucesso com o servidor Oracle da FIAP.")
+        pre_montar_sentencas()
+        if os.environ.get("LEVELUP_INDICE_BUSCA") == "1":
+            ok_indice, total_indexado = construir_indice_busca(pool_bd)
+            if ok_indice:
+                print(f"Índice de busca em memória montado com {total_indexado} registros.")
+            else:
+                print(f"Não foi possível montar o índice de busca: {total_indexado}")
+        input("\nAperte ENTER para acessar o sistema...")
+    else:
+        limpar_terminal()
+        exibir_titulo_centralizado("❌ ERRO AO CONECTAR AO BANCO DE DADOS", 60)
+        print(f"Detalhes do erro:\n{pool_bd}\n")
+        input("Aperte ENTER para encerrar o programa...")
+        exit()
+
+    # ========================================
+    #   MENU PRINCIPAL
+    # ========================================
+
+    while True:
+        limpar_terminal()
+        exibir_titulo_centralizado("LEVEL UP - PORTAL DE EMPRESAS E DEMANDAS", 60)
+
+        print("1 - Cadastrar nova empresa")
+        print("2 - Consultar empresas cadastradas")
+        print("3 - Atualizar informações de uma empresa")
+        print("4 - Remover cadastro de empresa")
+        print("5 - Importar empresas de arquivo (CSV/JSON)")
+        print("6 - Gerar base local de CEPs (uso offline)")
+        print("0 - Sair do sistema")
+
+        escolha_menu_principal = obter_int_intervalado("\nEscolha: ", "Entrada inválida.", 0, 6)
+
+        match escolha_menu_principal:
+
+            case 0:  # Sair do sistema
+                limpar_terminal()
+                print("\nPrograma encerrado. Até logo!\n")
+                break
+
+            case 1:  # Cadastrar nova empresa
+                limpar_terminal()
+                exibir_titulo_centralizado("CADASTRAR NOVA EMPRESA", 60)
+
+                print("\nAntes de continuar, precisamos solicitar algumas informações da empresa.\n")
+
+                deseja_continuar = obter_sim_nao(
+                    "Deseja informar os dados para continuar? (S/N): ",
+                    "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                )
+
+                if not deseja_continuar:
+                    print("\nCadastro cancelado pelo usuário.\n")
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+
+                # FLUXO DE CADASTRO
+                dados_coletados = {}
+
+                # 1. SOLICITAR LOGIN
+                limpar_terminal()
+                exibir_titulo_centralizado("CADASTRAR NOVA EMPRESA — LOGIN", 60)
+                sucesso_login, dados_login = solicitar_dados_t_lvup_login()
+                if not sucesso_login:
+                    print("\nErro ao coletar dados de login:")
+                    print(dados_login)
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+                dados_coletados['login'] = dados_login
+
+                # 2. SOLICITAR ENDEREÇO
+                limpar_terminal()
+                exibir_titulo_centralizado("CADASTRAR NOVA EMPRESA — ENDEREÇO", 60)
+                sucesso_end, dados_endereco = solicitar_dados_endereco()
+                if not sucesso_end:
+                    print("\nErro ao coletar dados de endereço:")
+                    print(dados_endereco)
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+                dados_coletados['endereco'] = dados_endereco
+
+                # 3. SOLICITAR DADOS DA EMPRESA
+                limpar_terminal()
+                exibir_titulo_centralizado("CADASTRAR NOVA EMPRESA — DADOS DA EMPRESA", 60)
+                sucesso_emp, dados_empresa = solicitar_dados_t_empresa()
+                if not sucesso_emp:
+                    print("\nErro ao coletar dados da empresa:")
+                    print(dados_empresa)
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+                dados_coletados['empresa'] = dados_empresa
+
+                # 4. CONFIRMAR CADASTRO
+                limpar_terminal()
+                exibir_titulo_centralizado("CONFIRMAR CADASTRO", 60)
+                print("\nResumo dos dados coletados:")
+                print(f"Login: {dados_login}")
+                print(f"Endereço: {dados_endereco}")
+                print(f"Empresa: {dados_empresa}")
+
+                confirmar = obter_sim_nao(
+                    "\nConfirmar cadastro? (S/N): ",
+                    "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                )
+
+                if not confirmar:
+                    print("\nCadastro cancelado pelo usuário.\n")
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+
+                # 5. INSERIR NO BANCO DE DADOS
+                limpar_terminal()
+                exibir_titulo_centralizado("PROCESSANDO CADASTRO...", 60)
+
+                # INSERE LOGIN, ENDEREÇO E EMPRESA (uma ida ao banco e um único commit)
+                ok_cadastro, ids_cadastro = cadastrar_empresa_completa(pool_bd, dados_login, dados_endereco, dados_empresa)
+                if not ok_cadastro:
+                    print("Erro ao cadastrar empresa no banco (nenhum dado foi gravado):")
+                    print(ids_cadastro)
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+                id_empresa = ids_cadastro["id_empresa"]
+
+                # SUCESSO FINAL
+                print("\n✅ Cadastro concluído com sucesso!")
+                print(f"ID da empresa: {id_empresa}")
+                input("\nAperte ENTER para voltar ao menu principal...")
+
+            case 2:  # Consultar empresas cadastradas
+                while True:
+                    limpar_terminal()
+                    exibir_titulo_centralizado("CONSULTAR EMPRESAS CADASTRADAS", 60)
+
+                    print("1 - Pesquisa genérica (escreva o que quiser)")
+                    print("2 - Pesquisa por ID de empresa")
+                    print("3 - Pesquisa geral (todas as empresas)")
+                    print("4 - Pesquisa rápida (índice em memória, ignora acentos)")
+                    print("0 - Voltar ao menu principal\n")
+
+                    tipo_pesquisa = obter_int_intervalado(
+                        "Escolha o tipo de pesquisa: ",
+                        "Entrada inválida! Digite um número entre 0 e 4.",
+                        0, 4
+                    )
+
+                    if tipo_pesquisa == 0:
+                        break
+
+                    resultados = None
+
+                    match tipo_pesquisa:
+                        case 1:  # PESQUISA GENÉRICA
+                            limpar_terminal()
+                            exibir_titulo_centralizado("PESQUISA GENÉRICA", 60)
+
+                            parametro = obter_texto(
+                                "Escreva o valor para buscar: ", 
+                                "Entrada inválida. O campo não pode ficar vazio."
+                            )
+
+                            tabelas_colunas = TABELAS_COLUNAS_BUSCA
+
+                            ok, resultados = select_para_generico(pool_bd, parametro, tabelas_colunas)
+
+                        case 2:  # PESQUISA POR ID
+                            limpar_terminal()
+                            exibir_titulo_centralizado("PESQUISA POR ID DE EMPRESA", 60)
+
+                            # Preview das empresas
+                            ok_preview, preview_empresas = lista_preview_empresas.obter(pool_bd)
+                            if ok_preview and preview_empresas:
+                                print("Empresas cadastradas:\n")
+                                imprimir_lista_como_tabela(preview_empresas)
+                            else:
+                                print("Nenhuma empresa encontrada para preview.")
+
+                            id_empresa = obter_int(
+                                "\nDigite o ID da empresa que deseja consultar: ",
+                                "Entrada inválida! Digite apenas números."
+                            )
+
+                            ok, resultados = select_empresa_por_id(pool_bd, id_empresa)
+
+                        case 3:  # PESQUISA GERAL (PAGINADA)
+                            tamanho_pagina = 10
+                            ok, resultados = select_pagina_empresas(pool_bd, 0, tamanho_pagina)
+
+                            while ok:
+                                limpar_terminal()
+
+                                if resultados:
+                                    exibir_titulo_centralizado(
+                                        f"PESQUISA GERAL — IDs {resultados[0]['id_empresa']} A {resultados[-1]['id_empresa']}", 60
+                                    )
+                                    imprimir_lista_como_tabela(resultados)
+                                else:
+                                    exibir_titulo_centralizado("PESQUISA GERAL", 60)
+                                    print("Nenhuma empresa nesta página.\n")
+
+                                print("P - Próxima página | A - Página anterior | I - Ir para um ID | S - Sair")
+                                opcao_pagina = obter_texto("Escolha: ", "Entrada inválida.").upper()[0]
+
+                                if opcao_pagina == "S":
+                                    break
+
+                                elif opcao_pagina == "P":
+                                    if len(resultados) < tamanho_pagina:
+                                        input("\nNão há mais páginas. Aperte ENTER para continuar...")
+                                        continue
+                                    ok_pagina, pagina = select_pagina_empresas(pool_bd, resultados[-1]["id_empresa"], tamanho_pagina)
+                                    if ok_pagina and pagina:
+                                        resultados = pagina
+                                    elif ok_pagina:
+                                        input("\nNão há mais páginas. Aperte ENTER para continuar...")
+                                    else:
+                                        ok, resultados = ok_pagina, pagina
+
+                                elif opcao_pagina == "A":
+                                    if not resultados:
+                                        ok_pagina, pagina = select_pagina_empresas(pool_bd, 0, tamanho_pagina)
+                                    else:
+                                        ok_pagina, pagina = select_pagina_empresas(pool_bd, resultados[0]["id_empresa"], tamanho_pagina, _anterior=True)
+                                    if ok_pagina and pagina:
+                                        resultados = pagina
+                                    elif ok_pagina:
+                                        input("\nVocê já está na primeira página. Aperte ENTER para continuar...")
+                                    else:
+                                        ok, resultados = ok_pagina, pagina
+
+                                elif opcao_pagina == "I":
+                                    id_destino = obter_int("ID da empresa: ", "Entrada inválida! Digite apenas números.")
+                                    ok, resultados = select_pagina_empresas(pool_bd, id_destino - 1, tamanho_pagina)
+
+                                else:
+                                    input("\nOpção inválida. Aperte ENTER para continuar...")
+
+                        case 4:  # PESQUISA RÁPIDA
+                            limpar_terminal()
+                            exibir_titulo_centralizado("PESQUISA RÁPIDA", 60)
+
+                            if busca.indice_busca is None:
+                                print("Montando o índice de busca em memória (só na primeira vez)...\n")
+
+                            parametro = obter_texto(
+                                "Escreva o valor para buscar: ",
+                                "Entrada inválida. O campo não pode ficar vazio."
+                            )
+
+                            ok, resultados = buscar_no_indice(pool_bd, parametro)
+
+                    # EXIBIR RESULTADOS
+                    limpar_terminal()
+                    exibir_titulo_centralizado("RESULTADOS DA CONSULTA", 60)
+
+                    if not ok:
+                        print("Erro na consulta:")
+                        print(resultados)
+                    elif not resultados:
+                        print("Nenhum resultado encontrado.")
+                    else:
+                        if tipo_pesquisa == 2:
+                            imprimir_lista_simples(resultados)
+                        else:
+                            imprimir_lista_como_tabela(resultados)
+
+                    # OPÇÃO DE EXPORTAÇÃO
+                    if ok and resultados:
+                        deseja_exportar = obter_sim_nao(
+                            "\nDeseja exportar essa consulta para um arquivo JSON? (S/N): ",
+                            "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                        )
+
+                        if deseja_exportar:
+                            nome_arquivo = input(
+                                "\nDigite o nome do arquivo (ex: consulta_empresas.json): "
+                            ).strip()
+
+                            if not nome_arquivo:
+                                nome_arquivo = "consulta_empresas.json"
+                            elif not nome_arquivo.lower().endswith(".json"):
+                                nome_arquivo += ".json"
+
+                            sucesso_export, erro_export = exportar_para_json(resultados, nome_arquivo)
+                            if sucesso_export:
+                                print(f"\n✅ Consulta exportada com sucesso para '{nome_arquivo}'!")
+                            else:
+                                print(f"\n❌ Erro ao exportar para JSON: {erro_export}")
+
+                    # EXPORTAÇÃO COMPLETA EM STREAMING (PESQUISA GERAL)
+                    if ok and tipo_pesquisa == 3:
+                        deseja_exportar_tudo = obter_sim_nao(
+                            "\nDeseja exportar TODAS as empresas cadastradas para um arquivo JSON Lines? (S/N): ",
+                            "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                        )
+
+                        if deseja_exportar_tudo:
+                            nome_arquivo = input(
+                                "\nDigite o nome do arquivo (ex: empresas.jsonl): "
+                            ).strip()
+
+                            if not nome_arquivo:
+                                nome_arquivo = "empresas.jsonl"
+                            elif not nome_arquivo.lower().endswith(".jsonl"):
+                                nome_arquivo += ".jsonl"
+
+                            sucesso_export, retorno_export = exportar_consulta_streaming(pool_bd, nome_arquivo)
+                            if sucesso_export:
+                                print(f"\n✅ {retorno_export} empresas exportadas para '{nome_arquivo}'!")
+                            else:
+                                print(f"\n❌ Erro ao exportar: {retorno_export}")
+
+                        deseja_snapshot = obter_sim_nao(
+                            "\nDeseja gerar um snapshot colunar de todas as empresas (Arrow ou .lvcol)? (S/N): ",
+                            "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                        )
+
+                        if deseja_snapshot:
+                            nome_arquivo = input(
+                                "\nDigite o nome do arquivo, sem extensão (ex: empresas_snapshot): "
+                            ).strip() or "empresas_snapshot"
+
+                            sucesso_snapshot, retorno_snapshot = exportar_snapshot_colunar(pool_bd, nome_arquivo)
+                            if sucesso_snapshot:
+                                print(
+                                    f"\n✅ {retorno_snapshot['linhas']} empresas gravadas em "
+                                    f"'{retorno_snapshot['arquivo']}' ({retorno_snapshot['formato']})!"
+                                )
+                            else:
+                                print(f"\n❌ Erro ao gerar snapshot: {retorno_snapshot}")
+
+                    # OPÇÃO DE NOVA CONSULTA
+                    if tipo_pesquisa != 0:
+                        nova_consulta = obter_sim_nao(
+                            "\nDeseja fazer outra consulta? (S/N): ",
+                            "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                        )
+                        if not nova_consulta:
+                            break
+
+            case 3:  # Atualizar informações de uma empresa
+                while True:
+                    limpar_terminal()
+                    exibir_titulo_centralizado("ATUALIZAR INFORMAÇÕES DE EMPRESA", 60)
+
+                    # Preview das empresas
+                    ok_preview, preview_empresas = lista_preview_empresas.obter(pool_bd)
+                    if ok_preview and preview_empresas:
+                        print("Empresas cadastradas:\n")
+                        imprimir_lista_como_tabela(preview_empresas)
+                    else:
+                        print("Nenhuma empresa encontrada para atualização.")
+                        input("\nAperte ENTER para voltar ao menu principal...")
+                        break
+
+                    # Solicita o ID da empresa
+                    id_empresa = obter_int(
+                        "\nDigite o ID da empresa que deseja atualizar (0 para cancelar): ",
+                        "Entrada inválida! Digite apenas números."
+                    )
+
+                    if id_empresa == 0:
+                        break
+
+                    # Consulta empresa específica
+                    ok_sel, resultado = select_empresa_por_id(pool_bd, id_empresa)
+                    if not ok_sel or not resultado:
+                        print("\n❌ Empresa não encontrada ou erro na consulta.")
+                        input("\nAperte ENTER para tentar novamente...")
+                        continue
+
+                    # Mostra os dados atuais
+                    limpar_terminal()
+                    exibir_titulo_centralizado("DADOS ATUAIS DA EMPRESA", 60)
+                    imprimir_lista_simples(resultado)
+
+                    # Acumula as alterações e grava todas juntas no final
+                    alteracoes = {}
+                    while True:
+                        campo_escolhido = obter_int_intervalado(
+                            "\nDigite o número do campo a alterar (0 para concluir): ",
+                            "Entrada inválida! Digite um número válido entre 0 e 16.",
+                            0, 16
+                        )
+
+                        if campo_escolhido == 0:
+                            break
+
+                        ok_campo, alteracao = solicitar_alteracao_empresa(campo_escolhido)
+                        if not ok_campo:
+                            print(f"\n{alteracao}")
+                            continue
+
+                        alteracoes.update(alteracao)
+
+                        print("\nAlterações pendentes:")
+                        for campo, valor in alteracoes.items():
+                            print(f"  - {campo}: {'SYSDATE' if valor is None and campo == 'dt_cadastro' else valor}")
+
+                    if not alteracoes:
+                        print("\nNenhuma alteração informada.")
+                        input("\nAperte ENTER para voltar...")
+                        break
+
+                    # Confirma a atualização
+                    confirmar = obter_sim_nao(
+                        f"\nConfirmar a atualização de {len(alteracoes)} campo(s)? (S/N): ",
+                        "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                    )
+
+                    if not confirmar:
+                        print("\nAtualização cancelada.")
+                        input("\nAperte ENTER para voltar...")
+                        continue
+
+                    # Executa a atualização (uma transação, no máximo um UPDATE por tabela)
+                    ok_atual, resultado_atual = atualizar_empresa_parcial(pool_bd, id_empresa, alteracoes, resultado[0])
+                    if ok_atual:
+                        limpar_terminal()
+                        exibir_titulo_centralizado("✅ DADOS ATUALIZADOS COM SUCESSO", 60)
+                        print("\nDados atualizados da empresa:")
+                        imprimir_lista_simples([resultado_atual])
+                    else:
+                        limpar_terminal()
+                        exibir_titulo_centralizado("❌ ERRO NA ATUALIZAÇÃO", 60)
+                        print(f"\nErro ao atualizar os dados: {resultado_atual}")
+
+                    # Pergunta se deseja fazer outra atualização
+                    outra_atualizacao = obter_sim_nao(
+                        "\nDeseja atualizar outra empresa? (S/N): ",
+                        "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                    )
+                    if not outra_atualizacao:
+                        break
+
+            case 4:  # Remover cadastro de empresa
+                while True:
+                    limpar_terminal()
+                    exibir_titulo_centralizado("EXCLUIR CADASTRO DE EMPRESA", 60)
+
+                    # Preview das empresas
+                    ok_preview, preview_empresas = lista_preview_empresas.obter(pool_bd)
+                    if ok_preview and preview_empresas:
+                        print("Empresas cadastradas:\n")
+                        imprimir_lista_como_tabela(preview_empresas)
+                    else:
+                        print("Nenhuma empresa encontrada para exclusão.")
+                        input("\nAperte ENTER para voltar ao menu principal...")
+                        break
+
+                    # Solicita o(s) ID(s) da empresa
+                    ids_empresa = obter_lista_ids(
+                        "\nDigite o ID da empresa que deseja excluir (vários: 1,2,5-9 | 0 para cancelar): ",
+                        "Entrada inválida! Digite números separados por vírgula ou intervalos como 5-9."
+                    )
+
+                    if ids_empresa == [0]:
+                        break
+
+                    ids_empresa = [id_ for id_ in ids_empresa if id_ != 0]
+
+                    if len(ids_empresa) > 1:
+                        # Exclusão em lote: primeiro a simulação, depois a confirmação
+                        limpar_terminal()
+                        exibir_titulo_centralizado("CONFIRMAR EXCLUSÃO EM LOTE", 60)
+
+                        ok_sim, simulacao = excluir_empresas_em_lote(pool_bd, ids_empresa, _simular=True)
+                        if not ok_sim:
+                            print(f"\n{simulacao}")
+                            input("\nAperte ENTER para voltar...")
+                            continue
+
+                        print(f"IDs informados: {len(ids_empresa)}\n")
+                        print("Linhas que serão excluídas:")
+                        for tabela, quantidade in simulacao["linhas"].items():
+                            print(f"• {tabela}: {quantidade}")
+
+                        print("\n⚠️  ATENÇÃO: Esta ação é IRREVERSÍVEL!")
+                        confirmar = obter_sim_nao(
+                            f"\nTem certeza que deseja excluir {simulacao['linhas']['T_EMPRESA']} empresa(s)? (S/N): ",
+                            "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                        )
+
+                        if not confirmar:
+                            print("\nExclusão cancelada.")
+                            input("\nAperte ENTER para voltar...")
+                            continue
+
+                        ok_exclusao, relatorio = excluir_empresas_em_lote(pool_bd, ids_empresa)
+
+                        limpar_terminal()
+                        if ok_exclusao:
+                            exibir_titulo_centralizado("✅ EMPRESAS EXCLUÍDAS COM SUCESSO", 60)
+                            print(f"\nEmpresas excluídas: {len(relatorio['excluidas'])} em {relatorio['segundos']:.2f}s ({relatorio['lotes']} lote(s))")
+                            if relatorio["nao_encontradas"]:
+                                print(f"IDs não encontrados: {', '.join(map(str, relatorio['nao_encontradas']))}")
+                        else:
+                            exibir_titulo_centralizado("❌ ERRO NA EXCLUSÃO", 60)
+                            print(f"\n{relatorio}")
+
+                        outra_exclusao = obter_sim_nao(
+                            "\nDeseja excluir outra empresa? (S/N): ",
+                            "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                        )
+                        if not outra_exclusao:
+                            break
+                        continue
+
+                    id_empresa = ids_empresa[0]
+
+                    # Confirmação de segurança
+                    limpar_terminal()
+                    exibir_titulo_centralizado("CONFIRMAR EXCLUSÃO", 60)
+
+                    # Mostra dados da empresa que será excluída
+                    ok_sel, resultado = select_empresa_por_id(pool_bd, id_empresa)
+                    if ok_sel and resultado:
+                        print("Dados da empresa que será excluída:\n")
+                        imprimir_lista_simples(resultado)
+
+                    # Mesma simulação da exclusão em lote: quantas linhas cada tabela perde
+                    ok_sim, simulacao = excluir_empresas_em_lote(pool_bd, [id_empresa], _simular=True)
+                    if not ok_sim:
+                        print(f"\n{simulacao}")
+                        input("\nAperte ENTER para voltar...")
+                        continue
+
+                    print("\n⚠️  ATENÇÃO: Esta ação é IRREVERSÍVEL!")
+                    print("Linhas que serão excluídas:")
+                    for tabela, quantidade in simulacao["linhas"].items():
+                        print(f"• {tabela}: {quantidade}")
+
+                    confirmar = obter_sim_nao(
+                        "\nTem certeza que deseja excluir esta empresa? (S/N): ",
+                        "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                    )
+
+                    if not confirmar:
+                        print("\nExclusão cancelada.")
+                        input("\nAperte ENTER para voltar...")
+                        continue
+
+                    # Executa a exclusão
+                    ok_exclusao, resultado_exclusao = excluir_empresa_por_id(pool_bd, id_empresa)
+
+                    if ok_exclusao:
+                        limpar_terminal()
+                        exibir_titulo_centralizado("✅ EMPRESA EXCLUÍDA COM SUCESSO", 60)
+                        print(f"\n{resultado_exclusao}")
+                    else:
+                        limpar_terminal()
+                        exibir_titulo_centralizado("❌ ERRO NA EXCLUSÃO", 60)
+                        print(f"\n{resultado_exclusao}")
+
+                    # Pergunta se deseja excluir outra empresa
+                    outra_exclusao = obter_sim_nao(
+                        "\nDeseja excluir outra empresa? (S/N): ",
+                        "Entrada inválida! Digite 'S' para Sim ou 'N' para Não."
+                    )
+                    if not outra_exclusao:
+                        break
+
+            case 5:  # Importar empresas de arquivo
+                limpar_terminal()
+                exibir_titulo_centralizado("IMPORTAR EMPRESAS DE ARQUIVO", 60)
+
+                print("Formatos aceitos: .csv (com cabeçalho), .json (lista) ou .jsonl (um objeto por linha).")
+                print("Colunas obrigatórias:", ", ".join(COLUNAS_OBRIGATORIAS_IMPORTACAO))
+                print("Colunas opcionais: st_ativo, pais, complemento, dt_cadastro (DD/MM/AAAA), st_empresa\n")
+
+                caminho_arquivo = obter_texto(
+                    "Caminho do arquivo: ",
+                    "Entrada inválida. O campo não pode ficar vazio."
+                )
+
+                if not os.path.isfile(caminho_arquivo):
+                    print(f"\n❌ Arquivo '{caminho_arquivo}' não encontrado.")
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+
+                tamanho_lote = obter_int_intervalado(
+                    "Quantidade de linhas por lote (1 a 10000): ",
+                    "Entrada inválida.",
+                    1, 10000
+                )
+                commit_a_cada = obter_int_intervalado(
+                    "Fazer commit a cada quantos lotes? (1 a 1000): ",
+                    "Entrada inválida.",
+                    1, 1000
+                )
+
+                limpar_terminal()
+                exibir_titulo_centralizado("PROCESSANDO IMPORTAÇÃO...", 60)
+
+                ok_import, relatorio = importar_empresas_arquivo(pool_bd, caminho_arquivo, tamanho_lote, commit_a_cada)
+
+                if ok_import:
+                    print("✅ Importação concluída!\n")
+                else:
+                    print("❌ Importação interrompida:")
+                    print(f"{relatorio.get('erro')}\n")
+
+                print(f"Linhas lidas:      {relatorio['lidas']}")
+                print(f"Linhas inseridas:  {relatorio['inseridas']}")
+                print(f"Linhas rejeitadas: {len(relatorio['rejeitadas'])}")
+                print(f"Lotes enviados:    {relatorio['lotes']}")
+                print(f"Tempo total:       {relatorio['segundos']:.2f} s")
+                print(f"Vazão:             {relatorio['linhas_por_segundo']:.0f} linhas/s")
+
+                if relatorio["rejeitadas"]:
+                    imprimir_linha_separadora("-", 60)
+                    print("Linhas rejeitadas (primeiras 20):\n")
+                    for numero_linha, motivo in relatorio["rejeitadas"][:20]:
+                        print(f"Linha {numero_linha}: {motivo}")
+
+                input("\nAperte ENTER para voltar ao menu principal...")
+
+            case 6:  # Gerar base local de CEPs
+                limpar_terminal()
+                exibir_titulo_centralizado("GERAR BASE LOCAL DE CEPS", 60)
+
+                print("Informe um arquivo CSV com as colunas: cep, logradouro, bairro, cidade, estado.")
+                print(f"A base será gravada em '{ARQUIVO_INDICE_CEP}' (modo atual: {MODO_INDICE_CEP}).\n")
+
+                caminho_dump = obter_texto(
+                    "Caminho do arquivo CSV: ",
+                    "Entrada inválida. O campo não pode ficar vazio."
+                )
+
+                if not os.path.isfile(caminho_dump):
+                    print(f"\n❌ Arquivo '{caminho_dump}' não encontrado.")
+                    input("\nAperte ENTER para voltar ao menu principal...")
+                    continue
+
+                print("\nGerando base local de CEPs...")
+                ok_indice, resultado_indice = construir_indice_cep(caminho_dump, ARQUIVO_INDICE_CEP)
+
+                if ok_indice:
+                    if cep._indice_cep is not None:
+                        cep._indice_cep.fechar()
+                        cep._indice_cep = None  # reabre o arquivo novo na próxima consulta
+                    print(f"\n✅ Base gerada com {resultado_indice} CEPs.")
+                else:
+                    print(f"\n❌ Erro ao gerar a base de CEPs: {resultado_indice}")
+
+                input("\nAperte ENTER para voltar ao menu principal...")
+
+    # Fechar o pool de conexões ao sair
+    if pool_bd:
+        pool_bd.close()
+
+    # Grava as métricas da sessão (só com LEVELUP_METRICAS=1)
+    if metricas.ativo:
+        metricas.exportar()
+
+if __name__ == "__main__":
+    executar_sistema()
@@ -0,0 +1,229 @@
+"""Métricas de latência e vazão das funções de banco, exportação e ViaCEP."""
+
+import os
+import json
+import time
+import functools
+import threading
+from bisect import bisect_left
+
+# ==========================================================
+#   MÉTRICAS (LATÊNCIA E VAZÃO)
+# ==========================================================
+
+ATIVAR_METRICAS = os.environ.get("LEVELUP_METRICAS", "0") not in ("", "0")
+ARQUIVO_METRICAS = os.environ.get("LEVELUP_ARQUIVO_METRICAS", "metricas.prom")  # .json grava o snapshot em JSON
+
+# Limites superiores dos baldes do histograma de latência (segundos), como no Prometheus
+LIMITES_LATENCIA = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class MetricaFuncao:
+    """Contadores e histograma de latência de uma função instrumentada."""
+
+    __slots__ = ("chamadas", "erros", "linhas", "bytes", "soma_segundos", "maximo_segundos", "baldes")
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.linhas = 0
+        self.bytes = 0
+        self.soma_segundos = 0.0
+        self.maximo_segundos = 0.0
+        self.baldes = [0] * (len(LIMITES_LATENCIA) + 1)  # último balde = acima de 10 s
+
+    def percentil(self, _p: float) -> float:
+        """Estimativa do percentil (segundos) por interpolação dentro do balde, como o histogram_quantile."""
+        alvo = _p * self.chamadas
+        acumulado = 0
+        for i, quantidade in enumerate(self.baldes):
+            if quantidade and acumulado + quantidade >= alvo:
+                inferior = LIMITES_LATENCIA[i - 1] if i else 0.0
+                superior = LIMITES_LATENCIA[i] if i < len(LIMITES_LATENCIA) else self.maximo_segundos
+                return min(inferior + (superior - inferior) * (alvo - acumulado) / quantidade, self.maximo_segundos)
+            acumulado += quantidade
+        return 0.0
+
+class Metricas:
+    """
+    Registro das chamadas instrumentadas (banco, exportação e ViaCEP): quantidade, erros,
+    linhas, bytes e histograma de latência por função.
+    Desligado (padrão), o custo por chamada é só a leitura de metricas.ativo.
+    Ligue com LEVELUP_METRICAS=1; o arquivo é gravado ao sair do sistema.
+    """
+
+    def __init__(self, _ativo: bool = ATIVAR_METRICAS):
+        self.ativo = _ativo
+        self._funcoes = {}  # nome -> MetricaFuncao
+        self._trava = threading.Lock()
+
+    def _metrica(self, _nome: str) -> MetricaFuncao:
+        metrica = self._funcoes.get(_nome)
+        if metrica is None:
+            metrica = self._funcoes[_nome] = MetricaFuncao()
+        return metrica
+
+    def registrar(self, _nome: str, _segundos: float, _ok: bool = True, _linhas: int = 0, _bytes: int = 0) -> None:
+        with self._trava:
+            metrica = self._metrica(_nome)
+            metrica.chamadas += 1
+            if not _ok:
+                metrica.erros += 1
+            metrica.linhas += _linhas
+            metrica.bytes += _bytes
+            metrica.soma_segundos += _segundos
+            if _segundos > metrica.maximo_segundos:
+                metrica.maximo_segundos = _segundos
+            metrica.baldes[bisect_left(LIMITES_LATENCIA, _segundos)] += 1
+
+    def somar_bytes(self, _nome: str, _bytes: int) -> None:
+        """Para funções que só conhecem o tamanho por dentro (ex.: corpo da resposta HTTP)."""
+        with self._trava:
+            self._metrica(_nome).bytes += _bytes
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._funcoes.clear()
+
+    def instantaneo(self) -> dict:
+        """Snapshot em dicionário: contadores e p50/p95/p99 em milissegundos por função."""
+        with self._trava:
+            return {
+                nome: {
+                    "chamadas": metrica.chamadas,
+                    "erros": metrica.erros,
+                    "linhas": metrica.linhas,
+                    "bytes": metrica.bytes,
+                    "segundos_total": metrica.soma_segundos,
+                    "p50_ms": metrica.percentil(0.50) * 1000,
+                    "p95_ms": metrica.percentil(0.95) * 1000,
+                    "p99_ms": metrica.percentil(0.99) * 1000,
+                    "max_ms": metrica.maximo_segundos * 1000
+                }
+                for nome, metrica in sorted(self._funcoes.items())
+            }
+
+    def texto_prometheus(self) -> str:
+        """Formato de exposição de texto do Prometheus (serve para o textfile collector do node_exporter)."""
+        linhas = []
+        contadores = (
+            ("levelup_chamadas_total", "Chamadas por função", "chamadas"),
+            ("levelup_erros_total", "Chamadas que retornaram erro", "erros"),
+            ("levelup_linhas_total", "Linhas lidas ou gravadas", "linhas"),
+            ("levelup_bytes_total", "Bytes gravados em arquivo ou recebidos da API", "bytes")
+        )
+
+        with self._trava:
+            funcoes = sorted(self._funcoes.items())
+
+            for nome_metrica, ajuda, atributo in contadores:
+                linhas.append(f"# HELP {nome_metrica} {ajuda}")
+                linhas.append(f"# TYPE {nome_metrica} counter")
+                for nome, metrica in funcoes:
+                    linhas.append(f'{nome_metrica}{{funcao="{nome}"}} {getattr(metrica, atributo)}')
+
+            linhas.append("# HELP levelup_latencia_segundos Latência por função")
+            linhas.append("# TYPE levelup_latencia_segundos histogram")
+            for nome, metrica in funcoes:
+                acumulado = 0
+                for limite, quantidade in zip((*LIMITES_LATENCIA, "+Inf"), metrica.baldes):
+                    acumulado += quantidade
+                    linhas.append(f'levelup_latencia_segundos_bucket{{funcao="{nome}",le="{limite}"}} {acumulado}')
+                linhas.append(f'levelup_latencia_segundos_sum{{funcao="{nome}"}} {metrica.soma_segundos}')
+                linhas.append(f'levelup_latencia_segundos_count{{funcao="{nome}"}} {metrica.chamadas}')
+
+        return "\n".join(linhas) + "\n"
+
+    def exportar(self, _caminho: str | None = None) -> tuple[bool, any]:
+        """Grava em Prometheus (.prom/.txt) ou JSON (.json) pela extensão; troca o arquivo de uma vez (os.replace)."""
+        caminho = _caminho or ARQUIVO_METRICAS
+        try:
+            if caminho.lower().endswith(".json"):
+                conteudo = json.dumps(self.instantaneo(), ensure_ascii=False, indent=4)
+            else:
+                conteudo = self.texto_prometheus()
+
+            temporario = f"{caminho}.tmp"
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                arquivo.write(conteudo)
+            os.replace(temporario, caminho)
+            return (True, caminho)
+
+        except Exception as e:
+            return (False, e)
+
+# Métricas compartilhadas por todas as funções instrumentadas
+metricas = Metricas()
+
+# Flag de código das funções "async def" (inspect.CO_COROUTINE, sem pagar o import do inspect)
+CO_COROUTINE = 0x0080
+
+def instrumentar(_nome: str | None = None, _linhas=None, _bytes=None):
+    """
+    Decorador que mede a função e registra em metricas.
+    Funções no padrão (ok, valor): ok False conta como erro; linhas = len(valor) para listas
+    ou 1, a menos que _linhas(args, kwargs, valor) diga outra coisa; _bytes(args, kwargs, valor)
+    informa os bytes. Os extratores só rodam com as métricas ligadas.
+    Funções async são medidas do início ao fim da corrotina (não só até criá-la).
+    """
+    def decorador(_funcao):
+        nome = _nome or _funcao.__name__
+
+        def registrar(_args, _kwargs, _resultado, _duracao: float) -> None:
+            ok = not (isinstance(_resultado, tuple) and _resultado and _resultado[0] is False)
+            linhas = 0
+            quantidade_bytes = 0
+            if ok:
+                valor = _resultado[1] if isinstance(_resultado, tuple) and len(_resultado) == 2 else _resultado
+                try:
+                    if _linhas is not None:
+                        linhas = _linhas(_args, _kwargs, valor)
+                    else:
+                        linhas = len(valor) if isinstance(valor, (list, tuple)) else 1
+                    if _bytes is not None:
+                        quantidade_bytes = _bytes(_args, _kwargs, valor)
+                except Exception:
+                    pass  # a métrica nunca derruba a chamada medida
+
+            metricas.registrar(nome, _duracao, ok, linhas, quantidade_bytes)
+
+        if _funcao.__code__.co_flags & CO_COROUTINE:
+            @functools.wraps(_funcao)
+            async def envoltorio_async(*args, **kwargs):
+                if not metricas.ativo:
+                    return await _funcao(*args, **kwargs)
+
+                inicio = time.perf_counter()
+                try:
+                    resultado = await _funcao(*args, **kwargs)
+                except BaseException:
+                    metricas.registrar(nome, time.perf_counter() - inicio, _ok=False)
+                    raise
+                registrar(args, kwargs, resultado, time.perf_counter() - inicio)
+                return resultado
+
+            return envoltorio_async
+
+        @functools.wraps(_funcao)
+        def envoltorio(*args, **kwargs):
+            if not metricas.ativo:
+                return _funcao(*args, **kwargs)
+
+            inicio = time.perf_counter()
+            try:
+                resultado = _funcao(*args, **kwargs)
+            except BaseException:
+                metricas.registrar(nome, time.perf_counter() - inicio, _ok=False)
+                raise
+            registrar(args, kwargs, resultado, time.perf_counter() - inicio)
+            return resultado
+
+        return envoltorio
+
+    return decorador
+
+def tamanho_arquivo_do_argumento(_posicao: int, _nome: str, _padrao: str | None = None):
+    """Extrator de bytes para instrumentar(): tamanho do arquivo informado no argumento."""
+    def extrator(_args, _kwargs, _valor):
+        caminho = _args[_posicao] if len(_args) > _posicao else _kwargs.get(_nome, _padrao)
+        return os.path.getsize(caminho) if caminho and os.path.isfile(caminho) else 0
+    return extrator
@@ -0,0 +1,857 @@
+"""
+Driver local (SQLite) com a mesma interface da parte do python-oracledb usada pelo pacote levelup.
+
+Serve para medir e testar o sistema sem o servidor Oracle da FIAP: as funções do levelup
+recebem uma conexão ou um pool deste módulo no lugar dos objetos do oracledb.
+
+Suportado:
+    connect() / create_pool() (acquire, release, close, opened, busy)
+    connect_async() / create_pool_async(): API asyncio do oracledb (cada chamada roda numa thread)
+    cursor.var(tipo, arraysize=n) e setinputsizes(**{nome: var})
+    INSERT/UPDATE/DELETE ... RETURNING ... INTO :var (execute e executemany)
+    blocos PL/SQL BEGIN ... END com DMLs em sequência, RETURNING INTO e COMMIT
+    FETCH FIRST :n ROWS ONLY e OFFSET :x ROWS FETCH NEXT :n ROWS ONLY
+    binds nomeados, SYSDATE, TO_DATE(valor, 'DD/MM/YY'), CAST(... AS DATE), DATE 'AAAA-MM-DD'
+    INTEGER GENERATED ALWAYS AS IDENTITY, VARCHAR2, CHAR, DATE (voltam como datetime)
+    description, rowfactory, arraysize, prefetchrows, fetchone/fetchmany/fetchall
+    commit, rollback e autocommit (desligado por padrão, como no Oracle)
+    executar_script(): roda arquivos .sql (GERAL_1executado.sql, DML.sql) ignorando DROP de tabela inexistente
+    inicializar_base(): cria o esquema (e os dados de exemplo) só quando a base está vazia,
+        e falha (sem deixar carga parcial) se algum comando for recusado
+    DATE volta como datetime e datetime/date são aceitos em binds, sem registrar
+        adaptadores ou conversores globais no módulo sqlite3
+    LIKE diferenciando maiúsculas de minúsculas, como no Oracle
+
+dsn é o caminho do arquivo SQLite; ":memory:" cria um banco em memória
+(compartilhado entre as conexões do mesmo pool).
+"""
+
+import re
+import asyncio
+import sqlite3
+import threading
+import itertools
+from datetime import datetime, date
+
+# ==========================================================
+#   CONSTANTES E EXCEÇÕES (MESMOS NOMES DO ORACLEDB)
+# ==========================================================
+
+class TipoBanco:
+    """Equivalente simples de oracledb.DbType."""
+
+    def __init__(self, _nome: str):
+        self.name = _nome
+
+    def __repr__(self):
+        return f"<TipoBanco {self.name}>"
+
+DB_TYPE_DATE = TipoBanco("DB_TYPE_DATE")
+DB_TYPE_TIMESTAMP = TipoBanco("DB_TYPE_TIMESTAMP")
+DB_TYPE_NUMBER = TipoBanco("DB_TYPE_NUMBER")
+DB_TYPE_VARCHAR = TipoBanco("DB_TYPE_VARCHAR")
+
+POOL_GETMODE_WAIT = 0
+POOL_GETMODE_NOWAIT = 1
+POOL_GETMODE_FORCEGET = 2
+POOL_GETMODE_TIMEDWAIT = 3
+
+class Error(Exception):
+    pass
+
+class InterfaceError(Error):
+    pass
+
+class DatabaseError(Error):
+    pass
+
+class IntegrityError(DatabaseError):
+    pass
+
+def _converter_erro(_erro: sqlite3.Error) -> Error:
+    if isinstance(_erro, sqlite3.IntegrityError):
+        return IntegrityError(str(_erro))
+    return DatabaseError(str(_erro))
+
+# ==========================================================
+#   DATAS
+# ==========================================================
+
+FORMATO_DATA_SQLITE = "%Y-%m-%d %H:%M:%S"
+
+def _data_para_texto(_valor) -> str:
+    if isinstance(_valor, datetime):
+        return _valor.strftime(FORMATO_DATA_SQLITE)
+    return datetime(_valor.year, _valor.month, _valor.day).strftime(FORMATO_DATA_SQLITE)
+
+def _texto_para_data(_valor):
+    if _valor is None or isinstance(_valor, datetime):
+        return _valor
+    if isinstance(_valor, bytes):
+        _valor = _valor.decode()
+    texto = str(_valor).strip()
+    for formato in (FORMATO_DATA_SQLITE, "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(texto, formato)
+        except ValueError:
+            continue
+    return _valor
+
+# As conversões ficam nas conexões deste driver (nada é registrado no módulo sqlite3):
+# datetime/date viram texto nos binds e as colunas DATE do esquema voltam como datetime.
+def _adaptar_valor(_valor):
+    if isinstance(_valor, (datetime, date)):
+        return _data_para_texto(_valor)
+    return _valor
+
+def _adaptar_parametros(_parametros):
+    if isinstance(_parametros, dict):
+        return {nome: _adaptar_valor(valor) for nome, valor in _parametros.items()}
+    return [_adaptar_valor(valor) for valor in _parametros]
+
+# Máscaras do Oracle -> strptime (YY aceita ano com 4 dígitos, como no Oracle)
+MASCARAS_DATA = {
+    "YYYY": "%Y", "RRRR": "%Y", "YY": "%y", "RR": "%y",
+    "DD": "%d", "MM": "%m", "HH24": "%H", "HH": "%H", "MI": "%M", "SS": "%S"
+}
+
+def _to_date(_valor, _mascara=None):
+    """Função TO_DATE registrada no SQLite: devolve o texto 'AAAA-MM-DD HH:MM:SS'."""
+    if _valor is None:
+        return None
+    if isinstance(_valor, (int, float)):
+        raise ValueError(f"TO_DATE: valor inválido {_valor!r}")
+
+    convertido = _texto_para_data(_valor)
+    if isinstance(convertido, datetime):
+        return convertido.strftime(FORMATO_DATA_SQLITE)
+
+    if _mascara:
+        formato = re.sub(r"YYYY|RRRR|YY|RR|DD|MM|HH24|HH|MI|SS", lambda m: MASCARAS_DATA[m.group(0)], _mascara.upper())
+        for tentativa in (formato, formato.replace("%y", "%Y")):
+            try:
+                return datetime.strptime(str(_valor).strip(), tentativa).strftime(FORMATO_DATA_SQLITE)
+            except ValueError:
+                continue
+
+    raise ValueError(f"TO_DATE: data inválida {_valor!r}")
+
+# ==========================================================
+#   TRADUÇÃO DE SQL (ORACLE -> SQLITE)
+# ==========================================================
+
+RE_RETURNING_INTO = re.compile(r"\bRETURNING\s+(.+?)\s+INTO\s+(.+?)\s*$", re.IGNORECASE | re.DOTALL)
+RE_SYSDATE = re.compile(r"\bSYSDATE\b", re.IGNORECASE)
+RE_CAST_DATE = re.compile(r"\bCAST\s*\(\s*(:\w+)\s+AS\s+DATE\s*\)", re.IGNORECASE)
+RE_LITERAL_DATE = re.compile(r"\bDATE\s+'(\d{4}-\d{2}-\d{2})'", re.IGNORECASE)
+RE_OFFSET_FETCH = re.compile(r"\bOFFSET\s+(:\w+|\d+)\s+ROWS?\s+FETCH\s+(?:FIRST|NEXT)\s+(:\w+|\d+)\s+ROWS?\s+ONLY\b", re.IGNORECASE)
+RE_FETCH_FIRST = re.compile(r"\bFETCH\s+(?:FIRST|NEXT)\s+(:\w+|\d+)\s+ROWS?\s+ONLY\b", re.IGNORECASE)
+RE_BLOCO_PLSQL = re.compile(r"^\s*BEGIN\b(.*)\bEND\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+RE_IDENTITY = re.compile(r"\bINTEGER\s+GENERATED\s+(?:ALWAYS|BY\s+DEFAULT)\s+AS\s+IDENTITY\s+PRIMARY\s+KEY", re.IGNORECASE)
+
+_traducoes = {}  # texto Oracle -> (texto SQLite, destinos do RETURNING INTO)
+_trava_traducoes = threading.Lock()
+
+def traduzir_sql(_sql: str) -> tuple[str, tuple[str, ...]]:
+    """Converte o texto Oracle para SQLite (com cache, como o cache de sentenças do driver)."""
+    traducao = _traducoes.get(_sql)
+    if traducao is not None:
+        return traducao
+
+    texto = _sql.strip().rstrip(";").strip()
+    destinos = ()
+
+    retorno = RE_RETURNING_INTO.search(texto)
+    if retorno:
+        destinos = tuple(nome.strip().lstrip(":") for nome in retorno.group(2).split(","))
+        texto = f"{texto[:retorno.start()]}RETURNING {retorno.group(1)}"
+
+    texto = RE_SYSDATE.sub("strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')", texto)
+    texto = RE_CAST_DATE.sub(r"TO_DATE(\1)", texto)
+    texto = RE_LITERAL_DATE.sub(r"'\1 00:00:00'", texto)
+    texto = RE_OFFSET_FETCH.sub(r"LIMIT \2 OFFSET \1", texto)
+    texto = RE_FETCH_FIRST.sub(r"LIMIT \1", texto)
+    texto = RE_IDENTITY.sub("INTEGER PRIMARY KEY AUTOINCREMENT", texto)
+
+    traducao = (texto, destinos)
+    with _trava_traducoes:
+        if len(_traducoes) > 1024:
+            _traducoes.clear()
+        _traducoes[_sql] = traducao
+    return traducao
+
+def dividir_script(_texto: str) -> list[str]:
+    """Separa um script .sql em comandos (por ';' fora de aspas), removendo comentários '--'."""
+    comandos = []
+    atual = []
+    em_aspas = False
+    i = 0
+
+    while i < len(_texto):
+        caractere = _texto[i]
+        if caractere == "'":
+            em_aspas = not em_aspas
+        elif not em_aspas and _texto.startswith("--", i):
+            fim = _texto.find("\n", i)
+            i = len(_texto) if fim == -1 else fim
+            continue
+        elif not em_aspas and caractere == ";":
+            comando = "".join(atual).strip()
+            if comando:
+                comandos.append(comando)
+            atual = []
+            i += 1
+            continue
+        atual.append(caractere)
+        i += 1
+
+    comando = "".join(atual).strip()
+    if comando:
+        comandos.append(comando)
+    return comandos
+
+# ==========================================================
+#   VARIÁVEIS DE BIND (cursor.var)
+# ==========================================================
+
+def _eh_tipo_data(_tipo) -> bool:
+    return _tipo in (datetime, date) or getattr(_tipo, "name", "") in ("DB_TYPE_DATE", "DB_TYPE_TIMESTAMP")
+
+class Var:
+    """
+    Variável de bind de saída. Depois de um DML com RETURNING INTO, getvalue(i)
+    devolve a lista de valores da linha i do executemany (ou getvalue() no execute).
+    """
+
+    def __init__(self, _tipo=str, _arraysize: int = 1):
+        self.type = _tipo
+        self.arraysize = max(1, _arraysize)
+        self._valores = [None] * self.arraysize
+        self._data = _eh_tipo_data(_tipo)
+
+    def _converter(self, _valor):
+        return _texto_para_data(_valor) if self._data else _valor
+
+    def getvalue(self, _posicao: int = 0):
+        return self._valores[_posicao]
+
+    def setvalue(self, _posicao: int, _valor) -> None:
+        if _posicao >= len(self._valores):
+            self._valores.extend([None] * (_posicao + 1 - len(self._valores)))
+        self._valores[_posicao] = _valor
+
+    def __repr__(self):
+        return f"<Var {getattr(self.type, 'name', self.type)} {self._valores[:1]}>"
+
+# ==========================================================
+#   CURSOR
+# ==========================================================
+
+class Cursor:
+    def __init__(self, _conexao: "Connection"):
+        self.connection = _conexao
+        self._cursor = _conexao._sqlite.cursor()
+        self._entradas = {}   # setinputsizes
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowfactory = None
+        self.rowcount = 0
+        self.description = None
+        self._indices_data = ()  # posições das colunas DATE no resultado atual
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            linha = self.fetchone()
+            if linha is None:
+                return
+            yield linha
+
+    def var(self, _tipo=str, arraysize: int = 1, **_opcoes) -> Var:
+        return Var(_tipo, arraysize)
+
+    def setinputsizes(self, *_posicionais, **_nomeados) -> None:
+        self._entradas = {nome: var for nome, var in _nomeados.items() if isinstance(var, Var)}
+
+    def _separar_binds(self, _parametros, _destinos) -> tuple[dict, dict]:
+        entrada = dict(_parametros or {})
+        saidas = {}
+        for nome in _destinos:
+            var = entrada.pop(nome, None)
+            if var is None:
+                var = self._entradas.get(nome)
+            if not isinstance(var, Var):
+                raise DatabaseError(f"DPY-4010: a variável de bind :{nome} não foi informada")
+            saidas[nome] = var
+        for nome, valor in entrada.items():
+            if isinstance(valor, Var):
+                entrada[nome] = valor.getvalue()
+        return entrada, saidas
+
+    def _executar(self, _texto: str, _parametros: dict):
+        try:
+            self._cursor.execute(_texto, _adaptar_parametros(_parametros))
+        except sqlite3.Error as e:
+            raise _converter_erro(e) from e
+
+    def execute(self, _sql: str, _parametros=None, **_nomeados):
+        if _nomeados:
+            _parametros = {**(_parametros or {}), **_nomeados}
+
+        bloco = RE_BLOCO_PLSQL.match(_sql)
+        if bloco:
+            self._executar_bloco(bloco.group(1), _parametros or {})
+            return None
+
+        texto, destinos = traduzir_sql(_sql)
+        entrada, saidas = self._separar_binds(_parametros, destinos)
+        self._indices_data = ()
+        self._executar(texto, entrada)
+
+        if destinos:
+            linhas = self._cursor.fetchall()
+            for indice, nome in enumerate(destinos):
+                var = saidas[nome]
+                var.setvalue(0, [var._converter(linha[indice]) for linha in linhas])
+            self.rowcount = len(linhas)
+            self.description = None
+        elif self._cursor.description is not None:
+            self.description = tuple(
+                (coluna[0].upper(), None, None, None, None, None, True) for coluna in self._cursor.description
+            )
+            self._indices_data = self.connection._indices_data(tuple(coluna[0] for coluna in self.description))
+            self.rowcount = 0
+        else:
+            self.description = None
+            self.rowcount = self._cursor.rowcount
+
+        self._entradas = {}
+        self.connection._apos_comando()
+        return self if self.description is not None else None
+
+    def _executar_bloco(self, _corpo: str, _parametros: dict) -> None:
+        """
+        Bloco anônimo BEGIN ... END com comandos DML em sequência (sem DECLARE, IF ou laços).
+        Um RETURNING INTO preenche a variável com o valor (não lista, como no PL/SQL) e ela
+        pode ser usada como bind nos comandos seguintes. Se um comando falha, o bloco
+        inteiro é desfeito, como uma exceção não tratada no Oracle.
+        """
+        sqlite = self.connection._sqlite
+        binds = dict(_parametros)
+        self._indices_data = ()
+        if not sqlite.in_transaction:
+            sqlite.execute("BEGIN")
+        sqlite.execute("SAVEPOINT bloco_plsql")
+        ponto_salvo = True
+        linhas = 0
+
+        try:
+            for comando in dividir_script(_corpo):
+                palavra = comando.split(None, 1)[0].upper()
+                if palavra == "NULL":
+                    continue
+                if palavra in ("COMMIT", "ROLLBACK"):
+                    sqlite.commit() if palavra == "COMMIT" else sqlite.rollback()
+                    ponto_salvo = False
+                    continue
+                if palavra not in ("INSERT", "UPDATE", "DELETE"):
+                    raise DatabaseError(f"PLS-00103: comando '{palavra}' não é suportado em blocos PL/SQL pelo driver local")
+
+                texto, destinos = traduzir_sql(comando)
+                entrada = {
+                    nome: valor.getvalue() if isinstance(valor, Var) else valor
+                    for nome, valor in binds.items() if nome not in destinos
+                }
+                self._executar(texto, entrada)
+
+                if destinos:
+                    retornadas = self._cursor.fetchall()
+                    if len(retornadas) != 1:
+                        raise DatabaseError("ORA-01422: RETURNING INTO em PL/SQL exige exatamente uma linha")
+                    for indice, nome in enumerate(destinos):
+                        var = binds.get(nome)
+                        if not isinstance(var, Var):
+                            raise DatabaseError(f"DPY-4010: a variável de bind :{nome} não foi informada")
+                        var.setvalue(0, var._converter(retornadas[0][indice]))
+                    linhas += 1
+                else:
+                    linhas += max(self._cursor.rowcount, 0)
+        except Exception:
+            if ponto_salvo:
+                sqlite.execute("ROLLBACK TO bloco_plsql")
+                sqlite.execute("RELEASE bloco_plsql")
+            raise
+
+        if ponto_salvo:
+            sqlite.execute("RELEASE bloco_plsql")
+        self.rowcount = linhas
+        self.description = None
+        self.connection._apos_comando()
+
+    def executemany(self, _sql: str, _linhas, **_opcoes) -> None:
+        texto, destinos = traduzir_sql(_sql)
+        linhas = list(_linhas)
+        self._indices_data = ()
+
+        if destinos:
+            total = 0
+            for posicao, linha in enumerate(linhas):
+                entrada, saidas = self._separar_binds(linha, destinos)
+                self._executar(texto, entrada)
+                retornadas = self._cursor.fetchall()
+                for indice, nome in enumerate(destinos):
+                    var = saidas[nome]
+                    var.setvalue(posicao, [var._converter(retornada[indice]) for retornada in retornadas])
+                total += len(retornadas)
+            self.rowcount = total
+        else:
+            try:
+                self._cursor.executemany(texto, [_adaptar_parametros(dict(linha)) for linha in linhas])
+            except sqlite3.Error as e:
+                raise _converter_erro(e) from e
+            self.rowcount = self._cursor.rowcount
+
+        self.description = None
+        self._entradas = {}
+        self.connection._apos_comando()
+
+    def _converter_datas(self, _linhas: list) -> list:
+        if not self._indices_data:
+            return _linhas
+        convertidas = []
+        for linha in _linhas:
+            linha = list(linha)
+            for indice in self._indices_data:
+                linha[indice] = _texto_para_data(linha[indice])
+            convertidas.append(tuple(linha))
+        return convertidas
+
+    def _montar(self, _linha):
+        if _linha is None:
+            return None
+        if self._indices_data:
+            _linha = self._converter_datas([_linha])[0]
+        if self.rowfactory is None:
+            return _linha
+        return self.rowfactory(*_linha)
+
+    def fetchone(self):
+        linha = self._cursor.fetchone()
+        if linha is not None:
+            self.rowcount += 1
+        return self._montar(linha)
+
+    def fetchmany(self, _quantidade: int | None = None) -> list:
+        linhas = self._converter_datas(self._cursor.fetchmany(_quantidade or self.arraysize))
+        self.rowcount += len(linhas)
+        if self.rowfactory is None:
+            return linhas
+        return [self.rowfactory(*linha) for linha in linhas]
+
+    def fetchall(self) -> list:
+        linhas = self._converter_datas(self._cursor.fetchall())
+        self.rowcount += len(linhas)
+        if self.rowfactory is None:
+            return linhas
+        return [self.rowfactory(*linha) for linha in linhas]
+
+    def close(self) -> None:
+        self._cursor.close()
+
+# ==========================================================
+#   CONEXÃO E POOL
+# ==========================================================
+
+class Connection:
+    def __init__(self, _dsn: str = ":memory:", _uri: bool = False, stmtcachesize: int = 20, **_opcoes):
+        self.dsn = _dsn
+        self.stmtcachesize = stmtcachesize
+        self._sqlite = sqlite3.connect(
+            _dsn,
+            uri=_uri,
+            check_same_thread=False,
+            cached_statements=max(stmtcachesize, 1)
+        )
+        self._sqlite.create_function("TO_DATE", 1, _to_date, deterministic=True)
+        self._sqlite.create_function("TO_DATE", 2, _to_date, deterministic=True)
+        self._sqlite.execute("PRAGMA foreign_keys = ON")
+        self._sqlite.execute("PRAGMA busy_timeout = 5000")
+        self._sqlite.execute("PRAGMA case_sensitive_like = ON")  # LIKE do Oracle diferencia maiúsculas
+        if not _uri and _dsn != ":memory:":
+            self._sqlite.execute("PRAGMA journal_mode = WAL")
+        self.autocommit = False
+        self._versao_esquema = None
+        self._nomes_data = frozenset()
+        self._indices_por_colunas = {}  # nomes das colunas do resultado -> posições das colunas DATE
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _indices_data(self, _colunas: tuple) -> tuple:
+        """
+        Posições, no resultado, das colunas declaradas como DATE nas tabelas da base (voltam como datetime).
+        Guardadas por formato de resultado; o esquema só é relido para um formato novo e quando o
+        schema_version mudou (CREATE/DROP/ALTER feito por qualquer conexão).
+        """
+        indices = self._indices_por_colunas.get(_colunas)
+        if indices is not None:
+            return indices
+
+        versao = self._sqlite.execute("PRAGMA schema_version").fetchone()[0]
+        if versao != self._versao_esquema:
+            nomes = set()
+            tabelas = self._sqlite.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+            for (tabela,) in tabelas:
+                for coluna in self._sqlite.execute(f'PRAGMA table_info("{tabela}")'):
+                    if coluna[2].split("(")[0].strip().upper() == "DATE":
+                        nomes.add(coluna[1].upper())
+            self._nomes_data = frozenset(nomes)
+            self._versao_esquema = versao
+            self._indices_por_colunas.clear()
+
+        indices = tuple(indice for indice, nome in enumerate(_colunas) if nome in self._nomes_data)
+        if len(self._indices_por_colunas) > 1024:
+            self._indices_por_colunas.clear()
+        self._indices_por_colunas[_colunas] = indices
+        return indices
+
+    def _apos_comando(self) -> None:
+        if self.autocommit and self._sqlite.in_transaction:
+            self._sqlite.commit()
+
+    def cursor(self) -> Cursor:
+        return Cursor(self)
+
+    def commit(self) -> None:
+        self._sqlite.commit()
+
+    def rollback(self) -> None:
+        self._sqlite.rollback()
+
+    def ping(self) -> None:
+        self._sqlite.execute("SELECT 1")
+
+    def close(self) -> None:
+        self._sqlite.close()
+
+_bancos_memoria = itertools.count(1)
+
+def _endereco_banco(_dsn: str | None) -> tuple[str, bool]:
+    """':memory:' vira um banco em memória com nome, para as conexões do pool enxergarem os mesmos dados."""
+    if not _dsn or _dsn == ":memory:":
+        return f"file:levelup_local_{next(_bancos_memoria)}?mode=memory&cache=shared", True
+    return _dsn, False
+
+def connect(user: str | None = None, password: str | None = None, dsn: str | None = ":memory:", **_opcoes) -> Connection:
+    """Mesma assinatura do oracledb.connect(); user e password são ignorados."""
+    return Connection(dsn or ":memory:", **_opcoes)
+
+class Pool:
+    """Pool de conexões com acquire/release, no mesmo formato do oracledb.ConnectionPool."""
+
+    def __init__(
+        self,
+        dsn: str | None = ":memory:",
+        min: int = 1,
+        max: int = 4,
+        increment: int = 1,
+        getmode: int = POOL_GETMODE_WAIT,
+        wait_timeout: int = 0,
+        stmtcachesize: int = 20,
+        **_opcoes
+    ):
+        self.dsn = dsn
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.getmode = getmode
+        self.wait_timeout = wait_timeout
+        self.stmtcachesize = stmtcachesize
+
+        self._endereco, self._uri = _endereco_banco(dsn)
+        self._livres = []
+        self._abertas = 0
+        self._condicao = threading.Condition()
+        self._fechado = False
+
+        for _ in range(self.min):
+            self._livres.append(self._abrir())
+
+    def _abrir(self) -> Connection:
+        self._abertas += 1
+        return Connection(self._endereco, _uri=self._uri, stmtcachesize=self.stmtcachesize)
+
+    @property
+    def opened(self) -> int:
+        return self._abertas
+
+    @property
+    def busy(self) -> int:
+        return self._abertas - len(self._livres)
+
+    def acquire(self) -> Connection:
+        with self._condicao:
+            while True:
+                if self._fechado:
+                    raise InterfaceError("DPY-1002: o pool foi fechado")
+                if self._livres:
+                    return self._livres.pop()
+                if self._abertas < self.max or self.getmode == POOL_GETMODE_FORCEGET:
+                    return self._abrir()
+                if self.getmode == POOL_GETMODE_NOWAIT:
+                    raise DatabaseError("DPY-4005: nenhuma conexão livre no pool")
+                espera = self.wait_timeout / 1000 if self.getmode == POOL_GETMODE_TIMEDWAIT and self.wait_timeout else None
+                if not self._condicao.wait(espera):
+                    raise DatabaseError("DPY-4005: tempo de espera por conexão esgotado")
+
+    def release(self, _conexao: Connection) -> None:
+        _conexao.rollback()  # como no Oracle, o que não foi confirmado é descartado
+        _conexao.autocommit = False
+        with self._condicao:
+            if self._fechado:
+                _conexao.close()
+                self._abertas -= 1
+                return
+            self._livres.append(_conexao)
+            self._condicao.notify()
+
+    def close(self, force: bool = False) -> None:
+        with self._condicao:
+            self._fechado = True
+            # Em memória, o banco some quando a última conexão fecha
+            for conexao in self._livres:
+                conexao.close()
+            self._abertas -= len(self._livres)
+            self._livres.clear()
+            self._condicao.notify_all()
+
+def create_pool(user: str | None = None, password: str | None = None, dsn: str | None = ":memory:", **_opcoes) -> Pool:
+    """Mesma assinatura do oracledb.create_pool(); user e password são ignorados."""
+    return Pool(dsn=dsn, **_opcoes)
+
+# ==========================================================
+#   API ASSÍNCRONA (connect_async / create_pool_async)
+# ==========================================================
+
+class AsyncCursor:
+    """
+    Mesmos métodos do oracledb.AsyncCursor: execute, executemany e fetch* são aguardáveis;
+    var, setinputsizes e close não. Os atributos (rowfactory, arraysize, description...)
+    são os do Cursor síncrono por baixo.
+    """
+
+    def __init__(self, _cursor: Cursor):
+        object.__setattr__(self, "_cursor", _cursor)
+
+    def __getattr__(self, _nome):
+        return getattr(self._cursor, _nome)
+
+    def __setattr__(self, _nome, _valor):
+        setattr(self._cursor, _nome, _valor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    async def execute(self, _sql: str, _parametros=None, **_nomeados) -> None:
+        await asyncio.to_thread(self._cursor.execute, _sql, _parametros, **_nomeados)
+
+    async def executemany(self, _sql: str, _linhas, **_opcoes) -> None:
+        await asyncio.to_thread(self._cursor.executemany, _sql, _linhas, **_opcoes)
+
+    async def fetchone(self):
+        return await asyncio.to_thread(self._cursor.fetchone)
+
+    async def fetchmany(self, _quantidade: int | None = None) -> list:
+        return await asyncio.to_thread(self._cursor.fetchmany, _quantidade)
+
+    async def fetchall(self) -> list:
+        return await asyncio.to_thread(self._cursor.fetchall)
+
+    def var(self, _tipo=str, arraysize: int = 1, **_opcoes) -> Var:
+        return self._cursor.var(_tipo, arraysize, **_opcoes)
+
+    def setinputsizes(self, *_posicionais, **_nomeados) -> None:
+        self._cursor.setinputsizes(*_posicionais, **_nomeados)
+
+    def close(self) -> None:
+        self._cursor.close()
+
+class AsyncConnection:
+    """Mesmos métodos do oracledb.AsyncConnection sobre uma Connection síncrona."""
+
+    def __init__(self, _conexao: Connection):
+        self._conexao = _conexao
+
+    @property
+    def autocommit(self) -> bool:
+        return self._conexao.autocommit
+
+    @autocommit.setter
+    def autocommit(self, _valor: bool) -> None:
+        self._conexao.autocommit = _valor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    def cursor(self) -> AsyncCursor:
+        return AsyncCursor(self._conexao.cursor())
+
+    async def commit(self) -> None:
+        await asyncio.to_thread(self._conexao.commit)
+
+    async def rollback(self) -> None:
+        await asyncio.to_thread(self._conexao.rollback)
+
+    async def ping(self) -> None:
+        await asyncio.to_thread(self._conexao.ping)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._conexao.close)
+
+class _ConexaoAguardavel:
+    """
+    Retorno de connect_async() e de AsyncConnectionPool.acquire(): como no oracledb,
+    serve tanto para "await" quanto para "async with" (que fecha ou devolve ao pool no fim).
+    """
+
+    def __init__(self, _abrir, _encerrar):
+        self._abrir = _abrir
+        self._encerrar = _encerrar
+        self._conexao = None
+
+    def __await__(self):
+        return self._abrir().__await__()
+
+    async def __aenter__(self) -> AsyncConnection:
+        self._conexao = await self._abrir()
+        return self._conexao
+
+    async def __aexit__(self, *_):
+        await self._encerrar(self._conexao)
+
+def connect_async(user: str | None = None, password: str | None = None, dsn: str | None = ":memory:", **_opcoes) -> _ConexaoAguardavel:
+    """Mesma assinatura do oracledb.connect_async(); user e password são ignorados."""
+    async def abrir() -> AsyncConnection:
+        return AsyncConnection(await asyncio.to_thread(connect, user, password, dsn, **_opcoes))
+
+    return _ConexaoAguardavel(abrir, lambda _conexao: _conexao.close())
+
+class AsyncConnectionPool:
+    """Mesmos métodos do oracledb.AsyncConnectionPool sobre um Pool síncrono."""
+
+    def __init__(self, _pool: Pool):
+        self._pool = _pool
+
+    @property
+    def opened(self) -> int:
+        return self._pool.opened
+
+    @property
+    def busy(self) -> int:
+        return self._pool.busy
+
+    def acquire(self) -> _ConexaoAguardavel:
+        async def abrir() -> AsyncConnection:
+            return AsyncConnection(await asyncio.to_thread(self._pool.acquire))
+
+        return _ConexaoAguardavel(abrir, self.release)
+
+    async def release(self, _conexao: AsyncConnection) -> None:
+        await asyncio.to_thread(self._pool.release, _conexao._conexao)
+
+    async def close(self, force: bool = False) -> None:
+        await asyncio.to_thread(self._pool.close, force)
+
+def create_pool_async(user: str | None = None, password: str | None = None, dsn: str | None = ":memory:", **_opcoes) -> AsyncConnectionPool:
+    """Mesma assinatura do oracledb.create_pool_async() (não é aguardável, como no oracledb)."""
+    return AsyncConnectionPool(create_pool(user, password, dsn, **_opcoes))
+
+# ==========================================================
+#   SCRIPTS .SQL
+# ==========================================================
+
+def executar_script(_conexao: Connection, _script: str, _ignorar_drop: bool = True, _erros: list | None = None) -> int:
+    """
+    Executa um script .sql (texto ou caminho de arquivo) comando a comando e faz COMMIT no final.
+    DROP TABLE de tabela que ainda não existe é ignorado, como na primeira execução do script no Oracle.
+    Com _erros (lista), os comandos que falham são anotados em (comando, erro) e o script continua,
+    como no "Executar Script" do SQL Developer; sem ela, o primeiro erro interrompe.
+    Retorna quantos comandos foram executados.
+    """
+    texto = _script
+    if "\n" not in _script and _script.lower().endswith(".sql"):
+        with open(_script, encoding="utf-8") as arquivo:
+            texto = arquivo.read()
+
+    cursor = _conexao.cursor()
+    executados = 0
+    for comando in dividir_script(texto):
+        try:
+            cursor.execute(comando)
+            executados += 1
+        except DatabaseError as e:
+            if _ignorar_drop and comando.upper().startswith("DROP TABLE") and "no such table" in str(e):
+                continue
+            if _erros is None:
+                raise
+            _erros.append((comando, e))
+    cursor.close()
+    _conexao.commit()
+    return executados
+
+def inicializar_base(_conexao: Connection, *_scripts: str) -> tuple[bool, any]:
+    """
+    Roda os scripts (ex.: GERAL_1executado.sql e DML.sql) só se a base ainda não tem a T_EMPRESA.
+    Se algum comando for recusado, a base volta a ficar vazia (nada de carga parcial)
+    e o erro informa quantos comandos falharam e qual foi o primeiro.
+    Retorna (True, quantidade de comandos executados) ou (False, erro)
+    """
+    try:
+        cursor = _conexao.cursor()
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'T_EMPRESA'")
+        existe = cursor.fetchone()[0]
+        cursor.close()
+
+        executados = 0
+        if not existe:
+            erros = []
+            for script in _scripts:
+                executados += executar_script(_conexao, script, _erros=erros)
+
+            if erros:
+                _esvaziar_base(_conexao)
+                comando, erro = erros[0]
+                return (False, DatabaseError(
+                    f"{len(erros)} comando(s) recusado(s) ao criar a base local; o primeiro foi "
+                    f"{' '.join(comando.split())[:200]!r}: {erro}"
+                ))
+        return (True, executados)
+    except Exception as e:
+        return (False, e)
+
+def _esvaziar_base(_conexao: Connection) -> None:
+    """Remove todas as tabelas (sem checar FKs), para a próxima inicialização começar do zero."""
+    sqlite = _conexao._sqlite
+    sqlite.rollback()
+    sqlite.execute("PRAGMA foreign_keys = OFF")
+    try:
+        tabelas = sqlite.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'").fetchall()
+        for (tabela,) in tabelas:
+            sqlite.execute(f'DROP TABLE "{tabela}"')
+        sqlite.commit()
+    finally:
+        sqlite.execute("PRAGMA foreign_keys = ON")
@@ -0,0 +1,175 @@
+"""Registro de sentenças SQL de texto fixo (reaproveitadas pelo cache de sentenças do driver)."""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# ========= REGISTRO DE SENTENÇAS SQL =========
+IDENTIFICADOR_SQL = re.compile(r"[A-Za-z_][A-Za-z0-9_$#]*")
+CAPACIDADE_REGISTRO_SQL = int(os.environ.get("LEVELUP_REGISTRO_SQL", "256"))  # textos distintos guardados
+
+class RegistroSql:
+    """
+    Textos SQL montados em tempo de execução (update por campo, update parcial, busca genérica,
+    exclusão em lote). Cada combinação (chave) é montada uma vez só e o mesmo texto é reaproveitado,
+    assim o cache de sentenças do driver (stmtcachesize do pool) e o shared pool do servidor
+    encontram a sentença já analisada em vez de fazer um novo parse.
+
+    Conta as execuções por chave e os textos distintos: muitos textos distintos para poucas
+    execuções indicam SQL montado com valores em vez de binds (hard parse).
+
+    As chaves incluem nomes de tabela/coluna vindos de quem chama (ex.: colunas da busca
+    genérica), então o registro é um LRU limitado a _capacidade textos: o menos usado é
+    descartado (e montado de novo se voltar a aparecer).
+    """
+
+    def __init__(self, _capacidade: int = CAPACIDADE_REGISTRO_SQL):
+        self.capacidade = max(1, _capacidade)
+        self._textos = OrderedDict()  # chave -> texto SQL (ordem de uso: LRU)
+        self._execucoes = {}          # chave -> quantidade de execuções (só chaves em _textos)
+        self._trava = threading.Lock()
+
+        self.descartados = 0             # textos removidos pelo limite de capacidade
+        self.execucoes_descartadas = 0   # execuções das chaves já removidas
+
+    def sentenca(self, _chave: tuple, _montar) -> str:
+        """Devolve o texto da chave, chamando _montar() só se ela não estiver no registro."""
+        with self._trava:
+            texto = self._textos.get(_chave)
+            if texto is not None:
+                self._textos.move_to_end(_chave)
+                return texto
+
+            texto = _montar()
+            self._textos[_chave] = texto
+            while len(self._textos) > self.capacidade:
+                chave_antiga, _ = self._textos.popitem(last=False)
+                self.descartados += 1
+                self.execucoes_descartadas += self._execucoes.pop(chave_antiga, 0)
+        return texto
+
+    def _contar(self, _chave: tuple) -> None:
+        with self._trava:
+            if _chave in self._textos:
+                self._execucoes[_chave] = self._execucoes.get(_chave, 0) + 1
+            else:
+                self.execucoes_descartadas += 1  # descartada entre sentenca() e a contagem
+
+    def executar(self, _cursor, _chave: tuple, _montar, _parametros=None) -> str:
+        texto = self.sentenca(_chave, _montar)
+        self._contar(_chave)
+        _cursor.execute(texto, _parametros or {})
+        return texto
+
+    async def executar_async(self, _cursor, _chave: tuple, _montar, _parametros=None) -> str:
+        """executar() para o cursor do driver async (execute aguardável)."""
+        texto = self.sentenca(_chave, _montar)
+        self._contar(_chave)
+        await _cursor.execute(texto, _parametros or {})
+        return texto
+
+    def executar_varios(self, _cursor, _chave: tuple, _montar, _linhas: list) -> str:
+        """executemany (conta uma execução por lote)."""
+        texto = self.sentenca(_chave, _montar)
+        self._contar(_chave)
+        _cursor.executemany(texto, _linhas)
+        return texto
+
+    def estatisticas(self) -> dict:
+        with self._trava:
+            execucoes = dict(self._execucoes)
+            textos_distintos = len(self._textos)
+            descartados = self.descartados
+            total = sum(execucoes.values()) + self.execucoes_descartadas
+        return {
+            "textos_distintos": textos_distintos,
+            "capacidade": self.capacidade,
+            "descartados": descartados,
+            "execucoes": total,
+            "execucoes_por_texto": total / (textos_distintos + descartados) if textos_distintos else 0.0,
+            "por_chave": {" | ".join(map(str, chave)): quantidade for chave, quantidade in execucoes.items()}
+        }
+
+# Registro compartilhado por todas as funções que montam SQL
+registro_sql = RegistroSql()
+
+def validar_identificadores_sql(*_nomes: str) -> None:
+    """Tabelas e colunas entram no texto SQL (não dá para usar bind), então só nomes simples são aceitos."""
+    for nome in _nomes:
+        if not IDENTIFICADOR_SQL.fullmatch(nome):
+            raise ValueError(f"Nome de tabela/coluna inválido: {nome}")
+
+def montar_update_campo(_tabela: str, _coluna: str, _chave: str, _sysdate: bool = False) -> str:
+    validar_identificadores_sql(_tabela, _coluna, _chave)
+    valor = "SYSDATE" if _sysdate else ":valor"
+    return f"UPDATE {_tabela} SET {_coluna} = {valor} WHERE {_chave} = :{_chave}"
+
+# ========= BUSCA GENÉRICA =========
+# Senhas ficam em texto puro no T_LVUP_LOGIN: nunca entram num filtro nem saem num resultado
+COLUNAS_SECRETAS = frozenset({"senha"})
+
+# Colunas devolvidas pela busca em cada tabela conhecida (lista explícita em vez de SELECT *)
+COLUNAS_RESULTADO_BUSCA = {
+    "T_EMPRESA": ("id_empresa", "nm_empresa", "cnpj_empresa", "email_empresa", "dt_cadastro", "st_empresa", "id_endereco", "id_login"),
+    "T_LVUP_LOGIN": ("id_login", "login", "st_ativo", "id_empresa", "id_instAcademica", "id_pessoa"),
+    "T_ENDERECO": ("id_endereco", "cep", "pais", "estado", "cidade", "bairro", "rua", "numero", "complemento")
+}
+
+def montar_busca_generica(_tabela: str, _colunas: tuple[str, ...]) -> str:
+    """
+    SELECT das colunas de COLUNAS_RESULTADO_BUSCA (SELECT * para outras tabelas) com as
+    _colunas combinadas por OR. Colunas secretas não podem ser pesquisadas.
+    """
+    validar_identificadores_sql(_tabela, *_colunas)
+    secretas = [col for col in _colunas if col.lower() in COLUNAS_SECRETAS]
+    if secretas:
+        raise ValueError(f"Coluna não pode ser pesquisada: {', '.join(secretas)}")
+
+    selecao = ", ".join(COLUNAS_RESULTADO_BUSCA.get(_tabela.upper(), ("*",)))
+    condicoes = " OR ".join(f"{col} LIKE :param" for col in _colunas)
+    return f"SELECT {selecao} FROM {_tabela} WHERE {condicoes}"
+
+# ========= PRÉ-MONTAGEM DAS SENTENÇAS =========
+def pre_montar_sentencas() -> int:
+    """
+    Registra de uma vez os textos SQL usados pela atualização, pela busca genérica padrão
+    e pela exclusão em lote (mesmas chaves usadas nessas funções).
+    Retorna quantos textos distintos ficaram no registro.
+    """
+    # Importados aqui porque esses módulos dependem do registro_sql
+    from .alteracao import CAMPOS_ATUALIZACAO_PARCIAL, SQL_UPDATE_CEP_COMPLETO, montar_update_parcial
+    from .busca import TABELAS_COLUNAS_BUSCA
+    from .exclusao import TABELAS_DEPENDENTES_EMPRESA
+
+    colunas_update = {
+        "T_EMPRESA": ("id_empresa", ["nm_empresa", "cnpj_empresa", "email_empresa", "st_empresa"]),
+        "T_LVUP_LOGIN": ("id_login", ["login", "st_ativo"]),
+        "T_ENDERECO": ("id_endereco", ["pais", "estado", "cidade", "bairro", "rua", "numero", "complemento"])
+    }
+    for tabela, (chave, colunas) in colunas_update.items():
+        for coluna in colunas:
+            registro_sql.sentenca(("update", tabela, coluna), lambda: montar_update_campo(tabela, coluna, chave))
+    registro_sql.sentenca(
+        ("update", "T_EMPRESA", "dt_cadastro", "SYSDATE"),
+        lambda: montar_update_campo("T_EMPRESA", "dt_cadastro", "id_empresa", _sysdate=True)
+    )
+    registro_sql.sentenca(("update", "T_ENDERECO", "cep_completo"), lambda: SQL_UPDATE_CEP_COMPLETO)
+
+    for tabela in CAMPOS_ATUALIZACAO_PARCIAL:
+        for por_subconsulta in ((False,) if tabela == "T_EMPRESA" else (False, True)):
+            registro_sql.sentenca(
+                ("update_parcial", tabela, por_subconsulta),
+                lambda: montar_update_parcial(tabela, por_subconsulta)
+            )
+
+    for tabela, colunas in TABELAS_COLUNAS_BUSCA.items():
+        registro_sql.sentenca(("busca", tabela, tuple(colunas)), lambda: montar_busca_generica(tabela, tuple(colunas)))
+
+    for tabela in TABELAS_DEPENDENTES_EMPRESA:
+        registro_sql.sentenca(
+            ("excluir_dependentes", tabela),
+            lambda: f"DELETE FROM {tabela} WHERE id_empresa = :id_empresa"
+        )
+
+    return registro_sql.estatisticas()["textos_distintos"]
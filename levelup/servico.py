@@ -0,0 +1,523 @@
+"""
+Serviço HTTP com o CRUD de empresas em JSON: python -m levelup servir.
+
+Só biblioteca padrão: asyncio atende as conexões (HTTP/1.1 com keep-alive) e as
+funções de banco, que são síncronas, rodam num ThreadPoolExecutor do mesmo tamanho
+do pool de conexões, então nenhuma thread fica parada esperando conexão livre.
+
+Limites:
+    _max_concorrencia   requisições atendidas ao mesmo tempo (as demais esperam na fila)
+    _max_fila           requisições esperando; acima disso a resposta é 503 com Retry-After
+    _max_corpo          tamanho máximo do corpo (413 acima disso)
+
+Listagens grandes (GET /empresas sem limite, GET /exportar) saem em streaming
+(Transfer-Encoding: chunked), página a página por chave: cada página usa uma conexão
+só durante a consulta e a próxima só é buscada depois que o cliente consumiu a anterior.
+
+Rotas:
+    GET    /saude                       estado do pool e das filas
+    GET    /metricas                    métricas no formato Prometheus
+    GET    /empresas                    todas as empresas (stream; ?formato=json|jsonl)
+    GET    /empresas?depois=ID&limite=N uma página (keyset) com "proximo"
+    GET    /empresas/{id}               uma empresa
+    POST   /empresas                    cadastro (campos da importação)
+    PATCH  /empresas/{id}               alteração parcial (campos da consulta)
+    DELETE /empresas/{id}               exclusão
+    POST   /empresas/excluir            exclusão em lote {"ids": [...], "simular": false}
+    GET    /busca?q=texto               busca genérica (&rapida=1 usa o índice em memória)
+    GET    /exportar                    download de todas as empresas (?formato=jsonl|json)
+"""
+
+import re
+import sys
+import json
+import time
+import signal
+import asyncio
+import functools
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+from .metricas import metricas
+from .cadastro import cadastrar_empresa_completa
+from .consultas import select_empresa_por_id, select_pagina_empresas
+from .busca import TABELAS_COLUNAS_BUSCA, buscar_no_indice, select_para_generico
+from .alteracao import atualizar_empresa_parcial, validar_alteracoes_empresa
+from .exclusao import excluir_empresa_por_id, excluir_empresas_em_lote
+from .exportacao import formatar_valor_json
+from .importacao import validar_linha_importacao
+
+# ==========================================================
+#   SERVIÇO HTTP
+# ==========================================================
+
+TEMPO_OCIOSO = 15.0        # segundos esperando a próxima requisição numa conexão keep-alive
+TEMPO_CABECALHO = 10.0     # segundos para receber linha de requisição, cabeçalhos e corpo
+MAX_CABECALHOS = 100
+LIMITE_PAGINA = 1000       # máximo de ?limite numa página
+ERROS_NAO_ENCONTRADO = ("Empresa não encontrada.", "Registro relacionado em")  # mensagens das funções de banco que viram 404
+
+_codificador = json.JSONEncoder(ensure_ascii=False, default=formatar_valor_json)
+
+class ErroHttp(Exception):
+    """Erro que vira resposta JSON com o status informado."""
+
+    def __init__(self, _status: int, _mensagem: str):
+        super().__init__(_mensagem)
+        self.status = _status
+        self.mensagem = _mensagem
+
+class Requisicao:
+    __slots__ = ("metodo", "caminho", "consulta", "cabecalhos", "corpo", "manter_conexao")
+
+    def __init__(self, _metodo: str, _caminho: str, _consulta: dict, _cabecalhos: dict, _corpo: bytes, _manter_conexao: bool):
+        self.metodo = _metodo
+        self.caminho = _caminho
+        self.consulta = _consulta
+        self.cabecalhos = _cabecalhos
+        self.corpo = _corpo
+        self.manter_conexao = _manter_conexao
+
+    def parametro(self, _nome: str, _padrao: str | None = None) -> str | None:
+        valores = self.consulta.get(_nome)
+        return valores[-1] if valores else _padrao
+
+    def parametro_int(self, _nome: str, _padrao: int | None = None, _minimo: int = 0, _maximo: int | None = None) -> int | None:
+        valor = self.parametro(_nome)
+        if valor is None:
+            return _padrao
+        try:
+            numero = int(valor)
+        except ValueError:
+            raise ErroHttp(400, f"O parâmetro '{_nome}' precisa ser um número inteiro.")
+        if numero < _minimo or (_maximo is not None and numero > _maximo):
+            raise ErroHttp(400, f"O parâmetro '{_nome}' precisa estar entre {_minimo} e {_maximo}.")
+        return numero
+
+    def json(self):
+        """Corpo como objeto JSON; corpo vazio ou inválido vira 400."""
+        if not self.corpo:
+            raise ErroHttp(400, "Corpo JSON obrigatório.")
+        try:
+            objeto = json.loads(self.corpo)
+        except ValueError:
+            raise ErroHttp(400, "Corpo não é um JSON válido.")
+        if not isinstance(objeto, dict):
+            raise ErroHttp(400, "O corpo precisa ser um objeto JSON.")
+        return objeto
+
+class Resposta:
+    """Resposta completa (corpo em bytes) ou em streaming (partes = gerador assíncrono de bytes)."""
+
+    __slots__ = ("status", "corpo", "partes", "tipo", "cabecalhos")
+
+    def __init__(self, _status: int, _corpo: bytes = b"", _partes=None, _tipo: str = "application/json; charset=utf-8", _cabecalhos: dict | None = None):
+        self.status = _status
+        self.corpo = _corpo
+        self.partes = _partes
+        self.tipo = _tipo
+        self.cabecalhos = _cabecalhos or {}
+
+def resposta_json(_status: int, _objeto) -> Resposta:
+    return Resposta(_status, _codificador.encode(_objeto).encode("utf-8"))
+
+def resposta_erro(_status: int, _mensagem: str) -> Resposta:
+    return resposta_json(_status, {"ok": False, "erro": _mensagem})
+
+def resposta_erro_banco(_erro) -> Resposta:
+    """Erro devolvido por uma função de banco: 404 se o registro não existe, senão 500."""
+    mensagem = str(_erro)
+    return resposta_erro(404 if mensagem.startswith(ERROS_NAO_ENCONTRADO) else 500, mensagem)
+
+class ServicoEmpresas:
+    """
+    Atende as rotas do serviço sobre um pool de conexões (oracledb ou oracledb_local).
+    As funções de banco são as mesmas do menu e da linha de comando, no padrão (ok, resultado).
+    """
+
+    ROTAS = (
+        ("GET", re.compile(r"/saude"), "rota_saude"),
+        ("GET", re.compile(r"/metricas"), "rota_metricas"),
+        ("GET", re.compile(r"/empresas"), "rota_listar"),
+        ("POST", re.compile(r"/empresas"), "rota_cadastrar"),
+        ("POST", re.compile(r"/empresas/excluir"), "rota_excluir_lote"),
+        ("GET", re.compile(r"/empresas/(\d+)"), "rota_obter"),
+        ("PATCH", re.compile(r"/empresas/(\d+)"), "rota_atualizar"),
+        ("DELETE", re.compile(r"/empresas/(\d+)"), "rota_excluir"),
+        ("GET", re.compile(r"/busca"), "rota_busca"),
+        ("GET", re.compile(r"/exportar"), "rota_exportar")
+    )
+
+    def __init__(
+        self,
+        _pool,
+        _conexoes: int = 4,
+        _max_concorrencia: int = 64,
+        _max_fila: int = 256,
+        _max_corpo: int = 1024 * 1024,
+        _tamanho_pagina: int = 500
+    ):
+        self._pool = _pool
+        self._executor = ThreadPoolExecutor(max_workers=_conexoes, thread_name_prefix="levelup-bd")
+        self._semaforo = asyncio.Semaphore(_max_concorrencia)
+        self._max_concorrencia = _max_concorrencia
+        self._max_fila = _max_fila
+        self._max_corpo = _max_corpo
+        self._tamanho_pagina = _tamanho_pagina
+        self._em_andamento = 0
+        self._em_espera = 0
+        self._recusadas = 0
+
+    def fechar(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def no_banco(self, _funcao, *args, **kwargs) -> tuple[bool, any]:
+        """Roda a função de banco numa thread do executor, passando o pool como conexão."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(_funcao, self._pool, *args, **kwargs))
+
+    # ========= CONEXÃO HTTP =========
+    async def atender(self, _leitor: asyncio.StreamReader, _escritor: asyncio.StreamWriter) -> None:
+        """Atende as requisições de uma conexão TCP até o cliente fechar ou pedir Connection: close."""
+        try:
+            while True:
+                try:
+                    requisicao = await self.ler_requisicao(_leitor)
+                except ErroHttp as e:
+                    await self.enviar(_escritor, resposta_erro(e.status, e.mensagem), False)
+                    break
+                if requisicao is None:
+                    break
+
+                resposta = await self.processar(requisicao)
+                await self.enviar(_escritor, resposta, requisicao.manter_conexao)
+                if not requisicao.manter_conexao:
+                    break
+
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass  # cliente sumiu ou ficou ocioso: só fecha a conexão
+        except Exception as e:
+            print(f"Erro ao atender a conexão: {e}", file=sys.stderr)
+        finally:
+            _escritor.close()
+            try:
+                await _escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def ler_requisicao(self, _leitor: asyncio.StreamReader) -> Requisicao | None:
+        """Lê linha de requisição, cabeçalhos e corpo (Content-Length). None = conexão encerrada."""
+        linha = await asyncio.wait_for(_leitor.readline(), TEMPO_OCIOSO)
+        if not linha:
+            return None
+
+        try:
+            metodo, alvo, versao = linha.decode("latin-1").split()
+        except ValueError:
+            raise ErroHttp(400, "Linha de requisição inválida.")
+
+        cabecalhos = {}
+        while True:
+            linha = await asyncio.wait_for(_leitor.readline(), TEMPO_CABECALHO)
+            if linha in (b"\r\n", b"\n", b""):
+                break
+            if len(cabecalhos) >= MAX_CABECALHOS:
+                raise ErroHttp(431, "Cabeçalhos demais.")
+            nome, _, valor = linha.decode("latin-1").partition(":")
+            cabecalhos[nome.strip().lower()] = valor.strip()
+
+        if "transfer-encoding" in cabecalhos:
+            raise ErroHttp(501, "Corpo em chunks não é suportado; envie Content-Length.")
+
+        try:
+            tamanho = int(cabecalhos.get("content-length", "0"))
+        except ValueError:
+            raise ErroHttp(400, "Content-Length inválido.")
+        if tamanho > self._max_corpo:
+            raise ErroHttp(413, f"Corpo maior que {self._max_corpo} bytes.")
+        corpo = await asyncio.wait_for(_leitor.readexactly(tamanho), TEMPO_CABECALHO) if tamanho else b""
+
+        conexao = cabecalhos.get("connection", "").lower()
+        manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+
+        partes = urlsplit(alvo)
+        return Requisicao(metodo.upper(), partes.path.rstrip("/") or "/", parse_qs(partes.query), cabecalhos, corpo, manter)
+
+    async def enviar(self, _escritor: asyncio.StreamWriter, _resposta: Resposta, _manter_conexao: bool) -> None:
+        """Escreve a resposta; em streaming usa chunked e espera o cliente (drain) a cada parte."""
+        status = HTTPStatus(_resposta.status)
+        cabecalhos = {
+            "Content-Type": _resposta.tipo,
+            "Connection": "keep-alive" if _manter_conexao else "close",
+            **_resposta.cabecalhos
+        }
+        if _resposta.partes is None:
+            cabecalhos["Content-Length"] = str(len(_resposta.corpo))
+        else:
+            cabecalhos["Transfer-Encoding"] = "chunked"
+
+        cabecalho = f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        cabecalho += "".join(f"{nome}: {valor}\r\n" for nome, valor in cabecalhos.items())
+        _escritor.write(cabecalho.encode("latin-1") + b"\r\n")
+
+        if _resposta.partes is None:
+            _escritor.write(_resposta.corpo)
+            await _escritor.drain()
+            return
+
+        # Se a consulta falhar no meio do stream, a exceção sobe sem o chunk final:
+        # a conexão é fechada e o cliente percebe a resposta incompleta
+        async for parte in _resposta.partes:
+            if parte:
+                _escritor.write(f"{len(parte):X}\r\n".encode("latin-1") + parte + b"\r\n")
+                await _escritor.drain()
+        _escritor.write(b"0\r\n\r\n")
+        await _escritor.drain()
+
+    async def processar(self, _requisicao: Requisicao) -> Resposta:
+        """Aplica os limites de concorrência e fila e chama a rota."""
+        if self._semaforo.locked() and self._em_espera >= self._max_fila:
+            self._recusadas += 1
+            resposta = resposta_erro(503, "Serviço ocupado, tente novamente.")
+            resposta.cabecalhos["Retry-After"] = "1"
+            return resposta
+
+        self._em_espera += 1
+        try:
+            await self._semaforo.acquire()
+        finally:
+            self._em_espera -= 1
+
+        self._em_andamento += 1
+        try:
+            resposta = await self.rotear(_requisicao)
+        except Exception:
+            self._em_andamento -= 1
+            self._semaforo.release()
+            raise
+
+        if resposta.partes is None:
+            self._em_andamento -= 1
+            self._semaforo.release()
+        else:
+            resposta.partes = self.liberar_ao_fim(resposta.partes)
+        return resposta
+
+    async def liberar_ao_fim(self, _partes):
+        """O stream ocupa a vaga de concorrência até a última parte ser enviada."""
+        try:
+            async for parte in _partes:
+                yield parte
+        finally:
+            self._em_andamento -= 1
+            self._semaforo.release()
+
+    async def rotear(self, _requisicao: Requisicao) -> Resposta:
+        metodos_do_caminho = []
+        for metodo, padrao, nome in self.ROTAS:
+            encontrado = padrao.fullmatch(_requisicao.caminho)
+            if not encontrado:
+                continue
+            metodos_do_caminho.append(metodo)
+            if metodo == _requisicao.metodo:
+                try:
+                    return await getattr(self, nome)(_requisicao, *encontrado.groups())
+                except ErroHttp as e:
+                    return resposta_erro(e.status, e.mensagem)
+                except Exception as e:
+                    return resposta_erro(500, f"Erro interno: {e}")
+
+        if metodos_do_caminho:
+            resposta = resposta_erro(405, "Método não permitido.")
+            resposta.cabecalhos["Allow"] = ", ".join(metodos_do_caminho)
+            return resposta
+        return resposta_erro(404, "Rota não encontrada.")
+
+    # ========= ROTAS =========
+    async def rota_saude(self, _requisicao: Requisicao) -> Resposta:
+        return resposta_json(200, {
+            "ok": True,
+            "pool": {"abertas": self._pool.opened, "ocupadas": self._pool.busy},
+            "em_andamento": self._em_andamento,
+            "em_espera": self._em_espera,
+            "recusadas": self._recusadas,
+            "max_concorrencia": self._max_concorrencia
+        })
+
+    async def rota_metricas(self, _requisicao: Requisicao) -> Resposta:
+        return Resposta(200, metricas.texto_prometheus().encode("utf-8"), _tipo="text/plain; version=0.0.4; charset=utf-8")
+
+    async def rota_obter(self, _requisicao: Requisicao, _id_empresa: str) -> Resposta:
+        ok, resultados = await self.no_banco(select_empresa_por_id, int(_id_empresa))
+        if not ok:
+            return resposta_erro(500, str(resultados))
+        if not resultados:
+            return resposta_erro(404, ERROS_NAO_ENCONTRADO[0])
+        return resposta_json(200, {"ok": True, "empresa": resultados[0]})
+
+    async def rota_listar(self, _requisicao: Requisicao) -> Resposta:
+        depois = _requisicao.parametro_int("depois", 0)
+        limite = _requisicao.parametro_int("limite", None, 1, LIMITE_PAGINA)
+
+        if limite is not None:
+            ok, pagina = await self.no_banco(select_pagina_empresas, depois, limite)
+            if not ok:
+                return resposta_erro(500, str(pagina))
+            proximo = pagina[-1]["id_empresa"] if len(pagina) == limite else None
+            return resposta_json(200, {"ok": True, "empresas": pagina, "proximo": proximo})
+
+        return await self.resposta_stream(_requisicao.parametro("formato", "json"), depois)
+
+    async def rota_exportar(self, _requisicao: Requisicao) -> Resposta:
+        formato = _requisicao.parametro("formato", "jsonl")
+        resposta = await self.resposta_stream(formato, 0)
+        if resposta.partes is not None:
+            resposta.cabecalhos["Content-Disposition"] = f'attachment; filename="empresas.{formato}"'
+        return resposta
+
+    async def resposta_stream(self, _formato: str, _depois: int) -> Resposta:
+        """
+        Todas as empresas a partir de _depois, em JSON (lista) ou JSON Lines.
+        A primeira página é lida antes do cabeçalho, então erro logo no início ainda vira 500.
+        """
+        if _formato not in ("json", "jsonl"):
+            raise ErroHttp(400, "Formato inválido: use 'json' ou 'jsonl'.")
+
+        ok, pagina = await self.no_banco(select_pagina_empresas, _depois, self._tamanho_pagina)
+        if not ok:
+            return resposta_erro(500, str(pagina))
+
+        async def partes():
+            atual = pagina
+            primeira_linha = True
+            if _formato == "json":
+                yield b"["
+            while True:
+                if atual:
+                    linhas = [_codificador.encode(linha) for linha in atual]
+                    if _formato == "json":
+                        texto = ("\n" if primeira_linha else ",\n") + ",\n".join(linhas)
+                    else:
+                        texto = "\n".join(linhas) + "\n"
+                    primeira_linha = False
+                    yield texto.encode("utf-8")
+                if len(atual) < self._tamanho_pagina:
+                    break
+                ok_pagina, atual = await self.no_banco(select_pagina_empresas, atual[-1]["id_empresa"], self._tamanho_pagina)
+                if not ok_pagina:
+                    raise RuntimeError(f"Erro ao ler a página: {atual}")
+            if _formato == "json":
+                yield b"\n]\n"
+
+        tipo = "application/json; charset=utf-8" if _formato == "json" else "application/x-ndjson; charset=utf-8"
+        return Resposta(200, _partes=partes(), _tipo=tipo)
+
+    async def rota_cadastrar(self, _requisicao: Requisicao) -> Resposta:
+        ok, registro = validar_linha_importacao(_requisicao.json())
+        if not ok:
+            return resposta_erro(400, registro)
+
+        ok, ids = await self.no_banco(cadastrar_empresa_completa, *registro)
+        if not ok:
+            return resposta_erro(500, str(ids))
+        resposta = resposta_json(201, {"ok": True, **ids})
+        resposta.cabecalhos["Location"] = f"/empresas/{ids['id_empresa']}"
+        return resposta
+
+    async def rota_atualizar(self, _requisicao: Requisicao, _id_empresa: str) -> Resposta:
+        alteracoes = _requisicao.json()
+        alteracoes.pop("id_empresa", None)
+        ok, erro = validar_alteracoes_empresa(alteracoes)
+        if not ok:
+            return resposta_erro(400, erro)
+        if not alteracoes:
+            return resposta_erro(400, "Nenhuma alteração informada.")
+
+        ok, resultado = await self.no_banco(atualizar_empresa_parcial, int(_id_empresa), alteracoes)
+        if not ok:
+            return resposta_erro_banco(resultado)
+        return resposta_json(200, {"ok": True, "empresa": resultado})
+
+    async def rota_excluir(self, _requisicao: Requisicao, _id_empresa: str) -> Resposta:
+        ok, mensagem = await self.no_banco(excluir_empresa_por_id, int(_id_empresa))
+        if not ok:
+            return resposta_erro_banco(mensagem)
+        return resposta_json(200, {"ok": True, "mensagem": mensagem})
+
+    async def rota_excluir_lote(self, _requisicao: Requisicao) -> Resposta:
+        corpo = _requisicao.json()
+        ids = corpo.get("ids")
+        if not isinstance(ids, list) or not ids or not all(isinstance(i, int) for i in ids):
+            return resposta_erro(400, "Informe 'ids' como uma lista de números inteiros.")
+
+        ok, relatorio = await self.no_banco(excluir_empresas_em_lote, ids, _simular=bool(corpo.get("simular")))
+        if not ok:
+            return resposta_erro(500, str(relatorio))
+        return resposta_json(200, {"ok": True, **relatorio})
+
+    async def rota_busca(self, _requisicao: Requisicao) -> Resposta:
+        texto = (_requisicao.parametro("q") or "").strip()
+        if not texto:
+            return resposta_erro(400, "Informe o texto da busca em ?q=.")
+
+        if _requisicao.parametro("rapida") in ("1", "true", "sim"):
+            limite = _requisicao.parametro_int("limite", 50, 1, LIMITE_PAGINA)
+            ok, resultados = await self.no_banco(buscar_no_indice, texto, limite)
+        else:
+            ok, resultados = await self.no_banco(select_para_generico, texto, TABELAS_COLUNAS_BUSCA)
+
+        if not ok:
+            return resposta_erro(500, str(resultados))
+        return resposta_json(200, {"ok": True, "resultados": resultados})
+
+# ========= EXECUÇÃO =========
+async def servir(
+    _pool,
+    _host: str = "127.0.0.1",
+    _porta: int = 8080,
+    _conexoes: int = 4,
+    _max_concorrencia: int = 64,
+    _max_fila: int = 256,
+    _max_corpo: int = 1024 * 1024,
+    _backlog: int = 1024,
+    _parar: asyncio.Event | None = None
+) -> None:
+    """
+    Atende até _parar ser acionado ou, sem _parar, até receber SIGINT/SIGTERM;
+    ao parar, espera as threads de banco terminarem.
+    Com _parar os sinais não são tocados, então o serviço pode rodar embutido
+    (fora da thread principal, em testes ou dentro de outra aplicação).
+    """
+    servico = ServicoEmpresas(_pool, _conexoes, _max_concorrencia, _max_fila, _max_corpo)
+    servidor = await asyncio.start_server(servico.atender, _host, _porta, backlog=_backlog, reuse_address=True)
+
+    parar = _parar
+    if parar is None:
+        parar = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sinal in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sinal, parar.set)
+            except (NotImplementedError, AttributeError, RuntimeError):
+                pass  # Windows ou fora da thread principal: Ctrl+C chega como KeyboardInterrupt
+
+    host, porta = servidor.sockets[0].getsockname()[:2]
+    print(f"Servindo em http://{host}:{porta} ({_conexoes} conexões, até {_max_concorrencia} requisições simultâneas)", flush=True)
+
+    inicio = time.perf_counter()
+    async with servidor:
+        await parar.wait()
+
+    servico.fechar()
+    print(f"Serviço encerrado após {time.perf_counter() - inicio:.0f}s.", flush=True)
+
+def executar_servico(_pool, _host: str, _porta: int, _conexoes: int, _max_concorrencia: int, _max_fila: int) -> tuple[bool, any]:
+    """Roda o serviço no loop do asyncio. Retorna (True, None) ao encerrar ou (False, erro)."""
+    try:
+        asyncio.run(servir(_pool, _host, _porta, _conexoes, _max_concorrencia, _max_fila))
+        return (True, None)
+    except KeyboardInterrupt:
+        return (True, None)
+    except Exception as e:
+        return (False, e)
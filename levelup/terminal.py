@@ -0,0 +1,290 @@
+"""Exibição no terminal e leitura de entradas do usuário (números, textos, datas e opções)."""
+
+import os
+from datetime import datetime
+
+# ==========================================================
+#   SUBALGORITMOS
+# ==========================================================
+
+# ==========================================================
+#   EXIBIÇÃO
+# ==========================================================
+
+def limpar_terminal() -> None:
+    """Limpa a tela do terminal, compatível com Windows e Linux."""
+    os.system("cls" if os.name == "nt" else "clear")
+
+def exibir_titulo_centralizado(_texto: str, _largura_caracteres: int) -> None:
+    """Mostra um título centralizado com linhas decorativas acima e abaixo."""
+    print("=-" * (_largura_caracteres // 2))
+    print(_texto.center(_largura_caracteres))
+    print("=-" * (_largura_caracteres // 2), "\n")
+
+def imprimir_linha_separadora(simbolo: str, quantidade: int) -> None:
+    """Mostra uma linha formada pela repetição de um símbolo."""
+    print()
+    print(simbolo * quantidade)
+    print()
+
+# ==========================================================
+#   VALIDAÇÃO DE DADOS (TIPOS BÁSICOS)
+# ==========================================================
+
+def obter_int(_msg_input: str, _msg_erro: str) -> int:
+    """Obtém um número inteiro digitado pelo usuário, exibindo uma mensagem de erro personalizada."""
+    entrada_int = None
+    while entrada_int is None:
+        try:
+            entrada_int = int(input(_msg_input).strip())
+        except ValueError:
+            print(f"{_msg_erro}\n") # Exemplo: Entrada inválida. Por favor, digite um número inteiro.
+            entrada_int = None
+    return entrada_int
+
+def obter_float(_msg_input: str, _msg_erro: str) -> float:
+    """Obtém um número float digitado pelo usuário, exibindo uma mensagem de erro personalizada."""
+    entrada_float = None
+    while entrada_float is None:
+        try:
+            valor = float(input(_msg_input).strip().replace(',', '.'))  # aceita vírgula ou ponto
+            entrada_float = float(valor)
+        except ValueError:
+            print(f"{_msg_erro}\n")  # Exemplo: "Entrada inválida. Por favor, digite um número decimal."
+            entrada_float = None
+    return entrada_float
+
+def obter_texto(_msg_input: str, _msg_erro: str) -> str:
+    """Obtém um texto digitado pelo usuário, garantindo que não esteja vazio e exibindo uma mensagem de erro personalizada."""
+    entrada_texto = ""
+    
+    while not entrada_texto:
+        entrada_texto = input(_msg_input).strip()
+        if not entrada_texto:
+            print(f"{_msg_erro}\n") # Entrada inválida. O campo não pode ficar vazio.
+    
+    return entrada_texto
+
+def obter_data(_msg_input: str, _msg_erro: str) -> str:
+    """Obtém uma data digitada pelo usuário (formato DD/MM/AAAA), exibindo uma mensagem de erro personalizada."""
+    data = None
+    while data is None:
+        data_str = input(_msg_input).strip()
+        if not data_str:
+            print(f"{_msg_erro}\n")
+            continue
+        try:
+            data = datetime.strptime(data_str, "%d/%m/%Y")
+        except ValueError:
+            print(f"{_msg_erro}\n")  # Exemplo: "Data inválida. Use o formato DD/MM/AAAA."
+            data = None
+    return data.strftime("%d/%m/%Y")
+
+def obter_data_hora(_msg_input: str, _msg_erro: str) -> str:
+    """Obtém uma data e hora digitada pelo usuário no formato 'dd/mm/aaaa hh:mm',
+    exibindo uma mensagem de erro personalizada."""
+    
+    data = None
+
+    while data is None:
+        data_str = input(_msg_input).strip()
+        
+        if not data_str:
+            print(f"{_msg_erro}\n")
+
+        else:
+            try:
+                data = datetime.strptime(data_str, "%d/%m/%Y %H:%M")
+            except ValueError:
+                print(f"{_msg_erro}\n") # Formato inválido! Use dd/mm/aaaa hh:mm, por exemplo: 15/11/2025 14:30.
+                data = None
+
+    return data.strftime("%d/%m/%Y %H:%M")
+
+def obter_sim_nao(_msg_input: str, _msg_erro: str) -> bool:
+    """Pergunta ao usuário uma questão de Sim/Não e retorna True para 'S' ou False para 'N',
+    aceitando também 'sim' e 'não', com mensagem personalizável."""
+    
+    entrada_sim_nao = ""
+    resultado = False
+
+    while entrada_sim_nao not in ["S", "N"]:
+        entrada_sim_nao = input(_msg_input).strip().upper()
+
+        if not entrada_sim_nao:
+            print(f"{_msg_erro}\n")
+            entrada_sim_nao = ""
+
+        else:
+            if entrada_sim_nao[0] == "S":
+                resultado = True
+                entrada_sim_nao = "S"
+
+            elif entrada_sim_nao[0] == "N":
+                resultado = False
+                entrada_sim_nao = "N"
+
+            else:
+                print(f"{_msg_erro}\n")
+                entrada_sim_nao = ""
+
+    return resultado
+
+def obter_int_intervalado(_msg_input: str, _msg_erro: str, _min: int, _max: int) -> int:
+    """Solicita ao usuário um número inteiro entre os valores mínimos e máximos informados, com mensagem personalizável."""
+
+    entrada_valida = False
+    entrada_numero = None
+
+    while not entrada_valida:
+        try:
+            entrada_numero = int(input(_msg_input).strip())
+
+            if _min <= entrada_numero <= _max:
+                entrada_valida = True
+
+            else:
+                print(f"{_msg_erro} Digite entre {_min} e {_max}.\n")  # Entrada inválida.
+
+        except ValueError:
+            print(f"{_msg_erro} Digite entre {_min} e {_max}.\n")
+
+    return entrada_numero
+
+def obter_opcao_dict(_msg_input: str, _msg_erro: str, _opcoes_dict: dict) -> str:
+    """Exibe um dicionário numerado de opções e solicita ao usuário que escolha um número válido."""
+
+    minimo = min(_opcoes_dict.keys())
+    maximo = max(_opcoes_dict.keys())
+
+    escolha = obter_int_intervalado(_msg_input, _msg_erro, minimo, maximo)
+
+    return _opcoes_dict[escolha]
+
+def obter_multiplas_opcoes_dict(_msg_input: str, _msg_erro: str, _opcoes_dict: dict) -> tuple[str, list]:
+    """Solicita ao usuário uma ou mais opções numéricas (separadas por vírgula) com base em um dicionário numerado.
+    Aceita também 'A' para selecionar todas as opções.
+    Retorna uma tupla contendo: (string_formatada, lista_de_valores)."""
+
+    valores_str = ""
+    valores_lista = []
+    entrada_valida = False
+
+    while not entrada_valida:
+        entrada = input(_msg_input).strip().upper()
+
+        if not entrada:
+            print(f"{_msg_erro}\n")
+            continue
+
+        if entrada == "A":
+            valores_lista = []
+            for chave in _opcoes_dict:
+                valores_lista.append(_opcoes_dict[chave])
+            valores_str = ", ".join(valores_lista)
+            entrada_valida = True
+            continue
+
+        try:
+            numeros = []
+            partes = entrada.split(",")
+            for parte in partes:
+                parte = parte.strip()
+                if parte:
+                    numeros.append(int(parte))
+
+            if not numeros:
+                print(f"{_msg_erro}\n")
+                continue
+
+            todos_validos = True
+            for n in numeros:
+                if n not in _opcoes_dict:
+                    todos_validos = False
+                    break
+
+            if todos_validos:
+                valores_lista = []
+                for n in numeros:
+                    valores_lista.append(_opcoes_dict[n])
+
+                valores_str = ", ".join(valores_lista)
+                entrada_valida = True
+            else:
+                print(f"{_msg_erro}\n")
+
+        except ValueError:
+            print(f"{_msg_erro}\n")
+
+    return valores_str, valores_lista
+
+def obter_lista_ids(_msg_input: str, _msg_erro: str) -> list[int]:
+    """Solicita ao usuário um ou mais IDs separados por vírgula, aceitando também intervalos (ex: 10-20).
+    Retorna a lista de IDs sem repetições, na ordem digitada."""
+
+    ids = []
+    entrada_valida = False
+
+    while not entrada_valida:
+        entrada = input(_msg_input).strip()
+
+        try:
+            ids = []
+            for parte in entrada.split(","):
+                parte = parte.strip()
+                if not parte:
+                    continue
+                if "-" in parte:
+                    inicio, fim = (int(valor) for valor in parte.split("-", 1))
+                    ids.extend(range(inicio, fim + 1))
+                else:
+                    ids.append(int(parte))
+
+            if ids and all(id_ >= 0 for id_ in ids):
+                entrada_valida = True
+            else:
+                print(f"{_msg_erro}\n")
+
+        except ValueError:
+            print(f"{_msg_erro}\n")
+
+    return list(dict.fromkeys(ids))
+
+# ========= IMPRIMIR LISTA COMO TABELA =========
+def imprimir_lista_como_tabela(lista_resultados: list[dict]) -> None:
+    """
+    Recebe uma lista de dicionários e imprime em formato de tabela organizada,
+    deixando a saída mais bonita.
+    """
+    if not lista_resultados:
+        print("Nenhum registro encontrado.")
+        return
+
+    largura_campo = 18
+
+    print(f"{'CAMPO':<{largura_campo}} | VALOR")
+    print("-"* 30)
+
+    for item in lista_resultados:
+
+        for chave, valor in item.items():
+            print(f"{chave:<{largura_campo}} | {valor}")
+
+        print("")
+
+# ========= IMPRIMIR LISTA NORMAL =========
+def imprimir_lista_simples(lista_resultados: list[dict]) -> None:
+    if not lista_resultados:
+        print("Nenhum registro encontrado.")
+        return
+
+    print(f"{'INDEX':<7} | {'CAMPO':<20} | VALOR")
+    imprimir_linha_separadora("-", 60)
+
+    contador = 1  # contador global de campos
+    for item in lista_resultados:
+        for chave, valor in item.items():
+            print(f"{contador:<7} | {chave:<20} | {valor}")
+            contador += 1
+
+    imprimir_linha_separadora("-", 60)
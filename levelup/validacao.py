@@ -0,0 +1,134 @@
+"""Validação e normalização de dados específicos: e-mail, sexo, CPF, CNPJ, RG e CEP."""
+
+import re
+
+# ==========================================================
+#   VALIDAÇÃO DE DADOS ESPECÍFICO
+# ==========================================================
+
+def obter_email(_msg_input: str, _msg_erro: str) -> str:
+    """Solicita um e-mail válido usando regex, exibindo mensagem de erro personalizada."""
+    email = ""
+    padrao = r"^[\w\.-]+@[\w\.-]+\.\w+$"
+    
+    while not re.match(padrao, email):
+        email = input(_msg_input).strip()
+        if not re.match(padrao, email):
+            print(f"{_msg_erro}\n")
+            email = ""
+    return email
+
+def obter_m_f(_msg_input: str, _msg_erro: str) -> str:
+    """Pergunta ao usuário o sexo ('M' ou 'F'), aceitando também palavras completas ('Masculino', 'Feminino'),
+    e exibindo uma mensagem de erro personalizada em caso de entrada inválida."""
+    
+    entrada_mf = ""
+
+    while entrada_mf not in ["M", "F"]:
+        entrada_mf = input(_msg_input).strip().upper()
+
+        if not entrada_mf:
+            print(f"{_msg_erro}\n") 
+            entrada_mf = ""
+
+        else:
+            if entrada_mf[0] == "M":
+                entrada_mf = "M"
+
+            elif entrada_mf[0] == "F":
+                entrada_mf = "F"
+
+            else:
+                print(f"{_msg_erro}\n") # Entrada inválida. Digite 'M' para Masculino ou 'F' para Feminino.
+                entrada_mf = ""
+
+    return entrada_mf
+
+def obter_cpf(_msg_input: str, _msg_erro: str) -> str:
+    """Solicita ao usuário um CPF (11 dígitos), aceitando com ou sem formatação
+    e retornando sempre no formato 000.000.000-00."""
+    
+    cpf = ""
+
+    while not (cpf.isdigit() and len(cpf) == 11):
+        entrada = input(_msg_input).strip()
+        cpf = (
+            entrada.replace(".", "")
+                   .replace("-", "")
+                   .replace(" ", "")
+        )
+
+        if not (cpf.isdigit() and len(cpf) == 11):
+            print(f"{_msg_erro}\n")
+            cpf = ""
+
+    cpf_formatado = (
+        f"{cpf[0:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:11]}"
+    )
+
+    return cpf_formatado
+
+def obter_cnpj(_msg_input: str, _msg_erro: str) -> str:
+    """Solicita ao usuário um CNPJ (14 dígitos), aceitando com ou sem formatação
+    e retornando sempre no formato 00.000.000/0000-00."""
+    
+    cnpj = ""
+
+    while not (cnpj.isdigit() and len(cnpj) == 14):
+        entrada = input(_msg_input).strip()
+        cnpj = (
+            entrada.replace(".", "")
+                   .replace("-", "")
+                   .replace("/", "")
+                   .replace(" ", "")
+        )
+
+        if not (cnpj.isdigit() and len(cnpj) == 14):
+            print(f"{_msg_erro}\n")
+            cnpj = ""
+
+    cnpj_formatado = (
+        f"{cnpj[0:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:14]}"
+    )
+
+    return cnpj_formatado
+
+def normalizar_cnpj(_texto: str) -> str | None:
+    """Versão sem interação de obter_cnpj(): retorna o CNPJ no formato 00.000.000/0000-00
+    ou None se o texto não tiver 14 dígitos."""
+    cnpj = str(_texto).strip().replace(".", "").replace("-", "").replace("/", "").replace(" ", "")
+
+    if not (cnpj.isdigit() and len(cnpj) == 14):
+        return None
+
+    return f"{cnpj[0:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:14]}"
+
+def normalizar_cep(_texto: str) -> str | None:
+    """Retorna o CEP somente com os 8 dígitos ou None se for inválido."""
+    cep = str(_texto).strip().replace("-", "").replace(".", "").replace(" ", "")
+
+    if not (cep.isdigit() and len(cep) == 8):
+        return None
+
+    return cep
+
+def validar_email(_texto: str) -> bool:
+    """Versão sem interação de obter_email(): verifica o e-mail com a mesma regex."""
+    return re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", str(_texto).strip()) is not None
+
+def obter_rg(_msg_input: str, _msg_erro: str) -> str:
+    """Solicita ao usuário um número de RG (somente números, 9 dígitos), 
+    aceitando também formatos com pontos e traços, e exibindo uma mensagem de erro personalizada.
+    Exemplo aceito: 12.345.678-9 ou 123456789."""
+    
+    rg = ""
+
+    while not (rg.isdigit() and len(rg) == 9):
+        entrada = input(_msg_input).strip()
+        rg = entrada.replace(".", "").replace("-", "").replace(" ", "")
+
+        if not (rg.isdigit() and len(rg) == 9):
+            print(f"{_msg_erro}\n")
+            rg = "" # Entrada inválida. Digite um RG com 9 números.
+
+    return rg
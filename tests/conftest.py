@@ -0,0 +1,25 @@
+"""Os testes rodam sobre o driver local (SQLite): cada teste recebe uma base nova com o DML.sql."""
+
+import os
+
+os.environ["LEVELUP_DRIVER"] = "local"  # antes de qualquer import do levelup: nunca usa o Oracle da FIAP
+
+import pytest
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """Pool do sistema sobre um arquivo novo, com os caches globais do pacote zerados."""
+    from levelup import busca
+    from levelup.conexao import abrir_pool_sistema
+    from levelup.consultas import cache_empresas, lista_preview_empresas
+
+    monkeypatch.setenv("LEVELUP_DSN", str(tmp_path / "levelup.db"))
+    cache_empresas.limpar()
+    lista_preview_empresas.invalidar()
+    busca.indice_busca = None
+
+    ok, pool = abrir_pool_sistema(_max=4)
+    assert ok, pool
+    yield pool
+    pool.close()
+    busca.indice_busca = None
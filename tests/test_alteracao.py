@@ -0,0 +1,66 @@
+"""atualizar_empresa_parcial: um UPDATE por tabela, valores do RETURNING e registro completo no retorno."""
+
+import asyncio
+import sqlite3
+
+from levelup.alteracao import atualizar_empresa_parcial
+from levelup.assincrono import abrir_pool_sistema_async, atualizar_empresa_parcial_async
+from levelup.consultas import cache_empresas, select_empresa_por_id
+
+def test_retorna_registro_completo(pool):
+    select_empresa_por_id(pool, 1)  # registro no cache antes da alteração
+
+    ok, empresa = atualizar_empresa_parcial(pool, 1, {"nm_empresa": "TechCo Nova", "st_login": "n", "cep": "01001000"})
+
+    assert ok, empresa
+    assert empresa["nm_empresa"] == "TechCo Nova"
+    assert empresa["st_login"] == "N"
+    assert empresa["cep"] == "01001-000"
+    # campos não alterados também voltam, no formato de select_empresa_por_id
+    assert empresa["cnpj_empresa"] == "01.000.000/0001-01"
+    assert empresa["login"] == "techco.adm"
+    assert empresa["cidade"] == "São Paulo"
+
+    ok, [gravado] = select_empresa_por_id(pool, 1)
+    assert gravado == empresa
+    assert cache_empresas.obter(1) == (True, gravado)
+
+def test_dados_atuais_recebem_valores_do_returning(pool):
+    ok, [atual] = select_empresa_por_id(pool, 2)
+
+    ok, empresa = atualizar_empresa_parcial(pool, 2, {"email_empresa": " novo@bankx.com ", "st_empresa": "i"}, _dados_atuais=atual)
+
+    assert ok, empresa
+    assert empresa == {**atual, "email_empresa": "novo@bankx.com", "st_empresa": "I"}
+
+def test_erros_nao_alteram_nada(pool, tmp_path):
+    assert atualizar_empresa_parcial(pool, 3, {"senha": "x"}) == (False, "O campo 'senha' não pode ser atualizado.")
+    assert atualizar_empresa_parcial(pool, 3, {}) == (False, "Nenhuma alteração informada.")
+    assert atualizar_empresa_parcial(pool, 999999, {"nm_empresa": "Nenhuma"}) == (False, "Empresa não encontrada.")
+
+    # Endereço sumido: o UPDATE de T_EMPRESA já feito na mesma transação é desfeito
+    with sqlite3.connect(tmp_path / "levelup.db") as banco:
+        banco.execute("PRAGMA foreign_keys = OFF")
+        banco.execute("DELETE FROM T_ENDERECO WHERE id_endereco = (SELECT id_endereco FROM T_EMPRESA WHERE id_empresa = 3)")
+    ok, [antes] = select_empresa_por_id(pool, 3, _usar_cache=False)
+
+    resultado = atualizar_empresa_parcial(pool, 3, {"nm_empresa": "Outra", "cidade": "Recife"})
+
+    assert resultado == (False, "Registro relacionado em T_ENDERECO não encontrado.")
+    assert select_empresa_por_id(pool, 3, _usar_cache=False) == (True, [antes])
+
+def test_versao_async_retorna_registro_completo(pool):
+    async def alterar():
+        ok, pool_async = await abrir_pool_sistema_async()
+        assert ok, pool_async
+        try:
+            return await atualizar_empresa_parcial_async(pool_async, 4, {"cidade": "Recife", "login": "varejo.novo"})
+        finally:
+            await pool_async.close()
+
+    ok, empresa = asyncio.run(alterar())
+
+    assert ok, empresa
+    assert (empresa["cidade"], empresa["login"]) == ("Recife", "varejo.novo")
+    assert empresa["nm_empresa"] == "Varejo Top LTDA"
+    assert select_empresa_por_id(pool, 4, _usar_cache=False) == (True, [empresa])
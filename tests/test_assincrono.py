@@ -0,0 +1,79 @@
+"""Variantes async (levelup.assincrono): mesmo contrato (ok, resultado) e mesmos dados das funções síncronas."""
+
+import asyncio
+
+from levelup.assincrono import (
+    abrir_pool_sistema_async, excluir_empresa_por_id_async, executar_concorrentes, insert_endereco_async,
+    insert_empresa_async, insert_lvup_login_async, select_empresa_por_id_async, select_pagina_empresas_async,
+    select_para_generico_async, select_para_preview_async, select_todas_empresas_completas_async
+)
+from levelup.busca import TABELAS_COLUNAS_BUSCA, select_para_generico
+from levelup.consultas import (
+    select_empresa_por_id, select_pagina_empresas, select_para_preview, select_todas_empresas_completas
+)
+
+from test_cadastro import EMPRESA, ENDERECO, LOGIN
+
+def com_pool_async(_corrotina):
+    """Roda _corrotina(pool_async) num loop novo, com um pool async aberto sobre a base do teste."""
+    async def principal():
+        ok, pool_async = await abrir_pool_sistema_async()
+        assert ok, pool_async
+        try:
+            return await _corrotina(pool_async)
+        finally:
+            await pool_async.close()
+
+    return asyncio.run(principal())
+
+def test_consultas_iguais_as_sincronas(pool):
+    resultados = com_pool_async(lambda pool_async: executar_concorrentes(
+        select_empresa_por_id_async(pool_async, 1, _usar_cache=False),
+        select_todas_empresas_completas_async(pool_async),
+        select_pagina_empresas_async(pool_async, 3, 2, _anterior=True),
+        select_para_preview_async(pool_async, "tupla"),
+        select_para_generico_async(pool_async, "adm", TABELAS_COLUNAS_BUSCA)
+    ))
+
+    assert resultados == [
+        select_empresa_por_id(pool, 1, _usar_cache=False),
+        select_todas_empresas_completas(pool),
+        select_pagina_empresas(pool, 3, 2, _anterior=True),
+        select_para_preview(pool, "tupla"),
+        select_para_generico(pool, "adm", TABELAS_COLUNAS_BUSCA)
+    ]
+    assert all("senha" not in registro for registro in resultados[-1][1])
+
+def test_inserts_e_exclusao(pool):
+    async def cadastrar_e_excluir(_pool_async):
+        ok, id_login = await insert_lvup_login_async(_pool_async, LOGIN)
+        assert ok, id_login
+        ok, id_endereco = await insert_endereco_async(_pool_async, {**ENDERECO, "pais": "BRA", "complemento": None})
+        assert ok, id_endereco
+        ok, id_empresa = await insert_empresa_async(_pool_async, {**EMPRESA, "st_empresa": "A"}, id_endereco, id_login)
+        assert ok, id_empresa
+
+        cadastrada = await select_empresa_por_id_async(_pool_async, id_empresa)
+        excluida = await excluir_empresa_por_id_async(_pool_async, id_empresa)
+        de_novo = await excluir_empresa_por_id_async(_pool_async, id_empresa)
+        return id_empresa, cadastrada, excluida, de_novo
+
+    id_empresa, (ok, [empresa]), excluida, de_novo = com_pool_async(cadastrar_e_excluir)
+
+    assert ok and (empresa["nm_empresa"], empresa["login"]) == ("Nova Empresa", "nova.adm")
+    assert excluida == (True, f"Empresa ID {id_empresa} excluída com sucesso!")
+    assert de_novo == (False, "Empresa não encontrada.")
+    assert select_empresa_por_id(pool, id_empresa) == (True, [])
+
+def test_erros_viram_false_e_mensagem(pool):
+    resultados = com_pool_async(lambda pool_async: executar_concorrentes(
+        select_empresa_por_id_async(pool_async, None),
+        select_para_generico_async(pool_async, "x", {"T_LVUP_LOGIN": ["senha"]}),
+        select_para_preview_async(pool_async, "inexistente"),
+        insert_empresa_async(pool_async, EMPRESA, None, None)
+    ))
+
+    assert [ok for ok, _ in resultados] == [False] * 4
+    assert resultados[0] == (False, "Erro: é necessário informar o ID da empresa.")
+    assert resultados[1] == (False, "Coluna não pode ser pesquisada: senha")
+    assert all(isinstance(mensagem, (str, Exception)) for _, mensagem in resultados)
@@ -0,0 +1,47 @@
+"""select_para_generico: uma consulta por tabela (colunas com OR) e colunas_encontradas."""
+
+from levelup.busca import TABELAS_COLUNAS_BUSCA, select_para_generico
+from levelup.sentencas import registro_sql
+
+def test_uma_linha_por_registro_com_colunas_encontradas(pool):
+    ok, resultados = select_para_generico(pool, "bankx", {"T_EMPRESA": ["nm_empresa", "email_empresa"], "T_LVUP_LOGIN": ["login"]})
+
+    assert ok, resultados
+    por_tabela = {(r["tabela"], r.get("id_empresa") if r["tabela"] == "T_EMPRESA" else r["id_login"]): r for r in resultados}
+    assert len(por_tabela) == len(resultados)  # sem linhas repetidas
+    empresa = por_tabela[("T_EMPRESA", 2)]
+    assert empresa["colunas_encontradas"] == "email_empresa"
+    assert por_tabela[("T_LVUP_LOGIN", 6)]["colunas_encontradas"] == "login"
+
+def test_valor_em_varias_colunas(pool):
+    ok, resultados = select_para_generico(pool, "a", {"T_ENDERECO": ["cidade", "bairro", "rua"]})
+
+    assert ok
+    for registro in resultados:
+        encontradas = registro["colunas_encontradas"].split(", ")
+        assert encontradas == [c for c in ("cidade", "bairro", "rua") if "a" in registro[c]]
+    assert any(len(r["colunas_encontradas"].split(", ")) > 1 for r in resultados)
+
+def test_curingas_do_like_e_modo_por_coluna(pool):
+    ok, por_tabela = select_para_generico(pool, "tech%adm", TABELAS_COLUNAS_BUSCA)
+    assert ok
+    assert [(r["tabela"], r["login"], r["colunas_encontradas"]) for r in por_tabela] == [("T_LVUP_LOGIN", "techco.adm", "login")]
+
+    ok, por_coluna = select_para_generico(pool, "tech%adm", TABELAS_COLUNAS_BUSCA, _uma_consulta_por_tabela=False)
+    assert ok
+    assert [{k: v for k, v in r.items() if k != "colunas_encontradas"} for r in por_tabela] == por_coluna
+
+def test_um_texto_sql_por_tabela(pool):
+    antes = registro_sql.estatisticas()["por_chave"]
+
+    select_para_generico(pool, "x", TABELAS_COLUNAS_BUSCA)
+
+    depois = registro_sql.estatisticas()["por_chave"]
+    chaves_busca = {c for c in depois if c.startswith("busca |") and depois[c] != antes.get(c, 0)}
+    assert len(chaves_busca) == len(TABELAS_COLUNAS_BUSCA)
+
+def test_like_diferencia_maiusculas_como_no_oracle(pool):
+    ok, resultados = select_para_generico(pool, "techco", {"T_EMPRESA": ["nm_empresa"], "T_LVUP_LOGIN": ["login"]})
+
+    assert ok
+    assert [(r["tabela"], r["colunas_encontradas"]) for r in resultados] == [("T_LVUP_LOGIN", "login")]
@@ -0,0 +1,59 @@
+"""cadastrar_empresa_completa: login, endereço e empresa numa ida ao banco e num único commit."""
+
+from levelup import oracledb_local
+from levelup.cadastro import cadastrar_empresa_completa
+from levelup.conexao import usar_conexao
+from levelup.consultas import select_empresa_por_id
+
+LOGIN = {"login": "nova.adm", "senha": "segredo", "st_ativo": "S"}
+ENDERECO = {"cep": "01001-000", "estado": "SP", "cidade": "São Paulo", "bairro": "Sé", "rua": "Praça da Sé", "numero": 1}
+EMPRESA = {"nm_empresa": "Nova Empresa", "cnpj_empresa": "12.345.678/0001-90", "email_empresa": "contato@nova.com", "dt_cadastro": "05/03/2024"}
+
+def contar(_pool, _tabela: str) -> int:
+    with usar_conexao(_pool) as conexao:
+        cur = conexao.cursor()
+        cur.execute(f"SELECT COUNT(*) FROM {_tabela}")
+        (quantidade,) = cur.fetchone()
+        cur.close()
+    return quantidade
+
+def espiar_driver(_monkeypatch) -> dict:
+    """Conta execute() e commit() feitos pelo código sob teste no driver local."""
+    chamadas = {"execute": 0, "commit": 0}
+    execute, commit = oracledb_local.Cursor.execute, oracledb_local.Connection.commit
+
+    def execute_contado(self, *_args, **_kwargs):
+        chamadas["execute"] += 1
+        return execute(self, *_args, **_kwargs)
+
+    def commit_contado(self):
+        chamadas["commit"] += 1
+        return commit(self)
+
+    _monkeypatch.setattr(oracledb_local.Cursor, "execute", execute_contado)
+    _monkeypatch.setattr(oracledb_local.Connection, "commit", commit_contado)
+    return chamadas
+
+def test_um_execute_e_dados_gravados(pool, monkeypatch):
+    chamadas = espiar_driver(monkeypatch)
+
+    ok, ids = cadastrar_empresa_completa(pool, LOGIN, ENDERECO, EMPRESA)
+
+    assert ok, ids
+    assert chamadas == {"execute": 1, "commit": 0}  # o COMMIT vai dentro do bloco
+    monkeypatch.undo()
+
+    ok, [empresa] = select_empresa_por_id(pool, ids["id_empresa"])
+    assert (empresa["nm_empresa"], empresa["login"], empresa["cidade"]) == ("Nova Empresa", "nova.adm", "São Paulo")
+    assert empresa["dt_cadastro"].strftime("%d/%m/%Y") == "05/03/2024"
+
+def test_falha_nao_deixa_login_nem_endereco_orfao(pool):
+    antes = {tabela: contar(pool, tabela) for tabela in ("T_LVUP_LOGIN", "T_ENDERECO", "T_EMPRESA")}
+
+    ok, erro = cadastrar_empresa_completa(pool, LOGIN, ENDERECO, {**EMPRESA, "email_empresa": None})
+
+    assert not ok and isinstance(erro, Exception)
+    assert {tabela: contar(pool, tabela) for tabela in antes} == antes
+
+    ok, ids = cadastrar_empresa_completa(pool, LOGIN, ENDERECO, EMPRESA)  # a conexão devolvida segue usável
+    assert ok, ids
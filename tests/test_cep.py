@@ -0,0 +1,102 @@
+"""resolver_ceps_em_lote contra um ViaCEP falso local (http.server), sem acesso à rede."""
+
+import json
+import time
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from levelup.cep import CacheCep, resolver_ceps_em_lote
+
+# cep -> lista de respostas, consumidas uma por requisição (a última se repete)
+#   int   -> status HTTP sem corpo JSON
+#   float -> segundos de espera antes de responder (provoca timeout)
+#   dict  -> corpo JSON com status 200
+RESPOSTAS = {
+    "01001000": [{"cep": "01001-000", "logradouro": "Praça da Sé", "bairro": "Sé", "localidade": "São Paulo", "uf": "SP"}],
+    "99999999": [{"erro": True}],
+    "20040002": [503, 429, {"cep": "20040-002", "localidade": "Rio de Janeiro", "uf": "RJ"}],
+    "30130000": [500],
+    "40010000": [1.0],
+}
+
+class ViaCepFalso(BaseHTTPRequestHandler):
+    def do_GET(self):
+        cep = self.path.strip("/").split("/")[0]
+        with self.server.trava:
+            self.server.chamadas[cep] += 1
+            self.server.instantes.append(time.monotonic())
+            respostas = RESPOSTAS.get(cep, [{"erro": True}])
+            resposta = respostas[min(self.server.chamadas[cep], len(respostas)) - 1]
+
+        if isinstance(resposta, float):
+            time.sleep(resposta)
+            resposta = {"erro": True}
+
+        if isinstance(resposta, int):
+            corpo, status = b"<html>indisponivel</html>", resposta
+        else:
+            corpo, status = json.dumps(resposta).encode(), 200
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *_args):
+        pass
+
+@pytest.fixture
+def servidor():
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), ViaCepFalso)
+    servidor.daemon_threads = True
+    servidor.trava = threading.Lock()
+    servidor.chamadas = Counter()
+    servidor.instantes = []
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+
+def resolver(_servidor, _ceps, **_opcoes):
+    opcoes = {"_cache": CacheCep(None), "_url_base": f"http://127.0.0.1:{_servidor.server_port}", "_espera_tentativa": 0.01}
+    opcoes.update(_opcoes)
+    ok, resultado = resolver_ceps_em_lote(_ceps, **opcoes)
+    assert ok, resultado
+    return resultado
+
+def test_repetidos_e_inexistentes(servidor):
+    resultado = resolver(servidor, ["01001-000", "01001000", "99999999", "01001000", "123"])
+
+    assert resultado["enderecos"]["01001000"]["cidade"] == "São Paulo"
+    assert resultado["enderecos"]["99999999"] is None
+    assert list(resultado["falhas"]) == ["123"]
+    assert servidor.chamadas == {"01001000": 1, "99999999": 1}
+
+def test_repete_503_e_429(servidor):
+    resultado = resolver(servidor, ["20040002", "30130000"], _tentativas=3)
+
+    assert resultado["enderecos"]["20040002"]["estado"] == "RJ"
+    assert "500" in resultado["falhas"]["30130000"]
+    assert servidor.chamadas == {"20040002": 3, "30130000": 3}
+
+def test_limite_de_requisicoes_por_segundo(servidor):
+    ceps = [f"0100{i:04d}" for i in range(6)]
+    resolver(servidor, ceps, _max_threads=6, _requisicoes_por_segundo=20.0)
+
+    instantes = sorted(servidor.instantes)
+    assert len(instantes) == 6
+    assert instantes[-1] - instantes[0] >= 5 / 20.0 * 0.9
+
+def test_timeout_vira_falha(servidor):
+    inicio = time.monotonic()
+    resultado = resolver(servidor, ["40010000", "01001000"], _timeout=0.2, _tentativas=2)
+
+    assert "40010000" not in resultado["enderecos"]
+    assert "timed out" in resultado["falhas"]["40010000"].lower()
+    assert resultado["enderecos"]["01001000"]["estado"] == "SP"
+    assert servidor.chamadas["40010000"] == 2
+    assert time.monotonic() - inicio < 0.9
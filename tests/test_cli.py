@@ -0,0 +1,113 @@
+"""Subcomandos de python -m levelup (executar_cli) sobre a base local, com a saída JSON Lines do stdout."""
+
+import io
+import json
+import sys
+
+import pytest
+
+from levelup import cli
+
+from test_importacao import linha
+
+@pytest.fixture
+def rodar(pool, monkeypatch, capsys):
+    """rodar(*argv, entrada=None) -> (código de saída, objetos JSON do stdout, stderr)."""
+    monkeypatch.setattr(cli, "_pool", pool)  # a sessão usa o pool do teste
+
+    def executar(*_argv, entrada: str | None = None):
+        if entrada is not None:
+            monkeypatch.setattr(sys, "stdin", io.StringIO(entrada))
+        codigo = cli.executar_cli(list(_argv))
+        saida = capsys.readouterr()
+        return codigo, saida.out, saida.err
+
+    return executar
+
+def objetos(_saida: str) -> list:
+    return [json.loads(texto) for texto in _saida.splitlines() if texto.strip()]
+
+def test_cadastrar_e_consultar_por_id(rodar):
+    argumentos = [f"--{campo.replace('_', '-')}={valor}" for campo, valor in linha(1).items()]
+
+    codigo, saida, _ = rodar("cadastrar", *argumentos)
+
+    assert codigo == 0
+    [cadastro] = objetos(saida)
+    assert cadastro["ok"] and cadastro["linha"] == 1
+
+    codigo, saida, _ = rodar("consultar", "--id", "1", str(cadastro["id_empresa"]))
+    assert codigo == 0
+    assert [e["nm_empresa"] for e in objetos(saida)] == ["TechCo Software", "Importada 1"]
+
+    codigo, saida, erro = rodar("consultar", "--id", "999999")
+    assert codigo == 1 and saida == ""
+    assert "Empresa ID 999999 não encontrada." in erro
+
+def test_consultar_todas_em_json_e_busca(rodar):
+    codigo, saida, _ = rodar("consultar", "--todas", "--tamanho-pagina", "3", "--formato", "json")
+
+    assert codigo == 0
+    empresas = json.loads(saida)
+    assert [e["id_empresa"] for e in empresas] == sorted(e["id_empresa"] for e in empresas)
+    assert len(empresas) == 10
+
+    codigo, saida, _ = rodar("consultar", "--busca", "adm")
+    assert codigo == 0
+    assert "techco.adm" in saida and "senha" not in saida and "empresa123" not in saida
+
+def test_atualizar_por_argumentos_e_pelo_stdin(rodar):
+    codigo, saida, _ = rodar("atualizar", "--id", "1", "--campo", "cidade=Recife", "--campo", "st_login=N")
+
+    assert codigo == 0
+    [resultado] = objetos(saida)
+    assert resultado["empresa"]["cidade"] == "Recife"
+    assert resultado["empresa"]["nm_empresa"] == "TechCo Software"
+
+    entrada = '{"id_empresa": 2, "nm_empresa": "Bank Y"}\n{"nm_empresa": "sem id"}\n{"id_empresa": 3, "cnpj_empresa": "1"}\n'
+    codigo, saida, _ = rodar("atualizar", "--entrada", "-", entrada=entrada)
+
+    assert codigo == 1
+    assert [(r["linha"], r["ok"]) for r in objetos(saida)] == [(1, True), (2, False), (3, False)]
+
+def test_excluir_simulado_e_pelo_stdin(rodar):
+    codigo, saida, _ = rodar("excluir", "--id", "1", "2", "--simular")
+
+    assert codigo == 0
+    [simulacao] = objetos(saida)
+    assert simulacao["simulacao"] and simulacao["linhas"]["T_EMPRESA"] == 2
+
+    codigo, saida, _ = rodar("excluir", "--entrada", "-", entrada="1\n2\n999\n")
+
+    assert codigo == 1  # 999 não existe: as outras são excluídas, mas o código indica a falha
+    [relatorio] = objetos(saida)
+    assert (relatorio["excluidas"], relatorio["nao_encontradas"]) == ([1, 2], [999])
+
+    codigo, saida, _ = rodar("excluir", "--entrada", "-", entrada="3\nabc\n")
+    assert codigo == 1
+    assert objetos(saida) == [{"ok": False, "linha": 2, "erro": "ID de empresa inválido; nada foi excluído."}]
+
+def test_importar_e_exportar(rodar, tmp_path):
+    arquivo = tmp_path / "empresas.jsonl"
+    arquivo.write_text("".join(json.dumps(linha(i)) + "\n" for i in range(1, 4)), encoding="utf-8")
+
+    codigo, saida, _ = rodar("importar", str(arquivo), "--tamanho-lote", "2")
+
+    assert codigo == 0
+    [relatorio] = objetos(saida)
+    assert (relatorio["inseridas"], relatorio["lotes"]) == (3, 2)
+
+    destino = tmp_path / "exportadas.jsonl"
+    codigo, saida, _ = rodar("exportar", "--arquivo", str(destino))
+
+    assert codigo == 0
+    [exportacao] = objetos(saida)
+    assert exportacao["linhas"] == 13
+    assert len(objetos(destino.read_text(encoding="utf-8"))) == 13
+
+def test_argumentos_invalidos(rodar):
+    with pytest.raises(SystemExit):
+        rodar("atualizar", "--id", "1", "--campo", "sem_igual")
+
+    codigo, _, erro = rodar("atualizar", "--id", "1")
+    assert codigo == 1 and "Informe --id" in erro
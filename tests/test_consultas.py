@@ -0,0 +1,129 @@
+"""Consultas de empresas: paginação por chave, cache de select_empresa_por_id e preview incremental."""
+
+import sqlite3
+
+from levelup.alteracao import atualizar_dados_empresa_por_id, atualizar_empresa_parcial
+from levelup.cadastro import cadastrar_empresa_completa
+from levelup.consultas import (
+    CacheEmpresas, ListaPreviewEmpresas, cache_empresas, lista_preview_empresas, select_empresa_por_id,
+    select_pagina_empresas, select_para_preview, select_todas_empresas_completas
+)
+from levelup.exclusao import excluir_empresa_por_id, excluir_empresas_em_lote
+
+from test_cadastro import EMPRESA, ENDERECO, LOGIN
+
+def ids(_pagina: list[dict]) -> list[int]:
+    return [empresa["id_empresa"] for empresa in _pagina]
+
+def test_paginas_seguintes_cobrem_a_tabela(pool):
+    ok, todas = select_todas_empresas_completas(pool)
+    assert ok and len(todas) >= 7
+
+    paginas, referencia = [], 0
+    while True:
+        ok, pagina = select_pagina_empresas(pool, referencia, _tamanho_pagina=3)
+        assert ok, pagina
+        if not pagina:
+            break
+        assert len(pagina) <= 3
+        paginas.append(pagina)
+        referencia = pagina[-1]["id_empresa"]
+
+    assert [empresa for pagina in paginas for empresa in pagina] == todas
+    assert all(len(pagina) == 3 for pagina in paginas[:-1])
+
+def test_pagina_anterior_em_ordem_crescente(pool):
+    ok, primeira = select_pagina_empresas(pool, 0, _tamanho_pagina=3)
+    ok, segunda = select_pagina_empresas(pool, primeira[-1]["id_empresa"], _tamanho_pagina=3)
+
+    ok, voltando = select_pagina_empresas(pool, segunda[0]["id_empresa"], _tamanho_pagina=3, _anterior=True)
+
+    assert ok
+    assert voltando == primeira
+    assert ids(voltando) == sorted(ids(voltando))
+    assert select_pagina_empresas(pool, primeira[0]["id_empresa"], _tamanho_pagina=3, _anterior=True) == (True, [])
+
+def test_pagina_com_formato_tupla(pool):
+    ok, pagina = select_pagina_empresas(pool, 0, _tamanho_pagina=2, _formato="tupla")
+
+    assert ok and len(pagina) == 2
+    assert [linha[0] for linha in pagina] == [1, 2]
+
+# ========= CACHE DE EMPRESAS =========
+def test_cache_lru_ttl_e_versao():
+    cache = CacheEmpresas(_capacidade=2, _ttl=60)
+    for id_empresa in (1, 2):
+        cache.guardar(id_empresa, {"id_empresa": id_empresa})
+    cache.obter(1)           # 1 passa a ser o mais recente
+    cache.guardar(3, {"id_empresa": 3})
+
+    assert cache.obter(2) == (False, None)
+    assert cache.obter(1) == (True, {"id_empresa": 1})
+
+    versao = cache.versao()
+    cache.invalidar(1)
+    cache.guardar(1, {"id_empresa": 1, "antigo": True}, versao)  # SELECT anterior ao UPDATE
+    assert cache.obter(1) == (False, None)
+
+    expirando = CacheEmpresas(_capacidade=2, _ttl=0)
+    expirando.guardar(1, {"id_empresa": 1})
+    assert expirando.obter(1) == (False, None)
+    assert expirando.estatisticas()["expirados"] == 1
+
+def test_leitura_pelo_cache_e_invalidacao_nas_escritas(pool, monkeypatch):
+    ok, [empresa] = select_empresa_por_id(pool, 1)
+    assert select_empresa_por_id(pool, 1) == (True, [empresa])
+    assert cache_empresas.estatisticas()["acertos"] >= 1
+
+    # Alteração campo a campo (menu): o nome digitado substitui o do cache
+    monkeypatch.setattr("builtins.input", lambda _msg="": "TechCo Renomeada")
+    ok, _ = atualizar_dados_empresa_por_id(pool, 2, 1)
+    assert ok
+    assert select_empresa_por_id(pool, 1)[1][0]["nm_empresa"] == "TechCo Renomeada"
+
+    ok, _ = atualizar_empresa_parcial(pool, 1, {"cidade": "Recife"})
+    assert select_empresa_por_id(pool, 1)[1][0]["cidade"] == "Recife"
+
+    select_empresa_por_id(pool, 2)
+    excluir_empresas_em_lote(pool, [2])
+    excluir_empresa_por_id(pool, 1)
+    assert select_empresa_por_id(pool, 1) == (True, [])
+    assert select_empresa_por_id(pool, 2) == (True, [])
+
+# ========= PREVIEW INCREMENTAL =========
+def test_preview_incremental_acompanha_as_escritas(pool, tmp_path):
+    preview = lista_preview_empresas
+
+    assert preview.obter(pool) == select_para_preview(pool)
+    assert preview.recargas_completas == 1
+
+    lidas = preview.linhas_lidas
+    ok, ids = cadastrar_empresa_completa(pool, LOGIN, ENDERECO, EMPRESA)
+    atualizar_empresa_parcial(pool, 2, {"nm_empresa": "Bank X Renomeado"})
+    excluir_empresa_por_id(pool, 3)
+
+    ok, lista = preview.obter(pool)
+    assert (ok, lista) == select_para_preview(pool)
+    assert {"id_empresa": ids["id_empresa"], "nm_empresa": "Nova Empresa"} in lista
+    assert preview.recargas_completas == 1
+    assert preview.linhas_lidas == lidas + 1  # só a empresa nova veio do banco
+
+    # Exclusão feita por fora do programa: a contagem diverge e a lista é relida inteira
+    with sqlite3.connect(tmp_path / "levelup.db") as banco:
+        banco.execute("PRAGMA foreign_keys = OFF")
+        banco.execute("DELETE FROM T_EMPRESA WHERE id_empresa = 4")
+    assert preview.obter(pool, "tupla") == select_para_preview(pool, "tupla")
+    assert preview.recargas_completas == 2
+
+def test_preview_limita_as_alteracoes_guardadas(pool):
+    preview = ListaPreviewEmpresas(_limite_alteracoes=2)
+    preview.registrar("inserir", 50, "Antes de carregar")  # nada carregado: ignorado
+    assert preview._alteracoes == []
+
+    preview.obter(pool)
+    for id_empresa in (1, 2, 3):
+        preview.registrar("alterar", id_empresa, f"Nome {id_empresa}")
+
+    assert preview._alteracoes == []
+    assert preview.obter(pool) == select_para_preview(pool)
+    assert preview.recargas_completas == 2
@@ -0,0 +1,57 @@
+"""Exclusão de empresas: em lote (contagens, simulação, uma transação) e por ID, com os dependentes."""
+
+import sqlite3
+
+from levelup.exclusao import TABELAS_DEPENDENTES_EMPRESA, excluir_empresa_por_id, excluir_empresas_em_lote
+from levelup.consultas import select_empresa_por_id
+
+from test_cadastro import contar
+
+TABELAS = (*TABELAS_DEPENDENTES_EMPRESA, "T_EMPRESA", "T_LVUP_LOGIN", "T_ENDERECO")
+
+def contagens(_pool) -> dict:
+    return {tabela: contar(_pool, tabela) for tabela in TABELAS}
+
+def test_simulacao_conta_sem_apagar_e_bate_com_a_exclusao(pool):
+    antes = contagens(pool)
+
+    ok, simulacao = excluir_empresas_em_lote(pool, [1, 2, 2, 999], _simular=True)
+
+    assert ok, simulacao
+    assert simulacao["linhas"] == {
+        "T_TELEFONE_EMPRESA": 3, "EMPRESA_CATEGORIA": 3, "EMPRESA_VAGA": 3,
+        "T_EMPRESA": 2, "T_LVUP_LOGIN": 2, "T_ENDERECO": 2
+    }
+    assert contagens(pool) == antes
+
+    ok, relatorio = excluir_empresas_em_lote(pool, [1, 2, 2, 999], _tamanho_lote=2)
+
+    assert ok, relatorio
+    assert relatorio["linhas"] == simulacao["linhas"]
+    assert (relatorio["excluidas"], relatorio["nao_encontradas"], relatorio["lotes"]) == ([1, 2], [999], 2)
+    assert contagens(pool) == {tabela: antes[tabela] - simulacao["linhas"][tabela] for tabela in TABELAS}
+    assert select_empresa_por_id(pool, 1) == (True, [])
+
+def test_erro_em_um_lote_desfaz_todos(pool, tmp_path):
+    # Empresa 3 passa a usar o endereço da empresa 4: apagar o endereço da 4 viola a FK
+    with sqlite3.connect(tmp_path / "levelup.db") as banco:
+        banco.execute("UPDATE T_EMPRESA SET id_endereco = (SELECT id_endereco FROM T_EMPRESA WHERE id_empresa = 4) WHERE id_empresa = 3")
+    antes = contagens(pool)
+
+    ok, erro = excluir_empresas_em_lote(pool, [1, 4], _tamanho_lote=1)
+
+    assert not ok and erro.startswith("Erro durante a exclusão em lote")
+    assert contagens(pool) == antes
+
+def test_sem_ids(pool):
+    assert excluir_empresas_em_lote(pool, []) == (False, "Nenhum ID informado.")
+
+def test_exclusao_por_id_leva_os_dependentes(pool):
+    ok, simulacao = excluir_empresas_em_lote(pool, [1], _simular=True)
+    antes = contagens(pool)
+
+    ok, mensagem = excluir_empresa_por_id(pool, 1)
+
+    assert ok, mensagem
+    assert contagens(pool) == {tabela: antes[tabela] - simulacao["linhas"][tabela] for tabela in TABELAS}
+    assert excluir_empresa_por_id(pool, 1) == (False, "Empresa não encontrada.")
@@ -0,0 +1,76 @@
+"""importar_empresas_arquivo: linhas recusadas no relatório, array DML em lotes e commit a cada N lotes."""
+
+import json
+
+from levelup import oracledb_local
+from levelup.importacao import importar_empresas_arquivo
+
+from test_cadastro import contar
+
+CABECALHO = ["login", "senha", "cep", "estado", "cidade", "bairro", "rua", "numero", "nm_empresa", "cnpj_empresa", "email_empresa"]
+
+def linha(_i: int, **_trocas) -> dict:
+    dados = dict(zip(CABECALHO, [
+        f"imp{_i}.adm", "segredo", "01001000", "sp", "São Paulo", "Sé", "Praça da Sé", str(_i),
+        f"Importada {_i}", f"11222333000{_i:03d}", f"contato{_i}@importada.com"
+    ]))
+    dados.update(_trocas)
+    return dados
+
+def contar_commits(_monkeypatch) -> list:
+    commits = []
+    commit = oracledb_local.Connection.commit
+
+    def commit_contado(self):
+        commits.append(1)
+        return commit(self)
+
+    _monkeypatch.setattr(oracledb_local.Connection, "commit", commit_contado)
+    return commits
+
+def test_csv_com_linhas_recusadas_e_commit_a_cada_dois_lotes(pool, tmp_path, monkeypatch):
+    linhas = [linha(i) for i in range(1, 8)]
+    linhas[2]["cnpj_empresa"] = "123"
+    linhas[5]["senha"] = ""
+    arquivo = tmp_path / "empresas.csv"
+    arquivo.write_text(
+        ";".join(CABECALHO) + "\n" + "".join(";".join(l[c] for c in CABECALHO) + "\n" for l in linhas),
+        encoding="utf-8"
+    )
+    empresas_antes = contar(pool, "T_EMPRESA")
+    commits = contar_commits(monkeypatch)
+
+    ok, relatorio = importar_empresas_arquivo(pool, str(arquivo), _tamanho_lote=2, _commit_a_cada=2)
+
+    assert ok, relatorio
+    assert (relatorio["lidas"], relatorio["inseridas"], relatorio["lotes"]) == (7, 5, 4)
+    assert relatorio["rejeitadas"] == [
+        (4, "CNPJ inválido (precisa ter 14 números)."),  # linha 1 do arquivo é o cabeçalho
+        (7, "Campos obrigatórios vazios: senha")
+    ]
+    assert len(commits) == 3  # depois do 2º e do 4º lote, e o commit final
+    assert contar(pool, "T_EMPRESA") == empresas_antes + 5
+
+def test_json_lines_com_linha_ilegivel(pool, tmp_path):
+    arquivo = tmp_path / "empresas.jsonl"
+    arquivo.write_text(json.dumps(linha(1)) + "\n{quebrado\n\n" + json.dumps(linha(2)) + "\n", encoding="utf-8")
+
+    ok, relatorio = importar_empresas_arquivo(pool, str(arquivo))
+
+    assert ok, relatorio
+    assert relatorio["inseridas"] == 2
+    [(numero, motivo)] = relatorio["rejeitadas"]
+    assert numero == 2 and motivo.startswith("JSON inválido")
+
+def test_erro_no_arquivo_desfaz_so_o_que_nao_teve_commit(pool, tmp_path):
+    itens = ",".join(json.dumps(linha(i)) for i in range(1, 4))
+    arquivo = tmp_path / "empresas.json"
+    arquivo.write_text(f"[{itens}, {{quebrado", encoding="utf-8")
+    empresas_antes = contar(pool, "T_EMPRESA")
+
+    ok, relatorio = importar_empresas_arquivo(pool, str(arquivo), _tamanho_lote=1, _commit_a_cada=2)
+
+    assert not ok
+    assert relatorio["inseridas"] == 2
+    assert "1 linha(s) sem commit foram desfeitas" in relatorio["erro"]
+    assert contar(pool, "T_EMPRESA") == empresas_antes + 2
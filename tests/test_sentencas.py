@@ -0,0 +1,53 @@
+"""RegistroSql: textos montados uma vez, LRU limitado e contagem de execuções."""
+
+import pytest
+
+from levelup.sentencas import RegistroSql, montar_busca_generica
+
+class CursorFalso:
+    def __init__(self):
+        self.executados = []
+
+    def execute(self, _sql, _parametros):
+        self.executados.append(_sql)
+
+def test_monta_uma_vez_por_chave():
+    registro = RegistroSql()
+    montagens = []
+
+    def montar():
+        montagens.append(1)
+        return "SELECT 1 FROM dual"
+
+    cursor = CursorFalso()
+    for _ in range(3):
+        registro.executar(cursor, ("teste",), montar)
+
+    assert len(montagens) == 1
+    assert cursor.executados == ["SELECT 1 FROM dual"] * 3
+    assert registro.estatisticas()["por_chave"] == {"teste": 3}
+
+def test_chaves_de_quem_chama_nao_crescem_sem_limite():
+    registro = RegistroSql(_capacidade=3)
+    cursor = CursorFalso()
+
+    registro.executar(cursor, ("busca", "T_EMPRESA", ("nm_empresa",)), lambda: "fixa")
+    for i in range(10):
+        registro.executar(cursor, ("busca", "T_EMPRESA", (f"coluna_{i}",)), lambda: f"texto {i}")
+        registro.sentenca(("busca", "T_EMPRESA", ("nm_empresa",)), lambda: "remontada")  # usada: fica no LRU
+
+    estatisticas = registro.estatisticas()
+    assert estatisticas["textos_distintos"] == 3
+    assert estatisticas["descartados"] == 8
+    assert estatisticas["execucoes"] == 11
+    assert registro.sentenca(("busca", "T_EMPRESA", ("nm_empresa",)), lambda: "remontada") == "fixa"
+    assert registro.sentenca(("busca", "T_EMPRESA", ("coluna_0",)), lambda: "remontada") == "remontada"
+
+def test_busca_generica_recusa_senha_e_nomes_invalidos():
+    with pytest.raises(ValueError, match="senha"):
+        montar_busca_generica("T_LVUP_LOGIN", ("login", "senha"))
+    with pytest.raises(ValueError, match="inválido"):
+        montar_busca_generica("T_EMPRESA", ("nm_empresa = nm_empresa --",))
+
+    sql = montar_busca_generica("T_LVUP_LOGIN", ("login",))
+    assert "senha" not in sql and "*" not in sql
@@ -0,0 +1,160 @@
+"""Rotas do serviço HTTP (levelup.servico) rodando embutido numa thread, sobre a base local."""
+
+import json
+import socket
+import asyncio
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from levelup.servico import servir
+
+from test_importacao import linha
+
+@pytest.fixture
+def servico(pool):
+    """Sobe servir() numa thread com um asyncio.Event de parada; devolve a URL base."""
+    with socket.socket() as sonda:
+        sonda.bind(("127.0.0.1", 0))
+        porta = sonda.getsockname()[1]
+
+    pronto = threading.Event()
+    estado = {}
+
+    def rodar():
+        async def principal():
+            estado["loop"] = asyncio.get_running_loop()
+            estado["parar"] = asyncio.Event()
+            pronto.set()
+            await servir(pool, _porta=porta, _conexoes=2, _parar=estado["parar"])
+
+        asyncio.run(principal())
+
+    thread = threading.Thread(target=rodar, daemon=True)
+    thread.start()
+    pronto.wait(5)
+
+    url = f"http://127.0.0.1:{porta}"
+    for _ in range(50):
+        try:
+            urllib.request.urlopen(f"{url}/saude", timeout=1).close()
+            break
+        except OSError:
+            threading.Event().wait(0.05)
+
+    yield url
+    estado["loop"].call_soon_threadsafe(estado["parar"].set)
+    thread.join(5)
+    assert not thread.is_alive()
+
+def requisitar_bruto(_url: str, _metodo: str = "GET", _corpo=None) -> tuple[int, dict, bytes]:
+    dados = json.dumps(_corpo).encode() if _corpo is not None else None
+    pedido = urllib.request.Request(_url, data=dados, method=_metodo, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(pedido, timeout=5) as resposta:
+            return resposta.status, dict(resposta.headers), resposta.read()
+    except urllib.error.HTTPError as erro:
+        return erro.code, dict(erro.headers), erro.read()
+
+def requisitar(_url: str, _metodo: str = "GET", _corpo=None) -> tuple[int, dict]:
+    status, _, corpo = requisitar_bruto(_url, _metodo, _corpo)
+    return status, json.loads(corpo)
+
+def test_busca_nao_devolve_senha(servico):
+    status, corpo = requisitar(f"{servico}/busca?q=adm")
+
+    assert status == 200
+    logins = [r for r in corpo["resultados"] if r["tabela"] == "T_LVUP_LOGIN"]
+    assert {r["login"] for r in logins} >= {"techco.adm", "bankx.adm"}
+    assert all("senha" not in r for r in corpo["resultados"])
+    assert "empresa123" not in json.dumps(corpo)
+
+def test_busca_pela_senha_nao_encontra_nada(servico):
+    status, corpo = requisitar(f"{servico}/busca?q=empresa123")
+
+    assert status == 200
+    assert corpo["resultados"] == []
+
+def test_busca_rapida_nao_indexa_senha(servico, pool):
+    from levelup import busca
+    from levelup.cadastro import insert_lvup_login
+
+    status, corpo = requisitar(f"{servico}/busca?q=adm&rapida=1")  # constrói o índice
+    assert status == 200 and corpo["resultados"]
+
+    ok, _ = insert_lvup_login(pool, {"login": "novo.adm", "senha": "segredo987", "st_ativo": "S"})
+    assert ok
+
+    status, corpo = requisitar(f"{servico}/busca?q=adm&rapida=1")
+    assert "novo.adm" in {r.get("login") for r in corpo["resultados"]}
+    assert all("senha" not in r for r in corpo["resultados"])
+    assert "empresa123" not in json.dumps(corpo) and "segredo987" not in json.dumps(corpo)
+
+    for senha in ("empresa123", "segredo987"):
+        _, corpo = requisitar(f"{servico}/busca?q={senha}&rapida=1")
+        assert corpo["resultados"] == []
+    assert all("senha" not in registro for registro in busca.indice_busca._registros.values())
+
+def test_crud_de_empresas(servico):
+    status, _, corpo = requisitar_bruto(f"{servico}/empresas", "POST", linha(1))
+    criada = json.loads(corpo)
+    assert status == 201 and criada["ok"]
+    id_empresa = criada["id_empresa"]
+
+    status, corpo = requisitar(f"{servico}/empresas/{id_empresa}")
+    assert status == 200 and corpo["empresa"]["nm_empresa"] == "Importada 1"
+
+    status, corpo = requisitar(f"{servico}/empresas/{id_empresa}", "PATCH", {"cidade": "Recife", "st_empresa": "I"})
+    assert status == 200
+    assert (corpo["empresa"]["cidade"], corpo["empresa"]["st_empresa"], corpo["empresa"]["login"]) == ("Recife", "I", "imp1.adm")
+
+    status, corpo = requisitar(f"{servico}/empresas/{id_empresa}", "DELETE")
+    assert status == 200 and corpo["ok"]
+    assert requisitar(f"{servico}/empresas/{id_empresa}")[0] == 404
+    assert requisitar(f"{servico}/empresas/{id_empresa}", "PATCH", {"cidade": "Recife"})[0] == 404
+    assert requisitar(f"{servico}/empresas/{id_empresa}", "DELETE")[0] == 404
+
+def test_erros_de_entrada(servico):
+    status, corpo = requisitar(f"{servico}/empresas", "POST", {**linha(1), "cnpj_empresa": "1"})
+    assert status == 400 and "CNPJ" in corpo["erro"]
+    assert requisitar(f"{servico}/empresas/1", "PATCH", {"senha": "x"})[0] == 400
+    assert requisitar(f"{servico}/empresas/1", "PATCH", {})[0] == 400
+    assert requisitar(f"{servico}/busca")[0] == 400
+    assert requisitar(f"{servico}/empresas/excluir", "POST", {"ids": "1"})[0] == 400
+    assert requisitar(f"{servico}/inexistente")[0] == 404
+
+    status, cabecalhos, _ = requisitar_bruto(f"{servico}/empresas/1", "POST", {})
+    assert status == 405 and set(cabecalhos["Allow"].split(", ")) == {"GET", "PATCH", "DELETE"}
+
+def test_listagem_paginada_e_exportacao(servico):
+    status, primeira = requisitar(f"{servico}/empresas?limite=4")
+    assert status == 200 and len(primeira["empresas"]) == 4 and primeira["proximo"] == 4
+
+    status, segunda = requisitar(f"{servico}/empresas?limite=4&depois={primeira['proximo']}")
+    assert [e["id_empresa"] for e in segunda["empresas"]] == [5, 6, 7, 8]
+
+    status, todas = requisitar(f"{servico}/empresas")
+    assert status == 200 and [e["id_empresa"] for e in todas] == list(range(1, 11))
+
+    status, cabecalhos, corpo = requisitar_bruto(f"{servico}/exportar")
+    assert status == 200 and "empresas.jsonl" in cabecalhos["Content-Disposition"]
+    assert [json.loads(texto) for texto in corpo.splitlines()] == todas
+
+    assert requisitar(f"{servico}/exportar?formato=xml")[0] == 400
+
+def test_exclusao_em_lote(servico):
+    status, simulacao = requisitar(f"{servico}/empresas/excluir", "POST", {"ids": [1, 2], "simular": True})
+    assert status == 200 and simulacao["linhas"]["T_EMPRESA"] == 2
+
+    status, relatorio = requisitar(f"{servico}/empresas/excluir", "POST", {"ids": [1, 2, 999]})
+    assert status == 200
+    assert (relatorio["excluidas"], relatorio["nao_encontradas"]) == ([1, 2], [999])
+
+def test_saude_e_metricas(servico):
+    status, saude = requisitar(f"{servico}/saude")
+    assert status == 200 and saude["ok"] and saude["em_andamento"] == 1
+
+    status, cabecalhos, corpo = requisitar_bruto(f"{servico}/metricas")
+    assert status == 200 and cabecalhos["Content-Type"].startswith("text/plain")